@@ -31,6 +31,7 @@ import firewxpy.geometry as geometry
 import firewxpy.colormaps as colormaps
 import firewxpy.settings as settings
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
 import os
 import firewxpy.dims as dims
 import imageio
@@ -69,7 +70,7 @@ class relative_humidity:
 
     '''
 
-    def plot_poor_overnight_recovery_relative_humidity_forecast(poor_overnight_recovery_rh_threshold=50, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_poor_overnight_recovery_relative_humidity_forecast(poor_overnight_recovery_rh_threshold=50, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Minimum RH Forecast. 
@@ -438,7 +439,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
     
@@ -498,537 +499,101 @@ class relative_humidity:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-
         print("Creating Graphics - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Night 1]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-        if show_sample_points == True and no_vals == False:
-
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn1.plot_parameter('C', df1['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass     
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
         if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Night 2]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df2['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
 
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
         if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Night 3]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df3['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
+            extent = [-170, -151, 52, 62.9]
 
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
         if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Night 4]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df4['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
+            extent = [-145, -129.5, 54, 60.75]
 
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
         if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Night 5]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df5['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
+            extent = [-170, -140.75, 59, 72]
 
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax6.set_title('National Weather Service Forecast [Night 6]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
+            ocean_zorder = 3
 
+        grb_vals = [vals1, vals2, vals3, vals4, vals5, vals6]
 
-        if show_sample_points == True and no_vals == False:
-
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn6.plot_parameter('C', df6['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
         if files == 7:
+            grb_vals.append(vals7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Night 7]\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals7, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
+        days = len(grb_vals)
 
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['maxrh'])
             else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Night ' +str(i + 1)+ ']\nPoor Overnight RH Recovery\n(Max RH <= ' +str(poor_overnight_recovery_rh_threshold) + '%)',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Poor Overnight Recovery', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Poor Overnight Recovery')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Poor Overnight Recovery', prefix='Night')
     
     
     
-    def plot_excellent_overnight_recovery_relative_humidity_forecast(excellent_overnight_recovery_rh_threshold=80, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_excellent_overnight_recovery_relative_humidity_forecast(excellent_overnight_recovery_rh_threshold=80, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Minimum RH Forecast. 
@@ -1393,7 +958,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
     
@@ -1453,537 +1018,100 @@ class relative_humidity:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-
         print("Creating Graphics - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Night 1]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn1.plot_parameter('C', df1['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass     
-
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Night 2]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df2['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Night 3]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df3['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Night 4]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df4['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Night 5]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df5['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax6.set_title('National Weather Service Forecast [Night 6]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+            ocean_zorder = 3
 
-            stn6.plot_parameter('C', df6['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        grb_vals = [vals1, vals2, vals3, vals4, vals5, vals6]
 
-        else:
-            pass   
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
         if files == 7:
+            grb_vals.append(vals7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Night 7]\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], vals7, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
+        days = len(grb_vals)
 
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['maxrh'])
             else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Night ' +str(i + 1)+ ']\nExcellent Overnight RH Recovery\n(Max RH >= ' +str(excellent_overnight_recovery_rh_threshold) + '%)',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Excellent Overnight Recovery', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Excellent Overnight Recovery')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Excellent Overnight Recovery', prefix='Night')
     
     
-    def plot_maximum_relative_humidity_forecast(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_maximum_relative_humidity_forecast(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Maximum RH Forecast. 
@@ -2340,7 +1468,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
     
@@ -2400,534 +1528,100 @@ class relative_humidity:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
         
-        figs = [] 
-
         print("Creating Graphics - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Night 1]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            ocean_zorder = 3
 
+        grb_vals = [val1, val2, val3, val4, val5, val6]
 
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)    
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
-        if show_sample_points == True and no_vals == False:
+        if files == 7:
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+        days = len(grb_vals)
 
-            stn1.plot_parameter('C', df1['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
+            if show_sample_points == True and no_vals == False:
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['maxrh'])
+            else:
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Night ' +str(i + 1)+ ']\nMaximum Relative Humidity Forecast [%]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
-        else:
-            pass     
+        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Maximum RH', reference_system)
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Maximum RH', prefix='Night')
+    
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Night 2]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)    
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df2['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Night 3]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)                   
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df3['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Night 4]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)    
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df4['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Night 5]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)              
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df5['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax6.set_title('National Weather Service Forecast [Night 6]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)               
-
-        if show_sample_points == True and no_vals == False:
-
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn6.plot_parameter('C', df6['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        if files == 7:
-
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Night 7]\nMaximum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)              
-
-            if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['maxrh'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-            else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-
-        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Maximum RH', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Maximum RH')
-    
-
-    def plot_maximum_relative_humidity_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_maximum_relative_humidity_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Maximum RH Forecast. 
@@ -3284,7 +1978,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'maxrh', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
         
@@ -3350,466 +2044,105 @@ class relative_humidity:
         datacrs = ccrs.PlateCarree()
 
         print("Creating Images - Please Wait...")
-    
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Night 2]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            ocean_zorder = 3
 
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
+        grb_vals = [val1, val2, val3, val4, val5]
 
-        if show_sample_points == True and no_vals == False:
+        grb_starts = [grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+        grb_ends = [grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
-            stn1.plot_parameter('C', df2['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        if files == 7:
+            grb_vals.append(val6)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-        else:
-            pass     
+        days = len(grb_vals)
+
+        if show_sample_points == True and no_vals == False:
+            dfs = [df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
+            if show_sample_points == True and no_vals == False:
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['diff'])
+            else:
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Night ' +str(i + 2)+ ']\nMaximum Relative Humidity Trend [Δ%]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
+        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Maximum RH Trend', reference_system)
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Maximum RH Trend', prefix='Night', first_day=2)
         
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Night 3]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df3['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Night 4]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df4['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Night 5]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df5['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Night 6]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df6['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        if files == 7:
-
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Night 7]\nMaximum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both') 
-
-
-            if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-            else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-
-        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Maximum RH Trend', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Maximum RH Trend')
-        
-    
-    def plot_low_minimum_relative_humidity_forecast(low_minimum_rh_threshold=25, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
-    
-        r'''
-        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
-    
-        Required Arguments: None
+    
+    def plot_low_minimum_relative_humidity_forecast(low_minimum_rh_threshold=25, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
+    
+        r'''
+        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
+    
+        Required Arguments: None
 
         Optional Arguments: 1) low_minimum_rh_threshold (Integer) -  Default = 25%. The relative humidity threshold for 
                                a low minimum relative humidity. This is the upper bound of values shaded. 
@@ -4167,7 +2500,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
     
@@ -4227,518 +2560,100 @@ class relative_humidity:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-
         print("Creating Graphics - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Day 1]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            extent = [-155, -140.75, 55, 63.6]
 
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
+        if cwa == 'ALU' or cwa == 'alu':
+            extent = [-170, -155, 52, 62.9]
 
-        if show_sample_points == True and no_vals == False:
+        if cwa == 'AJK' or cwa == 'ajk':
+            extent = [-145, -129.5, 54, 60.75]
 
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+        if cwa == 'AFG' or cwa == 'afg':
+            extent = [-170, -140.75, 60.75, 72]
 
-            stn1.plot_parameter('C', df1['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        grb_vals = [val1, val2, val3, val4, val5, val6]
 
-        else:
-            pass     
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Day 2]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+        if files == 7:
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
+        days = len(grb_vals)
 
         if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': 3,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
+            if show_sample_points == True and no_vals == False:
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['unknown'])
+            else:
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Day ' +str(i + 1)+ ']\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df2['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
+        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Low Minimum RH', reference_system)
 
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Day 3]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df3['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Day 4]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df4['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Day 5]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df5['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55, 63.6], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -155, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 60.75, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax6.set_title('National Weather Service Forecast [Day 6]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn6.plot_parameter('C', df6['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        if files == 7:
-
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55, 63.6], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -155, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 60.75, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Day 7]\nExceptionally Low Minimum RH\n(Min RH <= ' +str(low_minimum_rh_threshold) + '%)', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-            if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-            else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-
-        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Low Minimum RH', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Low Minimum RH')
-    
-    
-    def plot_minimum_relative_humidity_forecast(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
-    
-        r'''
-        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
-    
-        Required Arguments: None
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Low Minimum RH')
+    
+    
+    def plot_minimum_relative_humidity_forecast(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
+    
+        r'''
+        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
+    
+        Required Arguments: None
 
         Optional Arguments: 1) color_table_shrink (Integer or Float) - Default = 0.7. This is how the colorbar is sized to the figure. 
                                This is a feature of matplotlib, as per their definition, the shrink is:
@@ -5090,7 +3005,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
     
@@ -5150,538 +3065,106 @@ class relative_humidity:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-
         print("Creating Images - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Day 1]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            extent = [-170, -151, 52, 62.9]
 
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
+        if cwa == 'AJK' or cwa == 'ajk':
+            extent = [-145, -129.5, 54, 60.75]
 
-        if show_sample_points == True and no_vals == False:
+        if cwa == 'AFG' or cwa == 'afg':
+            extent = [-170, -140.75, 59, 72]
 
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
+            ocean_zorder = 3
 
-            stn1.plot_parameter('C', df1['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        grb_vals = [val1, val2, val3, val4, val5, val6]
 
-        else:
-            pass     
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Day 2]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+        if files == 7:
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
+        days = len(grb_vals)
 
         if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
+            if show_sample_points == True and no_vals == False:
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['unknown'])
+            else:
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Day ' +str(i + 1)+ ']\nMinimum Relative Humidity Forecast [%]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn2.plot_parameter('C', df2['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
+        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Minimum RH', reference_system)
 
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Day 3]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df3['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Day 4]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df4['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Day 5]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df5['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax6.set_title('National Weather Service Forecast [Day 6]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn6.plot_parameter('C', df6['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        if files == 7:
-
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Day 7]\nMinimum Relative Humidity Forecast [%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2)
-
-
-            if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['unknown'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-            else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-
-        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Minimum RH', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Minimum RH')
-    
-    
-    
-    def plot_minimum_relative_humidity_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
-    
-        r'''
-        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
-    
-        Required Arguments: None
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Minimum RH')
+    
+    
+    
+    def plot_minimum_relative_humidity_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
+    
+        r'''
+        This function plots the latest available NOAA/NWS Minimum RH Forecast. 
+    
+        Required Arguments: None
 
         Optional Arguments: 1) color_table_shrink (Integer or Float) - Default = 0.7. This is how the colorbar is sized to the figure. 
                                This is a feature of matplotlib, as per their definition, the shrink is:
@@ -6034,7 +3517,7 @@ class relative_humidity:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'unknown', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
         
@@ -6101,479 +3584,121 @@ class relative_humidity:
         #datacrs = ccrs.PlateCarree()
 
         print("Creating Images - Please Wait...")
-    
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax1.set_title('National Weather Service Forecast [Day 2]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            ocean_zorder = 3
+
+        grb_vals = [val1, val2, val3, val4, val5]
 
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')   
+        grb_starts = [grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
+        if files == 7:
+            grb_vals.append(val6)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
+
+        days = len(grb_vals)
 
         if show_sample_points == True and no_vals == False:
+            dfs = [df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 3,
+            'rivers_zorder': 3,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'blue',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Relative Humidity (%)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
+            if show_sample_points == True and no_vals == False:
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['diff'])
+            else:
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Day ' +str(i + 2)+ ']\nMinimum Relative Humidity Trend [Δ%]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
 
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Minimum RH Trend', reference_system)
 
-            stn1.plot_parameter('C', df2['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Minimum RH Trend', first_day=2)
 
-        else:
-            pass     
+class temperature: 
 
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+    r'''
+    This class holds all the plotting functions for the National Weather Service Temperature Forecasts:
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax2.set_title('National Weather Service Forecast [Day 3]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+    1) Extreme Heat Forecast
 
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')  
+    2) Extremely Warm Low Temperature Forecast
 
-        if show_sample_points == True and no_vals == False:
+    3) Frost/Freeze Forecast 
 
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
+    4) Maximum Temperature Forecast
 
-            stn2.plot_parameter('C', df3['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
+    5) Minimum Temperature Forecast
 
-        else:
-            pass   
+    6) Maximum Temperature Trend Forecast
 
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax3.set_title('National Weather Service Forecast [Day 4]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')    
-        
-        if show_sample_points == True and no_vals == False:
-
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn3.plot_parameter('C', df4['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax4.set_title('National Weather Service Forecast [Day 5]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
- 
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')  
-
-
-        if show_sample_points == True and no_vals == False:
-
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn4.plot_parameter('C', df5['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        ax5.set_title('National Weather Service Forecast [Day 6]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')            
-
-        if show_sample_points == True and no_vals == False:
-
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-
-            stn5.plot_parameter('C', df6['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-
-        else:
-            pass   
-
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-
-        if files == 7:
-
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            
-            ax7.set_title('National Weather Service Forecast [Day 7]\nMinimum Relative Humidity Trend [Δ%]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, transform=datacrs, alpha=alpha, zorder=2, extend='both')                
-
-
-            if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['diff'][::decimate], color='blue', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-            else:
-                pass   
-
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Relative Humidity (%)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig7)
-
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-
-        path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Minimum RH Trend', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Minimum RH Trend')
-
-class temperature: 
-
-    r'''
-    This class holds all the plotting functions for the National Weather Service Temperature Forecasts:
-
-    1) Extreme Heat Forecast
-
-    2) Extremely Warm Low Temperature Forecast
-
-    3) Frost/Freeze Forecast 
-
-    4) Maximum Temperature Forecast
-
-    5) Minimum Temperature Forecast
-
-    6) Maximum Temperature Trend Forecast
-
-    7) Minimum Temperature Trend Forecast
+    7) Minimum Temperature Trend Forecast
 
     '''
 
 
-    def plot_extreme_heat_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=70, temp_scale_warm_stop=90, temp_scale_cool_start=70, temp_scale_cool_stop=90, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None,count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9): 
+    def plot_extreme_heat_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=70, temp_scale_warm_stop=90, temp_scale_cool_start=70, temp_scale_cool_stop=90, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None,count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Extreme Heat Forecast. 
@@ -6965,7 +4090,7 @@ class temperature:
             pass
     
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmax'])
@@ -7040,582 +4165,105 @@ class temperature:
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
             labels = temp_scale_cool
     
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn1.plot_parameter('C', df1['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-            
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df2['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df3['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df4['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df5['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-    
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn6.plot_parameter('C', df6['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
+            ocean_zorder = 3
+
         if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
+            levels = temp_scale_warm
+            title = "\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))"
+
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-    
-        if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
+            levels = temp_scale_cool
+            title = "\nExtreme Heat\n(Maximum Temperature >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))"
+
+        grb_vals = [val1, val2, val3, val4, val5, val6]
+
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
+        if files == 7:
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
+
+        days = len(grb_vals)
+
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 2,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'lime',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': 'hot_r',
+            'alpha': alpha,
+            'extend': 'max',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Maximum Temperature (\N{DEGREE SIGN}F)",
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tmaxf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tmaxf'])
             else:
-                pass
-    
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-    
+                sample_points = None
+            day_settings.append({
+                'title': "National Weather Service Forecast [Day " +str(i + 1)+ "]" + title,
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Extreme Heat', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Extreme Heat')
 
-    def plot_extremely_warm_low_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=60, temp_scale_warm_stop=80, temp_scale_cool_start=60, temp_scale_cool_stop=80, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None,count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9): 
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Extreme Heat')
+
+    def plot_extremely_warm_low_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=60, temp_scale_warm_stop=80, temp_scale_cool_start=60, temp_scale_cool_stop=80, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None,count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Extremely Warm Low Temperature Forecast. 
@@ -8007,7 +4655,7 @@ class temperature:
             pass
     
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tminf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmin'])
@@ -8080,586 +4728,106 @@ class temperature:
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
             labels = temp_scale_cool
     
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax1.set_title("National Weather Service Forecast [Night 1]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax1.set_title("National Weather Service Forecast [Night 1]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn1.plot_parameter('C', df1['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax2.set_title("National Weather Service Forecast [Night 2]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax2.set_title("National Weather Service Forecast [Night 2]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df2['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax3= fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax3.set_title("National Weather Service Forecast [Night 3]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax3.set_title("National Weather Service Forecast [Night 3]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df3['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax4.set_title("National Weather Service Forecast [Night 4]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax4.set_title("National Weather Service Forecast [Night 4]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df4['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax5.set_title("National Weather Service Forecast [Night 5]\nExtremely Warm Low Temperatures (Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax5.set_title("National Weather Service Forecast [Night 5]\nExtremely Warm Low Temperatures (Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df5['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax6.set_title("National Weather Service Forecast [Night 6]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax6.set_title("National Weather Service Forecast [Night 6]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn6.plot_parameter('C', df6['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
+        if cwa == 'AER' or cwa == 'aer':
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
+        if cwa == 'ALU' or cwa == 'alu':
+            extent = [-170, -151, 52, 62.9]
+
+        if cwa == 'AJK' or cwa == 'ajk':
+            extent = [-145, -129.5, 54, 60.75]
+
+        if cwa == 'AFG' or cwa == 'afg':
+            extent = [-170, -140.75, 59, 72]
+
+        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
+            ocean_zorder = 3
+
         if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
+            levels = temp_scale_warm
+            title = "\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))"
+
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
+            levels = temp_scale_cool
+            title = "\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))"
+
+        grb_vals = [val1, val2, val3, val4, val5, val6]
+
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=2)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                ax7.set_title("National Weather Service Forecast [Night 7]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_warm_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                ax7.set_title("National Weather Service Forecast [Night 7]\nExtremely Warm Low Temperatures\n(Min T >= " +str(temp_scale_cool_start)+ " (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
+
+        days = len(grb_vals)
+
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 2,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'lime',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': 'hot_r',
+            'alpha': alpha,
+            'extend': 'max',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Minimum Temperature (\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tminf'][::decimate], color='lime', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tminf'])
             else:
-                pass
-    
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_warm, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_cool, cmap='hot_r', alpha=alpha, transform=datacrs, extend='max', zorder=2)
-    
-    
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-    
+                sample_points = None
+            day_settings.append({
+                'title': "National Weather Service Forecast [Night " +str(i + 1)+ "]" + title,
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Warm Min T', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Warm Min T')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Warm Min T', prefix='Night')
     
-    def plot_frost_freeze_forecast(temperature_bottom_bound=-10, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9): 
+    def plot_frost_freeze_forecast(temperature_bottom_bound=-10, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Frost/Freeze Forecast. 
@@ -9037,7 +5205,7 @@ class temperature:
             pass
             
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tminf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmin'])
@@ -9105,530 +5273,101 @@ class temperature:
         val6 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val6)
         val7 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val7)
     
-        figs = [] 
-
         print("Creating Images - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
 
-        ax1.set_title("National Weather Service Forecast [Night 1]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn1.plot_parameter('C', df1['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
         if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-
-        ax2.set_title("National Weather Service Forecast [Night 2]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df2['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
 
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
         if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-
-        ax3.set_title("National Weather Service Forecast [Night 3]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df3['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-170, -151, 52, 62.9]
 
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
         if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-
-        ax4.set_title("National Weather Service Forecast [Night 4]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df4['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-145, -129.5, 54, 60.75]
 
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
         if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
-
-        ax5.set_title("National Weather Service Forecast [Night 5]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df5['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-170, -140.75, 59, 72]
 
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-        if show_cwa_borders == True:
-            ax6.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_firewx_zones == True:
-            ax6.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-        else:
-            pass
-        if show_nws_public_zones == True:
-            ax6.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-        else:
-            pass
+        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
+            ocean_zorder = 3
+
+        grb_vals = [val1, val2, val3, val4, val5, val6]
+
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
 
-        ax6.set_title("National Weather Service Forecast [Night 6]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn6.plot_parameter('C', df6['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-            if show_cwa_borders == True:
-                ax7.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_firewx_zones == True:
-                ax7.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
-            else:
-                pass
-            if show_nws_public_zones == True:
-                ax7.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
-            else:
-                pass
+        days = len(grb_vals)
 
-            ax7.set_title("National Weather Service Forecast [Night 7]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-            cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, extend='min', zorder=2)
-    
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 4,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'orange',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'min',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Minimum Temperature (\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tminf'][::decimate], color='orange', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tminf'])
             else:
-                pass
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-    
+                sample_points = None
+            day_settings.append({
+                'title': "National Weather Service Forecast [Night " +str(i + 1)+ "]\nFreeze Areas\n(Minimum Temperature <= 32 (\N{DEGREE SIGN}F))",
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Frost Freeze', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Frost Freeze')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Frost Freeze', prefix='Night')
     
     
-    def plot_maximum_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=30, temp_scale_warm_stop=90, temp_scale_cool_start=-20, temp_scale_cool_stop=50, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9): 
+    def plot_maximum_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=30, temp_scale_warm_stop=90, temp_scale_cool_start=-20, temp_scale_cool_stop=50, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Maximum Temperature Forecast. 
@@ -10032,7 +5771,7 @@ class temperature:
             pass
     
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmax'])
@@ -10108,501 +5847,106 @@ class temperature:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-
         print("Creating Images - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
 
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-        
-            stn1.plot_parameter('C', df1['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
 
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df2['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
         if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df3['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
 
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
         if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
+            extent = [-170, -151, 52, 62.9]
 
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df4['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
         if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df5['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-145, -129.5, 54, 60.75]
 
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
         if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
+            ocean_zorder = 3
 
         if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
+            levels = temp_scale_warm
+
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn6.plot_parameter('C', df6['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
+            levels = temp_scale_cool
+
+        grb_vals = [val1, val2, val3, val4, val5, val6]
+
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
+        days = len(grb_vals)
 
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nMaximum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-                
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 4,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'green',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Maximum Temperature (\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tmaxf'])
             else:
-                pass
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Maximum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-    
+                sample_points = None
+            day_settings.append({
+                'title': "National Weather Service Forecast [Day " +str(i + 1)+ "]\nMaximum Temperature (\N{DEGREE SIGN}F)",
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Max T', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Max T')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Max T')
     
-    def plot_minimum_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=10, temp_scale_warm_stop=60, temp_scale_cool_start=-30, temp_scale_cool_stop=40, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9): 
+    def plot_minimum_temperature_forecast(start_of_warm_season_month=5, end_of_warm_season_month=9, start_of_cool_season_month=10, end_of_cool_season_month=4, temp_scale_warm_start=10, temp_scale_warm_stop=60, temp_scale_cool_start=-30, temp_scale_cool_stop=40, temp_scale_step=1, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Minimum Temperature Forecast. 
@@ -11006,7 +6350,7 @@ class temperature:
             pass
     
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmin'])
@@ -11026,558 +6370,163 @@ class temperature:
             df6 = vals[5]
             df6['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df6['tmin'])
     
-            if test_7 == True:
-                df7 = vals[6]
-                df7['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df7['tmin'])
-            else:
-                pass
-            
-            no_vals = False
-    
-        except Exception as g:
-            no_vals = True
-            
-        files = count
-
-        local_time, utc_time = standard.plot_creation_time()
-
-        try:
-            if ds_short['time'][1]:
-                time_idx = 1
-                time_var = True
-            else:
-                time_idx  = 0
-                time_var = True
-        except Exception as e:
-            time_var = False
-            time_idx = None
-            
-        try:
-            if ds_extended['time'][1]:
-                time_var = True
-            else:
-                time_var = True
-
-        except Exception as e:
-            time_var = False
-            time_idx = None
-
-        steps, short_steps, extended_steps = parsers.NDFD.ndfd_step_count(ds_short, ds_extended)
-
-        val1, val2, val3, val4, val5, val6, val7 = parsers.NDFD.find_ds_vals(ds_short, ds_extended, steps, short_steps, extended_steps, time_var, time_idx, 'tmin')
-
-        val1 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val1)
-        val2 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val2)
-        val3 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val3)
-        val4 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val4)
-        val5 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val5)
-        val6 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val6)
-        val7 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val7)
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            labels = temp_scale_warm[::5]
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            labels = temp_scale_cool[::5]
-
-        mapcrs = ccrs.PlateCarree()
-        datacrs = ccrs.PlateCarree()
-    
-        figs = [] 
-
-        print("Creating Images - Please Wait...")
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax1.set_title("National Weather Service Forecast [Day 1]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs1 = ax1.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val1, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df1['longitude'][::decimate], df1['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-        
-            stn1.plot_parameter('C', df1['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax2.set_title("National Weather Service Forecast [Day 2]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs2 = ax2.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val2, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df2['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax3.set_title("National Weather Service Forecast [Day 3]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs3 = ax3.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val3, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df3['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax4.set_title("National Weather Service Forecast [Day 4]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs4 = ax4.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val4, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df4['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax5.set_title("National Weather Service Forecast [Day 5]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
+            if test_7 == True:
+                df7 = vals[6]
+                df7['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df7['tmin'])
+            else:
+                pass
             
-        ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
+            no_vals = False
     
+        except Exception as g:
+            no_vals = True
+            
+        files = count
+
+        local_time, utc_time = standard.plot_creation_time()
+
+        try:
+            if ds_short['time'][1]:
+                time_idx = 1
+                time_var = True
+            else:
+                time_idx  = 0
+                time_var = True
+        except Exception as e:
+            time_var = False
+            time_idx = None
+            
+        try:
+            if ds_extended['time'][1]:
+                time_var = True
+            else:
+                time_var = True
+
+        except Exception as e:
+            time_var = False
+            time_idx = None
+
+        steps, short_steps, extended_steps = parsers.NDFD.ndfd_step_count(ds_short, ds_extended)
+
+        val1, val2, val3, val4, val5, val6, val7 = parsers.NDFD.find_ds_vals(ds_short, ds_extended, steps, short_steps, extended_steps, time_var, time_idx, 'tmin')
+
+        val1 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val1)
+        val2 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val2)
+        val3 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val3)
+        val4 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val4)
+        val5 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val5)
+        val6 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val6)
+        val7 = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(val7)
+
         if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
+            labels = temp_scale_warm[::5]
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs5 = ax5.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val5, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df5['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
+            labels = temp_scale_cool[::5]
+
+        mapcrs = ccrs.PlateCarree()
+        datacrs = ccrs.PlateCarree()
     
-        fig6 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig6.set_facecolor('aliceblue')
-        fig6.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        print("Creating Images - Please Wait...")
+
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
 
-        ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax6.set_extent([-170, -125, 50, 72], datacrs)
         if cwa == 'AER' or cwa == 'aer':
-            ax6.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax6.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax6.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax6.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
+            ocean_zorder = 3
 
         if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-    
-        if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            ax6.set_title("National Weather Service Forecast [Day 6]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-        ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-        if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
+            levels = temp_scale_warm
+
         if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-            cs6 = ax6.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val6, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn6 = mpplots.StationPlot(ax6, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn6.plot_parameter('C', df6['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar6 = fig6.colorbar(cs6, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar6.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
+            levels = temp_scale_cool
+
+        grb_vals = [val1, val2, val3, val4, val5, val6]
+
+        grb_starts = [grb_1_start, grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_1_end, grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            grb_vals.append(val7)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
+        days = len(grb_vals)
 
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                ax7.set_title("National Weather Service Forecast [Day 7]\nMinimum Temperature (\N{DEGREE SIGN}F)", fontsize=title_fontsize, fontweight='bold', loc='left')
-                
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-    
-            if utc_time.month >= start_of_warm_season_month and utc_time.month <= end_of_warm_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_warm, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-        
-            if utc_time.month >= start_of_cool_season_month or utc_time.month <= end_of_cool_season_month:
-                cs7 = ax7.contourf(ds_short['longitude'][:, :], ds_short['latitude'][:, :], val7, levels=temp_scale_cool, cmap=cmap, alpha=alpha, transform=datacrs, extend='both', zorder=2)
-    
+        if show_sample_points == True and no_vals == False:
+            dfs = [df1, df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 4,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'green',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Minimum Temperature (\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tmaxf'][::decimate], color='green', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tmaxf'])
             else:
-                pass
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Minimum Temperature (\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig6)
-    
+                sample_points = None
+            day_settings.append({
+                'title': "National Weather Service Forecast [Day " +str(i + 1)+ "]\nMinimum Temperature (\N{DEGREE SIGN}F)",
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Min T', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Min T')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Min T', prefix='Night')
     
     
-    def plot_minimum_temperature_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_minimum_temperature_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Minimum Temperature Trend Forecast. 
@@ -11952,7 +6901,7 @@ class temperature:
     
         
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmin', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tminf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmin'])
@@ -12018,393 +6967,109 @@ class temperature:
 
         val1, val2, val3, val4, val5, val6, val7 = parsers.NDFD.find_ds_vals(ds_short, ds_extended, steps, short_steps, extended_steps, time_var, time_idx, 'tmin', diff=True)
 
-        val1 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val1)
-        val2 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val2)
-        val3 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val3)
-        val4 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val4)
-        val5 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val5)
-        val6 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val6)
-
-        mapcrs = ccrs.PlateCarree()
-        datacrs = ccrs.PlateCarree()
-    
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax1.set_title('National Weather Service Forecast [Night 2]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs1 = ax1.contourf(ds_short['longitude'], ds_short['latitude'], val1, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn1.plot_parameter('C', df2['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax2.set_title('National Weather Service Forecast [Night 3]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs2 = ax2.contourf(ds_short['longitude'], ds_short['latitude'], val2, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df3['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax3.set_title('National Weather Service Forecast [Night 4]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs3 = ax3.contourf(ds_short['longitude'], ds_short['latitude'], val3, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df4['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax4.set_title('National Weather Service Forecast [Night 5]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs4 = ax4.contourf(ds_short['longitude'], ds_short['latitude'], val4, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df5['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
+        val1 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val1)
+        val2 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val2)
+        val3 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val3)
+        val4 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val4)
+        val5 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val5)
+        val6 = unit_conversion.Temperature_Or_Dewpoint_Change_to_Fahrenheit(val6)
+
+        mapcrs = ccrs.PlateCarree()
+        datacrs = ccrs.PlateCarree()
     
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
+
         if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
+
         if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
+            extent = [-170, -151, 52, 62.9]
+
         if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax5.set_title('National Weather Service Forecast [Night 6]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs5 = ax5.contourf(ds_short['longitude'], ds_short['latitude'], val5, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df6['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
+            ocean_zorder = 3
+
+        grb_vals = [val1, val2, val3, val4, val5]
+
+        grb_starts = [grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            grb_vals.append(val6)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-    
-            ax7.set_title('National Weather Service Forecast [Night 7]\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-                
-            cs7 = ax7.contourf(ds_short['longitude'], ds_short['latitude'], val6, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
+        days = len(grb_vals)
+
+        if show_sample_points == True and no_vals == False:
+            dfs = [df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 4,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'black',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tdiff'])
             else:
-                pass
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Minimum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-    
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Night ' +str(i + 2)+ ']\nMinimum Temperature Trend [Δ\N{DEGREE SIGN}F]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Min T Trend', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Min T Trend')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Min T Trend', prefix='Night', first_day=2)
     
     
-    def plot_maximum_temperature_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9):
+    def plot_maximum_temperature_forecast_trend(color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=10, alpha=0.5, file_path=None, ds_short=None, ds_extended=None, ds=None, count_short=None, count_extended=None, decimate='default', cwa=None, aspect=30, tick=9, render_mode=None):
     
         r'''
         This function plots the latest available NOAA/NWS Maximum Temperature Trend Forecast. 
@@ -12779,7 +7444,7 @@ class temperature:
     
         
         try:
-            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard)
+            vals = parsers.checks.parse_NWS_GRIB_data_array(ds, 'tmax', count, True, count_short, count_extended, discard, decimate=decimate, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             
             df1 = vals[0]
             df1['tmaxf'] = unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(df1['tmax'])
@@ -12855,380 +7520,96 @@ class temperature:
         mapcrs = ccrs.PlateCarree()
         datacrs = ccrs.PlateCarree()
     
-        figs = [] 
-    
-        fig1 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig1.set_facecolor('aliceblue')
-        fig1.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+        extent = [-170, -125, 50, 72]
+        ocean_zorder = None
 
-        ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax1.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax1.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax1.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
         if cwa == 'AER' or cwa == 'aer':
-            ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax1.set_title('National Weather Service Forecast [Day 2]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax1.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs1 = ax1.contourf(ds_short['longitude'], ds_short['latitude'], val1, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn1 = mpplots.StationPlot(ax1, df2['longitude'][::decimate], df2['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn1.plot_parameter('C', df2['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar1 = fig1.colorbar(cs1, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar1.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig2 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig2.set_facecolor('aliceblue')
-        fig2.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-155, -140.75, 55.5, 64.5]
+            ocean_zorder = 11
 
-        ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax2.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
         if cwa == 'ALU' or cwa == 'alu':
-            ax2.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax2.set_title('National Weather Service Forecast [Day 3]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax2.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs2 = ax2.contourf(ds_short['longitude'], ds_short['latitude'], val2, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn2 = mpplots.StationPlot(ax2, df3['longitude'][::decimate], df3['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn2.plot_parameter('C', df3['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar2 = fig2.colorbar(cs2, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar2.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig3 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig3.set_facecolor('aliceblue')
-        fig3.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            extent = [-170, -151, 52, 62.9]
 
-        ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax3.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax3.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax3.set_title('National Weather Service Forecast [Day 4]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax3.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs3 = ax3.contourf(ds_short['longitude'], ds_short['latitude'], val3, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn3 = mpplots.StationPlot(ax3, df4['longitude'][::decimate], df4['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn3.plot_parameter('C', df4['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar3 = fig3.colorbar(cs3, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar3.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-        fig4 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig4.set_facecolor('aliceblue')
-        fig4.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-    
-        ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax4.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax4.set_extent([-170, -151, 52, 62.9], datacrs)
-        if cwa == 'AJK' or cwa == 'ajk':
-            ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
-        if cwa == 'AFG' or cwa == 'afg':
-            ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-        if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax4.set_title('National Weather Service Forecast [Day 5]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax4.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs4 = ax4.contourf(ds_short['longitude'], ds_short['latitude'], val4, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn4 = mpplots.StationPlot(ax4, df5['longitude'][::decimate], df5['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn4.plot_parameter('C', df5['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar4 = fig4.colorbar(cs4, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar4.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
-        fig5 = plt.figure(figsize=(fig_x_length, fig_y_length))
-        fig5.set_facecolor('aliceblue')
-        fig5.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
-        
-        ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
-        if cwa == None:
-            ax5.set_extent([-170, -125, 50, 72], datacrs)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-        if cwa == 'ALU' or cwa == 'alu':
-            ax5.set_extent([-170, -151, 52, 62.9], datacrs)
         if cwa == 'AJK' or cwa == 'ajk':
-            ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
+            extent = [-145, -129.5, 54, 60.75]
+
         if cwa == 'AFG' or cwa == 'afg':
-            ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-        ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
+            extent = [-170, -140.75, 59, 72]
+
         if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        if cwa == 'AER' or cwa == 'aer':
-            ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-        ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-        if show_rivers == True:
-            ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-        if show_gacc_borders == True:
-            ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-        else:
-            pass
-        if show_psa_borders == True:
-            ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_county_borders == True:
-            ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-        else:
-            pass
-        if show_state_borders == True:
-            ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-        else:
-            pass
-    
-        ax5.set_title('National Weather Service Forecast [Day 6]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-        
-        ax5.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-            
-        cs5 = ax5.contourf(ds_short['longitude'], ds_short['latitude'], val5, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
-        if show_sample_points == True and no_vals == False:
-    
-            stn5 = mpplots.StationPlot(ax5, df6['longitude'][::decimate], df6['latitude'][::decimate],
-                                             transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-            stn5.plot_parameter('C', df6['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
-        else:
-            pass
-    
-        cbar5 = fig5.colorbar(cs5, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-        cbar5.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-    
+            ocean_zorder = 3
+
+        grb_vals = [val1, val2, val3, val4, val5]
+
+        grb_starts = [grb_2_start, grb_3_start, grb_4_start, grb_5_start, grb_6_start]
+
+        grb_ends = [grb_2_end, grb_3_end, grb_4_end, grb_5_end, grb_6_end]
+
         if files == 7:
-    
-            fig7 = plt.figure(figsize=(fig_x_length, fig_y_length))
-            fig7.set_facecolor('aliceblue')
-            fig7.text(signature_x_position, signature_y_position, 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'), fontsize=signature_fontsize, fontweight='bold', bbox=props, zorder=10)
+            grb_vals.append(val6)
+            grb_starts.append(grb_7_start)
+            grb_ends.append(grb_7_end)
 
-            ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
-            if cwa == None:
-                ax7.set_extent([-170, -125, 50, 72], datacrs)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.set_extent([-155, -140.75, 55.5, 64.5], datacrs)
-            if cwa == 'ALU' or cwa == 'alu':
-                ax7.set_extent([-170, -151, 52, 62.9], datacrs)
-            if cwa == 'AJK' or cwa == 'ajk':
-                ax7.set_extent([-145, -129.5, 54, 60.75], datacrs)
-            if cwa == 'AFG' or cwa == 'afg':
-                ax7.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-            if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-            if cwa == 'AER' or cwa == 'aer':
-                ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
-            if show_rivers == True:
-                ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
-            if show_gacc_borders == True:
-                ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
-            else:
-                pass
-            if show_psa_borders == True:
-                ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_county_borders == True:
-                ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
-            else:
-                pass
-            if show_state_borders == True:
-                ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
-            else:
-                pass
-    
-            ax7.set_title('National Weather Service Forecast [Day 7]\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]', fontsize=title_fontsize, fontweight='bold', loc='left')
-            
-            ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
-                
-            cs7 = ax7.contourf(ds_short['longitude'], ds_short['latitude'], val6, levels=levels, cmap=cmap, alpha=alpha, transform=datacrs, zorder=2, extend='both')
-    
+        days = len(grb_vals)
+
+        if show_sample_points == True and no_vals == False:
+            dfs = [df2, df3, df4, df5, df6]
+            if files == 7:
+                dfs.append(df7)
+
+        figure_settings = {
+            'fig_x_length': fig_x_length,
+            'fig_y_length': fig_y_length,
+            'signature_x_position': signature_x_position,
+            'signature_y_position': signature_y_position,
+            'signature': 'Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: '+reference_system+'\nData Source: NOAA/NWS/NDFD\nImage Created: ' + utc_time.strftime('%a %m/%d/%Y %H:%MZ'),
+            'signature_fontsize': signature_fontsize,
+            'props': props,
+            'mapcrs': mapcrs,
+            'datacrs': datacrs,
+            'render_mode': render_mode,
+            'extent': extent,
+            'reference_system': reference_system,
+            'show_rivers': show_rivers,
+            'ocean_zorder': ocean_zorder,
+            'lakes_zorder': 4,
+            'rivers_zorder': 4,
+            'borders': rendering.border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle),
+            'title_fontsize': title_fontsize,
+            'subplot_title_fontsize': subplot_title_fontsize,
+            'sample_point_fontsize': sample_point_fontsize,
+            'sample_point_color': 'black',
+            'sample_point_zorder': 10,
+            'levels': levels,
+            'cmap': cmap,
+            'alpha': alpha,
+            'extend': 'both',
+            'contour_zorder': 2,
+            'labels': labels,
+            'aspect': aspect,
+            'color_table_shrink': color_table_shrink,
+            'colorbar_label': "Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)",
+            'colorbar_fontsize': colorbar_fontsize,
+            'tick': mpl.rcParams['xtick.labelsize'],
+        }
+
+        day_settings = []
+
+        for i in range(0, days):
             if show_sample_points == True and no_vals == False:
-    
-                stn7 = mpplots.StationPlot(ax7, df7['longitude'][::decimate], df7['latitude'][::decimate],
-                                                 transform=ccrs.PlateCarree(), fontsize=sample_point_fontsize, zorder=10, clip_on=True)
-    
-                stn7.plot_parameter('C', df7['tdiff'][::decimate], color='black', path_effects=[withStroke(linewidth=1, foreground='black')], zorder=10)
-    
+                sample_points = (dfs[i]['longitude'], dfs[i]['latitude'], dfs[i]['tdiff'])
             else:
-                pass
-    
-            cbar7 = fig7.colorbar(cs7, location='bottom', ticks=labels, aspect=aspect, shrink=color_table_shrink, pad=0.02)
-            cbar7.set_label(label="Maximum Temperature Trend (Δ\N{DEGREE SIGN}F)", fontsize=colorbar_fontsize, fontweight='bold')
-        
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-            figs.append(fig7)
-    
-        else:
-            figs.append(fig1)
-            figs.append(fig2)
-            figs.append(fig3)
-            figs.append(fig4)
-            figs.append(fig5)
-    
+                sample_points = None
+            day_settings.append({
+                'title': 'National Weather Service Forecast [Day ' +str(i + 2)+ ']\nMaximum Temperature Trend [Δ\N{DEGREE SIGN}F]',
+                'start': grb_starts[i],
+                'end': grb_ends[i],
+                'sample_points': sample_points,
+            })
+
         path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'NWS Max T Trend', reference_system)
-        file_functions.update_images(figs, path, gif_path, 'NWS Max T Trend')
+
+        rendering.render_nws_forecast(grb_vals, ds_short['latitude'], ds_short['longitude'], day_settings, figure_settings, path, gif_path, 'NWS Max T Trend', first_day=2)
 
 class hot_dry_and_windy:
 
@@ -13973,43 +8354,43 @@ class hot_dry_and_windy:
                 ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
             if cwa == 'AFG' or cwa == 'afg':
                 ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
             if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
+                rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=3)
             if cwa == 'AER' or cwa == 'aer':
-                ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+                rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=11)       
+            rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
             if show_rivers == True:
-                ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
 
@@ -14053,43 +8434,43 @@ class hot_dry_and_windy:
                 ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
             if cwa == 'AFG' or cwa == 'afg':
                 ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
             if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
+                rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=3)
             if cwa == 'AER' or cwa == 'aer':
-                ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+                rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=11)       
+            rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=4)
             if show_rivers == True:
-                ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
 
@@ -14872,43 +9253,43 @@ class hot_dry_and_windy:
                 ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
             if cwa == 'AFG' or cwa == 'afg':
                 ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
             if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
+                rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=3)
             if cwa == 'AER' or cwa == 'aer':
-                ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+                rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=11)       
+            rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
             if show_rivers == True:
-                ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
 
@@ -14952,43 +9333,43 @@ class hot_dry_and_windy:
                 ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
             if cwa == 'AFG' or cwa == 'afg':
                 ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-            ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
             if cwa == None or cwa == 'AJK' or cwa == 'ajk':
-                ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
+                rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=3)
             if cwa == 'AER' or cwa == 'aer':
-                ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=11)       
-            ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+                rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=11)       
+            rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=4)
             if show_rivers == True:
-                ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
 
@@ -13,6 +13,7 @@ import pandas as pd
 import matplotlib.gridspec as gridspec
 import firewxpy.settings as settings
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
 import firewxpy.dims as dims
 import warnings
 warnings.filterwarnings('ignore')
@@ -30,7 +31,7 @@ mpl.rcParams['font.weight'] = 'bold'
 
 mpl.rcParams['font.weight'] = 'bold'
 
-def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity. 
@@ -394,41 +395,41 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -440,7 +441,7 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -480,7 +481,7 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
     file_functions.update_images(fig, path, gif_path, 'RTMA RH')
 
 
-def plot_low_and_high_relative_humidity(low_rh_threshold=25, high_rh_threshold=80, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None):
+def plot_low_and_high_relative_humidity(low_rh_threshold=25, high_rh_threshold=80, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity filtered for areas of low RH and high RH. 
@@ -878,41 +879,41 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=25, high_rh_threshold=8
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -934,10 +935,10 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=25, high_rh_threshold=8
     x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size = x1, y, x_size, 0.02
     x_cbar2_0, y_cbar2_0, x_cbar2_size, y_cbar2_size = x2, y, x_size, 0.02
     
-    cs_low = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_low = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_low, cmap=cmap_low, alpha=alpha, zorder=2)
 
-    cs_high = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_high = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_high, cmap=cmap_high, alpha=alpha, zorder=2)
 
     ax_cbar = plt.gcf().add_axes([x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size])
@@ -984,7 +985,7 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=25, high_rh_threshold=8
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA LOW AND HIGH RH', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA LOW AND HIGH RH')
 
-def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Relative Humidity. 
@@ -1395,41 +1396,41 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1441,7 +1442,7 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -1481,7 +1482,7 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
     file_functions.update_images(fig, path, gif_path, '24HR RTMA RH COMPARISON')
 
 
-def plot_temperature(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature. 
@@ -1842,41 +1843,41 @@ def plot_temperature(color_table_shrink=1, title_fontsize=12, subplot_title_font
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1888,7 +1889,7 @@ def plot_temperature(color_table_shrink=1, title_fontsize=12, subplot_title_font
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -1928,7 +1929,7 @@ def plot_temperature(color_table_shrink=1, title_fontsize=12, subplot_title_font
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE')
 
 
-def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature Advection. 
@@ -2289,41 +2290,41 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2345,7 +2346,7 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2380,7 +2381,7 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE ADVECTION')
 
 
-def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point Advection. 
@@ -2740,41 +2741,41 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2796,7 +2797,7 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2830,7 +2831,7 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT ADVECTION')
 
 
-def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity Advection. 
@@ -3199,41 +3200,41 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3255,7 +3256,7 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3287,7 +3288,7 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA RH ADVECTION', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA RH ADVECTION')
 
-def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Frost/Freeze Areas (RTMA Temperature <= 32F). 
@@ -3639,41 +3640,41 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3685,7 +3686,7 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='min', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3724,7 +3725,7 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA FROST FREEZE', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA FROST FREEZE')
 
-def plot_extreme_heat(temperature_threshold=70, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_extreme_heat(temperature_threshold=70, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Extreme Heat. 
@@ -4080,41 +4081,41 @@ def plot_extreme_heat(temperature_threshold=70, color_table_shrink=1, title_font
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4126,7 +4127,7 @@ def plot_extreme_heat(temperature_threshold=70, color_table_shrink=1, title_font
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap='hot', alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -4165,7 +4166,7 @@ def plot_extreme_heat(temperature_threshold=70, color_table_shrink=1, title_font
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA EXTREME HEAT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA EXTREME HEAT')
 
-def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Temperature. 
@@ -4554,41 +4555,41 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4600,7 +4601,7 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -4639,7 +4640,7 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, '24HR RTMA TEMPERATURE COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TEMPERATURE COMPARISON')
 
-def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point. 
@@ -4998,41 +4999,41 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5044,7 +5045,7 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -5083,7 +5084,7 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA DEW POINT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT')
 
-def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Dew Point. 
@@ -5473,41 +5474,41 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5519,7 +5520,7 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -5558,7 +5559,7 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, '24HR RTMA DEW POINT COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA DEW POINT COMPARISON')
 
-def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Total Cloud Cover. 
@@ -5908,41 +5909,41 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5954,7 +5955,7 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, tcdcclm[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, tcdcclm[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -5993,7 +5994,7 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA TOTAL CLOUD COVER', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA TOTAL CLOUD COVER')
 
-def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Total Cloud Cover. 
@@ -6378,41 +6379,41 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6424,7 +6425,7 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -6464,7 +6465,7 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TOTAL CLOUD COVER COMPARISON')
 
 
-def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Wind Speed. 
@@ -6818,41 +6819,41 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6864,7 +6865,7 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -6903,7 +6904,7 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, 'RTMA WIND SPEED', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA WIND SPEED')
 
-def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed. 
@@ -7339,41 +7340,41 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -7385,7 +7386,7 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -7425,7 +7426,7 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
     file_functions.update_images(fig, path, gif_path, '24HR RTMA WIND SPEED COMPARISON')
 
 
-def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) for Wind Speed & Direction. 
@@ -7807,41 +7808,41 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -7859,7 +7860,7 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -7898,7 +7899,7 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
     path, gif_path = file_functions.check_file_paths_alaska(state, cwa, fname, reference_system)
     file_functions.update_images(fig, path, gif_path, fname)
 
-def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, cwa=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed & Direction. 
@@ -8328,41 +8329,41 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
         ax.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -8380,7 +8381,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if cwa == None:
@@ -8441,7 +8442,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_greenup_temperature_threshold=75, low_rh_threshold=25, high_wind_threshold=15, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, tick=9, aspect=30):
+def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_greenup_temperature_threshold=75, low_rh_threshold=25, high_wind_threshold=15, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available RTMA Hot, Dry and Windy Areas with their components.
@@ -8970,41 +8971,41 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
         ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=15)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=15)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -9044,41 +9045,41 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
         ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=15)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=15)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -9102,45 +9103,45 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
         ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax3.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax3, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -9190,45 +9191,45 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
         ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax4.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax4, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax4, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax4, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax4, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax4, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax4, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax4, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax4, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax4, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax4.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax4, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
@@ -9290,45 +9291,45 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
         ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax5.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax5, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax5, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax5, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax5, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax5, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax5, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax5, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax5, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax5, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs3 = ax5.contourf(lons, lats, rtma_temp[:, :], 
+    cs3 = rendering.contourf(ax5, lons, lats, rtma_temp[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=temp_contourf, cmap=colormaps.reds(), alpha=alpha, extend='max')
 
     cbar3 = fig.colorbar(cs3, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=temp_labels)
@@ -9360,7 +9361,7 @@ def plot_hot_dry_and_windy_areas(pre_greenup_temperature_threshold=65, post_gree
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_greenup_temperature_threshold=75, low_rh_threshold=25, high_wind_threshold=15, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, tick=9, aspect=30):
+def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_greenup_temperature_threshold=75, low_rh_threshold=25, high_wind_threshold=15, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, cwa=None, colorbar_pad=0.02, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available RTMA Hot, Dry and Gusty Areas with their components.
@@ -9891,41 +9892,41 @@ def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_gree
         ax1.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax1.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=15)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=15)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -9965,41 +9966,41 @@ def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_gree
         ax2.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax2.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=15)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=15)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -10023,45 +10024,45 @@ def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_gree
         ax3.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax3.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax3.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax3, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -10111,45 +10112,45 @@ def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_gree
         ax4.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax4.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax4.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax4, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax4, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax4, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax4, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax4, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax4, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax4, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax4.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax4.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax4, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax4.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax4, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax4.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax4, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
@@ -10185,45 +10186,45 @@ def plot_hot_dry_and_gusty_areas(pre_greenup_temperature_threshold=65, post_gree
         ax5.set_extent([-145, -129.5, 54, 60.75], datacrs)
     if cwa == 'AFG' or cwa == 'afg':
         ax5.set_extent([-170, -140.75, 59, 72], datacrs)
-    ax5.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax5, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax5, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax5, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax5, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax5, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax5, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax5, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax5.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax5.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax5, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax5.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax5, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs3 = ax5.contourf(lons, lats, rtma_temp[:, :], 
+    cs3 = rendering.contourf(ax5, lons, lats, rtma_temp[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=temp_contourf, cmap=colormaps.reds(), alpha=alpha, extend='max')
 
     cbar3 = fig.colorbar(cs3, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=temp_labels)
@@ -12,6 +12,7 @@ import pandas as pd
 import matplotlib.gridspec as gridspec
 import firewxpy.settings as settings
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
 import firewxpy.dims as dims
 import warnings
 warnings.filterwarnings('ignore')
@@ -30,7 +31,7 @@ mpl.rcParams['font.weight'] = 'bold'
 
 mpl.rcParams['font.weight'] = 'bold'
 
-def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity. 
@@ -377,15 +378,15 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.relative_humidity_colormap()
 
@@ -401,7 +402,7 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             lat = ds['lat']
@@ -435,7 +436,7 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
             
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 lat = ds['lat']
@@ -466,41 +467,41 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -512,7 +513,7 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -543,7 +544,7 @@ def plot_relative_humidity(western_bound=None, eastern_bound=None, southern_boun
     file_functions.update_images(fig, path, gif_path, 'RTMA RH')
 
 
-def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=80, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None):
+def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=80, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity filtered for areas of low RH and high RH. 
@@ -940,15 +941,15 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap_low = colormaps.low_relative_humidity_colormap()
     cmap_high = colormaps.excellent_recovery_colormap()
@@ -965,7 +966,7 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             lat = ds['lat']
@@ -999,7 +1000,7 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
             
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 lat = ds['lat']
@@ -1030,41 +1031,41 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1086,10 +1087,10 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
     x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size = x1, y, x_size, 0.02
     x_cbar2_0, y_cbar2_0, x_cbar2_size, y_cbar2_size = x2, y, x_size, 0.02
     
-    cs_low = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_low = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_low, cmap=cmap_low, alpha=alpha, zorder=2)
 
-    cs_high = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_high = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_high, cmap=cmap_high, alpha=alpha, zorder=2)
 
     ax_cbar = plt.gcf().add_axes([x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size])
@@ -1127,7 +1128,7 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=15, high_rh_threshold=8
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA LOW AND HIGH RH', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA LOW AND HIGH RH')
 
-def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Relative Humidity. 
@@ -1487,15 +1488,15 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.relative_humidity_change_colormap()
 
@@ -1511,7 +1512,7 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             lat = ds['lat']
@@ -1565,7 +1566,7 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
         except Exception as e:
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 lat = ds['lat']
@@ -1611,41 +1612,41 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1657,7 +1658,7 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -1688,7 +1689,7 @@ def plot_24_hour_relative_humidity_comparison(western_bound=None, eastern_bound=
     file_functions.update_images(fig, path, gif_path, '24HR RTMA RH COMPARISON')
 
 
-def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature. 
@@ -2043,15 +2044,15 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.temperature_colormap()
 
@@ -2067,7 +2068,7 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
             temp = ds['tmp2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -2092,7 +2093,7 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
                 temp = ds['tmp2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -2119,41 +2120,41 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2165,7 +2166,7 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2196,7 +2197,7 @@ def plot_temperature(western_bound=None, eastern_bound=None, southern_bound=None
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE')
 
 
-def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature Advection. 
@@ -2545,15 +2546,15 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.temperature_change_colormap()
 
@@ -2569,7 +2570,7 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'ugrd10m', 'vgrd10m'])
             temp = ds['tmp2m']
             u = ds['ugrd10m']
             v = ds['vgrd10m']
@@ -2598,7 +2599,7 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'ugrd10m', 'vgrd10m'])
                 temp = ds['tmp2m']
                 u = ds['ugrd10m']
                 v = ds['vgrd10m']
@@ -2627,41 +2628,41 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2683,7 +2684,7 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2709,7 +2710,7 @@ def plot_temperature_advection(western_bound=None, eastern_bound=None, southern_
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE ADVECTION')
 
 
-def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point Advection. 
@@ -3059,15 +3060,15 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.dew_point_change_colormap()
 
@@ -3083,7 +3084,7 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m', 'ugrd10m', 'vgrd10m'])
             temp = ds['dpt2m']
             u = ds['ugrd10m']
             v = ds['vgrd10m']
@@ -3112,7 +3113,7 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m', 'ugrd10m', 'vgrd10m'])
                 temp = ds['dpt2m']
                 u = ds['ugrd10m']
                 v = ds['vgrd10m']
@@ -3140,41 +3141,41 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3196,7 +3197,7 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3221,7 +3222,7 @@ def plot_dew_point_advection(western_bound=None, eastern_bound=None, southern_bo
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT ADVECTION')
 
 
-def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity Advection. 
@@ -3570,15 +3571,15 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.relative_humidity_change_colormap()
 
@@ -3594,7 +3595,7 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'ugrd10m', 'vgrd10m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             temp = temp - 273.15
@@ -3629,7 +3630,7 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'ugrd10m', 'vgrd10m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 temp = temp - 273.15
@@ -3661,41 +3662,41 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3717,7 +3718,7 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3740,7 +3741,7 @@ def plot_relative_humidity_advection(western_bound=None, eastern_bound=None, sou
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA RH ADVECTION', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA RH ADVECTION')
 
-def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Frost/Freeze Areas (RTMA Temperature <= 32F). 
@@ -4089,15 +4090,15 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.cool_temperatures_colormap()
 
@@ -4113,7 +4114,7 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
             temp = ds['tmp2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -4138,7 +4139,7 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
                 temp = ds['tmp2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -4164,41 +4165,41 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4210,7 +4211,7 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='min', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -4240,7 +4241,7 @@ def plot_frost_freeze(western_bound=None, eastern_bound=None, southern_bound=Non
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA FROST FREEZE', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA FROST FREEZE')
 
-def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Extreme Heat. 
@@ -4592,15 +4593,15 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.cool_temperatures_colormap()
 
@@ -4616,7 +4617,7 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
             temp = ds['tmp2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -4641,7 +4642,7 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
                 temp = ds['tmp2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -4667,41 +4668,41 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4713,7 +4714,7 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap='hot', alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -4743,7 +4744,7 @@ def plot_extreme_heat(temperature_threshold=100, western_bound=None, eastern_bou
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA EXTREME HEAT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA EXTREME HEAT')
 
-def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Temperature. 
@@ -5103,15 +5104,15 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.temperature_change_colormap()
 
@@ -5127,7 +5128,7 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
             temp = ds['tmp2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -5168,7 +5169,7 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m'])
                 temp = ds['tmp2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -5206,41 +5207,41 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5252,7 +5253,7 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -5282,7 +5283,7 @@ def plot_24_hour_temperature_comparison(western_bound=None, eastern_bound=None,
     path, gif_path = file_functions.check_file_paths(state, gacc_region, '24HR RTMA TEMPERATURE COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TEMPERATURE COMPARISON')
 
-def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point. 
@@ -5636,15 +5637,15 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.dew_point_colormap()
 
@@ -5660,7 +5661,7 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m'])
             temp = ds['dpt2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -5685,7 +5686,7 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m'])
                 temp = ds['dpt2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -5711,41 +5712,41 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5757,7 +5758,7 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -5787,7 +5788,7 @@ def plot_dew_point(western_bound=None, eastern_bound=None, southern_bound=None,
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA DEW POINT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT')
 
-def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Dew Point. 
@@ -6147,15 +6148,15 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.dew_point_change_colormap()
 
@@ -6171,7 +6172,7 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m'])
             temp = ds['dpt2m']
             lat = ds['lat']
             lon = ds['lon']
@@ -6212,7 +6213,7 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['dpt2m'])
                 temp = ds['dpt2m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -6250,41 +6251,41 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6296,7 +6297,7 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -6326,7 +6327,7 @@ def plot_24_hour_dew_point_comparison(western_bound=None, eastern_bound=None, so
     path, gif_path = file_functions.check_file_paths(state, gacc_region, '24HR RTMA DEW POINT COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA DEW POINT COMPARISON')
 
-def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Total Cloud Cover. 
@@ -6675,15 +6676,15 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.cloud_cover_colormap()
 
@@ -6699,7 +6700,7 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tcdcclm'])
             lat = ds['lat']
             lon = ds['lon']
             tcdcclm = ds['tcdcclm']
@@ -6722,7 +6723,7 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tcdcclm'])
                 lat = ds['lat']
                 lon = ds['lon']
                 tcdcclm = ds['tcdcclm']
@@ -6747,41 +6748,41 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6793,7 +6794,7 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, tcdcclm[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, tcdcclm[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -6823,7 +6824,7 @@ def plot_total_cloud_cover(western_bound=None, eastern_bound=None, southern_boun
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA TOTAL CLOUD COVER', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA TOTAL CLOUD COVER')
 
-def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Total Cloud Cover. 
@@ -7183,15 +7184,15 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.cloud_cover_change_colormap()
 
@@ -7207,7 +7208,7 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tcdcclm'])
             tcdcclm= ds['tcdcclm']
             lat = ds['lat']
             lon = ds['lon']
@@ -7244,7 +7245,7 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tcdcclm'])
                 tcdcclm= ds['tcdcclm']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -7280,41 +7281,41 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -7326,7 +7327,7 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -7357,7 +7358,7 @@ def plot_24_hour_total_cloud_cover_comparison(western_bound=None, eastern_bound=
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TOTAL CLOUD COVER COMPARISON')
 
 
-def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Wind Speed. 
@@ -7706,15 +7707,15 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_colormap()
 
@@ -7730,7 +7731,7 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['wind10m'])
             lat = ds['lat']
             lon = ds['lon']
             ws = ds['wind10m']
@@ -7755,7 +7756,7 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['wind10m'])
                 lat = ds['lat']
                 lon = ds['lon']
                 ws = ds['wind10m']
@@ -7781,41 +7782,41 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -7827,7 +7828,7 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -7857,7 +7858,7 @@ def plot_wind_speed(western_bound=None, eastern_bound=None, southern_bound=None,
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA WIND SPEED', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA WIND SPEED')
 
-def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed. 
@@ -8217,15 +8218,15 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_change_colormap()
 
@@ -8241,7 +8242,7 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['wind10m'])
             ws = ds['wind10m']
             lat = ds['lat']
             lon = ds['lon']
@@ -8282,7 +8283,7 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['wind10m'])
                 ws = ds['wind10m']
                 lat = ds['lat']
                 lon = ds['lon']
@@ -8320,41 +8321,41 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -8366,7 +8367,7 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -8397,7 +8398,7 @@ def plot_24_hour_wind_speed_comparison(western_bound=None, eastern_bound=None, s
     file_functions.update_images(fig, path, gif_path, '24HR RTMA WIND SPEED COMPARISON')
 
 
-def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) for Wind Speed & Direction. 
@@ -8759,15 +8760,15 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
         mpl.rcParams['ytick.labelsize'] = tick
         aspect=aspect
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_colormap()
 
@@ -8783,7 +8784,7 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['ugrd10m', 'vgrd10m', 'wind10m'])
             u = ds['ugrd10m']
             v = ds['vgrd10m']
             ws = ds['wind10m']
@@ -8818,7 +8819,7 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['ugrd10m', 'vgrd10m', 'wind10m'])
                 u = ds['ugrd10m']
                 v = ds['vgrd10m']
                 ws = ds['wind10m']
@@ -8849,41 +8850,41 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -8901,7 +8902,7 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -8931,7 +8932,7 @@ def plot_wind_speed_and_direction(western_bound=None, eastern_bound=None, southe
     path, gif_path = file_functions.check_file_paths(state, gacc_region, fname, reference_system)
     file_functions.update_images(fig, path, gif_path, fname)
 
-def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, state='us', gacc_region=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed & Direction. 
@@ -9313,15 +9314,15 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_change_colormap()
 
@@ -9336,7 +9337,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
     if test == True and time == None:
         
         try:
-            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+            ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['ugrd10m', 'vgrd10m', 'wind10m'])
             u = ds['ugrd10m']
             v = ds['vgrd10m']
             u_24 = ds_24['ugrd10m']
@@ -9393,7 +9394,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time)
+                ds, ds_24, rtma_time, rtma_time_24 = RTMA_CONUS.get_RTMA_24_hour_comparison_datasets(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['ugrd10m', 'vgrd10m', 'wind10m'])
                 u = ds['ugrd10m']
                 v = ds['vgrd10m']
                 u_24 = ds_24['ugrd10m']
@@ -9439,41 +9440,41 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -9491,7 +9492,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     decimate = scaling.get_nomads_decimation(western_bound, eastern_bound, southern_bound, northern_bound, True)
@@ -9534,7 +9535,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(western_bound=None, eastern
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, row1=None, row2=None, row3=None, row4=None, row5=None, row6=None, col1=None, col2=None, col3=None, col4=None, col5=None, col6=None, tick=9, aspect=30):
+def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, row1=None, row2=None, row3=None, row4=None, row5=None, row6=None, col1=None, col2=None, col3=None, col4=None, col5=None, col6=None, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dry and Windy Areas along with the components. 
@@ -9966,15 +9967,15 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.red_flag_warning_criteria_colormap()
 
@@ -9994,7 +9995,7 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'wind10m', 'ugrd10m', 'vgrd10m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             temp = temp - 273.15
@@ -10037,7 +10038,7 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'wind10m', 'ugrd10m', 'vgrd10m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 temp = temp - 273.15
@@ -10082,41 +10083,41 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax1 = fig.add_subplot(gs[row1:row2, col1:col2], projection=ccrs.PlateCarree())
     ax1.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=8)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=8)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -10136,45 +10137,45 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax2 = fig.add_subplot(gs[row3:row4, col3:col4], projection=ccrs.PlateCarree())
     ax2.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax2.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax2, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -10206,45 +10207,45 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax3 = fig.add_subplot(gs[row5:row6, col5:col6], projection=ccrs.PlateCarree())
     ax3.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax3.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax3, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
@@ -10304,7 +10305,7 @@ def plot_dry_and_windy_areas(low_rh_threshold=15, high_wind_threshold=25, wester
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, row1=None, row2=None, row3=None, row4=None, row5=None, row6=None, col1=None, col2=None, col3=None, col4=None, col5=None, col6=None, tick=9, aspect=30):
+def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, state='us', gacc_region=None, colorbar_pad=0.02, row1=None, row2=None, row3=None, row4=None, row5=None, row6=None, col1=None, col2=None, col3=None, col4=None, col5=None, col6=None, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dry and Gusty Areas along with the components. 
@@ -10737,15 +10738,15 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
     
     local_time, utc_time = standard.plot_creation_time()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.red_flag_warning_criteria_colormap()
 
@@ -10765,7 +10766,7 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
     if test == True and time == None:
         
         try:
-            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+            ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'gust10m'])
             temp = ds['tmp2m']
             dwpt = ds['dpt2m']
             temp = temp - 273.15
@@ -10800,7 +10801,7 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
             print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
 
             try:
-                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time)
+                ds, rtma_time = RTMA_CONUS.get_RTMA_dataset(utc_time, extent=[western_bound, eastern_bound, southern_bound, northern_bound], variables=['tmp2m', 'dpt2m', 'gust10m'])
                 temp = ds['tmp2m']
                 dwpt = ds['dpt2m']
                 temp = temp - 273.15
@@ -10841,41 +10842,41 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax1 = fig.add_subplot(gs[row1:row2, col1:col2], projection=ccrs.PlateCarree())
     ax1.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=8)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=8)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -10895,45 +10896,45 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax2 = fig.add_subplot(gs[row3:row4, col3:col4], projection=ccrs.PlateCarree())
     ax2.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax2.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax2, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -10964,45 +10965,45 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
 
     ax3 = fig.add_subplot(gs[row5:row6, col5:col6], projection=ccrs.PlateCarree())
     ax3.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax3.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax3, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
@@ -11030,7 +11031,7 @@ def plot_dry_and_gusty_areas(low_rh_threshold=15, high_wind_threshold=25, wester
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA DRY & GUSTY AREAS', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA DRY & GUSTY AREAS')
 
-def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, aspect=30, tick=9):
+def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity overlayed with METAR Observations. 
@@ -11368,7 +11369,7 @@ def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None
     
     if data == None:
         try:
-            data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask)
+            data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             rtma_data = data[0]
             rtma_time = data[1]
             sfc_data = data[2]
@@ -11403,7 +11404,7 @@ def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None
         except Exception as f:
             try:
                 print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
-                data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask)
+                data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 rtma_data = data[0]
                 rtma_time = data[1]
                 sfc_data = data[2]
@@ -11434,15 +11435,15 @@ def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None
     
     datacrs = ccrs.PlateCarree()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.relative_humidity_colormap()
 
@@ -11453,45 +11454,45 @@ def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs = ax.contourf(lon, lat, rtma_data, 
+    cs = rendering.contourf(ax, lon, lat, rtma_data, render_mode=render_mode, 
                      transform=datacrs, levels=contourf, cmap=cmap, alpha=alpha)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -11524,7 +11525,7 @@ def plot_relative_humidity_with_metar_obs(western_bound=None, eastern_bound=None
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA RH & METAR', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA RH & METAR')
 
-def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, aspect=30, tick=9):
+def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Low Relative Humidity Areas overlayed with METAR Observations. 
@@ -11875,7 +11876,7 @@ def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound
     
     if data == None:
         try:
-            data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask)
+            data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             rtma_data = data[0]
             rtma_time = data[1]
             sfc_data = data[2]
@@ -11910,7 +11911,7 @@ def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound
         except Exception as f:
             try:
                 print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
-                data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask)
+                data = RTMA_CONUS.RTMA_Relative_Humidity_Synced_With_METAR(utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 rtma_data = data[0]
                 rtma_time = data[1]
                 sfc_data = data[2]
@@ -11939,15 +11940,15 @@ def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound
     
     datacrs = ccrs.PlateCarree()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.low_relative_humidity_colormap()
 
@@ -11958,45 +11959,45 @@ def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs = ax.contourf(lon, lat, rtma_data, 
+    cs = rendering.contourf(ax, lon, lat, rtma_data, render_mode=render_mode, 
                      transform=datacrs, levels=contourf, cmap=cmap, alpha=alpha)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -12029,7 +12030,7 @@ def plot_low_relative_humidity_with_metar_obs(low_rh_threshold=15, western_bound
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA LOW RH & METAR', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA LOW RH & METAR')
 
-def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, u_component=None, v_component=None, sample_point_type='barbs', aspect=30, tick=9, decimate=None):
+def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, u_component=None, v_component=None, sample_point_type='barbs', aspect=30, tick=9, decimate=None, render_mode=None):
 
     r'''
         This function does the following:
@@ -12371,7 +12372,7 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
     
     if data == None:
         try:
-            data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_Analysis_height_above_ground', utc_time, mask)
+            data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_Analysis_height_above_ground', utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             rtma_data = data[0]
             rtma_time = data[1]
             sfc_data = data[2]
@@ -12384,8 +12385,8 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
             lat = rtma_data['latitude']
             lon = rtma_data['longitude']
             rtma_data = rtma_data * 2.23694
-            u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground')
-            v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground')
+            u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
+            v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             u = u * 2.23694
             v = v * 2.23694
             
@@ -12417,7 +12418,7 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
         except Exception as f:
             try:
                 print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
-                data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_Analysis_height_above_ground', utc_time, mask)
+                data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_Analysis_height_above_ground', utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 rtma_data = data[0] 
                 rtma_time = data[1]
                 sfc_data = data[2]
@@ -12430,8 +12431,8 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
                 lat = rtma_data['latitude']
                 lon = rtma_data['longitude']
                 rtma_data = rtma_data * 2.23694
-                u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground')
-                v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground')
+                u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
+                v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 u = u * 2.23694
                 v = v * 2.23694
                 
@@ -12453,15 +12454,15 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
     
     datacrs = ccrs.PlateCarree()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_colormap()
 
@@ -12472,41 +12473,41 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -12519,7 +12520,7 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
     df_u = u.to_dataframe()
     df_v = v.to_dataframe()
 
-    cs = ax.contourf(lon, lat, rtma_data, 
+    cs = rendering.contourf(ax, lon, lat, rtma_data, render_mode=render_mode, 
                      transform=datacrs, levels=contourf, cmap=cmap, alpha=alpha, zorder=4, extend='max')
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -12561,7 +12562,7 @@ def plot_wind_speed_with_observed_winds(western_bound=None, eastern_bound=None,
     path, gif_path = file_functions.check_file_paths(state, gacc_region, 'RTMA WIND SPEED & OBS', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA WIND SPEED & OBS')
 
-def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, sample_point_type='barbs', aspect=30, tick=9, decimate=None):
+def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, state='us', gacc_region=None, colorbar_pad=0.02, metar_mask=None, metar_fontsize=10, sample_point_type='barbs', aspect=30, tick=9, decimate=None, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Wind Gust overlayed with RTMA Winds & METAR Observed Winds. 
@@ -12902,7 +12903,7 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
     
     if data == None:
         try:
-            data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_gust_Analysis_height_above_ground', utc_time, mask)
+            data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_gust_Analysis_height_above_ground', utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             rtma_data = data[0]
             rtma_time = data[1]
             sfc_data = data[2]
@@ -12915,8 +12916,8 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
             lat = rtma_data['latitude']
             lon = rtma_data['longitude']
             rtma_data = rtma_data * 2.23694
-            u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground')
-            v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground')
+            u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
+            v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
             u = u * 2.23694
             v = v * 2.23694
             
@@ -12948,7 +12949,7 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
         except Exception as f:
             try:
                 print("There was a problem with the data passed in by the user.\nNo worries! FireWxPy will now try downloading and unpacking the data for you!")
-                data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_gust_Analysis_height_above_ground', utc_time, mask)
+                data = RTMA_CONUS.RTMA_Synced_With_METAR('Wind_speed_gust_Analysis_height_above_ground', utc_time, mask, extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 rtma_data = data[0] 
                 rtma_time = data[1]
                 sfc_data = data[2]
@@ -12961,8 +12962,8 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
                 lat = rtma_data['latitude']
                 lon = rtma_data['longitude']
                 rtma_data = rtma_data * 2.23694
-                u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground')
-                v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground')
+                u, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'u-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
+                v, t = RTMA_CONUS.get_current_rtma_data(utc_time, 'v-component_of_wind_Analysis_height_above_ground', extent=[western_bound, eastern_bound, southern_bound, northern_bound])
                 u = u * 2.23694
                 v = v * 2.23694
                 
@@ -12984,15 +12985,15 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
     
     datacrs = ccrs.PlateCarree()
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     cmap = colormaps.wind_speed_colormap()
 
@@ -13003,41 +13004,41 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -13050,7 +13051,7 @@ def plot_wind_gust_with_observed_winds(western_bound=None, eastern_bound=None, s
     df_u = u.to_dataframe()
     df_v = v.to_dataframe()
 
-    cs = ax.contourf(lon, lat, rtma_data, 
+    cs = rendering.contourf(ax, lon, lat, rtma_data, render_mode=render_mode, 
                      transform=datacrs, levels=contourf, cmap=cmap, alpha=alpha, zorder=4, extend='max')
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
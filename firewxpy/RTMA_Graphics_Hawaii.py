@@ -12,6 +12,7 @@ import pandas as pd
 import matplotlib.gridspec as gridspec
 import firewxpy.settings as settings
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
 import firewxpy.dims as dims
 import warnings
 warnings.filterwarnings('ignore')
@@ -29,7 +30,7 @@ mpl.rcParams['font.weight'] = 'bold'
 
 mpl.rcParams['font.weight'] = 'bold'
 
-def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity. 
@@ -366,41 +367,41 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -412,7 +413,7 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -443,7 +444,7 @@ def plot_relative_humidity(color_table_shrink=1, title_fontsize=12, subplot_titl
     file_functions.update_images(fig, path, gif_path, 'RTMA RH')
 
 
-def plot_low_and_high_relative_humidity(low_rh_threshold=45, high_rh_threshold=80, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None):
+def plot_low_and_high_relative_humidity(low_rh_threshold=45, high_rh_threshold=80, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, x1=None, x2=None, y=None, x_size=None, colorbar_fontsize=None, labels_low_increment=None, labels_high_increment=None, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity filtered for areas of low RH and high RH. 
@@ -812,41 +813,41 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=45, high_rh_threshold=8
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -868,10 +869,10 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=45, high_rh_threshold=8
     x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size = x1, y, x_size, 0.02
     x_cbar2_0, y_cbar2_0, x_cbar2_size, y_cbar2_size = x2, y, x_size, 0.02
     
-    cs_low = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_low = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_low, cmap=cmap_low, alpha=alpha, zorder=2)
 
-    cs_high = ax.contourf(lon, lat, rtma_data[0, :, :], 
+    cs_high = rendering.contourf(ax, lon, lat, rtma_data[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf_high, cmap=cmap_high, alpha=alpha, zorder=2)
 
     ax_cbar = plt.gcf().add_axes([x_cbar_0, y_cbar_0, x_cbar_size, y_cbar_size])
@@ -909,7 +910,7 @@ def plot_low_and_high_relative_humidity(low_rh_threshold=45, high_rh_threshold=8
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA LOW AND HIGH RH', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA LOW AND HIGH RH')
 
-def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Relative Humidity. 
@@ -1295,41 +1296,41 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1341,7 +1342,7 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -1372,7 +1373,7 @@ def plot_24_hour_relative_humidity_comparison(color_table_shrink=1, title_fontsi
     file_functions.update_images(fig, path, gif_path, '24HR RTMA RH COMPARISON')
 
 
-def plot_temperature(colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature(colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature. 
@@ -1707,41 +1708,41 @@ def plot_temperature(colorbar_fontsize=8, show_rivers=True, reference_system='St
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -1753,7 +1754,7 @@ def plot_temperature(colorbar_fontsize=8, show_rivers=True, reference_system='St
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -1784,7 +1785,7 @@ def plot_temperature(colorbar_fontsize=8, show_rivers=True, reference_system='St
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE')
 
 
-def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Temperature Advection. 
@@ -2116,41 +2117,41 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2172,7 +2173,7 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2198,7 +2199,7 @@ def plot_temperature_advection(color_table_shrink=1, title_fontsize=12, subplot_
     file_functions.update_images(fig, path, gif_path, 'RTMA TEMPERATURE ADVECTION')
 
 
-def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point Advection. 
@@ -2529,41 +2530,41 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -2585,7 +2586,7 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -2610,7 +2611,7 @@ def plot_dew_point_advection(color_table_shrink=1, title_fontsize=12, subplot_ti
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT ADVECTION')
 
 
-def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Relative Humidity Advection. 
@@ -2950,41 +2951,41 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3006,7 +3007,7 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
 
     advection = advection * 3600
 
-    cs = ax.contourf(lon, lat, advection[:, :], 
+    cs = rendering.contourf(ax, lon, lat, advection[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3029,7 +3030,7 @@ def plot_relative_humidity_advection(color_table_shrink=1, title_fontsize=12, su
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA RH ADVECTION', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA RH ADVECTION')
 
-def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Frost/Freeze Areas (RTMA Temperature <= 32F). 
@@ -3354,41 +3355,41 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3400,7 +3401,7 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='min', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3430,7 +3431,7 @@ def plot_frost_freeze(color_table_shrink=1, title_fontsize=12, subplot_title_fon
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA FROST FREEZE', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA FROST FREEZE')
 
-def plot_extreme_heat(temperature_threshold=85, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_extreme_heat(temperature_threshold=85, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Extreme Heat. 
@@ -3761,41 +3762,41 @@ def plot_extreme_heat(temperature_threshold=85, color_table_shrink=1, title_font
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -3807,7 +3808,7 @@ def plot_extreme_heat(temperature_threshold=85, color_table_shrink=1, title_font
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap='hot_r', alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -3837,7 +3838,7 @@ def plot_extreme_heat(temperature_threshold=85, color_table_shrink=1, title_font
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA EXTREME HEAT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA EXTREME HEAT')
 
-def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Temperature. 
@@ -4199,41 +4200,41 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4245,7 +4246,7 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -4275,7 +4276,7 @@ def plot_24_hour_temperature_comparison(color_table_shrink=1, title_fontsize=12,
     path, gif_path = file_functions.check_file_paths(state, None, '24HR RTMA TEMPERATURE COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TEMPERATURE COMPARISON')
 
-def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dew Point. 
@@ -4605,41 +4606,41 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -4651,7 +4652,7 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, temp[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, temp[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -4681,7 +4682,7 @@ def plot_dew_point(color_table_shrink=1, title_fontsize=12, subplot_title_fontsi
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA DEW POINT', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA DEW POINT')
 
-def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Dew Point. 
@@ -5042,41 +5043,41 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5088,7 +5089,7 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -5118,7 +5119,7 @@ def plot_24_hour_dew_point_comparison(color_table_shrink=1, title_fontsize=12, s
     path, gif_path = file_functions.check_file_paths(state, None, '24HR RTMA DEW POINT COMPARISON', reference_system)
     file_functions.update_images(fig, path, gif_path, '24HR RTMA DEW POINT COMPARISON')
 
-def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Total Cloud Cover. 
@@ -5446,41 +5447,41 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5492,7 +5493,7 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, tcdcclm[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, tcdcclm[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -5522,7 +5523,7 @@ def plot_total_cloud_cover(color_table_shrink=1, title_fontsize=12, subplot_titl
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA TOTAL CLOUD COVER', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA TOTAL CLOUD COVER')
 
-def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Total Cloud Cover. 
@@ -5878,41 +5879,41 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -5924,7 +5925,7 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -5955,7 +5956,7 @@ def plot_24_hour_total_cloud_cover_comparison(color_table_shrink=1, title_fontsi
     file_functions.update_images(fig, path, gif_path, '24HR RTMA TOTAL CLOUD COVER COMPARISON')
 
 
-def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Wind Speed. 
@@ -6279,41 +6280,41 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6325,7 +6326,7 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -6355,7 +6356,7 @@ def plot_wind_speed(color_table_shrink=1, title_fontsize=12, subplot_title_fonts
     path, gif_path = file_functions.check_file_paths(state, None, 'RTMA WIND SPEED', reference_system)
     file_functions.update_images(fig, path, gif_path, 'RTMA WIND SPEED')
 
-def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9):
+def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed. 
@@ -6717,41 +6718,41 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -6763,7 +6764,7 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     if sp_font_default == False:
@@ -6794,7 +6795,7 @@ def plot_24_hour_wind_speed_comparison(color_table_shrink=1, title_fontsize=12,
     file_functions.update_images(fig, path, gif_path, '24HR RTMA WIND SPEED COMPARISON')
 
 
-def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, time=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=7, barb_linewidth=1, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) for Wind Speed & Direction. 
@@ -7152,41 +7153,41 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -7204,7 +7205,7 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, ws[0, :, :], 
+    cs = rendering.contourf(ax, lon, lat, ws[0, :, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar = fig.colorbar(cs, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=labels)
@@ -7234,7 +7235,7 @@ def plot_wind_speed_and_direction(color_table_shrink=1, title_fontsize=12, subpl
     path, gif_path = file_functions.check_file_paths(state, None, fname, reference_system)
     file_functions.update_images(fig, path, gif_path, fname)
 
-def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9):
+def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, data=None, data_24=None, time=None, time_24=None, colorbar_pad=0.02, barbs_or_quivers='barbs', barb_quiver_alpha=1, barb_quiver_fontsize=6, barb_linewidth=0.5, quiver_linewidth=0.5, aspect=30, tick=9, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) 24-Hour Comparison for Wind Speed & Direction. 
@@ -7633,41 +7634,41 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
 
     ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
     ax.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=3)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
@@ -7685,7 +7686,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
 
     ax.text(signature_x_position, signature_y_position, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nReference System: "+reference_system+"\nData Source: NOAA/NCEP/NOMADS\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", transform=ax.transAxes, fontsize=signature_fontsize, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)
 
-    cs = ax.contourf(lon, lat, diff[:, :], 
+    cs = rendering.contourf(ax, lon, lat, diff[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=contourf, cmap=cmap, alpha=alpha, extend='both', zorder=2)
 
     decimate = scaling.get_nomads_decimation(western_bound, eastern_bound, southern_bound, northern_bound, True)
@@ -7728,7 +7729,7 @@ def plot_24_hour_wind_speed_and_direction_comparison(color_table_shrink=1, title
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, tick=9, aspect=30):
+def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, sample_point_type='barbs', barb_quiver_linewidth=1, barb_fontsize=10, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dry and Windy Areas along with the components. 
@@ -8125,41 +8126,41 @@ def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax1 = fig.add_subplot(gs[row1:row2, col1:col2], projection=ccrs.PlateCarree())
     ax1.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=8)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=8)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -8179,45 +8180,45 @@ def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax2 = fig.add_subplot(gs[row3:row4, col3:col4], projection=ccrs.PlateCarree())
     ax2.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax2.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax2, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -8249,45 +8250,45 @@ def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax3 = fig.add_subplot(gs[row5:row6, col5:col6], projection=ccrs.PlateCarree())
     ax3.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax3.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax3, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
@@ -8342,7 +8343,7 @@ def plot_dry_and_windy_areas(low_rh_threshold=45, high_wind_threshold=20, color_
     file_functions.update_images(fig, path, gif_path, fname)
 
 
-def plot_dry_and_gusty_areas(low_rh_threshold=45, high_wind_threshold=20, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, tick=9, aspect=30):
+def plot_dry_and_gusty_areas(low_rh_threshold=45, high_wind_threshold=20, color_table_shrink=1, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', show_sample_points=True, sample_point_fontsize=8, alpha=0.5, data=None, time=None, colorbar_pad=0.02, tick=9, aspect=30, render_mode=None):
 
     r'''
         This function plots the latest available Real Time Mesoscale Analysis (RTMA) Dry and Gusty Areas along with the components. 
@@ -8729,41 +8730,41 @@ def plot_dry_and_gusty_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax1 = fig.add_subplot(gs[row1:row2, col1:col2], projection=ccrs.PlateCarree())
     ax1.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=8)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=4)
+    rendering.add_feature(ax1, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=8)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=4)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax1.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax1.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax1.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax1, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
     
@@ -8783,45 +8784,45 @@ def plot_dry_and_gusty_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax2 = fig.add_subplot(gs[row3:row4, col3:col4], projection=ccrs.PlateCarree())
     ax2.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax2.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax2.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax2.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax2.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax2, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs1 = ax2.contourf(lons, lats, rtma_rh[:, :], 
+    cs1 = rendering.contourf(ax2, lons, lats, rtma_rh[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=rh_contourf, cmap=low_rh_cmap, alpha=alpha)
 
     cbar1 = fig.colorbar(cs1, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=rh_labels)
@@ -8852,45 +8853,45 @@ def plot_dry_and_gusty_areas(low_rh_threshold=45, high_wind_threshold=20, color_
 
     ax3 = fig.add_subplot(gs[row5:row6, col5:col6], projection=ccrs.PlateCarree())
     ax3.set_extent((western_bound, eastern_bound, southern_bound, northern_bound), crs=ccrs.PlateCarree())
-    ax3.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=1)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=1)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=4)
     else:
         pass
 
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
     if show_cwa_borders == True:
-        ax3.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
     else:
         pass
     if show_nws_firewx_zones == True:
-        ax3.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
     else:
         pass
     if show_nws_public_zones == True:
-        ax3.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+        rendering.add_feature(ax3, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
     else:
         pass
 
-    cs2 = ax3.contourf(lons, lats, rtma_wind[:, :], 
+    cs2 = rendering.contourf(ax3, lons, lats, rtma_wind[:, :], render_mode=render_mode, 
                      transform=ccrs.PlateCarree(), levels=wind_speed_contourf, cmap=wind_cmap, alpha=alpha, extend='max', zorder=2)
 
     cbar2 = fig.colorbar(cs2, shrink=color_table_shrink, pad=colorbar_pad, location='bottom', aspect=aspect, ticks=wind_labels)
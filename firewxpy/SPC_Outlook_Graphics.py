@@ -24,6 +24,7 @@ import firewxpy.parsers as parsers
 import firewxpy.geometry as geometry
 import firewxpy.colormaps as colormaps
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
 import firewxpy.settings as settings
 import firewxpy.dims as dims
 import warnings
@@ -37,7 +38,7 @@ from firewxpy.data_access import NDFD_CONUS_Hawaii
 
 mpl.rcParams['font.weight'] = 'bold'
 
-def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, directory_name='CONUS', file_path=None, data_array=None, count_short=None, count_extended=None, state='us', gacc_region=None, cwa=None, aspect=30, colorbar_pad=0.02):
+def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, directory_name='CONUS', file_path=None, data_array=None, count_short=None, count_extended=None, state='us', gacc_region=None, cwa=None, aspect=30, colorbar_pad=0.02, render_mode=None):
 
     r'''
         This function plots the latest available Storm Prediction Center Critical Fire Weather Forecast. 
@@ -366,15 +367,15 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     else:
         pass
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     directory_name = settings.check_NDFD_directory_name(directory_name)
 
@@ -446,25 +447,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
 
     ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
     ax1.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -472,7 +473,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs1 = ax1.contourf(lons_1, lats_1, grb_1_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs1 = rendering.contourf(ax1, lons_1, lats_1, grb_1_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar1 = fig1.colorbar(cs1, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar1.set_ticks([])
@@ -487,25 +488,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
     ax2.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -513,7 +514,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
         
     ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs2 = ax2.contourf(lons_2, lats_2, grb_2_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs2 = rendering.contourf(ax2, lons_2, lats_2, grb_2_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar2 = fig2.colorbar(cs2, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar2.set_ticks([])
@@ -528,25 +529,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
 
     ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
     ax3.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -554,7 +555,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs3 = ax3.contourf(lons_3, lats_3, grb_3_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs3 = rendering.contourf(ax3, lons_3, lats_3, grb_3_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar3 = fig3.colorbar(cs3, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar3.set_ticks([])
@@ -569,25 +570,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
 
     ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
     ax4.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax4, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax4, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax4, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax4, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax4, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax4, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -595,7 +596,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs4 = ax4.contourf(lons_4, lats_4, grb_4_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs4 = rendering.contourf(ax4, lons_4, lats_4, grb_4_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar4 = fig4.colorbar(cs4, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar4.set_ticks([])
@@ -610,25 +611,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
 
     ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
     ax5.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax5, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax5, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax5, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax5, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax5, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax5, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -636,7 +637,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs5 = ax5.contourf(lons_5, lats_5, grb_5_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs5 = rendering.contourf(ax5, lons_5, lats_5, grb_5_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar5 = fig5.colorbar(cs5, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar5.set_ticks([])
@@ -651,25 +652,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
     ax6.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax6, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax6, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax6, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax6, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax6, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax6, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax6, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax6, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -677,7 +678,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     
     ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs6 = ax6.contourf(lons_6, lats_6, grb_6_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs6 = rendering.contourf(ax6, lons_6, lats_6, grb_6_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar6 = fig6.colorbar(cs6, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar6.set_ticks([])
@@ -694,25 +695,25 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
 
         ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
         ax7.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-        ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+        rendering.add_feature(ax7, cfeature.LAND, color='beige', zorder=1)
+        rendering.add_feature(ax7, cfeature.OCEAN, color='lightcyan', zorder=3)
+        rendering.add_feature(ax7, cfeature.LAKES, color='lightcyan', zorder=3)
         if show_rivers == True:
-            ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+            rendering.add_feature(ax7, cfeature.RIVERS, color='lightcyan', zorder=3)
         if show_gacc_borders == True:
-            ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+            rendering.add_feature(ax7, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
         else:
             pass
         if show_psa_borders == True:
-            ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+            rendering.add_feature(ax7, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
         else:
             pass
         if show_county_borders == True:
-            ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+            rendering.add_feature(ax7, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
         else:
             pass
         if show_state_borders == True:
-            ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+            rendering.add_feature(ax7, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
         else:
             pass
 
@@ -720,7 +721,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
         
         ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
             
-        cs7 = ax7.contourf(lons_7, lats_7, grb_7_vals, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
+        cs7 = rendering.contourf(ax7, lons_7, lats_7, grb_7_vals, render_mode=render_mode, levels=np.arange(4, 12, 2), cmap=cmap, transform=datacrs, zorder=2)
 
         cbar7 = fig7.colorbar(cs7, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
         cbar7.set_ticks([])
@@ -749,7 +750,7 @@ def plot_critical_fire_weather_risk_outlook(western_bound=None, eastern_bound=No
     file_functions.update_images(figs, path, gif_path, 'SPC CRITICAL FIRE WEATHER OUTLOOK')
 
 
-def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, directory_name='CONUS', file_path=None, data_array=None, count_short=None, count_extended=None, state='us', gacc_region=None, cwa=None, aspect=30, colorbar_pad=0.02):
+def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_bound=None, northern_bound=None, fig_x_length=None, fig_y_length=None, signature_x_position=None, signature_y_position=None, color_table_shrink=0.7, title_fontsize=12, subplot_title_fontsize=10, signature_fontsize=10, colorbar_fontsize=8, show_rivers=True, reference_system='States & Counties', show_state_borders=False, show_county_borders=False, show_gacc_borders=False, show_psa_borders=False, show_cwa_borders=False, show_nws_firewx_zones=False, show_nws_public_zones=False, state_border_linewidth=2, county_border_linewidth=1, gacc_border_linewidth=2, psa_border_linewidth=1, cwa_border_linewidth=1, nws_firewx_zones_linewidth=0.5, nws_public_zones_linewidth=0.5, state_border_linestyle='-', county_border_linestyle='-', gacc_border_linestyle='-', psa_border_linestyle='-', cwa_border_linestyle='-', nws_firewx_zones_linestyle='-', nws_public_zones_linestyle='-', psa_color='black', gacc_color='black', cwa_color='black', fwz_color='black', pz_color='black', alpha=0.5, directory_name='CONUS', file_path=None, data_array=None, count_short=None, count_extended=None, state='us', gacc_region=None, cwa=None, aspect=30, colorbar_pad=0.02, render_mode=None):
 
     r'''
         This function plots the latest available Storm Prediction Dry Lightning Forecast. 
@@ -1082,15 +1083,15 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     else:
         pass
 
-    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa')
+    PSAs = geometry.import_shapefiles(f"PSA Shapefiles/National_PSA_Current.shp", psa_color, 'psa', state=state, gacc_region=gacc_region)
     
-    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc')
+    GACC = geometry.import_shapefiles(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", gacc_color, 'gacc', state=state, gacc_region=gacc_region)
 
-    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa')
+    CWAs = geometry.import_shapefiles(f"NWS CWA Boundaries/w_05mr24.shp", cwa_color, 'cwa', state=state, gacc_region=gacc_region)
 
-    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz')
+    FWZs = geometry.import_shapefiles(f"NWS Fire Weather Zones/fz05mr24.shp", fwz_color, 'fwz', state=state, gacc_region=gacc_region)
 
-    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz')
+    PZs = geometry.import_shapefiles(f"NWS Public Zones/z_05mr24.shp", pz_color, 'pz', state=state, gacc_region=gacc_region)
 
     directory_name = settings.check_NDFD_directory_name(directory_name)
 
@@ -1159,25 +1160,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
     ax1 = fig1.add_subplot(1, 1, 1, projection=mapcrs)
     ax1.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax1.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax1.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax1.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax1, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax1, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax1, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax1.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax1, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax1.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax1, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax1.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax1.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax1, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax1.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax1, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1185,7 +1186,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax1.set_title('Start: '+ grb_1_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_1_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs1 = ax1.contourf(lons_1, lats_1, grb_1_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs1 = rendering.contourf(ax1, lons_1, lats_1, grb_1_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar1 = fig1.colorbar(cs1, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar1.set_ticks([])
@@ -1199,25 +1200,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
     ax2 = fig2.add_subplot(1, 1, 1, projection=mapcrs)
     ax2.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax2.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax2.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax2.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax2, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax2, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax2, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax2.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax2, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax2.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax2, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax2.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax2.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax2, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax2.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax2, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1225,7 +1226,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
         
     ax2.set_title('Start: '+ grb_2_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_2_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs2 = ax2.contourf(lons_2, lats_2, grb_2_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs2 = rendering.contourf(ax2, lons_2, lats_2, grb_2_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar2 = fig2.colorbar(cs2, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar2.set_ticks([])
@@ -1239,25 +1240,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
     ax3 = fig3.add_subplot(1, 1, 1, projection=mapcrs)
     ax3.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax3.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax3.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax3.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax3, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax3, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax3, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax3.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax3, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax3.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax3, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax3.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax3.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax3, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax3.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax3, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1265,7 +1266,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax3.set_title('Start: '+ grb_3_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_3_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs3 = ax3.contourf(lons_3, lats_3, grb_3_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs3 = rendering.contourf(ax3, lons_3, lats_3, grb_3_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar3 = fig3.colorbar(cs3, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar3.set_ticks([])
@@ -1279,25 +1280,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
     ax4 = fig4.add_subplot(1, 1, 1, projection=mapcrs)
     ax4.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax4.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax4.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax4.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax4, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax4, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax4, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax4.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax4, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax4.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax4, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax4.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax4.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax4, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax4.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax4, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1305,7 +1306,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax4.set_title('Start: '+ grb_4_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_4_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs4 = ax4.contourf(lons_4, lats_4, grb_4_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs4 = rendering.contourf(ax4, lons_4, lats_4, grb_4_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar4 = fig4.colorbar(cs4, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar4.set_ticks([])
@@ -1321,25 +1322,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax5 = fig5.add_subplot(1, 1, 1, projection=mapcrs)
     ax5.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax5.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax5.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax5.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax5, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax5, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax5, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax5.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax5, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax5.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax5, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax5.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax5.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax5, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax5.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax5, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1347,7 +1348,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax5.set_title('Start: '+ grb_5_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_5_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs5 = ax5.contourf(lons_5, lats_5, grb_5_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs5 = rendering.contourf(ax5, lons_5, lats_5, grb_5_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar5 = fig5.colorbar(cs5, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar5.set_ticks([])
@@ -1361,25 +1362,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
     ax6 = fig6.add_subplot(1, 1, 1, projection=mapcrs)
     ax6.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax6.add_feature(cfeature.LAND, color='beige', zorder=1)
-    ax6.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-    ax6.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+    rendering.add_feature(ax6, cfeature.LAND, color='beige', zorder=1)
+    rendering.add_feature(ax6, cfeature.OCEAN, color='lightcyan', zorder=3)
+    rendering.add_feature(ax6, cfeature.LAKES, color='lightcyan', zorder=3)
     if show_rivers == True:
-        ax6.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+        rendering.add_feature(ax6, cfeature.RIVERS, color='lightcyan', zorder=3)
     if show_gacc_borders == True:
-        ax6.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+        rendering.add_feature(ax6, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
     else:
         pass
     if show_psa_borders == True:
-        ax6.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+        rendering.add_feature(ax6, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
     else:
         pass
     if show_county_borders == True:
-        ax6.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+        rendering.add_feature(ax6, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
     else:
         pass
     if show_state_borders == True:
-        ax6.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+        rendering.add_feature(ax6, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
     else:
         pass
 
@@ -1387,7 +1388,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
     
     ax6.set_title('Start: '+ grb_6_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_6_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
         
-    cs6 = ax6.contourf(lons_6, lats_6, grb_6_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+    cs6 = rendering.contourf(ax6, lons_6, lats_6, grb_6_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
     cbar6 = fig6.colorbar(cs6, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
     cbar6.set_ticks([])
@@ -1403,25 +1404,25 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
 
         ax7 = fig7.add_subplot(1, 1, 1, projection=mapcrs)
         ax7.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-        ax7.add_feature(cfeature.LAND, color='beige', zorder=1)
-        ax7.add_feature(cfeature.OCEAN, color='lightcyan', zorder=3)
-        ax7.add_feature(cfeature.LAKES, color='lightcyan', zorder=3)
+        rendering.add_feature(ax7, cfeature.LAND, color='beige', zorder=1)
+        rendering.add_feature(ax7, cfeature.OCEAN, color='lightcyan', zorder=3)
+        rendering.add_feature(ax7, cfeature.LAKES, color='lightcyan', zorder=3)
         if show_rivers == True:
-            ax7.add_feature(cfeature.RIVERS, color='lightcyan', zorder=3)
+            rendering.add_feature(ax7, cfeature.RIVERS, color='lightcyan', zorder=3)
         if show_gacc_borders == True:
-            ax7.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+            rendering.add_feature(ax7, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
         else:
             pass
         if show_psa_borders == True:
-            ax7.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+            rendering.add_feature(ax7, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
         else:
             pass
         if show_county_borders == True:
-            ax7.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+            rendering.add_feature(ax7, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
         else:
             pass
         if show_state_borders == True:
-            ax7.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+            rendering.add_feature(ax7, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
         else:
             pass
 
@@ -1429,7 +1430,7 @@ def plot_dry_lightning_outlook(western_bound=None, eastern_bound=None, southern_
         
         ax7.set_title('Start: '+ grb_7_start.strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ grb_7_end.strftime('%a %m/%d %H:00 Local'), fontsize=subplot_title_fontsize, fontweight='bold', loc='right')
             
-        cs7 = ax7.contourf(lons_7, lats_7, grb_7_vals, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
+        cs7 = rendering.contourf(ax7, lons_7, lats_7, grb_7_vals, render_mode=render_mode, levels=np.arange(4, 10, 2), cmap=cmap, transform=datacrs, zorder=2)
 
         cbar7 = fig7.colorbar(cs7, location='bottom', shrink=color_table_shrink, pad=colorbar_pad)
         cbar7.set_ticks([])
@@ -1,30 +1,85 @@
-import firewxpy.RTMA_Graphics_CONUS as rtma_conus
-import firewxpy.RTMA_Graphics_Alaska as rtma_alaska
-import firewxpy.RTMA_Graphics_Hawaii as rtma_hawaii
+'''
+FireWxPy
 
-import firewxpy.SPC_Outlook_Graphics as spc
+The public names below are loaded lazily. Importing firewxpy does not import any of the plotting modules
+(or cartopy, metpy, pygrib, cfgrib and siphon). Each module is only imported the first time one of its
+public names is used (i.e. firewxpy.rtma_conus or from firewxpy import nws_temperature_forecast_conus).
 
-from firewxpy.standard import plot_creation_time
+ This file was written by Meteorologist Eric J. Drewitz
 
-from firewxpy.data_access import RTMA_CONUS, NDFD_CONUS_Hawaii, NDFD_Alaska, RTMA_Alaska, RTMA_Hawaii, model_data
+            (C) Meteorologist Eric J. Drewitz
+                        USDA/USFS
 
-from firewxpy.NWS_CONUS import temperature as nws_temperature_forecast_conus
-from firewxpy.NWS_CONUS import relative_humidity as nws_relative_humidity_forecast_conus
-from firewxpy.NWS_CONUS import dry_and_windy as nws_dry_and_windy_forecast_conus
+'''
 
-from firewxpy.NWS_Alaska import temperature as nws_temperature_forecast_alaska
-from firewxpy.NWS_Alaska import relative_humidity as nws_relative_humidity_forecast_alaska
-from firewxpy.NWS_Alaska import hot_dry_and_windy as nws_hot_dry_and_windy_alaska
+import importlib
 
-from firewxpy.NWS_Hawaii import temperature as nws_temperature_forecast_hawaii
-from firewxpy.NWS_Hawaii import relative_humidity as nws_relative_humidity_forecast_hawaii
+# Public name: (module, attribute). An attribute of None returns the module itself.
+_lazy_attributes = {
+    'rtma_conus': ('firewxpy.RTMA_Graphics_CONUS', None),
+    'rtma_alaska': ('firewxpy.RTMA_Graphics_Alaska', None),
+    'rtma_hawaii': ('firewxpy.RTMA_Graphics_Hawaii', None),
 
-from firewxpy.observations import graphical_daily_summary
+    'spc': ('firewxpy.SPC_Outlook_Graphics', None),
 
-from firewxpy.soundings import plot_observed_sounding, plot_observed_sounding_custom_date_time
+    'plot_creation_time': ('firewxpy.standard', 'plot_creation_time'),
 
-from firewxpy.dims import get_metar_mask
+    'RTMA_CONUS': ('firewxpy.data_access', 'RTMA_CONUS'),
+    'NDFD_CONUS_Hawaii': ('firewxpy.data_access', 'NDFD_CONUS_Hawaii'),
+    'NDFD_Alaska': ('firewxpy.data_access', 'NDFD_Alaska'),
+    'RTMA_Alaska': ('firewxpy.data_access', 'RTMA_Alaska'),
+    'RTMA_Hawaii': ('firewxpy.data_access', 'RTMA_Hawaii'),
+    'model_data': ('firewxpy.data_access', 'model_data'),
 
-from firewxpy.sawti import sawti
+    'nws_temperature_forecast_conus': ('firewxpy.NWS_CONUS', 'temperature'),
+    'nws_relative_humidity_forecast_conus': ('firewxpy.NWS_CONUS', 'relative_humidity'),
+    'nws_dry_and_windy_forecast_conus': ('firewxpy.NWS_CONUS', 'dry_and_windy'),
 
-from firewxpy.solar_information import plot_daily_solar_information
+    'nws_temperature_forecast_alaska': ('firewxpy.NWS_Alaska', 'temperature'),
+    'nws_relative_humidity_forecast_alaska': ('firewxpy.NWS_Alaska', 'relative_humidity'),
+    'nws_hot_dry_and_windy_alaska': ('firewxpy.NWS_Alaska', 'hot_dry_and_windy'),
+
+    'nws_temperature_forecast_hawaii': ('firewxpy.NWS_Hawaii', 'temperature'),
+    'nws_relative_humidity_forecast_hawaii': ('firewxpy.NWS_Hawaii', 'relative_humidity'),
+
+    'graphical_daily_summary': ('firewxpy.observations', 'graphical_daily_summary'),
+    'graphical_daily_summaries': ('firewxpy.observations', 'graphical_daily_summaries'),
+
+    'plot_observed_sounding': ('firewxpy.soundings', 'plot_observed_sounding'),
+    'plot_observed_sounding_custom_date_time': ('firewxpy.soundings', 'plot_observed_sounding_custom_date_time'),
+
+    'get_metar_mask': ('firewxpy.dims', 'get_metar_mask'),
+
+    'render_all_regions': ('firewxpy.rendering', 'render_all_regions'),
+
+    'sawti': ('firewxpy.sawti', 'sawti'),
+
+    'plot_daily_solar_information': ('firewxpy.solar_information', 'plot_daily_solar_information'),
+}
+
+__all__ = list(_lazy_attributes.keys())
+
+
+def __getattr__(name):
+
+    try:
+        module_name, attribute = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module 'firewxpy' has no attribute '{name}'")
+
+    module = importlib.import_module(module_name)
+
+    if attribute == None:
+        value = module
+    else:
+        value = getattr(module, attribute)
+
+    # Caches the value so __getattr__ is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+
+    return sorted(set(globals().keys()) | set(__all__))
@@ -163,6 +163,22 @@ class Thermodynamics:
         e_s = Thermodynamics.saturation_vapor_pressure(temperature)
         return (e / e_s) * 100
 
+
+    def relative_humidity_from_temperature_and_dewpoint_kelvin(temperature, dewpoint):
+
+        r'''
+        This function calculates the relative humidity (%) from temperature and dewpoint in Kelvin.
+        This function uses the same Bolton 1980 formula as saturation_vapor_pressure() without units and in float32
+        so a large grid (i.e. the RTMA) only needs a few float32 temporary arrays.
+
+        '''
+
+        temperature = temperature.astype('float32') - np.float32(273.15)
+        dewpoint = dewpoint.astype('float32') - np.float32(273.15)
+
+        # e / e_s with both exponents in one exp()
+        return np.exp(np.float32(17.67) * ((dewpoint / (dewpoint + np.float32(243.5))) - (temperature / (temperature + np.float32(243.5))))) * np.float32(100)
+
     def find_mixing_height(temperature, height):
         temperture = temperature
         height = height
@@ -27,13 +27,27 @@ import numpy as np
 import netCDF4
 import time as t
 import urllib.request
+import urllib.parse
+import importlib.util
 import os
 import sys
+import json
+import hashlib
+import shutil
+import threading
+import atexit
+import ftplib
+import asyncio
 import firewxpy.standard as standard
+import firewxpy.geometry as geometry
+import shapely.geometry as sgeom
 import warnings
 warnings.filterwarnings('ignore')
 
 from ftplib import FTP
+from concurrent.futures import ThreadPoolExecutor
+from shapely.prepared import prep
+from scipy.spatial import cKDTree
 from siphon.catalog import TDSCatalog
 from metpy.cbook import get_test_data
 from io import StringIO
@@ -41,6 +55,7 @@ from metpy.io import parse_metar_file
 from metpy.units import units, pandas_dataframe_to_unit_arrays
 from dateutil import tz
 from firewxpy.settings import coords_for_forecast_model_data
+from firewxpy.utilities import file_functions
 
 try:
     from datetime import datetime, timedelta, UTC
@@ -849,64 +864,19 @@ class RTMA_Alaska:
     
         '''
         
-        times = []
-        for i in range(0, 5):
-            time = pd.to_datetime(current_time - timedelta(hours=i))
-            times.append(time)
-    
-        url_0 = 'http://nomads.ncep.noaa.gov:80/dods/akrtma/akrtma'+times[0].strftime('%Y%m%d')+'/akrtma_anl_'+times[0].strftime('%H')+'z'
-        url_1 = 'http://nomads.ncep.noaa.gov:80/dods/akrtma/akrtma'+times[1].strftime('%Y%m%d')+'/akrtma_anl_'+times[1].strftime('%H')+'z'
-        url_2 = 'http://nomads.ncep.noaa.gov:80/dods/akrtma/akrtma'+times[2].strftime('%Y%m%d')+'/akrtma_anl_'+times[2].strftime('%H')+'z'
-        url_3 = 'http://nomads.ncep.noaa.gov:80/dods/akrtma/akrtma'+times[3].strftime('%Y%m%d')+'/akrtma_anl_'+times[3].strftime('%H')+'z'
-        url_4 = 'http://nomads.ncep.noaa.gov:80/dods/akrtma/akrtma'+times[4].strftime('%Y%m%d')+'/akrtma_anl_'+times[4].strftime('%H')+'z'
-    
-        try:
-            ds = xr.open_dataset(url_0, engine='netcdf4').sel(lon=slice(360-180, 360-120, 2), lat=slice(50, 72, 2)) 
-            print("Data was successfully retrieved for " + times[0].strftime('%m/%d/%Y %HZ'))
-            strtime = times[0]
-            return ds, strtime
-            
-        except Exception as a:
+        for analysis_time in rtma_analysis_times('akrtma', current_time, lambda time: nomads_rtma_url('akrtma', time) + '.dds'):
             try:
-                print("There is no data for " + times[0].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[1].strftime('%m/%d/%Y %HZ'))
-                ds = xr.open_dataset(url_1, engine='netcdf4').sel(lon=slice(360-180, 360-120, 2), lat=slice(50, 72, 2)) 
-                print("Data was successfully retrieved for " + times[1].strftime('%m/%d/%Y %HZ'))
-                strtime = times[1]
-                return ds, strtime
-                
-            except Exception as b:
-                    try:
-                        print("There is no data for " + times[1].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[2].strftime('%m/%d/%Y %HZ'))
-                        ds = xr.open_dataset(url_2, engine='netcdf4').sel(lon=slice(360-180, 360-120, 2), lat=slice(50, 72, 2)) 
-                        print("Data was successfully retrieved for " + times[2].strftime('%m/%d/%Y %HZ'))
-                        strtime = times[2]
-                        return ds, strtime
-                        
-                    except Exception as c:
-                        try:
-                            print("There is no data for " + times[2].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[3].strftime('%m/%d/%Y %HZ'))
-                            ds = xr.open_dataset(url_3, engine='netcdf4').sel(lon=slice(360-180, 360-120, 2), lat=slice(50, 72, 2)) 
-                            print("Data was successfully retrieved for " + times[3].strftime('%m/%d/%Y %HZ'))
-                            strtime = times[3]
-                            return ds, strtime
-                        except Exception as d:
-    
-                            try:
-                                print("There is no data for " + times[3].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[4].strftime('%m/%d/%Y %HZ'))
-                                ds = xr.open_dataset(url_4, engine='netcdf4').sel(lon=slice(360-180, 360-120, 2), lat=slice(50, 72, 2)) 
-                                print("Data was successfully retrieved for " + times[4].strftime('%m/%d/%Y %HZ'))
-                                strtime = times[4]
-                                return ds, strtime
-                                
-                            except Exception as e:
-                                print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
-    
-            
-        except Exception as f:
-            error = info.invalid_parameter_NOMADS_RTMA_Alaska()
-            print(error)
+                ds = xr.open_dataset(nomads_rtma_url('akrtma', analysis_time), engine='netcdf4')
+                print("Data was successfully retrieved for " + analysis_time.strftime('%m/%d/%Y %HZ'))
+                remember_rtma_analysis_time('akrtma', analysis_time)
+                return ds, analysis_time
 
+            except Exception as e:
+                print("There is no data for " + analysis_time.strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis.")
 
+        print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
+    
+    
     def get_RTMA_24_hour_comparison_datasets(current_time):
     
         r'''
@@ -1041,62 +1011,17 @@ class RTMA_Hawaii:
     
         '''
         
-        times = []
-        for i in range(0, 5):
-            time = pd.to_datetime(current_time - timedelta(hours=i))
-            times.append(time)
-    
-        url_0 = 'http://nomads.ncep.noaa.gov:80/dods/hirtma/hirtma'+times[0].strftime('%Y%m%d')+'/hirtma_anl_'+times[0].strftime('%H')+'z'
-        url_1 = 'http://nomads.ncep.noaa.gov:80/dods/hirtma/hirtma'+times[1].strftime('%Y%m%d')+'/hirtma_anl_'+times[1].strftime('%H')+'z'
-        url_2 = 'http://nomads.ncep.noaa.gov:80/dods/hirtma/hirtma'+times[2].strftime('%Y%m%d')+'/hirtma_anl_'+times[2].strftime('%H')+'z'
-        url_3 = 'http://nomads.ncep.noaa.gov:80/dods/hirtma/hirtma'+times[3].strftime('%Y%m%d')+'/hirtma_anl_'+times[3].strftime('%H')+'z'
-        url_4 = 'http://nomads.ncep.noaa.gov:80/dods/hirtma/hirtma'+times[4].strftime('%Y%m%d')+'/hirtma_anl_'+times[4].strftime('%H')+'z'
-    
-        try:
-            ds = xr.open_dataset(url_0, engine='netcdf4')
-            print("Data was successfully retrieved for " + times[0].strftime('%m/%d/%Y %HZ'))
-            strtime = times[0]
-            return ds, strtime
-            
-        except Exception as a:
+        for analysis_time in rtma_analysis_times('hirtma', current_time, lambda time: nomads_rtma_url('hirtma', time) + '.dds'):
             try:
-                print("There is no data for " + times[0].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[1].strftime('%m/%d/%Y %HZ'))
-                ds = xr.open_dataset(url_1, engine='netcdf4')
-                print("Data was successfully retrieved for " + times[1].strftime('%m/%d/%Y %HZ'))
-                strtime = times[1]
-                return ds, strtime
-                
-            except Exception as b:
-                    try:
-                        print("There is no data for " + times[1].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[2].strftime('%m/%d/%Y %HZ'))
-                        ds = xr.open_dataset(url_2, engine='netcdf4')
-                        print("Data was successfully retrieved for " + times[2].strftime('%m/%d/%Y %HZ'))
-                        strtime = times[2]
-                        return ds, strtime
-                        
-                    except Exception as c:
-                        try:
-                            print("There is no data for " + times[2].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[3].strftime('%m/%d/%Y %HZ'))
-                            ds = xr.open_dataset(url_3, engine='netcdf4')
-                            print("Data was successfully retrieved for " + times[3].strftime('%m/%d/%Y %HZ'))
-                            strtime = times[3]
-                            return ds, strtime
-                        except Exception as d:
-    
-                            try:
-                                print("There is no data for " + times[3].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[4].strftime('%m/%d/%Y %HZ'))
-                                ds = xr.open_dataset(url_4, engine='netcdf4')
-                                print("Data was successfully retrieved for " + times[4].strftime('%m/%d/%Y %HZ'))
-                                strtime = times[4]
-                                return ds, strtime
-                                
-                            except Exception as e:
-                                print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
-    
-            
-        except Exception as f:
-            error = info.invalid_parameter_NOMADS_RTMA_Alaska()
-            print(error)
+                ds = xr.open_dataset(nomads_rtma_url('hirtma', analysis_time), engine='netcdf4')
+                print("Data was successfully retrieved for " + analysis_time.strftime('%m/%d/%Y %HZ'))
+                remember_rtma_analysis_time('hirtma', analysis_time)
+                return ds, analysis_time
+
+            except Exception as e:
+                print("There is no data for " + analysis_time.strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis.")
+
+        print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
     
     
     def get_RTMA_24_hour_comparison_datasets(current_time):
@@ -1217,7 +1142,7 @@ class RTMA_CONUS:
 
     '''
 
-    def get_RTMA_dataset(current_time):
+    def get_RTMA_dataset(current_time, extent=None, variables=None):
     
         r'''
     
@@ -1227,71 +1152,32 @@ class RTMA_CONUS:
 
         Required Argument: 1) Current Time in UTC
 
+        Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                               Only the grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
+
+                            2) variables (List) - The names of the variables to download (i.e. ['tmp2m', 'dpt2m']). 
+                               Default is None (all variables). 
+
         Returns: 1) The latest 2.5km x 2.5km RTMA Dataset
 
                  2) The time corresponding to the dataset
     
         '''
         
-        times = []
-        for i in range(0, 5):
-            time = pd.to_datetime(current_time - timedelta(hours=i))
-            times.append(time)
-    
-        url_0 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[0].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[0].strftime('%H')+'z'
-        url_1 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[1].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[1].strftime('%H')+'z'
-        url_2 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[2].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[2].strftime('%H')+'z'
-        url_3 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[3].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[3].strftime('%H')+'z'
-        url_4 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[4].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[4].strftime('%H')+'z'
-    
-        try:
-            ds = xr.open_dataset(url_0, engine='netcdf4')
-            print("Data was successfully retrieved for " + times[0].strftime('%m/%d/%Y %HZ'))
-            strtime = times[0]
-            return ds, strtime
-            
-        except Exception as a:
+        for analysis_time in rtma_analysis_times('rtma2p5', current_time, lambda time: nomads_rtma_url('rtma2p5', time) + '.dds'):
             try:
-                print("There is no data for " + times[0].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[1].strftime('%m/%d/%Y %HZ'))
-                ds = xr.open_dataset(url_1, engine='netcdf4')
-                print("Data was successfully retrieved for " + times[1].strftime('%m/%d/%Y %HZ'))
-                strtime = times[1]
-                return ds, strtime
-                
-            except Exception as b:
-                    try:
-                        print("There is no data for " + times[1].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[2].strftime('%m/%d/%Y %HZ'))
-                        ds = xr.open_dataset(url_2, engine='netcdf4')
-                        print("Data was successfully retrieved for " + times[2].strftime('%m/%d/%Y %HZ'))
-                        strtime = times[2]
-                        return ds, strtime
-                        
-                    except Exception as c:
-                        try:
-                            print("There is no data for " + times[2].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[3].strftime('%m/%d/%Y %HZ'))
-                            ds = xr.open_dataset(url_3, engine='netcdf4')
-                            print("Data was successfully retrieved for " + times[3].strftime('%m/%d/%Y %HZ'))
-                            strtime = times[3]
-                            return ds, strtime
-                        except Exception as d:
-    
-                            try:
-                                print("There is no data for " + times[3].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[4].strftime('%m/%d/%Y %HZ'))
-                                ds = xr.open_dataset(url_4, engine='netcdf4')
-                                print("Data was successfully retrieved for " + times[4].strftime('%m/%d/%Y %HZ'))
-                                strtime = times[4]
-                                return ds, strtime
-                                
-                            except Exception as e:
-                                print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
-    
-            
-        except Exception as f:
-            error = info.invalid_parameter_NOMADS_RTMA_Alaska()
-            print(error)
+                ds = get_nomads_rtma_dataset('rtma2p5', analysis_time, extent, variables)
+                print("Data was successfully retrieved for " + analysis_time.strftime('%m/%d/%Y %HZ'))
+                remember_rtma_analysis_time('rtma2p5', analysis_time)
+                return ds, analysis_time
+
+            except Exception as e:
+                print("There is no data for " + analysis_time.strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis.")
+
+        print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
     
     
-    def get_RTMA_24_hour_comparison_datasets(current_time):
+    def get_RTMA_24_hour_comparison_datasets(current_time, extent=None, variables=None):
     
         r'''
         
@@ -1301,6 +1187,12 @@ class RTMA_CONUS:
 
         Required Argument: 1) Current Time in UTC
 
+        Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                               Only the grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
+
+                            2) variables (List) - The names of the variables to download (i.e. ['tmp2m', 'dpt2m']). 
+                               Default is None (all variables). 
+
         Returns: 1) The latest 2.5km x 2.5km RTMA Dataset
 
                  2) 1) The 2.5km x 2.5km RTMA Dataset from 24-Hours prior to the current dataset
@@ -1311,92 +1203,25 @@ class RTMA_CONUS:
     
         '''
         
-        times = []
-        new_times = []
-        for i in range(0, 5):
-            time = pd.to_datetime(current_time - timedelta(hours=i))
-            times.append(time)
-    
-        for t in times:
-            new_time = t - timedelta(hours=24)
-            new_times.append(new_time)
-    
-        url_0 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[0].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[0].strftime('%H')+'z'
-        url_1 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[1].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[1].strftime('%H')+'z'
-        url_2 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[2].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[2].strftime('%H')+'z'
-        url_3 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[3].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[3].strftime('%H')+'z'
-        url_4 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+times[4].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[4].strftime('%H')+'z'
-    
-        url_5 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+new_times[0].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[0].strftime('%H')+'z'
-        url_6 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+new_times[1].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[1].strftime('%H')+'z'
-        url_7 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+new_times[2].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[2].strftime('%H')+'z'
-        url_8 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+new_times[3].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[3].strftime('%H')+'z'
-        url_9 = 'http://nomads.ncep.noaa.gov:80/dods/rtma2p5/rtma2p5'+new_times[4].strftime('%Y%m%d')+'/rtma2p5_anl_'+times[4].strftime('%H')+'z'
-    
-        try:
-            ds = xr.open_dataset(url_0, engine='netcdf4')
-            print("Data was successfully retrieved for " + times[0].strftime('%m/%d/%Y %HZ'))
-            ds_24 = xr.open_dataset(url_5, engine='netcdf4')
-            print("Data was successfully retrieved for " + new_times[0].strftime('%m/%d/%Y %HZ'))
-            strtime = times[0]
-            strtime_24 = new_times[0]
-            return ds, ds_24, strtime, strtime_24
-            
-        except Exception as a:
+        for analysis_time in rtma_analysis_times('rtma2p5', current_time, lambda time: nomads_rtma_url('rtma2p5', time) + '.dds'):
+            analysis_time_24 = analysis_time - timedelta(hours=24)
             try:
-                print("There is no data for " + times[0].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[1].strftime('%m/%d/%Y %HZ'))
-                ds = xr.open_dataset(url_1, engine='netcdf4')
-                print("Data was successfully retrieved for " + times[1].strftime('%m/%d/%Y %HZ'))
-                ds_24 = xr.open_dataset(url_6, engine='netcdf4')
-                print("Data was successfully retrieved for " + new_times[1].strftime('%m/%d/%Y %HZ'))
-                strtime = times[1]
-                strtime_24 = new_times[1]
-                return ds, ds_24, strtime, strtime_24
-                
-            except Exception as b:
-                    try:
-                        print("There is no data for " + times[1].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[2].strftime('%m/%d/%Y %HZ'))
-                        ds = xr.open_dataset(url_2, engine='netcdf4')
-                        print("Data was successfully retrieved for " + times[2].strftime('%m/%d/%Y %HZ'))
-                        ds_24 = xr.open_dataset(url_7, engine='netcdf4')
-                        print("Data was successfully retrieved for " + new_times[2].strftime('%m/%d/%Y %HZ'))
-                        strtime = times[2]
-                        strtime_24 = new_times[2]
-                        return ds, ds_24, strtime, strtime_24
-                        
-                    except Exception as c:
-                        try:
-                            print("There is no data for " + times[2].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[3].strftime('%m/%d/%Y %HZ'))
-                            ds = xr.open_dataset(url_3, engine='netcdf4')
-                            print("Data was successfully retrieved for " + times[3].strftime('%m/%d/%Y %HZ'))
-                            ds_24 = xr.open_dataset(url_8, engine='netcdf4')
-                            print("Data was successfully retrieved for " + new_times[3].strftime('%m/%d/%Y %HZ'))
-                            strtime = times[3]
-                            strtime_24 = new_times[3]
-                            return ds, ds_24, strtime, strtime_24
-                            
-                        except Exception as d:
-    
-                            try:
-                                print("There is no data for " + times[3].strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis at " + times[4].strftime('%m/%d/%Y %HZ'))
-                                ds = xr.open_dataset(url_4, engine='netcdf4')
-                                print("Data was successfully retrieved for " + times[4].strftime('%m/%d/%Y %HZ'))
-                                ds_24 = xr.open_dataset(url_9, engine='netcdf4')
-                                print("Data was successfully retrieved for " + new_times[4].strftime('%m/%d/%Y %HZ'))
-                                strtime = times[4]
-                                strtime_24 = new_times[4]
-                                return ds, ds_24, strtime, strtime_24
-                                
-                            except Exception as e:
-                                print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
-    
-            
-        except Exception as f:
-            error = info.invalid_parameter_NOMADS_RTMA_Alaska()
-            print(error)
+                ds = get_nomads_rtma_dataset('rtma2p5', analysis_time, extent, variables)
+                print("Data was successfully retrieved for " + analysis_time.strftime('%m/%d/%Y %HZ'))
 
+                ds_24 = get_nomads_rtma_dataset('rtma2p5', analysis_time_24, extent, variables)
+                print("Data was successfully retrieved for " + analysis_time_24.strftime('%m/%d/%Y %HZ'))
 
-    def RTMA_Relative_Humidity_Synced_With_METAR(current_time, mask):
+                remember_rtma_analysis_time('rtma2p5', analysis_time)
+                return ds, ds_24, analysis_time, analysis_time_24
+
+            except Exception as e:
+                print("There is no data for " + analysis_time.strftime('%m/%d/%Y %HZ') + " and/or " + analysis_time_24.strftime('%m/%d/%Y %HZ') + " trying to retrieve data from the previous analysis.")
+
+        print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
+    
+    
+    def RTMA_Relative_Humidity_Synced_With_METAR(current_time, mask, extent=None):
     
         r'''
 
@@ -1408,6 +1233,9 @@ class RTMA_CONUS:
 
                            2) (Mask) Minimum radius allowed between points. If units are not provided, meters is assumed. 
 
+        Optional Argument: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                              Only the RTMA grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
+
         Returns: A list of all the aformentioned data:
 
                  RTMA RH Data = data[0]
@@ -1427,7 +1255,7 @@ class RTMA_CONUS:
     
         metar_time = latest_metar_time(current_time)
     
-        rtma_data, rtma_time = get_current_rtma_relative_humidity_data(current_time)
+        rtma_data, rtma_time = get_current_rtma_relative_humidity_data(current_time, extent)
     
         plot_projection = rtma_data.metpy.cartopy_crs
         
@@ -1448,7 +1276,7 @@ class RTMA_CONUS:
     
         return data
 
-    def RTMA_Synced_With_METAR(parameter, current_time, mask):
+    def RTMA_Synced_With_METAR(parameter, current_time, mask, extent=None):
     
         r'''
         This function is the recommended method to download the Real Time Mesoscale Analysis dataset with the METAR dataset as this function syncs the time of the
@@ -1459,6 +1287,8 @@ class RTMA_CONUS:
     
                 2) current_time (Datetime) - Current date and time in UTC. 
                 3) mask (Integer) - Distance in meters to mask METAR stations apart from eachother so stations don't clutter the plot. The higher the value, the less stations are displayed. 
+                4) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                                   Only the RTMA grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
         
         Returns: 1) rtma_data - The latest avaiable Real Time Mesoscale Analysis dataset
                  2) rtma_time - The time of the latest avaiable Real Time Mesoscale Analysis dataset
@@ -1477,7 +1307,7 @@ class RTMA_CONUS:
     
         metar_time = latest_metar_time(current_time)
     
-        rtma_data, rtma_time = RTMA_CONUS.get_current_rtma_data(current_time, parameter)
+        rtma_data, rtma_time = RTMA_CONUS.get_current_rtma_data(current_time, parameter, extent)
     
         plot_projection = rtma_data.metpy.cartopy_crs
         
@@ -1498,7 +1328,7 @@ class RTMA_CONUS:
         return data
 
 
-    def get_current_rtma_data(current_time, parameter):
+    def get_current_rtma_data(current_time, parameter, extent=None):
     
         r"""
         This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis for any available parameter. 
@@ -1507,266 +1337,34 @@ class RTMA_CONUS:
                1) current_time (Datetime) - Current time in UTC.
                2) parameter (String) - The weather parameter the user wishes to download. 
                                        To find the full list of parameters, visit: https://thredds.ucar.edu/thredds/dodsC/grib/NCEP/RTMA/CONUS_2p5km/Best.html
+               3) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                                  Only the grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
     
         Returns: 1) If there are zero errors, the latest dataset and the time of the dataset for the requested parameter will be returned. 
                  2) If there is an error, an error message is returned. 
     
         """
     
-        times = []
-    
-        for i in range(0,5):
-            new_time = current_time - timedelta(hours=i)
-            times.append(new_time)
-    
-        try:
-            main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-            main_server_status = main_server_response.status_code
-        except Exception as a:
-            pass
-            
-        try:
-            first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-            first_backup_server_status = first_backup_server_response.status_code
-        except Exception as b:
-            pass
-         
-        try:
-            second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-            second_backup_server_status = second_backup_server_response.status_code
-        except Exception as c:
-            pass
-    
-        if main_server_status == 200:
-            print("Main UCAR THREDDS Server is online. Connecting!")
+        server = select_thredds_server()
+
+        if server == None:
+            return
+
+        domain = server + '/RTMA_CONUS_2p5km'
+
+        for analysis_time in rtma_analysis_times(domain, current_time, lambda time: thredds_rtma_catalog_url(server, time), hours=4):
             try:
-                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
+                rtma_parameter = get_thredds_rtma_parameter(server, analysis_time, parameter, extent)
     
-                print("Data retrieval for " + current_time.strftime('%m/%d/%Y %H00 UTC') + " is successful")
+                print("Data retrieval for " + analysis_time.strftime('%m/%d/%Y %H00 UTC') + " is successful")
+                remember_rtma_analysis_time(domain, analysis_time)
                 
-                return rtma_parameter, current_time
+                return rtma_parameter, analysis_time
                 
             except Exception as e:
-        
-                print(parameter + " Data is unavailiable for "+current_time.strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[0].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-                    time = times[0]
-        
-                    print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                    return rtma_parameter, time
-        
-                except Exception as a:
-        
-                    print(parameter + " Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-                   
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                        time = times[1]
-            
-                        print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                        return rtma_parameter, time
-        
-        
-                    except Exception as b:
-                                    
-                        print(parameter + " Data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                            time = times[2]
-            
-                            print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                            return rtma_parameter, time
-        
-                        except Exception as c:
-                                    
-                            print(parameter + " Data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-        
-                            try:
-                                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                                rtma_parameter = rtma_data[parameter].squeeze()
-                                time = times[3]
-                
-                                print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                                return rtma_parameter, time
-                            
-                        
-                            except syntaxError as k:
-                                error = info.syntax_error()
-        
-                                return error
-    
-        if main_server_status != 200 and first_backup_server_status == 200:
-            print("Main UCAR THREDDS Server is down. Connected to the first backup UCAR THREDDS Server!")
-            try:
-                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
-    
-                print("Data retrieval for " + current_time.strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                
-                return rtma_parameter, current_time
-                
-            except Exception as e:
-        
-                print(parameter + " Data is unavailiable for "+current_time.strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[0].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-                    time = times[0]
-        
-                    print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                    return rtma_parameter, time
-        
-                except Exception as a:
-        
-                    print(parameter + " Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-                   
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                        time = times[1]
-            
-                        print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                        return rtma_parameter, time
-        
-        
-                    except Exception as b:
-                                    
-                        print(parameter + " Data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                            time = times[2]
-            
-                            print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                            return rtma_parameter, time
-        
-                        except Exception as c:
-                                    
-                            print(parameter + " Data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-        
-                            try:
-                                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                                rtma_parameter = rtma_data[parameter].squeeze()
-                                time = times[3]
-                
-                                print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                                return rtma_parameter, time
-                            
-                        
-                            except syntaxError as k:
-                                error = info.syntax_error()
-        
-                                return error
-    
-        if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status == 200:
-    
-            print("Main UCAR THREDDS Server is down. Connected to the second backup UCAR THREDDS Server!")
-            try:
-                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+current_time.strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
-    
-                print("Data retrieval for " + current_time.strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                
-                return rtma_parameter, current_time
-                
-            except Exception as e:
-        
-                print(parameter + " Data is unavailiable for "+current_time.strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[0].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-                    time = times[0]
-        
-                    print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                    return rtma_parameter, time
-        
-                except Exception as a:
-        
-                    print(parameter + " Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-                   
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                        time = times[1]
-            
-                        print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                        return rtma_parameter, time
-        
-        
-                    except Exception as b:
-                                    
-                        print(parameter + " Data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                            time = times[2]
-            
-                            print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                            return rtma_parameter, time
-        
-                        except Exception as c:
-                                    
-                            print(parameter + " Data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-        
-                            try:
-                                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                                rtma_parameter = rtma_data[parameter].squeeze()
-                                time = times[3]
-                
-                                print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
-                                return rtma_parameter, time
-                            
-                        
-                            except syntaxError as k:
-                                error = info.syntax_error()
-        
-                                return error
-            
-            print("Unable to connect to either the main or backup servers. Aborting!")
-    
-        if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status != 200:
-            print("Unable to connect to either the main or backup servers. Aborting!")
+                print(parameter + " Data is unavailiable for "+analysis_time.strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the previous analysis.")
+
+        print(parameter + " Data is unavailiable for the last 4 hours. Please try again later.")
 
 
 class NDFD_CONUS_Hawaii:
@@ -1791,7 +1389,7 @@ class NDFD_CONUS_Hawaii:
         Scripts that download files from the CONUS directory are recommended to be run between the 48th and 15th 
         minute to avoid the script idiling. The reason is because the files in the CONUS directory update between the 15th
         and 48th minute of the hour (and downloading them during that time makes them extremely hard to work with!!). Due
-        to this, if there is an issue with the data, the program will automatically idle until the 48th minute and resume and try again to download the latest data. 
+        to this, if there is an issue with the data, the program will check the FTP server with a growing delay and try again to download the latest data as soon as a complete set of files (with matching issuance times) is there. 
 
         Data Source: NOAA/NWS/NDFD (tgftp.nws.noaa.gov)
 
@@ -1812,24 +1410,39 @@ class NDFD_CONUS_Hawaii:
         directory_name = directory_name
         parameter = parameter
     
-        try:
-    
-            grbs, ds, count_short, count_extended = get_NWS_NDFD_7_Day_grid_data(directory_name, parameter)
-    
-            print("Downloaded data successfully!")
-        except Exception as a:
-    
-            standard.idle()
-    
-            print("Trying again to download data...")
-    
-            grbs, ds, count_short, count_extended = get_NWS_NDFD_7_Day_grid_data(directory_name, parameter)
-    
-            print("Downloaded data successfully!")
+        grbs, ds, count_short, count_extended, new_data = download_NDFD_grids_if_updated(directory_name, parameter)
     
         return grbs, ds, count_short, count_extended
 
 
+    def download_NDFD_grids_if_updated(directory_name, parameter):
+
+        r'''
+
+        This function retrieves the latest NWS Forecast (NDFD) files from the NWS FTP Server only when they changed since 
+        the last download. The modification time and size of the files on the server are checked first. 
+
+        Data Source: NOAA/NWS/NDFD (tgftp.nws.noaa.gov)
+
+        Required Arguments: 1) The name of the directory (see FireWxPy documentation for directory paths)
+
+                            2) The parameter that the user wishes to download. (i.e. ds.maxt.bin for max temperature)
+
+        Returns: 1) The files holding the forecast data in a GRIB2 format. 
+
+                 2) An xarray data-array of the same forecast data. 
+
+                 3) The count of the number of files in the short-term forecast period. 
+
+                 4) The count of the number of files in the extended forecast period. 
+
+                 5) new_data (Boolean) - True when new data arrived. When False the graphics made from the last download are still current. 
+
+        '''
+
+        return download_NDFD_grids_if_updated(directory_name, parameter)
+
+
     def download_short_term_NDFD_grids(directory_name, parameter):
 
         r'''
@@ -1839,7 +1452,7 @@ class NDFD_CONUS_Hawaii:
         Scripts that download files from the CONUS directory are recommended to be run between the 48th and 15th 
         minute to avoid the script idiling. The reason is because the files in the CONUS directory update between the 15th
         and 48th minute of the hour (and downloading them during that time makes them extremely hard to work with!!). Due
-        to this, if there is an issue with the data, the program will automatically idle until the 48th minute and resume and try again to download the latest data. 
+        to this, if there is an issue with the data, the program will check the FTP server with a growing delay and try again to download the latest data as soon as a complete set of files (with matching issuance times) is there. 
 
         Data Source: NOAA/NWS/NDFD (tgftp.nws.noaa.gov)
 
@@ -1867,7 +1480,7 @@ class NDFD_CONUS_Hawaii:
             print("Downloaded data successfully!")
         except Exception as a:
     
-            standard.idle()
+            wait_for_NDFD_files(directory_name, parameter)
     
             print("Trying again to download data...")
     
@@ -1886,7 +1499,7 @@ class NDFD_CONUS_Hawaii:
         Scripts that download files from the CONUS directory are recommended to be run between the 48th and 15th 
         minute to avoid the script idiling. The reason is because the files in the CONUS directory update between the 15th
         and 48th minute of the hour (and downloading them during that time makes them extremely hard to work with!!). Due
-        to this, if there is an issue with the data, the program will automatically idle until the 48th minute and resume and try again to download the latest data. 
+        to this, if there is an issue with the data, the program will check the FTP server with a growing delay and try again to download the latest data as soon as a complete set of files (with matching issuance times) is there. 
 
         Data Source: NOAA/NWS/NDFD (tgftp.nws.noaa.gov)
 
@@ -1914,7 +1527,7 @@ class NDFD_CONUS_Hawaii:
             print("Downloaded data successfully!")
         except Exception as a:
     
-            standard.idle()
+            wait_for_NDFD_files(directory_name, parameter)
     
             print("Trying again to download data...")
     
@@ -2044,35 +1657,24 @@ class NDFD_Alaska:
         # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
         ###################################################
     
-        ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
-        ftp = FTP('tgftp.nws.noaa.gov')
-        ftp.login()
-
         directory_name = '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/'
     
         ### SEARCHES FOR THE CORRECT DIRECTORY ###
         try:
-            dirName_short = directory_name + 'VP.001-003/'
             param = parameter
-            files = ftp.cwd(dirName_short)
+            ftp = get_ftp_connection()
+            try:
+                files = ftp.cwd(directory_name + 'VP.001-003/')
+            finally:
+                release_ftp_connection(ftp)
     
             ### SEARCHES FOR THE CORRECT PARAMETER ###
             try:
                 ################################
                 # DOWNLOADS THE NWS NDFD GRIDS #
                 ################################
-                
-                with open(param, 'wb') as fp:
-                    ftp.retrbinary('RETR ' + param, fp.write)
-    
-                dirName_extended = directory_name + 'VP.004-007/'
-                param = parameter
-                files = ftp.cwd(dirName_extended)
-    
-                with open(param, 'ab') as fp:
-                    ftp.retrbinary('RETR ' + param, fp.write)
-                
-                ftp.close()
+
+                download_short_and_extended_files(directory_name, param)
     
                 
                 #########################
@@ -2144,26 +1746,14 @@ class NDFD_Alaska:
         # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
         ###################################################
     
-        ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
-        ftp = FTP('tgftp.nws.noaa.gov')
-        ftp.login()
-    
-        ### SEARCHES FOR THE CORRECT DIRECTORY ###
-        
         dirName = directory_name + 'VP.001-003/'
         param = parameter
-        files = ftp.cwd(dirName)
-
-        ### SEARCHES FOR THE CORRECT PARAMETER ###
 
         ################################
         # DOWNLOADS THE NWS NDFD GRIDS #
         ################################
-        
-        with open(param, 'wb') as fp:
-            ftp.retrbinary('RETR ' + param, fp.write)
-            
-        ftp.close()
+
+        ftp_download(dirName, param, param)
         ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
         ds = ds.metpy.parse_cf()
         return ds
@@ -2218,2108 +1808,3185 @@ class NDFD_Alaska:
         # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
         ###################################################
     
-        ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
-        ftp = FTP('tgftp.nws.noaa.gov')
-        ftp.login()
-    
-        ### SEARCHES FOR THE CORRECT DIRECTORY ###
         dirName = directory_name + 'VP.004-007/'
         param = parameter
-        files = ftp.cwd(dirName)
 
-        ### SEARCHES FOR THE CORRECT PARAMETER ###
         ################################
         # DOWNLOADS THE NWS NDFD GRIDS #
         ################################
-        
-        with open(param, 'wb') as fp:
-            ftp.retrbinary('RETR ' + param, fp.write)
 
-        ftp.close()
+        ftp_download(dirName, param, param)
         ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
         ds = ds.metpy.parse_cf()
         return ds
 
-def get_NWS_NDFD_7_Day_grid_data(directory_name, parameter):
-    
-    '''
-             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
-             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
-    
-             Inputs:
-                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
-                                              The directory determines the domain the forecast data is valid for. 
-                                              Here is the full directory list: 
-                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
-                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
-                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
-                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
-                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
-                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
-                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
-                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
-                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
-                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
-                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
-                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
-                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
-                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
-                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
-                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
-                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
-                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
-                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
-                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
-                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
-                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
-                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
-                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
-    
-    
-                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
-                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
-                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
-    
-            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
-                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
-             
-    '''
+##########################
+# FTP CONNECTION POOL    #
+##########################
 
-    ###################################################
-    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
-    ###################################################
+# Logging in to the NWS FTP server takes several round-trips, so the logged-in connections are kept open and reused 
+# for every parameter and directory. Connections that sat idle longer than ftp_keepalive seconds are checked with a 
+# NOOP before they are reused and connections that fail are replaced with a new login. 
 
-    ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
-    try:
-        ftp = FTP('tgftp.nws.noaa.gov')
-        ftp.login()
-    
-        ### SEARCHES FOR THE CORRECT DIRECTORY ###
-        dirName_short = directory_name + 'VP.001-003/'
-        param = parameter
-        files = ftp.cwd(dirName_short)
-    
-        ### SEARCHES FOR THE CORRECT PARAMETER ###
-    
-        ################################
-        # DOWNLOADS THE NWS NDFD GRIDS #
-        ################################
-        
-        with open(param, 'wb') as fp:
-            ftp.retrbinary('RETR ' + param, fp.write)
+ndfd_ftp_host = 'tgftp.nws.noaa.gov'
+ndfd_ftp_port = 21
 
-        grbs_short = pygrib.open(param)
-        grbs_short.seek(0)
-        count_short = 0
-        for grb in grbs_short:
-            count_short = count_short + 1
+# The most connections kept open (and used at the same time) per server. 
+ftp_pool_size = 4
 
-        dirName_extended = directory_name + 'VP.004-007/'
-        param = parameter
-        files = ftp.cwd(dirName_extended)
+ftp_keepalive = 60
 
-        with open(param, 'ab') as fp:
-            ftp.retrbinary('RETR ' + param, fp.write)
-        
-        ftp.close()
+ftp_timeout = 60
 
-        #########################
-        # DATA ARRAYS PARAMETER #
-        #########################
-        grbs = pygrib.open(param)
-        grbs.seek(0)
-        count = 0
-        for grb in grbs:
-            count = count + 1
-        count_extended = count - count_short
-        ds = xr.load_dataset(param, engine='cfgrib')
-        ds = ds.metpy.parse_cf()
-        
-    except Exception as e:
-        count_short = get_short_and_extended_grids(directory_name, param)
+_ftp_idle_connections = {}
+_ftp_pool_lock = threading.Lock()
 
-        grbs = pygrib.open(param)
-        grbs.seek(0)
-        count = 0
-        for grb in grbs:
-            count = count + 1
-        count_extended = count - count_short
-        ds = xr.load_dataset(param, engine='cfgrib')
-        ds = ds.metpy.parse_cf()
 
-    print("Data retrieved successfully!")
-        
-    return grbs, ds, count_short, count_extended
+def open_ftp_connection(host, port):
 
+    ftp = FTP()
+    ftp.connect(host, port, timeout=ftp_timeout)
+    ftp.login()
 
-def get_short_and_extended_grids(directory_name, parameter):
-    
-    '''
-             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
-             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
-    
-             Inputs:
+    return ftp
 
-                1) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
-                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
-                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
-    
-            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
-                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
-             
-    '''
 
-    ###################################################
-    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
-    ###################################################
+def get_ftp_connection(host=None, port=None):
 
-    parameter = parameter
+    r'''
+    This function returns a logged-in FTP connection from the connection pool. A new connection is opened when there 
+    are no idle connections. 
 
-    directory_name = directory_name
+    Optional Arguments: 1) host (String) - Default is ndfd_ftp_host (tgftp.nws.noaa.gov). 
+                        2) port (Integer) - Default is ndfd_ftp_port (21). 
 
-    try:
-        short_term_fname, extended_fname = get_NWS_NDFD_7_Day_grid_data_backup(directory_name, parameter)
-        with open(parameter, 'wb') as myfile, open(short_term_fname, 'rb') as file1, open(extended_fname, 'rb') as file2:
-            myfile.write(file1.read())
-            myfile.write(file2.read())
+    Returns: 1) An ftplib.FTP object. Give it back with release_ftp_connection() when finished. 
 
-        grbs = pygrib.open(short_term_fname)
-        grbs.seek(0)
-        count_short = 0
-        for grb in grbs:
-            count_short = count_short + 1
-        return count_short
-    except Exception as e:
-        print("Unable to connect to server. Please try again later.")
+    '''
 
+    if host == None:
+        host = ndfd_ftp_host
+    if port == None:
+        port = ndfd_ftp_port
 
+    while True:
+        with _ftp_pool_lock:
+            idle = _ftp_idle_connections.get((host, port), [])
+            if len(idle) == 0:
+                break
+            ftp, last_used = idle.pop()
 
-def get_NWS_NDFD_7_Day_grid_data_backup(directory_name, parameter):
+        if (t.time() - last_used) < ftp_keepalive:
+            return ftp
 
-    parameter = parameter
+        try:
+            ftp.voidcmd('NOOP')
+            return ftp
+        except Exception as e:
+            close_ftp_connection(ftp)
 
-    if parameter == 'ds.maxrh.bin':
-        short_term_fname = 'ds.maxrh_short.bin'
-        extended_fname = 'ds.maxrh_extended.bin'
+    return open_ftp_connection(host, port)
 
-    if parameter == 'ds.minrh.bin':
-        short_term_fname = 'ds.minrh_short.bin'
-        extended_fname = 'ds.minrh_extended.bin'
 
-    if parameter == 'ds.maxt.bin':
-        short_term_fname = 'ds.maxt_short.bin'
-        extended_fname = 'ds.maxt_extended.bin'
+def release_ftp_connection(ftp, host=None, port=None):
 
-    if parameter == 'ds.mint.bin':
-        short_term_fname = 'ds.mint_short.bin'
-        extended_fname = 'ds.mint_extended.bin'
+    r'''
+    This function gives a connection back to the connection pool. The connection is closed when the pool is full. 
+    '''
 
-    if parameter == 'ds.critfireo.bin':
-        short_term_fname = 'ds.critfireo_short.bin'
-        extended_fname = 'ds.critfireo_extended.bin'
+    if host == None:
+        host = ndfd_ftp_host
+    if port == None:
+        port = ndfd_ftp_port
 
-    if parameter == 'ds.dryfireo.bin':
-        short_term_fname = 'ds.dryfireo_short.bin'
-        extended_fname = 'ds.dryfireo_extended.bin'
+    with _ftp_pool_lock:
+        idle = _ftp_idle_connections.setdefault((host, port), [])
+        if len(idle) < ftp_pool_size:
+            idle.append((ftp, t.time()))
+            return
 
-    if os.path.exists(short_term_fname):
-        os.remove(short_term_fname)
-        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
-        os.rename(parameter, short_term_fname)
-    else:
-        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
-        os.rename(parameter, short_term_fname)
-    
-    if os.path.exists(extended_fname):
-        os.remove(extended_fname)
-        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.004-007/{parameter}", f"{parameter}")
-        os.rename(parameter, extended_fname)
-    else:
-        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.004-007/{parameter}", f"{parameter}")
-        os.rename(parameter, extended_fname)
+    close_ftp_connection(ftp)
 
-    return short_term_fname, extended_fname
 
+def close_ftp_connection(ftp):
 
-def get_NWS_NDFD_short_term_grid_data(directory_name, parameter):
-    
-    '''
-             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
-             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
-    
-             Inputs:
-                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
-                                              The directory determines the domain the forecast data is valid for. 
-                                              Here is the full directory list: 
-                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
-                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
-                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
-                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
-                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
-                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
-                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
-                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
-                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
-                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
-                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
-                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
-                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
-                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
-                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
-                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
-                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
-                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
-                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
-                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
-                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
-                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
-                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
-                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
-    
-    
-                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
-                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
-                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
-    
-            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
-                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
-             
-    '''
+    try:
+        ftp.quit()
+    except Exception as e:
+        try:
+            ftp.close()
+        except Exception as e:
+            pass
 
-    ###################################################
-    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
-    ###################################################
 
-    ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
+def close_ftp_connections():
 
-    try:
-        ftp = FTP('tgftp.nws.noaa.gov')
-        ftp.login()
-    
-        ### SEARCHES FOR THE CORRECT DIRECTORY ###
-    
-        dirName = directory_name + 'VP.001-003/'
-        param = parameter
-        files = ftp.cwd(dirName)
-    
-        ### SEARCHES FOR THE CORRECT PARAMETER ###
-        ################################
-        # DOWNLOADS THE NWS NDFD GRIDS #
-        ################################
-        
-        with open(param, 'wb') as fp:
-            ftp.retrbinary('RETR ' + param, fp.write)
-            
-        ftp.close()
+    r'''
+    This function logs out of and closes every idle connection in the connection pool. 
+    '''
 
-        if directory_name == '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/':
+    with _ftp_pool_lock:
+        connections = [ftp for idle in _ftp_idle_connections.values() for ftp, last_used in idle]
+        _ftp_idle_connections.clear()
 
-            ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
-            ds = ds.metpy.parse_cf()
+    for ftp in connections:
+        close_ftp_connection(ftp)
 
-        else:
-        
-            ds = xr.load_dataset(param, engine='cfgrib')
-            ds = ds.metpy.parse_cf()
 
-    except Exception as e:
+atexit.register(close_ftp_connections)
 
-        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
-        
-        if directory_name == '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/':
 
-            ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
-            ds = ds.metpy.parse_cf()
+def ftp_download(directory, file_name, local_path, mode='wb', host=None, port=None):
 
-        else:
-        
-            ds = xr.load_dataset(param, engine='cfgrib')
-            ds = ds.metpy.parse_cf()
-        
-    return ds
+    r'''
+    This function downloads a file from an FTP server using a pooled connection. 
 
-    ### ERROR MESSAGE WHEN THERE IS AN INVALID PARAMETER NAME ###
+    When the connection fails (i.e. the server closed it) the download is retried once on a new connection. 
 
+    Required Arguments: 1) directory (String) - The directory on the FTP server (i.e. '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/VP.001-003/'). 
+                        2) file_name (String) - The name of the file in that directory (i.e. 'ds.maxt.bin'). 
+                        3) local_path (String) - Where to save the file. 
 
+    Optional Arguments: 1) mode (String) - 'wb' writes a new file and 'ab' appends to local_path. Default is 'wb'. 
+                        2) host (String) - Default is ndfd_ftp_host. 
+                        3) port (Integer) - Default is ndfd_ftp_port. 
 
-def get_NWS_NDFD_extended_grid_data(directory_name, parameter):
-    
-    '''
-             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
-             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
-    
-             Inputs:
-                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
-                                              The directory determines the domain the forecast data is valid for. 
-                                              Here is the full directory list: 
-                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
-                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
-                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
-                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
-                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
-                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
-                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
-                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
-                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
-                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
-                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
-                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
-                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
-                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
-                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
-                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
-                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
-                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
-                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
-                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
-                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
-                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
-                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
-                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
-    
-    
-                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
-                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
-                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
-    
-            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
-                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
-             
-    '''
+    Returns: 1) local_path
 
-    ###################################################
-    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
-    ###################################################
+    '''
 
-    ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
-    ftp = FTP('tgftp.nws.noaa.gov')
-    ftp.login()
+    for attempt in range(0, 2):
 
-    ### SEARCHES FOR THE CORRECT DIRECTORY ###
-    try:
-        dirName = directory_name + 'VP.004-007/'
-        param = parameter
-        files = ftp.cwd(dirName)
+        ftp = get_ftp_connection(host, port)
 
-        ### SEARCHES FOR THE CORRECT PARAMETER ###
         try:
-            ################################
-            # DOWNLOADS THE NWS NDFD GRIDS #
-            ################################
-            
-            with open(param, 'wb') as fp:
-                ftp.retrbinary('RETR ' + param, fp.write)
+            ftp.cwd(directory)
+            with open(local_path, mode) as fp:
+                ftp.retrbinary('RETR ' + file_name, fp.write)
 
-            ftp.close()
-            ds = xr.load_dataset(param, engine='cfgrib')
-            ds = ds.metpy.parse_cf()
-            return ds
+        except ftplib.error_perm as e:
+            # The server answered, so the connection is still good. The file or directory does not exist. 
+            release_ftp_connection(ftp, host, port)
+            raise
 
-        ### ERROR MESSAGE WHEN THERE IS AN INVALID PARAMETER NAME ###
+        except Exception as e:
+            close_ftp_connection(ftp)
+            if attempt == 1:
+                raise
+            print("Lost the connection to the FTP server. Reconnecting...")
+            continue
 
-        except Exception as a:
-            param_error = info.parameter_name_error()
-            return param_error
+        release_ftp_connection(ftp, host, port)
 
-    ### ERROR MESSAGE WHEN THERE IS AN INVALID DIRECTORY NAME ###
-        
-    except Exception as e:
-        dir_error = info.directory_name_error()
-        return dir_error
+        return local_path
 
-def get_rtma_24_hour_comparison_data_with_u_and_v_components(current_time):
 
+def ftp_download_files(downloads, host=None, port=None):
 
-    current_time = current_time
+    r'''
+    This function downloads several files at the same time, each one on its own pooled connection. 
 
-    rtma_data, rtma_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_rtma_data_24_hour_difference(current_time, 'Wind_speed_Analysis_height_above_ground')
+    Required Arguments: 1) downloads (List) - A list of (directory, file_name, local_path) tuples. 
 
-    t.sleep(15)
+    Optional Arguments: 1) host (String) - Default is ndfd_ftp_host. 
+                        2) port (Integer) - Default is ndfd_ftp_port. 
 
-    rtma_time_24 = rtma_time - timedelta(hours=24)
+    Returns: 1) The local paths in the same order as downloads. The first failed download raises its exception. 
 
-    u, u_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(current_time, 'u-component_of_wind_Analysis_height_above_ground')
+    '''
 
-    t.sleep(15)
+    if len(downloads) == 1:
+        directory, file_name, local_path = downloads[0]
+        return [ftp_download(directory, file_name, local_path, host=host, port=port)]
 
-    u_24, u_24_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(rtma_time_24, 'u-component_of_wind_Analysis_height_above_ground')
+    workers = min(len(downloads), ftp_pool_size)
 
-    t.sleep(15)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(ftp_download, directory, file_name, local_path, 'wb', host, port) for directory, file_name, local_path in downloads]
+        local_paths = [future.result() for future in futures]
 
-    v, v_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(current_time, 'v-component_of_wind_Analysis_height_above_ground')
+    return local_paths
 
-    t.sleep(15)
 
-    v_24, v_24_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(rtma_time_24, 'v-component_of_wind_Analysis_height_above_ground')
+def short_and_extended_file_names(parameter):
 
-    data = []
+    return parameter.replace('.bin', '_short.bin'), parameter.replace('.bin', '_extended.bin')
 
-    data.append(rtma_data)
-    data.append(rtma_time)
-    data.append(rtma_time_24)
-    data.append(u)
-    data.append(u_time)
-    data.append(u_24)
-    data.append(u_24_time)
-    data.append(v)
-    data.append(v_time)
-    data.append(v_24)
-    data.append(v_24_time)
 
-    return data
+def download_short_and_extended_files(directory_name, parameter):
 
+    r'''
+    This function downloads the short-term (VP.001-003) and extended (VP.004-007) files of an NDFD parameter at the 
+    same time and joins them into one file named parameter. 
 
+    Returns: 1) The number of GRIB messages in the short-term file. 
 
-def get_rtma_data_past_6hrs(parameter):
+    '''
 
+    short_term_fname, extended_fname = short_and_extended_file_names(parameter)
 
-    parameter = parameter
-    local_time, utc_time = standard.plot_creation_time()
-    times = []
+    ftp_download_files([(directory_name + 'VP.001-003/', parameter, short_term_fname),
+                        (directory_name + 'VP.004-007/', parameter, extended_fname)])
 
-    for i in range(0, 10):
-        time = utc_time - timedelta(hours=i)
-        times.append(time)
+    with open(parameter, 'wb') as myfile, open(short_term_fname, 'rb') as file1, open(extended_fname, 'rb') as file2:
+        shutil.copyfileobj(file1, myfile)
+        shutil.copyfileobj(file2, myfile)
 
-    t1 = times[0]
-    t2 = times[1]
-    t3 = times[2]
-    t4 = times[3]
-    t5 = times[4]
-    t6 = times[5]
-    t7 = times[6]
-    t8 = times[7]
-    t9 = times[8]
-    t10 = times[9]
+    grbs_short = pygrib.open(short_term_fname)
+    count_short = grbs_short.messages
+    grbs_short.close()
 
-    rtma_data_0, rtma_time_0 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t1, parameter)
+    return count_short
 
-    t.sleep(15)
 
-    rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t2, parameter)
+##########################
+# NDFD PRODUCT CACHE     #
+##########################
 
-    t.sleep(15)
-    
-    if rtma_time_0.hour == rtma_time_1.hour:
+# Every NDFD element (i.e. ds.maxt.bin) feeds several products. The raw GRIB2 file and the decoded arrays of each
+# element are kept in memory and on disk so the products of one element only cost one FTP transfer and one decode. 
+# Entries are keyed by (directory_name, parameter, issuance time) and the issuance time is read from the GRIB2 file. 
+# Only the newest ndfd_cache_retention issuances of each file are kept. 
 
-        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
-        t.sleep(15)
+ndfd_cache_directory = "NDFD Cache"
 
-        if rtma_time_0.hour == rtma_time_1.hour:
+# A download is reused for this many minutes without checking the FTP server. After that the modification time and 
+# size of the files on the server are compared with the last download (see download_NDFD_grids_if_updated()). 
+ndfd_cache_max_age = 15
 
-            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
-            t.sleep(15)
-            
-            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
-            t.sleep(15)
-    
-            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
-            t.sleep(15)
-    
-            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
-            t.sleep(15)
-    
-            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
-            t.sleep(15)
-    
-            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t9, parameter)
-            t.sleep(15)
+# The number of issuances of each NDFD file that are kept (in memory and in the cache directory). 
+# Older issuances are deleted when a new one is cached. 
+ndfd_cache_retention = 2
 
-            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t10, parameter)
+_ndfd_product_cache = {}
+_ndfd_latest_issuance = {}
 
 
-        else:
+def ndfd_issuance_time(file_path):
 
-            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
-            t.sleep(15)
-            
-            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
-            t.sleep(15)
-    
-            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
-            t.sleep(15)
-    
-            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
-            t.sleep(15)
-    
-            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
-            t.sleep(15)
-    
-            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
-            t.sleep(15)
+    r'''
+    This function returns the issuance (reference) time of an NDFD GRIB2 file. 
 
-            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t9, parameter)
-            t.sleep(15)
+    Required Arguments: 1) file_path (String) - The path to the GRIB2 file. 
 
-    else:
-        t.sleep(15)
+    Returns: 1) The issuance time as a datetime object. 
 
-        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t2, parameter)
-        t.sleep(15)
+    '''
 
-        rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
-        t.sleep(15)
+    grbs = pygrib.open(file_path)
+    try:
+        issuance = grbs.message(1).analDate
+    finally:
+        grbs.close()
 
-        rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
-        t.sleep(15)
+    return issuance
 
-        rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
-        t.sleep(15)
 
-        rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
-        t.sleep(15)
+def ndfd_cache_path(directory_name, parameter, issuance):
 
-        rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
-        t.sleep(15)
+    domain = directory_name.strip('/').split('/')[-1]
 
-        rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
-    
-    rtma_data, rtma_times = parsers.save.append_data_RTMA_6hr_timelapse(rtma_data_0, rtma_data_1, rtma_data_2, rtma_data_3, rtma_data_4, rtma_data_5, rtma_data_6, rtma_data_7, rtma_time_0, rtma_time_1, rtma_time_2, rtma_time_3, rtma_time_4, rtma_time_5, rtma_time_6, rtma_time_7)
+    return os.path.join(ndfd_cache_directory, domain, issuance.strftime('%Y%m%d%H%M'), parameter)
 
-    return rtma_data, rtma_times
 
+def read_ndfd_cache_index():
 
+    index_path = ndfd_cache_index_path()
 
-def get_rtma_data_24_hour_difference(current_time, parameter):
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, 'r') as fp:
+                return json.load(fp)
+        except Exception as e:
+            print("The NDFD cache index is corrupted. Starting a new index.")
 
-    r"""
-    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis dataset and the dataset from 24 hours prior to the current dataset. 
-    This function will then take the difference between the two datasets to show the 24 hour difference and create a new dataset based on that.
+    return {}
 
-    24 hour difference dataset = current dataset - dataset from 24 hours prior to the current dataset
 
-    Inputs:
-           1) current_time (Datetime) - Current time in UTC.
-           2) parameter (String) - The weather parameter the user wishes to download. 
-                                   To find the full list of parameters, visit: https://thredds.ucar.edu/thredds/dodsC/grib/NCEP/RTMA/CONUS_2p5km/Best.html
+def ndfd_cache_index_path():
 
-    Returns: 1) If there are zero errors, the latest 24 hour difference dataset and the time of the latest available dataset for the requested parameter will be returned. 
-             2) If there is an error, an error message is returned. 
+    return os.path.join(ndfd_cache_directory, 'index.json')
 
-    """
 
-    times = []
-    times_24 = []
+def update_ndfd_cache_index(update):
 
-    for i in range(0,5):
-        new_time = current_time - timedelta(hours=i)
-        old_time = new_time - timedelta(hours=24)
-        times.append(new_time)
-        times_24.append(old_time)
-        
-        
-    try:
-        main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-        main_server_status = main_server_response.status_code
-    except Exception as a:
-        pass
-    
-    try:
-        first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        first_backup_server_status = first_backup_server_response.status_code
-    except Exception as b:
-        pass
-    
-    try:
-        second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        second_backup_server_status = second_backup_server_response.status_code
-    except Exception as c:
-        pass
-    
-    if main_server_status == 200:
-        print("Main UCAR THREDDS Server is online. Connecting!")
-        
-        try:
-            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter = rtma_data[parameter].squeeze()
-    
-            rtma_cat_24 = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-    
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    r'''
+    This function changes the NDFD cache index with update(index). The index is read, changed and written under a 
+    lock so processes that cache different files at the same time do not drop each other's records. 
+    '''
 
-            time = times[0]
-            
-            return rtma_parameter - rtma_parameter_24, time
-            
-        except Exception as e:
-            
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-            print("Will try to download the most recent datasets from "+times[1].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
-        
-                rtma_cat_24 = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-        
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if os.path.exists(ndfd_cache_directory) == False:
+        os.makedirs(ndfd_cache_directory, exist_ok=True)
 
-                time = times[1]
-                
-                return rtma_parameter - rtma_parameter_24, time
-         
-            except Exception as a:
-    
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                print("Will try to download the most recent datasets from "+times[2].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-            
-                    rtma_cat_24 = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-            
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    with file_functions.locked_file(ndfd_cache_index_path()):
+        index = read_ndfd_cache_index()
+        update(index)
 
-                    time = times[2]
-                    
-                    return rtma_parameter - rtma_parameter_24, time
-    
-    
-                except Exception as b:
-                                
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                    print("Will try to download the most recent datasets from "+times[3].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                
-                        rtma_cat_24 = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+        def write(path):
+            with open(path, 'w') as fp:
+                json.dump(index, fp, indent=1)
 
-                        time = times[3]
-                        
-                        return rtma_parameter - rtma_parameter_24, time
-    
-                    except Exception as c:
-                                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                        print("Will try to download the most recent datasets from "+times[4].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                    
-                            rtma_cat_24 = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                    
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+        file_functions.write_file_atomically(ndfd_cache_index_path(), write)
 
-                            time = times[4]
-                            
-                            return rtma_parameter - rtma_parameter_24, time
-                                  
-                    
-                        except syntaxError as k:
-                            error = info.syntax_error()
-    
-                            return error
 
-    
-    if main_server_status != 200 and first_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connecting to the backup UCAR THREDDS Server!")
-        
-        try:
-            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter = rtma_data[parameter].squeeze()
-    
-            rtma_cat_24 = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-    
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+def working_file_fingerprint(file_path):
 
-            time = times[0]
-            
-            return rtma_parameter - rtma_parameter_24, time
-            
-        except Exception as e:
-            
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-            print("Will try to download the most recent datasets from "+times[1].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
-        
-                rtma_cat_24 = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-        
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    stats = os.stat(file_path)
 
-                time = times[1]
-                
-                return rtma_parameter - rtma_parameter_24, time
-         
-            except Exception as a:
-    
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                print("Will try to download the most recent datasets from "+times[2].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-            
-                    rtma_cat_24 = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-            
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    return [os.path.abspath(file_path), stats.st_mtime_ns, stats.st_size]
 
-                    time = times[2]
-                    
-                    return rtma_parameter - rtma_parameter_24, time
-    
-    
-                except Exception as b:
-                                
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                    print("Will try to download the most recent datasets from "+times[3].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                
-                        rtma_cat_24 = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
 
-                        time = times[3]
-                        
-                        return rtma_parameter - rtma_parameter_24, time
-    
-                    except Exception as c:
-                                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                        print("Will try to download the most recent datasets from "+times[4].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                    
-                            rtma_cat_24 = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                    
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+def cache_NDFD_product(directory_name, parameter, ds, count_short, count_extended, remote=None):
 
-                            time = times[4]
-                            
-                            return rtma_parameter - rtma_parameter_24, time
-                                  
-                    
-                        except syntaxError as k:
-                            error = info.syntax_error()
-    
-                            return error
+    r'''
+    This function adds a freshly downloaded NDFD file to the NDFD product cache. 
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connected to the second backup UCAR THREDDS Server!")
-        
-        try:
-            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter = rtma_data[parameter].squeeze()
-    
-            rtma_cat_24 = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-    
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    The downloaded file (parameter in the current working directory) is copied into the cache directory and the 
+    cache index records when it was downloaded. 
 
-            time = times[0]
-            
-            return rtma_parameter - rtma_parameter_24, time
-            
-        except Exception as e:
-            
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[0].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-            print("Will try to download the most recent datasets from "+times[1].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter = rtma_data[parameter].squeeze()
-        
-                rtma_cat_24 = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-        
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
+                        3) ds (xarray.Dataset) - The decoded dataset of the file. 
+                        4) count_short (Integer) - The number of short-term GRIB messages. 
+                        5) count_extended (Integer) - The number of extended GRIB messages. 
 
-                time = times[1]
-                
-                return rtma_parameter - rtma_parameter_24, time
-         
-            except Exception as a:
-    
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[1].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                print("Will try to download the most recent datasets from "+times[2].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter = rtma_data[parameter].squeeze()
-            
-                    rtma_cat_24 = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-            
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Optional Arguments: 1) remote (Dictionary) - The modification time and size of the files on the FTP server (see ndfd_remote_file_stats()). 
 
-                    time = times[2]
-                    
-                    return rtma_parameter - rtma_parameter_24, time
-    
-    
-                except Exception as b:
-                                
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[2].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                    print("Will try to download the most recent datasets from "+times[3].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter = rtma_data[parameter].squeeze()
-                
-                        rtma_cat_24 = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Returns: 1) The cache entry. 
 
-                        time = times[3]
-                        
-                        return rtma_parameter - rtma_parameter_24, time
-    
-                    except Exception as c:
-                                
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " and/or " + times_24[3].strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
-                        print("Will try to download the most recent datasets from "+times[4].strftime('%m/%d/%Y %H00 UTC')+ " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter = rtma_data[parameter].squeeze()
-                    
-                            rtma_cat_24 = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data_24 = rtma_cat_24.datasets['RTMA_CONUS_2p5km_'+times_24[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data_24 = rtma_data_24.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_parameter_24 = rtma_data_24[parameter].squeeze()
-                    
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " and " + times_24[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    '''
 
-                            time = times[4]
-                            
-                            return rtma_parameter - rtma_parameter_24, time
-                                  
-                    
-                        except syntaxError as k:
-                            error = info.syntax_error()
-    
-                            return error
+    issuance = ndfd_issuance_time(parameter)
+    raw_path = ndfd_cache_path(directory_name, parameter, issuance)
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status != 200:
-        print("Unable to connect to either the main or backup servers. Aborting!")
+    raw_directory = os.path.dirname(raw_path)
+    if os.path.exists(raw_directory) == False:
+        os.makedirs(raw_directory)
 
+    file_functions.write_file_atomically(raw_path, lambda path: shutil.copyfile(parameter, path))
 
-def get_rtma_relative_humidity_data_past_6hrs():
+    entry = {
+        'issuance': issuance,
+        'raw_path': raw_path,
+        'ds': ds,
+        'grids': {},
+        'count_short': count_short,
+        'count_extended': count_extended,
+        'fetched': t.time(),
+        'working_file': working_file_fingerprint(parameter),
+        'remote': remote,
+    }
 
+    _ndfd_product_cache[(directory_name, parameter, issuance)] = entry
+    _ndfd_latest_issuance[(directory_name, parameter)] = issuance
 
-    
-    local_time, utc_time = standard.plot_creation_time()
-    times = []
+    record = {
+        'issuance': issuance.strftime('%Y%m%d%H%M'),
+        'raw_path': raw_path,
+        'count_short': count_short,
+        'count_extended': count_extended,
+        'fetched': entry['fetched'],
+        'remote': remote,
+    }
 
-    for i in range(0, 10):
-        time = utc_time - timedelta(hours=i)
-        times.append(time)
+    def update(index):
+        index[directory_name + parameter] = record
 
-    t1 = times[0]
-    t2 = times[1]
-    t3 = times[2]
-    t4 = times[3]
-    t5 = times[4]
-    t6 = times[5]
-    t7 = times[6]
-    t8 = times[7]
-    t9 = times[8]
-    t10 = times[9]
+    update_ndfd_cache_index(update)
 
-    rtma_data_0, rtma_time_0 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t1)
+    try:
+        prune_NDFD_cache(directory_name, parameter)
+    except Exception as e:
+        print("Unable to delete the older " + parameter + " issuances from the NDFD cache.")
 
-    t.sleep(15)
+    return entry
 
-    rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t2)
 
-    t.sleep(15)
+def prune_NDFD_cache(directory_name, parameter):
 
-    if rtma_time_0.hour == rtma_time_1.hour:
+    r'''
+    This function deletes the issuances of an NDFD file that are older than the newest ndfd_cache_retention issuances 
+    from the cache directory and from memory. 
 
-        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
 
-        t.sleep(15)
+    Returns: None
 
-        if rtma_time_0.hour == rtma_time_1.hour:
+    '''
 
-            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+    domain_directory = os.path.dirname(os.path.dirname(ndfd_cache_path(directory_name, parameter, datetime(1970, 1, 1))))
 
-            t.sleep(15)
+    if os.path.exists(domain_directory):
+        issuances = sorted([issuance for issuance in os.listdir(domain_directory) if os.path.exists(os.path.join(domain_directory, issuance, parameter))], reverse=True)
 
-            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
+        for issuance in issuances[ndfd_cache_retention:]:
+            issuance_directory = os.path.join(domain_directory, issuance)
+            for file in os.listdir(issuance_directory):
+                if file == parameter or file.startswith(parameter + '.'):
+                    try:
+                        os.remove(os.path.join(issuance_directory, file))
+                    except OSError as e:
+                        pass
+            try:
+                os.rmdir(issuance_directory)
+            except OSError as e:
+                pass
 
-            t.sleep(15)
-    
-            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
+    issuances = sorted([key[2] for key in _ndfd_product_cache.keys() if key[0] == directory_name and key[1] == parameter], reverse=True)
 
-            t.sleep(15)
-    
-            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
+    for issuance in issuances[ndfd_cache_retention:]:
+        if _ndfd_latest_issuance.get((directory_name, parameter)) != issuance:
+            del _ndfd_product_cache[(directory_name, parameter, issuance)]
 
-            t.sleep(15)
-    
-            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
 
-            t.sleep(15)
-    
-            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t9)
+def latest_cached_NDFD_product(directory_name, parameter, check_age=True):
 
-            t.sleep(15)
+    r'''
+    This function returns the most recent cache entry of an NDFD file from memory or from disk. 
 
-            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t10)
+    Returns None when the file has not been downloaded yet or (when check_age is True) when the entry is older than ndfd_cache_max_age. 
 
-        else:
+    '''
 
-            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
+    key = (directory_name, parameter)
 
-            t.sleep(15)
-            
-            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+    if key in _ndfd_latest_issuance:
+        entry = _ndfd_product_cache[key + (_ndfd_latest_issuance[key],)]
 
-            t.sleep(15)
-    
-            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
+    else:
+        record = read_ndfd_cache_index().get(directory_name + parameter)
+        if record == None or os.path.exists(record['raw_path']) == False:
+            return None
 
-            t.sleep(15)
-    
-            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
+        issuance = datetime.strptime(record['issuance'], '%Y%m%d%H%M')
+        entry = {
+            'issuance': issuance,
+            'raw_path': record['raw_path'],
+            'ds': None,
+            'grids': {},
+            'count_short': record['count_short'],
+            'count_extended': record['count_extended'],
+            'fetched': record['fetched'],
+            'working_file': None,
+            'remote': record.get('remote'),
+        }
+        _ndfd_product_cache[key + (issuance,)] = entry
+        _ndfd_latest_issuance[key] = issuance
 
-            t.sleep(15)
-    
-            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
+    if check_age == True and (t.time() - entry['fetched']) > (ndfd_cache_max_age * 60):
+        return None
 
-            t.sleep(15)
-    
-            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
+    return entry
 
-            t.sleep(15)
 
-            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t9)
+def restore_NDFD_working_file(entry, parameter):
 
-    else:
+    r'''
+    The parsers read the NDFD file from the current working directory. Another directory (i.e. Hawaii) writes to the 
+    same file name, so the cached copy is put back when the working file is not the cached one. 
 
-        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t2)
+    '''
 
-        t.sleep(15)
+    if entry['working_file'] == None or os.path.exists(parameter) == False or working_file_fingerprint(parameter) != entry['working_file']:
+        file_functions.write_file_atomically(parameter, lambda path: shutil.copyfile(entry['raw_path'], path))
+        entry['working_file'] = working_file_fingerprint(parameter)
 
-        rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
 
-        t.sleep(15)
+def get_cached_NDFD_product(directory_name, parameter):
 
-        rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+    r'''
+    This function returns an NDFD file from the NDFD product cache. 
 
-        t.sleep(15)
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
 
-        rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
+    Returns: 1) grbs, ds, count_short, count_extended in the same layout as get_NWS_NDFD_7_Day_grid_data() or None when there is no valid cache entry. 
 
-        t.sleep(15)
+    '''
 
-        rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
+    try:
+        entry = latest_cached_NDFD_product(directory_name, parameter)
+    except Exception as e:
+        return None
 
-        t.sleep(15)
+    if entry == None:
+        return None
 
-        rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
+    return load_cached_NDFD_product(entry, parameter)
 
-        t.sleep(15)
 
-        rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
-    
-    rtma_data, rtma_times = parsers.save.append_data_RTMA_6hr_timelapse(rtma_data_0, rtma_data_1, rtma_data_2, rtma_data_3, rtma_data_4, rtma_data_5, rtma_data_6, rtma_data_7, rtma_time_0, rtma_time_1, rtma_time_2, rtma_time_3, rtma_time_4, rtma_time_5, rtma_time_6, rtma_time_7)
+class cached_grib_file:
 
-    return rtma_data, rtma_times
+    r'''
+    The pygrib file of a cached NDFD product. The plotting functions only use the decoded dataset, so the GRIB2 file 
+    is not opened on every cache hit. It is opened the first time it is used (i.e. grbs.select() or iterating over it) 
+    and closed with close() or when the object is deleted. 
+    '''
 
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._grbs = None
 
-def get_current_rtma_relative_humidity_data(current_time):
+    def open(self):
+        if self._grbs is None:
+            self._grbs = pygrib.open(self.file_path)
+        return self._grbs
 
-    r"""
-    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis for temperature and dewpoint. 
-    This function then uses MetPy to create a relative humidity dataset from the temperature and dewpoint datasets. 
-    This function then returns the relative humidity dataset. 
+    def close(self):
+        if self._grbs is not None:
+            self._grbs.close()
+            self._grbs = None
 
-    Inputs:
-           1) current_time (Datetime) - Current time in UTC.
+    def __getattr__(self, name):
+        if name.startswith('__') or name == '_grbs':
+            raise AttributeError(name)
+        return getattr(self.open(), name)
 
-    Returns: 1) If there are zero errors, the latest relative humidity dataset and the time for that dataset are returned. 
-             2) If there is an error, an error message is returned. 
+    def __getitem__(self, item):
+        return self.open()[item]
 
-    """
+    def __iter__(self):
+        return iter(self.open())
 
-    times = []
+    def __next__(self):
+        return next(self.open())
 
-    for i in range(0,5):
-        new_time = current_time - timedelta(hours=i)
-        times.append(new_time)
+    def __del__(self):
+        try:
+            self.close()
+        except Exception as e:
+            pass
 
-    try:
-        main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-        main_server_status = main_server_response.status_code
-    except Exception as a:
-        pass
-        
-    try:
-        first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        first_backup_server_status = first_backup_server_response.status_code
-    except Exception as b:
-        pass
-    
-    try:
-        second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        second_backup_server_status = second_backup_server_response.status_code
-    except Exception as c:
-        pass
-    
-    if main_server_status == 200:
-        print("Main UCAR THREDDS Server is online. Connecting!")
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+def load_cached_NDFD_product(entry, parameter):
 
-            time = times[0]
-            
-            return rtma_rh *100, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    restore_NDFD_working_file(entry, parameter)
 
-                time = times[1]
-               
-                return rtma_rh *100, time
+    if entry['ds'] is None:
+        ds = xr.load_dataset(entry['raw_path'], engine='cfgrib', backend_kwargs={'indexpath': ''})
+        entry['ds'] = ds.metpy.parse_cf()
 
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    grbs = cached_grib_file(entry['raw_path'])
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, time
+    print("Using the cached " + parameter + " file issued at " + entry['issuance'].strftime('%m/%d/%Y %H:%MZ'))
 
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    return grbs, entry['ds'], entry['count_short'], entry['count_extended']
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+def get_cached_NDFD_grids(directory_name, file_path, grid_time_interval):
 
-    if main_server_status != 200 and first_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connected to the first backup UCAR THREDDS Server!")
-        try:
-            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    r'''
+    This function returns the decoded forecast periods (parsers.NDFD_Grids) of an NDFD file. 
 
-            time = times[0]
-            
-            return rtma_rh *100, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    When the file is the cached download of directory_name, the arrays are only decoded once and are saved next to 
+    the cached GRIB2 file. Any other file is decoded directly. 
 
-                time = times[1]
-                
-                return rtma_rh *100, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) file_path (String) - The path to the GRIB2 file. 
+                        3) grid_time_interval (Integer) - The length in hours of each forecast period. 
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Returns: 1) An NDFD_Grids object. 
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    '''
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    parameter = os.path.basename(file_path)
+    key = (directory_name, parameter)
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connected to the second backup UCAR THREDDS Server!")
-        try:
-            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    entry = None
+    if key in _ndfd_latest_issuance:
+        entry = _ndfd_product_cache[key + (_ndfd_latest_issuance[key],)]
+        if entry['working_file'] == None or os.path.exists(file_path) == False or working_file_fingerprint(file_path) != entry['working_file']:
+            entry = None
 
-            time = times[0]
-            
-            return rtma_rh *100, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if entry == None:
+        return parsers.NDFD.decode_GRIB_file(file_path, grid_time_interval)
 
-                time = times[1]
-                
-                return rtma_rh *100, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    # The end times depend on grid_time_interval so the decoded periods are kept per grid_time_interval. 
+    # The arrays on disk do not depend on it and are shared. 
+    if grid_time_interval in entry['grids']:
+        return entry['grids'][grid_time_interval]
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    arrays_path = entry['raw_path'] + '.npz'
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if os.path.exists(arrays_path):
+        with np.load(arrays_path) as arrays:
+            start_times = [datetime.utcfromtimestamp(s) for s in arrays['start_times'].tolist()]
+            end_times = [s + timedelta(hours=grid_time_interval) for s in start_times]
+            grids = parsers.NDFD_Grids(arrays['values'], arrays['lats'], arrays['lons'], start_times, end_times, parameter)
+    else:
+        grids = parsers.NDFD.decode_GRIB_file(entry['raw_path'], grid_time_interval)
+        start_times = np.array([(s - datetime(1970, 1, 1)).total_seconds() for s in grids.start_times], dtype=np.int64)
+        file_functions.write_file_atomically(arrays_path, lambda path: np.savez_compressed(path, values=grids.values, lats=grids.lats, lons=grids.lons, start_times=start_times))
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    entry['grids'][grid_time_interval] = grids
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status != 200:
-        print("Unable to connect to either the main or backup servers. Aborting!")
+    return grids
 
 
-def get_red_flag_warning_parameters_using_wind_speed(current_time):
+def NDFD_grid_key(directory_name, parameter, file_path=None):
 
-    r"""
-    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis datasets for: 1) Temperature, 2) Dewpoint and 3) Wind Speed. 
-    This function uses MetPy to create a relative humidity dataset from the temperature and dewpoint datasets. 
-    This function then returns the relative humidity dataset, wind speed dataset and the time for the datasets. 
+    r'''
+    This function returns a key that identifies the decoded grids of an NDFD file (see rendering.render_forecast_days()). 
 
-    Inputs:
-           1) current_time (Datetime) - Current time in UTC. 
+    The cached download of directory_name is identified by (directory_name, parameter, issuance) and any other file by 
+    its absolute path, modification time and size, the same way get_cached_NDFD_grids() tells them apart. 
 
-    Returns:
-            1) 2.5km x 2.5km Real Time Mesoscale Analysis Relative Humidity dataset. 
-            2) 2.5km x 2.5km Real Time Mesoscale Analysis Wind Speed dataset. 
-            3) Time of the latest available datasets. 
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
 
-    """
+    Optional Arguments: 1) file_path (String) - The path to the GRIB2 file that was parsed. Default is None (the working file parameter). 
 
-    times = []
+    Returns: 1) A tuple or None when the file does not exist. 
 
-    for i in range(0,5):
-        new_time = current_time - timedelta(hours=i)
-        times.append(new_time)
+    '''
 
-    try:
-        main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-        main_server_status = main_server_response.status_code
-    except Exception as a:
-        pass
-        
-    try:
-        first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        first_backup_server_status = first_backup_server_response.status_code
-    except Exception as b:
-        pass
-        
-    try:
-        second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        second_backup_server_status = second_backup_server_response.status_code
-    except Exception as c:
-        pass
+    if file_path == None:
+        file_path = parameter
 
-    if main_server_status == 200:
-        print("Main UCAR THREDDS Server is online. Connecting!")
+    key = (directory_name, os.path.basename(file_path))
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if key in _ndfd_latest_issuance:
+        entry = _ndfd_product_cache[key + (_ndfd_latest_issuance[key],)]
+        if entry['working_file'] != None and os.path.exists(file_path) and working_file_fingerprint(file_path) == entry['working_file']:
+            return ('NDFD', directory_name, key[1], entry['issuance'])
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_wind * 2.23694, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if os.path.exists(file_path) == False:
+        return None
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_wind, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    return ('file',) + tuple(working_file_fingerprint(file_path))
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_wind, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_wind, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+def ndfd_remote_file_stats(directory_name, parameter):
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_wind, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    r'''
+    This function returns the modification time (MDTM) and size (SIZE) of the short-term and extended files of an 
+    NDFD parameter on the FTP server without downloading them. 
 
-    if main_server_status != 200 and first_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connecting to the backup UCAR THREDDS Server!")
+    Returns: 1) A dictionary {'VP.001-003': [modification time, size], 'VP.004-007': [modification time, size]}
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    '''
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_wind * 2.23694, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    stats = {}
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_wind, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    ftp = get_ftp_connection()
+    try:
+        ftp.voidcmd('TYPE I')
+        for period in ['VP.001-003', 'VP.004-007']:
+            path = directory_name + period + '/' + parameter
+            modified = ftp.voidcmd('MDTM ' + path).split()[-1]
+            stats[period] = [modified, ftp.size(path)]
+    except Exception as e:
+        close_ftp_connection(ftp)
+        raise
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_wind, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    release_ftp_connection(ftp)
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_wind, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    return stats
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_wind, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
 
+def ndfd_remote_issuance_time(directory, parameter):
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connected to the second backup UCAR THREDDS Server!")
+    r'''
+    This function reads the issuance (reference) time of an NDFD file on the FTP server from the first 35 bytes of 
+    the file (GRIB2 sections 0 and 1) without downloading the rest of the file. 
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Returns: 1) The issuance time as a datetime object. 
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_wind * 2.23694, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    '''
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_wind, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    # The transfer is stopped early so the connection is not given back to the pool. 
+    ftp = open_ftp_connection(ndfd_ftp_host, ndfd_ftp_port)
+    try:
+        ftp.voidcmd('TYPE I')
+        conn = ftp.transfercmd('RETR ' + directory + parameter)
+        header = b''
+        while len(header) < 35:
+            chunk = conn.recv(35 - len(header))
+            if not chunk:
+                break
+            header = header + chunk
+        conn.close()
+    finally:
+        close_ftp_connection(ftp)
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_wind, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    if len(header) < 35 or header[0:4] != b'GRIB' or header[7] != 2:
+        raise ValueError(parameter + " in " + directory + " is not a complete GRIB2 file.")
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_wind, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_wind = rtma_data['Wind_speed_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    year = int.from_bytes(header[28:30], 'big')
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_wind, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    return datetime(year, header[30], header[31], header[32], header[33], header[34])
 
 
+def NDFD_files_available(directory_name, parameter):
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status != 200:
-        print("Unable to connect to either the main or backup servers. Aborting!")
-                            
+    r'''
+    This function checks if a consistent pair of short-term (VP.001-003) and extended (VP.004-007) files of an NDFD 
+    parameter is on the FTP server. The pair is consistent when both files have the same issuance time. 
 
+    Returns: 1) True when both files are on the server and have the same issuance time. Otherwise False. 
 
-def get_red_flag_warning_parameters_using_wind_gust(current_time):
+    '''
 
-    r"""
-    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis datasets for: 1) Temperature, 2) Dewpoint and 3) Wind Gust. 
-    This function uses MetPy to create a relative humidity dataset from the temperature and dewpoint datasets. 
-    This function then returns the relative humidity dataset, wind gust dataset and the time for the datasets. 
+    try:
+        short_issuance = ndfd_remote_issuance_time(directory_name + 'VP.001-003/', parameter)
+        extended_issuance = ndfd_remote_issuance_time(directory_name + 'VP.004-007/', parameter)
+    except Exception as e:
+        return False
 
-    Inputs:
-           1) current_time (Datetime) - Current time in UTC. 
+    if short_issuance != extended_issuance:
+        print("The short-term (" + short_issuance.strftime('%H:%MZ') + ") and extended (" + extended_issuance.strftime('%H:%MZ') + ") " + parameter + " files are from different issuances.")
+        return False
 
-    Returns:
-            1) 2.5km x 2.5km Real Time Mesoscale Analysis Relative Humidity dataset. 
-            2) 2.5km x 2.5km Real Time Mesoscale Analysis Wind Gust dataset. 
-            3) Time of the latest available datasets. 
+    return True
 
-    """
 
-    times = []
+# The availability watcher polls the FTP server starting at ndfd_watch_first_delay seconds and doubles the delay after
+# every failed check up to ndfd_watch_max_delay seconds. It gives up after ndfd_watch_deadline minutes. 
+ndfd_watch_first_delay = 15
+ndfd_watch_max_delay = 240
+ndfd_watch_deadline = 35
 
-    for i in range(0,5):
-        new_time = current_time - timedelta(hours=i)
-        times.append(new_time)
 
-    try:
-        main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-        main_server_status = main_server_response.status_code
-    except Exception as a:
-        pass
-        
-    try:
-        first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        first_backup_server_status = first_backup_server_response.status_code
-    except Exception as b:
-        pass
-        
-    try:
-        second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        second_backup_server_status = second_backup_server_response.status_code
-    except Exception as c:
-        pass
+def NDFD_watch_delays(deadline):
 
-    if main_server_status == 200:
-        print("Main UCAR THREDDS Server is online. Connecting!")
+    if deadline == None:
+        deadline = ndfd_watch_deadline
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    stop = t.time() + (deadline * 60)
+    delay = ndfd_watch_first_delay
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_gust * 2.23694, time
-            
-        except Exception as e:
-    
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    while t.time() < stop:
+        yield min(delay, max(stop - t.time(), 0))
+        delay = min(delay * 2, ndfd_watch_max_delay)
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_gust, time
-      
-            except Exception as a:
-    
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_gust, time
-    
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+def wait_for_NDFD_files(directory_name, parameter, deadline=None):
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_gust, time
-    
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    r'''
+    This function waits until a consistent pair of short-term and extended files of an NDFD parameter is on the 
+    FTP server. It replaces idling until the 48th minute of the hour and returns as soon as the files are ready. 
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_gust, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
 
-    if main_server_status != 200 and first_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connecting to the backup UCAR THREDDS Server!")
+    Optional Arguments: 1) deadline (Integer) - The most minutes to wait. Default is ndfd_watch_deadline. 
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-    
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    Returns: 1) True when the files are ready. False when the deadline passed. 
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_gust * 2.23694, time
+    '''
+
+    print("Waiting for a complete set of " + parameter + " files on the NWS FTP server...")
+
+    for delay in NDFD_watch_delays(deadline):
+        if NDFD_files_available(directory_name, parameter) == True:
+            print("The " + parameter + " files are ready!")
+            return True
+        print("Checking again in " + str(int(round(delay, 0))) + " seconds.")
+        t.sleep(delay)
+
+    print("The " + parameter + " files were not ready before the deadline.")
+
+    return False
+
+
+async def wait_for_NDFD_files_async(directory_name, parameter, deadline=None):
+
+    r'''
+    This function is the asyncio version of wait_for_NDFD_files(). The FTP checks run in a worker thread so the 
+    event loop is not blocked. 
+
+    Returns: 1) True when the files are ready. False when the deadline passed. 
+
+    '''
+
+    loop = asyncio.get_running_loop()
+
+    for delay in NDFD_watch_delays(deadline):
+        ready = await loop.run_in_executor(None, NDFD_files_available, directory_name, parameter)
+        if ready == True:
+            return True
+        await asyncio.sleep(delay)
+
+    return False
+
+
+def mark_NDFD_product_checked(directory_name, parameter, entry):
+
+    entry['fetched'] = t.time()
+
+    def update(index):
+        record = index.get(directory_name + parameter)
+        if record != None:
+            record['fetched'] = entry['fetched']
+
+    update_ndfd_cache_index(update)
+
+
+def download_NDFD_grids_if_updated(directory_name, parameter):
+
+    r'''
+    This function only downloads an NDFD file when it changed on the FTP server. 
+
+    The modification time and size of the short-term (VP.001-003) and extended (VP.004-007) files on the server are 
+    compared with the ones recorded when the cached file was downloaded. When they match the cached file is returned 
+    and nothing is transferred or decoded again. 
+
+    Required Arguments: 1) directory_name (String) - The directory name on the NWS FTP server. 
+                        2) parameter (String) - The NDFD file name (i.e. ds.maxt.bin). 
+
+    Returns: 1) grbs, ds, count_short, count_extended (see get_NWS_NDFD_7_Day_grid_data())
+             2) new_data (Boolean) - True when new data was downloaded. False when the cached file is still the latest. 
+
+    '''
+
+    cached = get_cached_NDFD_product(directory_name, parameter)
+    if cached != None:
+        return cached + (False,)
+
+    try:
+        remote = ndfd_remote_file_stats(directory_name, parameter)
+    except Exception as e:
+        print("Unable to check the " + parameter + " files on the FTP server for updates.")
+        remote = None
+
+    if remote != None:
+        try:
+            entry = latest_cached_NDFD_product(directory_name, parameter, check_age=False)
+        except Exception as e:
+            entry = None
+
+        if entry != None and entry['remote'] == remote:
+            print("The " + parameter + " files on the FTP server have not changed since the last download.")
+            mark_NDFD_product_checked(directory_name, parameter, entry)
+            return load_cached_NDFD_product(entry, parameter) + (False,)
+
+    try:
+
+        grbs, ds, count_short, count_extended = get_NWS_NDFD_7_Day_grid_data(directory_name, parameter)
+
+        print("Downloaded data successfully!")
+    except Exception as a:
+
+        wait_for_NDFD_files(directory_name, parameter)
+
+        print("Trying again to download data...")
+
+        grbs, ds, count_short, count_extended = get_NWS_NDFD_7_Day_grid_data(directory_name, parameter)
+
+        print("Downloaded data successfully!")
+
+    try:
+        cache_NDFD_product(directory_name, parameter, ds, count_short, count_extended, remote)
+    except Exception as e:
+        print("Unable to cache " + parameter + ". The next product will download it again.")
+
+    return grbs, ds, count_short, count_extended, True
+
+
+def clear_NDFD_cache():
+
+    r'''
+    This function empties the in-memory NDFD product cache. The files in the cache directory are kept. 
+    '''
+
+    _ndfd_product_cache.clear()
+    _ndfd_latest_issuance.clear()
+
+
+##########################
+# SERVER HEALTH          #
+##########################
+
+# Checking whether the UCAR THREDDS servers are online used to download each catalog.xml before every request. 
+# The status of each server is now kept for server_health_ttl seconds and the servers are checked at the same time 
+# over one pooled requests.Session per host. A server that fails server_failure_threshold checks in a row is skipped 
+# (without waiting for its timeout) for server_retry_after seconds before it is checked again. 
+
+main_thredds_server = "https://thredds.ucar.edu"
+first_backup_thredds_server = "https://thredds-test.unidata.ucar.edu"
+second_backup_thredds_server = "https://thredds-dev.unidata.ucar.edu"
+
+thredds_servers = [main_thredds_server, first_backup_thredds_server, second_backup_thredds_server]
+
+server_health_ttl = 120
+
+server_health_timeout = 10
+
+server_failure_threshold = 2
+
+server_retry_after = 300
+
+_http_sessions = {}
+_server_health = {}
+_server_health_lock = threading.Lock()
+
+
+def get_http_session(url):
+
+    r'''
+    This function returns the pooled requests.Session of the host of a URL. 
+    '''
+
+    host = urllib.parse.urlsplit(url).netloc
+
+    with _server_health_lock:
+        try:
+            session = _http_sessions[host]
+        except KeyError:
+            session = requests.Session()
+            _http_sessions[host] = session
+
+    return session
+
+
+def check_server(server):
+
+    r'''
+    This function returns the status code of the catalog of a THREDDS server. 
+
+    The status is only requested from the server when the last check is older than server_health_ttl seconds. 
+    While a server is skipped after failing server_failure_threshold checks in a row, None is returned right away. 
+
+    Required Arguments: 1) server (String) - The THREDDS server (i.e. 'https://thredds.ucar.edu'). 
+
+    Returns: The status code (or None if the server did not answer). 
+    '''
+
+    now = t.monotonic()
+
+    with _server_health_lock:
+        health = _server_health.setdefault(server, {'status': None, 'checked': None, 'failures': 0, 'skip_until': 0})
+        if now < health['skip_until']:
+            return None
+        if health['checked'] != None and (now - health['checked']) < server_health_ttl:
+            return health['status']
+
+    try:
+        response = get_http_session(server).get(server + "/thredds/catalog/catalog.xml", timeout=server_health_timeout)
+        status = response.status_code
+    except Exception as e:
+        status = None
+
+    with _server_health_lock:
+        health['status'] = status
+        health['checked'] = t.monotonic()
+        if status == 200:
+            health['failures'] = 0
+        else:
+            health['failures'] = health['failures'] + 1
+            if health['failures'] >= server_failure_threshold:
+                print(server + " is not responding. It will be skipped for the next " + str(server_retry_after) + " seconds.")
+                health['skip_until'] = health['checked'] + server_retry_after
+
+    return status
+
+
+def thredds_server_statuses(servers=None):
+
+    r'''
+    This function checks the THREDDS servers at the same time. 
+
+    Optional Arguments: 1) servers (List) - The servers to check. Default is None (the main, first backup and second backup servers). 
+
+    Returns: A list of the status codes in the same order as the servers. 
+    '''
+
+    if servers == None:
+        servers = thredds_servers
+
+    with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+        statuses = list(executor.map(check_server, servers))
+
+    return statuses
+
+
+def clear_server_health():
+
+    r'''
+    This function forgets the status of every server so the next request checks them again. 
+    '''
+
+    with _server_health_lock:
+        _server_health.clear()
+
+
+##########################
+# RTMA SUBSETTING        #
+##########################
+
+# The RTMA analysis covers all of CONUS at 2.5km. When a plot only shows part of the domain (i.e. a state or a GACC) 
+# only the grid points inside the plot extent (plus rtma_subset_margin degrees on every side) are requested. 
+# The OPeNDAP datasets are opened lazily so slicing them by index before the values are read turns into a hyperslab 
+# request and the rest of the grid is never sent. The index window only depends on the grid and the extent so it is 
+# computed once per region and kept in _rtma_window_registry. 
+
+rtma_subset_margin = 1
+
+_rtma_window_registry = {}
+
+# While firewxpy.rendering.render_all_regions() runs this is a dictionary and the RTMA analyses are only downloaded 
+# once for the full domain. Every region is then cropped from the grids in memory instead of requesting its own window. 
+_rtma_batch_cache = None
+
+
+def index_slice(mask, margin=0):
+
+    r'''
+    This function returns the slice covering every True value in a 1-D mask. 
+
+    Required Arguments: 1) mask (Boolean Array) - True where the grid point is inside the extent. 
+
+    Optional Arguments: 1) margin (Integer) - Extra grid points to add on both sides. Default is 0. 
+
+    Returns: The slice of the indices (or None when no value is True). 
+    '''
+
+    indices = np.flatnonzero(mask)
+
+    if len(indices) == 0:
+        return None
+
+    start = max(int(indices[0]) - margin, 0)
+    stop = min(int(indices[-1]) + margin + 1, len(mask))
+
+    return slice(start, stop)
+
+
+def rtma_extent_with_margin(extent):
+
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    return (western_bound - rtma_subset_margin, eastern_bound + rtma_subset_margin, southern_bound - rtma_subset_margin, northern_bound + rtma_subset_margin)
+
+
+def rtma_latlon_window(ds, extent):
+
+    r'''
+    This function returns the index window of a dataset on a latitude/longitude grid (i.e. NOMADS) for a plot extent. 
+
+    Required Arguments: 1) ds (xarray.Dataset) - The dataset with 1-D lat and lon coordinates. 
+
+                        2) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. 
+
+    Returns: A dictionary of {dimension: slice} to pass into isel (or None if the extent is outside of the grid). 
+    '''
+
+    lat = ds['lat'].values
+    lon = ds['lon'].values
+    
+    key = ('latlon', tuple(extent), lat.size, lon.size, float(lat[0]), float(lon[0]))
+
+    try:
+        return _rtma_window_registry[key]
+    except KeyError:
+        pass
+
+    western_bound, eastern_bound, southern_bound, northern_bound = rtma_extent_with_margin(extent)
+
+    # NOMADS longitudes run from 0 to 360
+    if np.nanmax(lon) > 180:
+        western_bound = western_bound % 360
+        eastern_bound = eastern_bound % 360
+
+    lat_slice = index_slice((lat >= southern_bound) & (lat <= northern_bound))
+    lon_slice = index_slice((lon >= western_bound) & (lon <= eastern_bound))
+
+    if lat_slice == None or lon_slice == None:
+        window = None
+    else:
+        window = {ds['lat'].dims[0]: lat_slice, ds['lon'].dims[0]: lon_slice}
+
+    _rtma_window_registry[key] = window
+
+    return window
+
+
+def rtma_projected_window(data, extent):
+
+    r'''
+    This function returns the index window of a variable on a projected x/y grid (i.e. UCAR THREDDS) for a plot extent. 
+
+    The edges of the extent are transformed into the projection of the data so the window also covers the curved 
+    edges of the region on a Lambert Conformal grid. 
+
+    Required Arguments: 1) data (xarray.DataArray) - The variable after metpy.parse_cf(). 
+
+                        2) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. 
+
+    Returns: A dictionary of {dimension: slice} to pass into isel (or None if the extent is outside of the grid). 
+    '''
+
+    x = data.metpy.x
+    y = data.metpy.y
+    x_values = x.metpy.unit_array.m_as('m')
+    y_values = y.metpy.unit_array.m_as('m')
+
+    key = ('projected', tuple(extent), x_values.size, y_values.size, float(x_values[0]), float(y_values[0]))
+
+    try:
+        return _rtma_window_registry[key]
+    except KeyError:
+        pass
+
+    western_bound, eastern_bound, southern_bound, northern_bound = rtma_extent_with_margin(extent)
+
+    lons = np.linspace(western_bound, eastern_bound, 50)
+    lats = np.linspace(southern_bound, northern_bound, 50)
+    edge_lons = np.concatenate([lons, lons, np.full(50, western_bound), np.full(50, eastern_bound)])
+    edge_lats = np.concatenate([np.full(50, southern_bound), np.full(50, northern_bound), lats, lats])
+
+    points = data.metpy.cartopy_crs.transform_points(ccrs.PlateCarree(), edge_lons, edge_lats)
+
+    x_slice = index_slice((x_values >= np.nanmin(points[:, 0])) & (x_values <= np.nanmax(points[:, 0])))
+    y_slice = index_slice((y_values >= np.nanmin(points[:, 1])) & (y_values <= np.nanmax(points[:, 1])))
+
+    if x_slice == None or y_slice == None:
+        window = None
+    else:
+        window = {x.dims[0]: x_slice, y.dims[0]: y_slice}
+
+    _rtma_window_registry[key] = window
+
+    return window
+
+
+def subset_rtma_dataset(ds, extent=None, variables=None):
+
+    r'''
+    This function trims a lazily opened RTMA dataset (NOMADS) to the variables and region of a plot. 
+
+    Required Arguments: 1) ds (xarray.Dataset) - The RTMA dataset. 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. 
+                           Default is None (the full domain). 
+
+                        2) variables (List) - The names of the variables to keep. Default is None (all variables). 
+
+    Returns: The subset of the dataset. 
+    '''
+
+    if variables != None:
+        ds = ds[list(variables)]
+
+    if extent != None:
+        try:
+            window = rtma_latlon_window(ds, extent)
+        except Exception as e:
+            print("Unable to subset the RTMA data to the plot extent. Using the full domain.")
+            window = None
+
+        if window != None:
+            ds = ds.isel(window)
+
+    return ds
+
+
+def crop_rtma_parameter(rtma_parameter, extent=None):
+
+    r'''
+    This function trims one RTMA variable on the projected x/y grid to the region of a plot. 
+
+    Required Arguments: 1) rtma_parameter (xarray.DataArray) - The variable after metpy.parse_cf(). 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. 
+                           Default is None (the full domain). 
+
+    Returns: The subset of the variable. 
+    '''
+
+    if extent != None:
+        try:
+            window = rtma_projected_window(rtma_parameter, extent)
+        except Exception as e:
+            print("Unable to subset the RTMA data to the plot extent. Using the full domain.")
+            window = None
+
+        if window != None:
+            rtma_parameter = rtma_parameter.isel(window)
+
+    return rtma_parameter
+
+
+def subset_rtma_parameter(rtma_data, parameter, extent=None):
+
+    r'''
+    This function selects one variable of a lazily opened RTMA dataset (UCAR THREDDS), trims it to the region of a 
+    plot and assigns the latitude and longitude coordinates. 
+
+    Required Arguments: 1) rtma_data (xarray.Dataset) - The RTMA dataset returned by remote_access(). 
+
+                        2) parameter (String) - The name of the variable. 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. 
+                           Default is None (the full domain). 
+
+    Returns: The variable (squeezed) with latitude and longitude coordinates. 
+    '''
+
+    rtma_parameter = crop_rtma_parameter(rtma_data.metpy.parse_cf(parameter), extent)
+
+    rtma_parameter = rtma_parameter.metpy.assign_latitude_longitude()
+
+    return rtma_parameter.squeeze()
+
+
+##########################
+# RTMA ANALYSIS HOUR     #
+##########################
+
+# The latest RTMA analysis is not always posted yet (especially on NOMADS) so every candidate hour is checked at the 
+# same time with a small request (the DDS of the OPeNDAP dataset or the THREDDS catalog) and the newest hour that is 
+# available is opened. The hour that was opened is remembered per domain for rtma_latest_hour_ttl minutes so the 
+# next product skips the check. 
+
+rtma_probe_timeout = 10
+
+# Minutes
+rtma_latest_hour_ttl = 10
+
+_rtma_latest_hour = {}
+
+
+def nomads_rtma_url(domain, analysis_time):
+
+    r'''
+    This function returns the NOMADS OPeNDAP URL of an RTMA analysis. 
+
+    Required Arguments: 1) domain (String) - The NOMADS RTMA directory (i.e. 'rtma2p5', 'akrtma' or 'hirtma'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+    Returns: The URL of the dataset. 
+    '''
+
+    return 'http://nomads.ncep.noaa.gov:80/dods/'+domain+'/'+domain+analysis_time.strftime('%Y%m%d')+'/'+domain+'_anl_'+analysis_time.strftime('%H')+'z'
+
+
+def thredds_rtma_catalog_url(server, analysis_time):
+
+    r'''
+    This function returns the UCAR THREDDS catalog URL of a 2.5km x 2.5km RTMA analysis. 
+
+    Required Arguments: 1) server (String) - The THREDDS server (i.e. 'https://thredds.ucar.edu'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+    Returns: The URL of the catalog. 
+    '''
+
+    return server+'/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+analysis_time.strftime('%Y%m%d_%H00')+'.grib2/catalog.xml'
+
+
+def rtma_url_available(url):
+
+    try:
+        response = get_http_session(url).get(url, timeout=rtma_probe_timeout)
+    except Exception as e:
+        return False
+
+    # NOMADS answers a missing dataset with an error message instead of an error status
+    if response.status_code != 200 or response.text.lstrip().startswith('Error'):
+        return False
+
+    return True
+
+
+def probe_rtma_analysis_times(candidates, probe_url):
+
+    r'''
+    This function checks all of the candidate analysis times at the same time. 
+
+    Required Arguments: 1) candidates (List) - The analysis times (newest first). 
+
+                        2) probe_url (Function) - Returns the URL to check for an analysis time. 
+
+    Returns: The analysis times that are available (newest first). 
+    '''
+
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        available = list(executor.map(rtma_url_available, [probe_url(c) for c in candidates]))
+
+    return [c for c, a in zip(candidates, available) if a == True]
+
+
+def remember_rtma_analysis_time(domain, analysis_time):
+
+    hour = analysis_time.strftime('%Y%m%d%H')
+
+    # While the remembered hour is fresh, rtma_analysis_times() yields it without checking the server, so opening it 
+    # again is a cache hit and keeps the time of the last check. Otherwise the hour came from checking the server. 
+    try:
+        remembered, checked = _rtma_latest_hour[domain]
+        if remembered == hour and (t.monotonic() - checked) < (rtma_latest_hour_ttl * 60):
+            return
+    except KeyError:
+        pass
+
+    _rtma_latest_hour[domain] = (hour, t.monotonic())
+
+
+def forget_rtma_analysis_time(domain):
+
+    _rtma_latest_hour.pop(domain, None)
+
+
+def rtma_analysis_times(domain, current_time, probe_url, hours=5):
+
+    r'''
+    This function yields the analysis times to try opening for a domain (newest first). 
+
+    If an analysis time for the domain was opened less than rtma_latest_hour_ttl minutes ago, it is yielded without 
+    checking the server. Otherwise (or if that analysis can no longer be opened) every candidate hour is checked at 
+    once and only the available hours are yielded. 
+
+    Required Arguments: 1) domain (String) - The name of the RTMA domain. 
+
+                        2) current_time (Datetime) - Current time in UTC. 
+
+                        3) probe_url (Function) - Returns the URL to check for an analysis time. 
+
+    Optional Arguments: 1) hours (Integer) - The number of hours to look back. Default is 5. 
+
+    Yields: The analysis times. 
+    '''
+
+    candidates = []
+    for i in range(0, hours):
+        candidates.append(pd.to_datetime(current_time - timedelta(hours=i)))
+
+    remembered = None
+    try:
+        hour, checked = _rtma_latest_hour[domain]
+        if (t.monotonic() - checked) < (rtma_latest_hour_ttl * 60):
+            remembered = hour
+    except KeyError:
+        pass
+
+    for candidate in candidates:
+        if candidate.strftime('%Y%m%d%H') == remembered:
+            yield candidate
+            forget_rtma_analysis_time(domain)
+
+    for candidate in probe_rtma_analysis_times(candidates, probe_url):
+        if candidate.strftime('%Y%m%d%H') != remembered:
+            yield candidate
+
+
+##########################
+# RTMA ARCHIVE           #
+##########################
+
+# The 24-hour comparisons and the timelapses need the analyses from earlier hours, which were already downloaded by 
+# earlier runs. Each hour of a subset RTMA analysis is written once (one compressed NetCDF file per variable and 
+# extent) to "RTMA Archive/<domain>/<YYYYmmddHH>" and later runs read the earlier hours from there. 
+# Hours older than rtma_archive_retention hours before the newest archived hour are deleted. 
+
+use_rtma_archive = True
+
+rtma_archive_directory = "RTMA Archive"
+
+# Hours
+rtma_archive_retention = 30
+
+
+def rtma_archive_path(domain, analysis_time, variable, extent=None):
+
+    r'''
+    This function returns the path of an archived RTMA variable. 
+
+    Required Arguments: 1) domain (String) - The name of the RTMA domain (i.e. 'rtma2p5'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+                        3) variable (String) - The name of the variable. 
+
+    Optional Arguments: 1) extent (List) - The extent the variable was subset to. Default is None (the full domain). 
+
+    Returns: The path of the NetCDF file. 
+    '''
+
+    if extent == None:
+        extent_name = 'full'
+    else:
+        extent_name = '_'.join(f"{bound:.2f}" for bound in extent)
+
+    return os.path.join(rtma_archive_directory, domain, analysis_time.strftime('%Y%m%d%H'), variable+'_'+extent_name+'.nc')
+
+
+def write_rtma_archive_file(ds, path):
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    encoding = {}
+    for name in ds.data_vars:
+        if ds[name].ndim > 0:
+            encoding[name] = {'zlib': True, 'complevel': 4}
+
+    # Writes to a unique temporary file first so a run that stops halfway never leaves a partial file in the archive 
+    # and two processes archiving the same hour do not write to the same file
+    file_functions.write_file_atomically(path, lambda temporary_path: ds.to_netcdf(temporary_path, encoding=encoding))
+
+
+def prune_rtma_archive(domain, newest_time):
+
+    r'''
+    This function deletes the archived hours of a domain that are older than rtma_archive_retention hours before the newest hour. 
+    '''
+
+    domain_directory = os.path.join(rtma_archive_directory, domain)
+    oldest = (newest_time - timedelta(hours=rtma_archive_retention)).strftime('%Y%m%d%H')
+
+    for hour in os.listdir(domain_directory):
+        if hour < oldest:
+            shutil.rmtree(os.path.join(domain_directory, hour), ignore_errors=True)
+
+
+def archive_rtma_dataset(domain, analysis_time, ds, extent=None, variables=None):
+
+    r'''
+    This function writes the variables of an RTMA dataset (NOMADS) to the archive. 
+
+    Required Arguments: 1) domain (String) - The NOMADS RTMA directory (i.e. 'rtma2p5'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+                        3) ds (xarray.Dataset) - The dataset after subset_rtma_dataset(). 
+
+    Optional Arguments: 1) extent (List) - The extent the dataset was subset to. Default is None. 
+
+                        2) variables (List) - The variables in the dataset. Default is None. 
+                           Datasets with all of the variables are not archived. 
+
+    Returns: The dataset (with the values loaded into memory if it was archived). 
+    '''
+
+    if use_rtma_archive == False or variables == None:
+        return ds
+
+    try:
+        ds = ds.load()
+        for variable in variables:
+            path = rtma_archive_path(domain, analysis_time, variable, extent)
+            if os.path.exists(path) == False:
+                write_rtma_archive_file(ds[[variable]], path)
+        prune_rtma_archive(domain, analysis_time)
+    except Exception as e:
+        print("Unable to archive the RTMA data for " + analysis_time.strftime('%m/%d/%Y %HZ'))
+
+    return ds
+
+
+def read_archived_rtma_dataset(domain, analysis_time, extent=None, variables=None):
+
+    r'''
+    This function reads the variables of an RTMA dataset (NOMADS) from the archive. 
+
+    Required Arguments: 1) domain (String) - The NOMADS RTMA directory (i.e. 'rtma2p5'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+    Optional Arguments: 1) extent (List) - The extent the dataset was subset to. Default is None. 
+
+                        2) variables (List) - The variables to read. Default is None. 
+
+    Returns: The dataset (or None if any of the variables is not in the archive). 
+    '''
+
+    if use_rtma_archive == False or variables == None:
+        return None
+
+    paths = [rtma_archive_path(domain, analysis_time, variable, extent) for variable in variables]
+
+    if all(os.path.exists(path) for path in paths) == False:
+        return None
+
+    try:
+        ds = xr.merge([xr.load_dataset(path) for path in paths])
+    except Exception as e:
+        return None
+
+    print("Loaded the RTMA data for " + analysis_time.strftime('%m/%d/%Y %HZ') + " from the archive")
+
+    return ds
+
+
+def archive_rtma_parameter(domain, analysis_time, parameter, rtma_parameter, extent=None):
+
+    r'''
+    This function writes one RTMA variable (UCAR THREDDS) to the archive along with its grid mapping. 
+
+    Required Arguments: 1) domain (String) - The name of the RTMA domain. 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+                        3) parameter (String) - The name of the variable. 
+
+                        4) rtma_parameter (xarray.DataArray) - The variable after subset_rtma_parameter(). 
+
+    Optional Arguments: 1) extent (List) - The extent the variable was subset to. Default is None. 
+
+    Returns: The variable (with the values loaded into memory if it was archived). 
+    '''
+
+    if use_rtma_archive == False:
+        return rtma_parameter
+
+    path = rtma_archive_path(domain, analysis_time, parameter, extent)
+
+    try:
+        rtma_parameter = rtma_parameter.load()
+        if os.path.exists(path) == False:
+            grid_mapping = rtma_parameter.attrs.get('grid_mapping', 'grid_mapping')
+            ds = rtma_parameter.drop_vars('metpy_crs', errors='ignore').to_dataset(name=parameter)
+            ds[parameter].attrs['grid_mapping'] = grid_mapping
+            ds[grid_mapping] = xr.DataArray(0, attrs=rtma_parameter.metpy.crs.to_dict())
+            write_rtma_archive_file(ds, path)
+        prune_rtma_archive(domain, analysis_time)
+    except Exception as e:
+        print("Unable to archive the RTMA " + parameter + " data for " + analysis_time.strftime('%m/%d/%Y %H00 UTC'))
+
+    return rtma_parameter
+
+
+def read_archived_rtma_parameter(domain, analysis_time, parameter, extent=None):
+
+    r'''
+    This function reads one RTMA variable (UCAR THREDDS) from the archive. 
+
+    Returns: The variable with its projection (or None if it is not in the archive). 
+    '''
+
+    if use_rtma_archive == False:
+        return None
+
+    path = rtma_archive_path(domain, analysis_time, parameter, extent)
+
+    if os.path.exists(path) == False:
+        return None
+
+    try:
+        rtma_parameter = xr.load_dataset(path).metpy.parse_cf(parameter).squeeze()
+    except Exception as e:
+        return None
+
+    print("Loaded the RTMA " + parameter + " data for " + analysis_time.strftime('%m/%d/%Y %H00 UTC') + " from the archive")
+
+    return rtma_parameter
+
+
+def get_nomads_rtma_dataset(domain, analysis_time, extent=None, variables=None):
+
+    r'''
+    This function returns an RTMA analysis from the archive or (if it is not archived yet) from NOMADS. 
+    Datasets that are downloaded are added to the archive. 
+
+    Required Arguments: 1) domain (String) - The NOMADS RTMA directory (i.e. 'rtma2p5'). 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. Default is None. 
+
+                        2) variables (List) - The names of the variables. Default is None (all variables). 
+
+    Returns: The dataset. 
+    '''
+
+    if _rtma_batch_cache != None and extent != None:
+        if variables != None:
+            variables = list(variables)
+            key = ('nomads', domain, analysis_time, tuple(variables))
+        else:
+            key = ('nomads', domain, analysis_time, None)
+        if key not in _rtma_batch_cache:
+            _rtma_batch_cache[key] = get_nomads_rtma_dataset(domain, analysis_time, None, variables).load()
+        return subset_rtma_dataset(_rtma_batch_cache[key], extent)
+
+    ds = read_archived_rtma_dataset(domain, analysis_time, extent, variables)
+
+    if ds is None:
+        ds = subset_rtma_dataset(xr.open_dataset(nomads_rtma_url(domain, analysis_time), engine='netcdf4'), extent, variables)
+        ds = archive_rtma_dataset(domain, analysis_time, ds, extent, variables)
+
+    return ds
+
+
+def select_thredds_server():
+
+    r'''
+    This function returns the first UCAR THREDDS server that is online (the main server, then the first and second backup servers). 
+
+    Returns: The server (or None if all of the servers are down). 
+    '''
+
+    main_server_status, first_backup_server_status, second_backup_server_status = thredds_server_statuses()
+
+    if main_server_status == 200:
+        print("Main UCAR THREDDS Server is online. Connecting!")
+        return main_thredds_server
+
+    if first_backup_server_status == 200:
+        print("Main UCAR THREDDS Server is down. Connected to the first backup UCAR THREDDS Server!")
+        return first_backup_thredds_server
+
+    if second_backup_server_status == 200:
+        print("Main UCAR THREDDS Server is down. Connected to the second backup UCAR THREDDS Server!")
+        return second_backup_thredds_server
+
+    print("Unable to connect to either the main or backup servers. Aborting!")
+
+    return None
+
+
+def get_thredds_rtma_parameters(server, analysis_time, parameters, extent=None):
+
+    r'''
+    This function returns variables of the 2.5km x 2.5km RTMA analysis from the archive or (if they are not archived yet) 
+    from a UCAR THREDDS server. The remote dataset is opened once for all of the variables that are not archived and 
+    only the index window of the extent is downloaded for each of them. Variables that are downloaded are added to the archive. 
+
+    Required Arguments: 1) server (String) - The THREDDS server. 
+
+                        2) analysis_time (Datetime) - The time of the analysis. 
+
+                        3) parameters (List) - The names of the variables. 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. Default is None. 
+
+    Returns: A list of the variables (in the same order as the names) with latitude and longitude coordinates. 
+    '''
+
+    if _rtma_batch_cache != None and extent != None:
+        keys = [('thredds', analysis_time, parameter) for parameter in parameters]
+        missing = [parameter for parameter, key in zip(parameters, keys) if key not in _rtma_batch_cache]
+        if len(missing) > 0:
+            for parameter, rtma_parameter in zip(missing, get_thredds_rtma_parameters(server, analysis_time, missing, None)):
+                _rtma_batch_cache[('thredds', analysis_time, parameter)] = rtma_parameter.load()
+        return [crop_rtma_parameter(_rtma_batch_cache[key], extent) for key in keys]
+
+    rtma_parameters = [read_archived_rtma_parameter('RTMA_CONUS_2p5km', analysis_time, parameter, extent) for parameter in parameters]
+
+    if any(rtma_parameter is None for rtma_parameter in rtma_parameters):
+        rtma_cat = TDSCatalog(thredds_rtma_catalog_url(server, analysis_time))
+        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+analysis_time.strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
+
+        for i, parameter in enumerate(parameters):
+            if rtma_parameters[i] is None:
+                rtma_parameter = subset_rtma_parameter(rtma_data, parameter, extent)
+                rtma_parameters[i] = archive_rtma_parameter('RTMA_CONUS_2p5km', analysis_time, parameter, rtma_parameter, extent)
+
+    return rtma_parameters
+
+
+def get_thredds_rtma_parameter(server, analysis_time, parameter, extent=None):
+
+    r'''
+    This function returns one variable of the 2.5km x 2.5km RTMA analysis (see get_thredds_rtma_parameters()). 
+    '''
+
+    return get_thredds_rtma_parameters(server, analysis_time, [parameter], extent)[0]
+
+
+def get_latest_thredds_rtma_parameters(current_time, parameters, extent=None):
+
+    r'''
+    This function retrieves variables of the latest available 2.5km x 2.5km RTMA analysis from the UCAR THREDDS servers. 
+
+    Required Arguments: 1) current_time (Datetime) - Current time in UTC. 
+
+                        2) parameters (List) - The names of the variables. 
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] in degrees. Default is None. 
+
+    Returns: 1) A list of the variables (in the same order as the names)
+
+             2) The time of the analysis
+
+             (None if none of the analyses from the last 5 hours are available)
+    '''
+
+    server = select_thredds_server()
+
+    if server == None:
+        return None
+
+    domain = server + '/RTMA_CONUS_2p5km'
+
+    for analysis_time in rtma_analysis_times(domain, current_time, lambda time: thredds_rtma_catalog_url(server, time)):
+        try:
+            rtma_parameters = get_thredds_rtma_parameters(server, analysis_time, parameters, extent)
+
+            print("Data retrieval for " + analysis_time.strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            remember_rtma_analysis_time(domain, analysis_time)
+
+            return rtma_parameters, analysis_time
+
+        except Exception as e:
+            print("Data is unavailiable for "+analysis_time.strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the previous analysis.")
+
+    print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
+
+    return None
+
+
+def rtma_relative_humidity(rtma_temp, rtma_dwpt):
+
+    r'''
+    This function calculates the relative humidity (%) from the RTMA temperature and dewpoint (Kelvin) in float32 
+    without units. The coordinates (and projection) of the temperature are kept. 
+    '''
+
+    rtma_rh = calc.Thermodynamics.relative_humidity_from_temperature_and_dewpoint_kelvin(rtma_temp, rtma_dwpt)
+
+    if 'metpy_crs' in rtma_temp.coords:
+        rtma_rh = rtma_rh.assign_coords(metpy_crs=rtma_temp['metpy_crs'])
+
+    rtma_rh.name = 'Relative_humidity'
+    rtma_rh.attrs['units'] = 'percent'
+
+    return rtma_rh
+
+
+##########################
+# STATION INDEX          #
+##########################
+
+# The METAR functions only keep the stations that are airports in MetPy's airport-codes.csv. Reading and filtering 
+# that CSV (~60k rows) on every call is slow so the columns that are needed (station id, type, latitude and longitude) 
+# (and region, i.e. US-CA) are written once to a NumPy file in station_index_directory and kept in memory after the 
+# first load. The index is rebuilt when the modification time of the CSV (or station_index_version) changes. The station ids of each set of airport types are kept as a 
+# frozenset and the projected coordinates of the stations are kept for each map projection. 
+
+station_index_directory = "Station Index"
+
+# Changing the columns of the index requires a new version so the saved indexes are rebuilt
+station_index_version = 2
+
+_station_index = {}
+
+_station_id_sets = {}
+
+_station_projected_coordinates = {}
+
+_station_index_lock = threading.Lock()
+
+
+def station_index_path():
+
+    return os.path.join(station_index_directory, 'airport_codes.npz')
+
+
+def parse_station_coordinates(airports_df):
+
+    r'''
+    This function returns the latitude and longitude of each airport in airport-codes.csv as float32 arrays. 
+    The coordinates column is written as "longitude, latitude". 
+    '''
+
+    if 'latitude_deg' in airports_df.columns:
+        return airports_df['latitude_deg'].to_numpy(dtype='float32'), airports_df['longitude_deg'].to_numpy(dtype='float32')
+
+    coordinates = airports_df['coordinates'].astype(str).str.split(',', n=1, expand=True)
+    longitude = pd.to_numeric(coordinates[0], errors='coerce').to_numpy(dtype='float32')
+    latitude = pd.to_numeric(coordinates[1], errors='coerce').to_numpy(dtype='float32')
+
+    return latitude, longitude
+
+
+def build_station_index(source_path, source_mtime):
+
+    r'''
+    This function builds the station index from airport-codes.csv and writes it to the disk. 
+    '''
+
+    airports_df = pd.read_csv(source_path, dtype=str, keep_default_na=False)
+    latitude, longitude = parse_station_coordinates(airports_df)
+
+    index = {
+        'ident': airports_df['ident'].to_numpy(dtype='U'),
+        'type': airports_df['type'].to_numpy(dtype='U'),
+        'region': airports_df['iso_region'].to_numpy(dtype='U'),
+        'latitude': latitude,
+        'longitude': longitude,
+        'source_mtime': np.array(source_mtime),
+        'version': np.array(station_index_version)
+    }
+
+    try:
+        os.makedirs(station_index_directory, exist_ok=True)
+        file_functions.write_file_atomically(station_index_path(), lambda path: np.savez(path, **index))
+    except Exception as e:
+        print("Unable to save the station index to " + station_index_path() + ": " + str(e))
+
+    return index
+
+
+def load_station_index():
+
+    r'''
+    This function returns the station index (built from MetPy's airport-codes.csv). 
+    
+    Returns: A dictionary of NumPy arrays: 'ident' (station id), 'type', 'region', 'latitude', 'longitude'. 
+    '''
+
+    if 'ident' in _station_index:
+        return _station_index
+
+    with _station_index_lock:
+
+        if 'ident' in _station_index:
+            return _station_index
+
+        source_path = get_test_data('airport-codes.csv', as_file_obj=False)
+        source_mtime = os.path.getmtime(source_path)
+
+        index = None
+        if os.path.exists(station_index_path()):
+            try:
+                with np.load(station_index_path(), allow_pickle=False) as saved:
+                    if float(saved['source_mtime']) == source_mtime and 'version' in saved.files and int(saved['version']) == station_index_version:
+                        index = {key: saved[key] for key in saved.files}
+            except Exception as e:
+                index = None
+
+        if index == None:
+            print("Building the station index from airport-codes.csv")
+            index = build_station_index(source_path, source_mtime)
+
+        _station_index.update(index)
+
+    return _station_index
+
+
+def airport_station_ids(types=['large_airport', 'medium_airport', 'small_airport']):
+
+    r'''
+    This function returns the station ids of the airports of the given types. 
+
+    Optional Arguments: 1) types (List) - The airport types. Default is ['large_airport', 'medium_airport', 'small_airport']. 
+
+    Returns: A frozenset of station ids. 
+    '''
+
+    key = tuple(sorted(types))
+
+    try:
+        return _station_id_sets[key]
+    except KeyError:
+        index = load_station_index()
+        mask = np.isin(index['type'], list(key))
+        station_ids = frozenset(index['ident'][mask].tolist())
+        _station_id_sets[key] = station_ids
+        return station_ids
+
+
+def station_coordinates(station_ids):
+
+    r'''
+    This function returns the latitude and longitude of the given stations. 
+
+    Required Arguments: 1) station_ids (List) - The station ids. 
+
+    Returns: The latitude and longitude (float32 arrays). Stations that are not in the index are NaN. 
+    '''
+
+    index = load_station_index()
+    positions = station_positions(station_ids)
+    valid = positions >= 0
+
+    latitude = np.full(len(positions), np.nan, dtype='float32')
+    longitude = np.full(len(positions), np.nan, dtype='float32')
+    latitude[valid] = index['latitude'][positions[valid]]
+    longitude[valid] = index['longitude'][positions[valid]]
+
+    return latitude, longitude
+
+
+def station_positions(station_ids):
+
+    r'''
+    This function returns the position of each station in the station index (-1 if the station is not in the index). 
+    '''
+
+    index = load_station_index()
+
+    if 'positions' not in _station_index:
+        _station_index['positions'] = {ident: i for i, ident in enumerate(index['ident'].tolist())}
+
+    positions = _station_index['positions']
+
+    return np.array([positions.get(station_id, -1) for station_id in station_ids], dtype='int64')
+
+
+def station_projected_coordinates(projection):
+
+    r'''
+    This function returns the coordinates of every station in the index transformed to a map projection. 
+    The coordinates are computed once for each projection. 
+
+    Required Arguments: 1) projection (cartopy.crs) - The map projection. 
+
+    Returns: The x and y coordinates (float32 arrays in the order of the station index). 
+    '''
+
+    key = projection.proj4_init
+
+    try:
+        return _station_projected_coordinates[key]
+    except KeyError:
+        index = load_station_index()
+        points = projection.transform_points(ccrs.PlateCarree(), index['longitude'].astype('float64'), index['latitude'].astype('float64'))
+        coordinates = (points[:, 0].astype('float32'), points[:, 1].astype('float32'))
+        _station_projected_coordinates[key] = coordinates
+        return coordinates
+
+
+def stations_in_region(state=None, gacc_region=None, cwa=None, types=['large_airport', 'medium_airport', 'small_airport']):
+
+    r'''
+    This function returns the station ids of the airports in a state, a GACC region or an NWS County Warning Area (CWA). 
+
+    Optional Arguments: 1) state (String) - The two letter state abbreviation (i.e. 'CA'). Default is None. 
+
+                        2) gacc_region (String) - The GACC region abbreviation (i.e. 'OSCC'). Default is None. 
+
+                        3) cwa (String) - The 3 letter identifier of the NWS office (i.e. 'LOX'). Default is None. 
+
+                        4) types (List) - The airport types. Default is ['large_airport', 'medium_airport', 'small_airport']. 
+
+    Returns: A list of station ids. 
+    '''
+
+    index = load_station_index()
+    mask = np.isin(index['type'], types)
+
+    if state != None:
+        mask = mask & (index['region'] == 'US-' + state.upper())
+
+    if gacc_region != None or cwa != None:
+        if gacc_region != None:
+            polygons = geometry.boundary_record_geometries(f"GACC Boundaries Shapefiles/National_GACC_Current.shp", 'gacc', 'GACCAbbrev', gacc_region)
+        else:
+            polygons = geometry.boundary_record_geometries(f"NWS CWA Boundaries/w_05mr24.shp", 'cwa', 'CWA', cwa)
+
+        inside = np.zeros(len(mask), dtype=bool)
+        for polygon in polygons:
+            xmin, ymin, xmax, ymax = polygon.bounds
+            # Only the stations inside the bounds of the polygon are checked with shapely
+            candidates = np.flatnonzero(mask & (index['longitude'] >= xmin) & (index['longitude'] <= xmax) & (index['latitude'] >= ymin) & (index['latitude'] <= ymax))
+            prepared = prep(polygon)
+            for i in candidates:
+                if prepared.contains(sgeom.Point(float(index['longitude'][i]), float(index['latitude'][i]))):
+                    inside[i] = True
+        mask = mask & inside
+
+    return index['ident'][mask].tolist()
+
+
+##########################
+# METAR CACHE            #
+##########################
+
+# Every METAR product downloads an hourly collection file from the UCAR THREDDS server and parses it with MetPy, 
+# which takes several seconds per file. The parsed DataFrames are kept in memory and on disk (Feather when pyarrow is 
+# installed, otherwise pickle) keyed by the name of the collection file and its modification time on the server, so 
+# each version of an hourly file is only downloaded and parsed once. The file of the current hour keeps growing so a 
+# new version replaces the old one. Files older than metar_cache_retention hours are deleted from the disk. 
+
+metar_cache_directory = "METAR Cache"
+
+# Hours
+metar_cache_retention = 72
+
+# The most parsed files kept in memory
+metar_cache_memory_entries = 30
+
+# The most collection files downloaded at the same time
+metar_download_workers = 8
+
+if importlib.util.find_spec('pyarrow') != None:
+    metar_cache_format = 'feather'
+else:
+    metar_cache_format = 'pickle'
+
+_metar_frames = {}
+_metar_cache_lock = threading.Lock()
+
+
+def metar_collection_version(dataset):
+
+    r'''
+    This function returns the version (Last-Modified and Content-Length) of a METAR collection file on the THREDDS server. 
+
+    Required Arguments: 1) dataset (siphon Dataset) - The METAR collection file in the THREDDS catalog. 
+
+    Returns: A string or None if the server did not return the headers. 
+    '''
+
+    try:
+        url = dataset.access_urls['HTTPServer']
+        response = get_http_session(url).head(url, timeout=server_health_timeout, allow_redirects=True)
+        if response.status_code == 200 and 'Last-Modified' in response.headers:
+            return response.headers['Last-Modified'] + ' ' + response.headers.get('Content-Length', '')
+    except Exception as e:
+        pass
+
+    return None
+
+
+def metar_cache_paths(name):
+
+    frame_path = os.path.join(metar_cache_directory, name + '.' + metar_cache_format)
+    info_path = os.path.join(metar_cache_directory, name + '.json')
+
+    return frame_path, info_path
+
+
+def read_cached_metar_frame(name, version, year, month):
+
+    frame_path, info_path = metar_cache_paths(name)
+
+    if os.path.exists(info_path) == False or os.path.exists(frame_path) == False:
+        return None
+
+    try:
+        with open(info_path, 'r') as fp:
+            info = json.load(fp)
+        if info['version'] != version or info['year'] != year or info['month'] != month:
+            return None
+        if metar_cache_format == 'feather':
+            df = pd.read_feather(frame_path)
+        else:
+            df = pd.read_pickle(frame_path)
+    except Exception as e:
+        return None
+
+    return df, info['units']
+
+
+def write_cached_metar_frame(name, version, year, month, df, sfc_units):
+
+    frame_path, info_path = metar_cache_paths(name)
+
+    try:
+        os.makedirs(metar_cache_directory, exist_ok=True)
+        if metar_cache_format == 'feather':
+            file_functions.write_file_atomically(frame_path, lambda path: df.to_feather(path))
+        else:
+            file_functions.write_file_atomically(frame_path, lambda path: df.to_pickle(path))
+
+        def write_info(path):
+            with open(path, 'w') as fp:
+                json.dump({'version': version, 'year': year, 'month': month, 'units': sfc_units}, fp)
+
+        file_functions.write_file_atomically(info_path, write_info)
+    except Exception as e:
+        print("Unable to save " + name + " to the METAR cache: " + str(e))
+
+
+def prune_metar_cache():
+
+    r'''
+    This function deletes the cached METAR files that are older than metar_cache_retention hours. 
+    '''
+
+    if os.path.exists(metar_cache_directory) == False:
+        return
+
+    oldest = t.time() - (metar_cache_retention * 3600)
+
+    for file in os.listdir(metar_cache_directory):
+        path = os.path.join(metar_cache_directory, file)
+        try:
+            if os.path.getmtime(path) < oldest:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def filter_metar_text(metar_text, station_ids):
+
+    r'''
+    This function keeps only the reports of the given stations in the text of a METAR collection file so MetPy 
+    only parses those reports. Lines that start with 5 spaces continue the report on the previous line 
+    (the same rule parse_metar_file() uses to join the lines of a report). 
+
+    Required Arguments: 1) metar_text (String) - The text of the collection file. 
+
+                        2) station_ids (Set) - The station ids to keep. 
+
+    Returns: The filtered text. 
+    '''
+
+    lines = []
+    keep = False
+
+    for line in metar_text.splitlines():
+        if line.startswith('     '):
+            if keep == True:
+                lines.append(line)
+            continue
+
+        words = line.split()
+        while len(words) > 0 and words[0] in ('METAR', 'SPECI', 'COR'):
+            words = words[1:]
+
+        keep = len(words) > 0 and words[0] in station_ids
+        if keep == True:
+            lines.append(line)
+
+    return '\n'.join(lines) + '\n'
+
+
+def parse_metar_collection(dataset, year=None, month=None, station_ids=None):
+
+    r'''
+    This function downloads and parses a METAR collection file. 
+
+    Required Arguments: 1) dataset (siphon Dataset) - The METAR collection file in the THREDDS catalog. 
+
+    Optional Arguments: 1) year (Integer) - The year of the reports. Default is None (the current year). 
+
+                        2) month (Integer) - The month of the reports. Default is None (the current month). 
+
+                        3) station_ids (Set) - Only the reports of these stations are parsed. Default is None (all stations). 
+
+    Returns: The parsed DataFrame and the units of its columns. 
+    '''
+
+    data = dataset.remote_open()
+    metar_text = data.read().decode('latin-1')
+
+    if station_ids != None:
+        metar_text = filter_metar_text(metar_text, station_ids)
+
+    if year == None or month == None:
+        sfc_data = parse_metar_file(StringIO(metar_text))
+    else:
+        sfc_data = parse_metar_file(StringIO(metar_text), year=year, month=month)
+
+    sfc_units = dict(sfc_data.units)
+    sfc_data = sfc_data.reset_index(drop=True)
+
+    return sfc_data, sfc_units
+
+
+def get_parsed_metar_file(dataset, year=None, month=None, station_ids=None):
+
+    r'''
+    This function returns the parsed METAR reports of a collection file from the METAR cache. 
+    The file is only downloaded and parsed when it is not in the cache or it changed on the server. 
+
+    Required Arguments: 1) dataset (siphon Dataset) - The METAR collection file in the THREDDS catalog 
+                           (i.e. metar_cat.datasets.filter_time_nearest(metar_time)). 
+
+    Optional Arguments: 1) year (Integer) - The year of the reports. Default is None (the current year). 
+
+                        2) month (Integer) - The month of the reports. Default is None (the current month). 
+
+                        3) station_ids (List) - Only the reports of these stations are returned. Default is None (all stations). 
+                           When the file is not cached, only the reports of these stations are parsed and the 
+                           (partial) result is not added to the cache. 
+
+    Returns: The parsed DataFrame (with the units of the columns in sfc_data.units). 
+    '''
+
+    if station_ids != None:
+        station_ids = set(station_ids)
+
+    name = dataset.name
+    version = metar_collection_version(dataset)
+    key = (version, year, month)
+
+    with _metar_cache_lock:
+        entry = _metar_frames.get(name)
+
+    if version != None and entry != None and entry[0] == key:
+        sfc_data, sfc_units = entry[1], entry[2]
+    else:
+        cached = None
+        if version != None:
+            cached = read_cached_metar_frame(name, version, year, month)
+
+        if cached != None:
+            sfc_data, sfc_units = cached
+        elif version == None or station_ids != None:
+            # Without a version the file can't be compared with a cached copy so it is parsed (and not cached)
+            sfc_data, sfc_units = parse_metar_collection(dataset, year, month, station_ids)
+            sfc_data.units = sfc_units
+            return sfc_data
+        else:
+            sfc_data, sfc_units = parse_metar_collection(dataset, year, month)
+            write_cached_metar_frame(name, version, year, month, sfc_data, sfc_units)
+            prune_metar_cache()
+
+        with _metar_cache_lock:
+            _metar_frames.pop(name, None)
+            _metar_frames[name] = (key, sfc_data, sfc_units)
+            while len(_metar_frames) > metar_cache_memory_entries:
+                _metar_frames.pop(next(iter(_metar_frames)))
+
+    if station_ids != None:
+        sfc_data = sfc_data[sfc_data['station_id'].isin(station_ids)]
+    else:
+        # A shallow copy so callers that add columns don't change the cached DataFrame
+        sfc_data = sfc_data.copy(deep=False)
+
+    sfc_data.units = sfc_units
+
+    return sfc_data
+
+
+def fetch_metar_collections(datasets, year=None, month=None, station_ids=None):
+
+    r'''
+    This function downloads and parses several METAR collection files at the same time (i.e. the 25 hourly files of a day). 
+
+    Required Arguments: 1) datasets (List) - The METAR collection files in the THREDDS catalog. 
+
+    Optional Arguments: 1) year (Integer) - The year of the reports. Default is None (the current year). 
+
+                        2) month (Integer) - The month of the reports. Default is None (the current month). 
+
+                        3) station_ids (List) - Only the reports of these stations are kept. Default is None (all stations). 
+
+    Returns: A list of the parsed DataFrames (in the order of the datasets). 
+    '''
+
+    def fetch(dataset):
+        return get_parsed_metar_file(dataset, year=year, month=month, station_ids=station_ids)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(metar_download_workers, len(datasets)))) as executor:
+        return list(executor.map(fetch, datasets))
+
+
+def clear_METAR_cache():
+
+    r'''
+    This function empties the METAR cache (in memory and on disk). 
+    '''
+
+    with _metar_cache_lock:
+        _metar_frames.clear()
+
+    shutil.rmtree(metar_cache_directory, ignore_errors=True)
+
+
+##########################
+# METAR DENSITY MASKS    #
+##########################
+
+# The METAR station plots are thinned so the stations are at least mask meters apart on the map. The set of stations 
+# barely changes from hour to hour so the projected coordinates of every station are kept for each map projection and 
+# the thinned selection is kept for each (projection, mask, set of stations). When the set of stations changes, the 
+# previous selection of the same projection and mask is updated (stations that dropped out are removed and the new 
+# stations are added where there is room) instead of thinning every station again. 
+# The thinning uses a KD-tree so it stays fast for the full CONUS station list. 
+
+# The most selections kept in memory
+metar_density_cache_entries = 64
+
+_metar_station_xy = {}
+_metar_density_selections = {}
+_metar_latest_selection = {}
+_metar_density_lock = threading.Lock()
+
+
+def metar_station_xy(plot_projection, station_ids, longitude, latitude):
+
+    r'''
+    This function returns the projected coordinates of the stations. The coordinates of each station are only 
+    transformed the first time the station is seen with a projection. 
+
+    Required Arguments: 1) plot_projection (cartopy.crs) - The map projection. 
+
+                        2) station_ids (Array) - The unique station ids. 
+
+                        3) longitude (Array) - The longitude of each station. 
+
+                        4) latitude (Array) - The latitude of each station. 
+
+    Returns: An (n, 2) array of the x and y coordinates. 
+    '''
+
+    with _metar_density_lock:
+        known = _metar_station_xy.setdefault(plot_projection.proj4_init, {})
+        missing = [i for i, station_id in enumerate(station_ids) if station_id not in known]
+
+    if len(missing) > 0:
+        points = plot_projection.transform_points(ccrs.PlateCarree(), np.asarray(longitude, dtype='float64')[missing], np.asarray(latitude, dtype='float64')[missing])
+        with _metar_density_lock:
+            for i, point in zip(missing, points):
+                known[station_ids[i]] = (point[0], point[1])
+
+    return np.array([known[station_id] for station_id in station_ids], dtype='float64').reshape(-1, 2)
+
+
+def thin_points(points, radius, keep=None):
+
+    r'''
+    This function selects points that are at least radius apart. The points are checked in order and a point is kept 
+    when none of the points kept so far are within radius of it (the same rule as metpy.calc.reduce_point_density). 
+
+    Required Arguments: 1) points (Array) - An (n, 2) array of the projected coordinates. 
+
+                        2) radius (Float) - The smallest distance between the kept points (in the units of the projection). 
+
+    Optional Arguments: 1) keep (Array) - A boolean array of the points that are already kept. They must be at least 
+                           radius apart. Default is None (no points are kept yet). 
+
+    Returns: A boolean array of the kept points. 
+    '''
+
+    valid = np.isfinite(points).all(axis=1)
+
+    if keep is None:
+        keep = np.zeros(len(points), dtype=bool)
+    else:
+        keep = keep & valid
+
+    if valid.any() == False:
+        return keep
+
+    positions = np.flatnonzero(valid)
+    tree = cKDTree(points[valid])
+    neighbors = tree.query_ball_point(points[valid], radius)
+
+    for j, i in enumerate(positions):
+        if keep[i] == True:
+            continue
+        if keep[positions[neighbors[j]]].any() == False:
+            keep[i] = True
+
+    return keep
+
+
+def metar_density_mask(station_ids, longitude, latitude, plot_projection, radius):
+
+    r'''
+    This function returns the mask that keeps the METAR reports of stations that are at least radius meters apart 
+    on the map (one report per station). It replaces metpy.calc.reduce_point_density() for the METAR station plots. 
+    The stations are checked in the order of their first report. The stations plotted on the last map of the same 
+    projection and radius are kept first so the plotted stations do not change from one map to the next. 
+
+    Required Arguments: 1) station_ids (Array) - The station id of each report. 
+
+                        2) longitude (Array) - The longitude of each report. 
+
+                        3) latitude (Array) - The latitude of each report. 
+
+                        4) plot_projection (cartopy.crs) - The map projection. 
+
+                        5) radius (Integer) - The smallest distance between the plotted stations in meters 
+                           (i.e. the value from dims.get_metar_mask()). 
+
+    Returns: A boolean array that is True for the reports that are plotted. 
+    '''
+
+    station_ids = np.asarray(station_ids).astype(str)
+    stations, first = np.unique(station_ids, return_index=True)
+
+    # The stations are thinned in the order of their first report like reduce_point_density() (not in the sorted order of np.unique())
+    order = np.argsort(first, kind='stable')
+    stations = stations[order]
+    first = first[order]
+
+    projection_key = plot_projection.proj4_init
+    stations_hash = hashlib.sha1('\n'.join(stations.tolist()).encode()).hexdigest()
+    key = (projection_key, radius, stations_hash)
+
+    with _metar_density_lock:
+        selected = _metar_density_selections.get(key)
+        previous = _metar_latest_selection.get((projection_key, radius))
+
+    if selected == None:
+        points = metar_station_xy(plot_projection, stations, np.asarray(longitude)[first], np.asarray(latitude)[first])
+
+        if previous != None:
+            keep = thin_points(points, radius, keep=np.isin(stations, list(previous)))
+        else:
+            keep = thin_points(points, radius)
+
+        selected = frozenset(stations[keep].tolist())
+
+        with _metar_density_lock:
+            if len(_metar_density_selections) >= metar_density_cache_entries:
+                _metar_density_selections.clear()
+            _metar_density_selections[key] = selected
+            _metar_latest_selection[(projection_key, radius)] = selected
+
+    mask = np.zeros(len(station_ids), dtype=bool)
+    mask[first[np.isin(stations, list(selected))]] = True
+
+    return mask
+
+
+def clear_METAR_density_cache():
+
+    r'''
+    This function empties the cache of projected station coordinates and thinned station selections. 
+    '''
+
+    with _metar_density_lock:
+        _metar_station_xy.clear()
+        _metar_density_selections.clear()
+        _metar_latest_selection.clear()
+
+
+def get_NWS_NDFD_7_Day_grid_data(directory_name, parameter):
+    
+    '''
+             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
+             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
+    
+             Inputs:
+                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
+                                              The directory determines the domain the forecast data is valid for. 
+                                              Here is the full directory list: 
+                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
+                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
+                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
+                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
+                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
+                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
+                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
+                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
+                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
+                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
+                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
+                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
+                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
+                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
+                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
+                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
+                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
+                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
+                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
+                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
+                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
+                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
+                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
+                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
+    
+    
+                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
+                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
+                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
+    
+            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
+                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
+             
+    '''
+
+    ###################################################
+    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
+    ###################################################
+
+    ### DOWNLOADS THE SHORT-TERM AND EXTENDED FILES ON POOLED FTP CONNECTIONS ###
+    param = parameter
+    try:
+        count_short = download_short_and_extended_files(directory_name, param)
+
+        #########################
+        # DATA ARRAYS PARAMETER #
+        #########################
+        grbs = pygrib.open(param)
+        grbs.seek(0)
+        count = 0
+        for grb in grbs:
+            count = count + 1
+        count_extended = count - count_short
+        ds = xr.load_dataset(param, engine='cfgrib')
+        ds = ds.metpy.parse_cf()
+        
+    except Exception as e:
+        count_short = get_short_and_extended_grids(directory_name, param)
+
+        grbs = pygrib.open(param)
+        grbs.seek(0)
+        count = 0
+        for grb in grbs:
+            count = count + 1
+        count_extended = count - count_short
+        ds = xr.load_dataset(param, engine='cfgrib')
+        ds = ds.metpy.parse_cf()
+
+    print("Data retrieved successfully!")
+        
+    return grbs, ds, count_short, count_extended
+
+
+def get_short_and_extended_grids(directory_name, parameter):
+    
+    '''
+             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
+             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
+    
+             Inputs:
+
+                1) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
+                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
+                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
+    
+            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
+                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
+             
+    '''
+
+    ###################################################
+    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
+    ###################################################
+
+    parameter = parameter
+
+    directory_name = directory_name
+
+    try:
+        short_term_fname, extended_fname = get_NWS_NDFD_7_Day_grid_data_backup(directory_name, parameter)
+        with open(parameter, 'wb') as myfile, open(short_term_fname, 'rb') as file1, open(extended_fname, 'rb') as file2:
+            myfile.write(file1.read())
+            myfile.write(file2.read())
+
+        grbs = pygrib.open(short_term_fname)
+        grbs.seek(0)
+        count_short = 0
+        for grb in grbs:
+            count_short = count_short + 1
+        return count_short
+    except Exception as e:
+        print("Unable to connect to server. Please try again later.")
+
+
+
+def get_NWS_NDFD_7_Day_grid_data_backup(directory_name, parameter):
+
+    parameter = parameter
+
+    if parameter == 'ds.maxrh.bin':
+        short_term_fname = 'ds.maxrh_short.bin'
+        extended_fname = 'ds.maxrh_extended.bin'
+
+    if parameter == 'ds.minrh.bin':
+        short_term_fname = 'ds.minrh_short.bin'
+        extended_fname = 'ds.minrh_extended.bin'
+
+    if parameter == 'ds.maxt.bin':
+        short_term_fname = 'ds.maxt_short.bin'
+        extended_fname = 'ds.maxt_extended.bin'
+
+    if parameter == 'ds.mint.bin':
+        short_term_fname = 'ds.mint_short.bin'
+        extended_fname = 'ds.mint_extended.bin'
+
+    if parameter == 'ds.critfireo.bin':
+        short_term_fname = 'ds.critfireo_short.bin'
+        extended_fname = 'ds.critfireo_extended.bin'
+
+    if parameter == 'ds.dryfireo.bin':
+        short_term_fname = 'ds.dryfireo_short.bin'
+        extended_fname = 'ds.dryfireo_extended.bin'
+
+    if os.path.exists(short_term_fname):
+        os.remove(short_term_fname)
+        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
+        os.rename(parameter, short_term_fname)
+    else:
+        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
+        os.rename(parameter, short_term_fname)
+    
+    if os.path.exists(extended_fname):
+        os.remove(extended_fname)
+        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.004-007/{parameter}", f"{parameter}")
+        os.rename(parameter, extended_fname)
+    else:
+        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.004-007/{parameter}", f"{parameter}")
+        os.rename(parameter, extended_fname)
+
+    return short_term_fname, extended_fname
+
+
+def get_NWS_NDFD_short_term_grid_data(directory_name, parameter):
+    
+    '''
+             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
+             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
+    
+             Inputs:
+                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
+                                              The directory determines the domain the forecast data is valid for. 
+                                              Here is the full directory list: 
+                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
+                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
+                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
+                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
+                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
+                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
+                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
+                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
+                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
+                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
+                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
+                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
+                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
+                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
+                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
+                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
+                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
+                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
+                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
+                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
+                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
+                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
+                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
+                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
+    
+    
+                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
+                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
+                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
+    
+            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
+                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
+             
+    '''
+
+    ###################################################
+    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
+    ###################################################
+
+    ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
+
+    param = parameter
+    try:
+        ################################
+        # DOWNLOADS THE NWS NDFD GRIDS #
+        ################################
+
+        ftp_download(directory_name + 'VP.001-003/', param, param)
+
+        if directory_name == '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/':
+
+            ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
+            ds = ds.metpy.parse_cf()
+
+        else:
+        
+            ds = xr.load_dataset(param, engine='cfgrib')
+            ds = ds.metpy.parse_cf()
+
+    except Exception as e:
+
+        urllib.request.urlretrieve(f"https://tgftp.nws.noaa.gov{directory_name}VP.001-003/{parameter}", f"{parameter}")
+        
+        if directory_name == '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/':
+
+            ds = xr.load_dataset(param, engine='cfgrib').sel(x=slice(20, 1400, 2), y=slice(100, 1400, 2)) 
+            ds = ds.metpy.parse_cf()
+
+        else:
+        
+            ds = xr.load_dataset(param, engine='cfgrib')
+            ds = ds.metpy.parse_cf()
+        
+    return ds
+
+    ### ERROR MESSAGE WHEN THERE IS AN INVALID PARAMETER NAME ###
+
+
+
+def get_NWS_NDFD_extended_grid_data(directory_name, parameter):
+    
+    '''
+             This function connects to the National Weather Service FTP Server and returns the forecast data for the parameter of interest in a GRIB2 file.
+             This function is specifically for downloading the entire National Weather Service Forecast (Days 1-7) Forecast grids. 
+    
+             Inputs:
+                 1) directory_name (String) - The directory name is the complete filepath on the National Weather Service FTP server. 
+                                              The directory determines the domain the forecast data is valid for. 
+                                              Here is the full directory list: 
+                                                                        ALASKA: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/
+                                                                        CONUS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/
+                                                                        CENTRAL GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crgrlake/
+                                                                        CENTRAL MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crmissvy/
+                                                                        CENTRAL PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crplains/
+                                                                        CENTRAL ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.crrocks/
+                                                                        EASTERN GREAT LAKES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.ergrlake/
+                                                                        GUAM: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.guam/
+                                                                        HAWAII: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/
+                                                                        MID-ATLANTIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.midatlan/
+                                                                        NORTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.neast/
+                                                                        NORTHERN HEMISPHERE: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nhemi/
+                                                                        NORTH PACIFIC OCEAN: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.npacocn/
+                                                                        NORTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nplains/
+                                                                        NORTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.nrockies/
+                                                                        OCEANIC: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.oceanic/
+                                                                        PACIFIC NORTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacnwest/
+                                                                        PACIFIC SOUTHWEST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.pacswest/
+                                                                        PUERTO RICO: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.puertori/
+                                                                        SOUTHEAST: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.seast/
+                                                                        SOUTHERN MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.smissvly/
+                                                                        SOUTHERN PLAINS: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.splains/
+                                                                        SOUTHERN ROCKIES: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.srockies/
+                                                                        UPPER MISSISSIPPI VALLEY: /SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.umissvly/
+    
+    
+                2) parameter (String) - The parameter corresponds to the weather element the user is interested in (i.e. temperature, relative humidity, wind speed etc.)
+                                        Here is a link to the spreadsheet that contains all of the proper syntax for each parameter:
+                                        https://view.officeapps.live.com/op/view.aspx?src=https%3A%2F%2Fwww.weather.gov%2Fmedia%2Fmdl%2Fndfd%2FNDFDelem_fullres.xls&wdOrigin=BROWSELINK
+    
+            Returns: This function returns the National Weather Service NDFD gridded forecast data in a GRIB2 file for the entire forecast period (Days 1-7). 
+                     This function may also return an error message for either: 1) A bad file path (invalid directory_name) or 2) An invalid parameter (if the spelling of the parameter syntax is incorrect)
+             
+    '''
+
+    ###################################################
+    # NDFD GRIDS DATA ACCESS FROM NOAA/NWS FTP SERVER #
+    ###################################################
+
+    ### CONNECTS TO THE NOAA/NWS FTP SERVER ###
+    dirName = directory_name + 'VP.004-007/'
+    param = parameter
+
+    ### SEARCHES FOR THE CORRECT DIRECTORY ###
+    try:
+        ftp = get_ftp_connection()
+        try:
+            files = ftp.cwd(dirName)
+        finally:
+            release_ftp_connection(ftp)
+
+    ### ERROR MESSAGE WHEN THERE IS AN INVALID DIRECTORY NAME ###
+        
+    except Exception as e:
+        dir_error = info.directory_name_error()
+        return dir_error
+
+    ### SEARCHES FOR THE CORRECT PARAMETER ###
+    try:
+        ################################
+        # DOWNLOADS THE NWS NDFD GRIDS #
+        ################################
+
+        ftp_download(dirName, param, param)
+
+        ds = xr.load_dataset(param, engine='cfgrib')
+        ds = ds.metpy.parse_cf()
+        return ds
+
+    ### ERROR MESSAGE WHEN THERE IS AN INVALID PARAMETER NAME ###
+
+    except Exception as a:
+        param_error = info.parameter_name_error()
+        return param_error
+
+def get_rtma_24_hour_comparison_data_with_u_and_v_components(current_time):
+
+
+    current_time = current_time
+
+    rtma_data, rtma_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_rtma_data_24_hour_difference(current_time, 'Wind_speed_Analysis_height_above_ground')
+
+    t.sleep(15)
+
+    rtma_time_24 = rtma_time - timedelta(hours=24)
+
+    u, u_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(current_time, 'u-component_of_wind_Analysis_height_above_ground')
+
+    t.sleep(15)
+
+    u_24, u_24_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(rtma_time_24, 'u-component_of_wind_Analysis_height_above_ground')
+
+    t.sleep(15)
+
+    v, v_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(current_time, 'v-component_of_wind_Analysis_height_above_ground')
+
+    t.sleep(15)
+
+    v_24, v_24_time = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(rtma_time_24, 'v-component_of_wind_Analysis_height_above_ground')
+
+    data = []
+
+    data.append(rtma_data)
+    data.append(rtma_time)
+    data.append(rtma_time_24)
+    data.append(u)
+    data.append(u_time)
+    data.append(u_24)
+    data.append(u_24_time)
+    data.append(v)
+    data.append(v_time)
+    data.append(v_24)
+    data.append(v_24_time)
+
+    return data
+
+
+
+def get_rtma_data_past_6hrs(parameter):
+
+
+    parameter = parameter
+    local_time, utc_time = standard.plot_creation_time()
+    times = []
+
+    for i in range(0, 10):
+        time = utc_time - timedelta(hours=i)
+        times.append(time)
+
+    t1 = times[0]
+    t2 = times[1]
+    t3 = times[2]
+    t4 = times[3]
+    t5 = times[4]
+    t6 = times[5]
+    t7 = times[6]
+    t8 = times[7]
+    t9 = times[8]
+    t10 = times[9]
+
+    rtma_data_0, rtma_time_0 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t1, parameter)
+
+    t.sleep(15)
+
+    rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t2, parameter)
+
+    t.sleep(15)
+    
+    if rtma_time_0.hour == rtma_time_1.hour:
+
+        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
+        t.sleep(15)
+
+        if rtma_time_0.hour == rtma_time_1.hour:
+
+            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
+            t.sleep(15)
             
-        except Exception as e:
+            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
+            t.sleep(15)
+    
+            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
+            t.sleep(15)
+    
+            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
+            t.sleep(15)
+    
+            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
+            t.sleep(15)
     
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
+            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t9, parameter)
+            t.sleep(15)
+
+            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t10, parameter)
+
+
+        else:
+
+            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
+            t.sleep(15)
             
-            try:
-                rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
+            t.sleep(15)
+    
+            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
+            t.sleep(15)
+    
+            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
+            t.sleep(15)
+    
+            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
+            t.sleep(15)
+    
+            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
+            t.sleep(15)
+
+            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t9, parameter)
+            t.sleep(15)
+
+    else:
+        t.sleep(15)
+
+        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t2, parameter)
+        t.sleep(15)
+
+        rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t3, parameter)
+        t.sleep(15)
+
+        rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t4, parameter)
+        t.sleep(15)
+
+        rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t5, parameter)
+        t.sleep(15)
+
+        rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t6, parameter)
+        t.sleep(15)
+
+        rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t7, parameter)
+        t.sleep(15)
+
+        rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_data(t8, parameter)
+    
+    rtma_data, rtma_times = parsers.save.append_data_RTMA_6hr_timelapse(rtma_data_0, rtma_data_1, rtma_data_2, rtma_data_3, rtma_data_4, rtma_data_5, rtma_data_6, rtma_data_7, rtma_time_0, rtma_time_1, rtma_time_2, rtma_time_3, rtma_time_4, rtma_time_5, rtma_time_6, rtma_time_7)
+
+    return rtma_data, rtma_times
+
+
+
+def get_rtma_data_24_hour_difference(current_time, parameter, extent=None):
+
+    r"""
+    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis dataset and the dataset from 24 hours prior to the current dataset. 
+    This function will then take the difference between the two datasets to show the 24 hour difference and create a new dataset based on that.
+
+    24 hour difference dataset = current dataset - dataset from 24 hours prior to the current dataset
+
+    Inputs:
+           1) current_time (Datetime) - Current time in UTC.
+           2) parameter (String) - The weather parameter the user wishes to download. 
+                                   To find the full list of parameters, visit: https://thredds.ucar.edu/thredds/dodsC/grib/NCEP/RTMA/CONUS_2p5km/Best.html
+           3) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. Default is None (the full CONUS domain). 
+
+    The analysis from 24 hours prior is read from the RTMA archive when an earlier run already downloaded it. 
+
+    Returns: 1) If there are zero errors, the latest 24 hour difference dataset and the time of the latest available dataset for the requested parameter will be returned. 
+             2) If there is an error, an error message is returned. 
+
+    """
+
+    server = select_thredds_server()
+
+    if server == None:
+        return
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_gust, time
-      
-            except Exception as a:
+    domain = server + '/RTMA_CONUS_2p5km'
+
+    for analysis_time in rtma_analysis_times(domain, current_time, lambda time: thredds_rtma_catalog_url(server, time)):
+        analysis_time_24 = analysis_time - timedelta(hours=24)
+        try:
+            rtma_parameter = get_thredds_rtma_parameter(server, analysis_time, parameter, extent)
+            rtma_parameter_24 = get_thredds_rtma_parameter(server, analysis_time_24, parameter, extent)
     
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
+            print("Data retrieval for " + analysis_time.strftime('%m/%d/%Y %H00 UTC') + " and " + analysis_time_24.strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            remember_rtma_analysis_time(domain, analysis_time)
             
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            return rtma_parameter - rtma_parameter_24, analysis_time
+            
+        except Exception as e:
+            print("Data retrieval for " + analysis_time.strftime('%m/%d/%Y %H00 UTC') + " and/or " + analysis_time_24.strftime('%m/%d/%Y %H00 UTC') + " is unsuccessful")
+
+    print("The latest dataset is over 4 hours old which isn't current. Please try again later.")
+
+
+def get_rtma_relative_humidity_data_past_6hrs():
+
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_gust, time
     
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+    local_time, utc_time = standard.plot_creation_time()
+    times = []
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_gust, time
+    for i in range(0, 10):
+        time = utc_time - timedelta(hours=i)
+        times.append(time)
+
+    t1 = times[0]
+    t2 = times[1]
+    t3 = times[2]
+    t4 = times[3]
+    t5 = times[4]
+    t6 = times[5]
+    t7 = times[6]
+    t8 = times[7]
+    t9 = times[8]
+    t10 = times[9]
+
+    rtma_data_0, rtma_time_0 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t1)
+
+    t.sleep(15)
+
+    rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t2)
+
+    t.sleep(15)
+
+    if rtma_time_0.hour == rtma_time_1.hour:
+
+        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
+
+        t.sleep(15)
+
+        if rtma_time_0.hour == rtma_time_1.hour:
+
+            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+
+            t.sleep(15)
+
+            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
+
+            t.sleep(15)
     
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_gust, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
+            t.sleep(15)
     
-                            return None
+            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connecting to the backup UCAR THREDDS Server!")
+            t.sleep(15)
+    
+            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
 
-        try:
-            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[0].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
+            t.sleep(15)
     
-            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-            print("Data retrieval for " + times[0].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t9)
 
-            time = times[0]
-            
-            return rtma_rh *100, rtma_gust * 2.23694, time
+            t.sleep(15)
+
+            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t10)
+
+        else:
+
+            rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
+
+            t.sleep(15)
             
-        except Exception as e:
+            rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+
+            t.sleep(15)
     
-            print("Relative Humidity Data is unavailiable for "+times[0].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[1].strftime('%m/%d/%Y %H00 UTC'))
-            
-            try:
-                rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[1].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-        
-                rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                print("Data retrieval for " + times[1].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
 
-                time = times[1]
-                
-                return rtma_rh *100, rtma_gust, time
-      
-            except Exception as a:
+            t.sleep(15)
     
-                print("Relative Humidity data is unavailiable for "+times[1].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[2].strftime('%m/%d/%Y %H00 UTC'))
-                
-                try:
-                    rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                    rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[2].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                    rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                    rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                    rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-            
-                    rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                    print("Data retrieval for " + times[2].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
 
-                    time = times[2]
-                    
-                    return rtma_rh *100, rtma_gust, time
+            t.sleep(15)
     
-                except Exception as b:
-                                
-                    print("Relative Humidity data is unavailiable for "+times[2].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[3].strftime('%m/%d/%Y %H00 UTC'))
-                    
-                    try:
-                        rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                        rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[3].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                        rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                        rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                        rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                
-                        rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                        print("Data retrieval for " + times[3].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
 
-                        time = times[3]
-                        
-                        return rtma_rh *100, rtma_gust, time
+            t.sleep(15)
     
-                    except Exception as c:
-                                
-                        print("Relative Humidity data is unavailiable for "+times[3].strftime('%m/%d/%Y %H00 UTC')+ "\nWill try to download the most recent dataset from "+times[4].strftime('%m/%d/%Y %H00 UTC'))
-                        
-                        try:
-                            rtma_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/grib/NCEP/RTMA/CONUS_2p5km/RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2/catalog.xml')
-                            rtma_data = rtma_cat.datasets['RTMA_CONUS_2p5km_'+times[4].strftime('%Y%m%d_%H00')+'.grib2'].remote_access(use_xarray=True)
-                            rtma_data = rtma_data.metpy.parse_cf().metpy.assign_latitude_longitude()
-                            rtma_temp = rtma_data['Temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_dwpt = rtma_data['Dewpoint_temperature_Analysis_height_above_ground'].squeeze()
-                            rtma_gust = rtma_data['Wind_speed_gust_Analysis_height_above_ground'].squeeze()
-                    
-                            rtma_rh = mpcalc.relative_humidity_from_dewpoint(rtma_temp, rtma_dwpt)
-                            print("Data retrieval for " + times[4].strftime('%m/%d/%Y %H00 UTC') + " is successful")
+            rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
+
+            t.sleep(15)
+
+            rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t9)
+
+    else:
+
+        rtma_data_1, rtma_time_1 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t2)
+
+        t.sleep(15)
+
+        rtma_data_2, rtma_time_2 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t3)
+
+        t.sleep(15)
+
+        rtma_data_3, rtma_time_3 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t4)
+
+        t.sleep(15)
+
+        rtma_data_4, rtma_time_4 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t5)
+
+        t.sleep(15)
+
+        rtma_data_5, rtma_time_5 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t6)
+
+        t.sleep(15)
+
+        rtma_data_6, rtma_time_6 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t7)
+
+        t.sleep(15)
+
+        rtma_data_7, rtma_time_7 = UCAR_THREDDS_SERVER_OPENDAP_Downloads.CONUS.get_current_rtma_relative_humidity_data(t8)
+    
+    rtma_data, rtma_times = parsers.save.append_data_RTMA_6hr_timelapse(rtma_data_0, rtma_data_1, rtma_data_2, rtma_data_3, rtma_data_4, rtma_data_5, rtma_data_6, rtma_data_7, rtma_time_0, rtma_time_1, rtma_time_2, rtma_time_3, rtma_time_4, rtma_time_5, rtma_time_6, rtma_time_7)
+
+    return rtma_data, rtma_times
+
+
+def get_current_rtma_relative_humidity_data(current_time, extent=None):
+
+    r"""
+    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis for temperature and dewpoint. 
+    This function then creates a relative humidity dataset (float32, without units) from the temperature and dewpoint datasets. 
+    This function then returns the relative humidity dataset. 
+
+    Inputs:
+           1) current_time (Datetime) - Current time in UTC.
+           2) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                              Only the grid points inside the extent are downloaded. Default is None (the full CONUS domain). 
+
+    Returns: 1) If there are zero errors, the latest relative humidity dataset and the time for that dataset are returned. 
+             2) If there is an error, None is returned. 
+
+    """
+
+    data = get_latest_thredds_rtma_parameters(current_time, ['Temperature_Analysis_height_above_ground', 'Dewpoint_temperature_Analysis_height_above_ground'], extent)
+
+    if data == None:
+        return None
+
+    (rtma_temp, rtma_dwpt), time = data
+
+    return rtma_relative_humidity(rtma_temp, rtma_dwpt), time
+
+
+def get_red_flag_warning_parameters_using_wind_speed(current_time, extent=None):
+
+    r"""
+    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis datasets for: 1) Temperature, 2) Dewpoint and 3) Wind Speed. 
+    Only these three variables (and only the grid points inside the extent) are downloaded. 
+    This function creates a relative humidity dataset (float32, without units) from the temperature and dewpoint datasets. 
+    This function then returns the relative humidity dataset, wind speed dataset and the time for the datasets. 
+
+    Inputs:
+           1) current_time (Datetime) - Current time in UTC. 
+           2) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                              Default is None (the full CONUS domain). 
+
+    Returns:
+            1) 2.5km x 2.5km Real Time Mesoscale Analysis Relative Humidity dataset (%). 
+            2) 2.5km x 2.5km Real Time Mesoscale Analysis Wind Speed dataset (MPH). 
+            3) Time of the latest available datasets. 
+
+    """
+
+    data = get_latest_thredds_rtma_parameters(current_time, ['Temperature_Analysis_height_above_ground', 'Dewpoint_temperature_Analysis_height_above_ground', 'Wind_speed_Analysis_height_above_ground'], extent)
+
+    if data == None:
+        return None
+
+    (rtma_temp, rtma_dwpt, rtma_wind), time = data
+
+    return rtma_relative_humidity(rtma_temp, rtma_dwpt), rtma_wind.astype('float32') * 2.23694, time
+
+
+def get_red_flag_warning_parameters_using_wind_gust(current_time, extent=None):
+
+    r"""
+    This function retrieves the latest available 2.5km x 2.5km Real Time Mesoscale Analysis datasets for: 1) Temperature, 2) Dewpoint and 3) Wind Gust. 
+    Only these three variables (and only the grid points inside the extent) are downloaded. 
+    This function creates a relative humidity dataset (float32, without units) from the temperature and dewpoint datasets. 
+    This function then returns the relative humidity dataset, wind gust dataset and the time for the datasets. 
+
+    Inputs:
+           1) current_time (Datetime) - Current time in UTC. 
+           2) extent (List) - Optional. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                              Default is None (the full CONUS domain). 
 
-                            time = times[4]
-                            
-                            return rtma_rh *100, rtma_gust, time
-                                   
-                    
-                        except Exception as k:
-                            print("WARNING: Latest dataset is more than 4 hours old.\nQuitting - Please try again later.")
-    
-                            return None
+    Returns:
+            1) 2.5km x 2.5km Real Time Mesoscale Analysis Relative Humidity dataset (%). 
+            2) 2.5km x 2.5km Real Time Mesoscale Analysis Wind Gust dataset (MPH). 
+            3) Time of the latest available datasets. 
+
+    """
 
+    data = get_latest_thredds_rtma_parameters(current_time, ['Temperature_Analysis_height_above_ground', 'Dewpoint_temperature_Analysis_height_above_ground', 'Wind_speed_gust_Analysis_height_above_ground'], extent)
 
-    if main_server_status != 200 and first_backup_server_status != 200 and second_backup_server_status != 200:
-        print("Unable to connect to either the main or backup servers. Aborting!")
+    if data == None:
+        return None
+
+    (rtma_temp, rtma_dwpt, rtma_gust), time = data
+
+    return rtma_relative_humidity(rtma_temp, rtma_dwpt), rtma_gust.astype('float32') * 2.23694, time
 
 
 def get_rtma_relative_humidity_24_hour_difference_data(current_time):
@@ -4348,23 +5015,7 @@ def get_rtma_relative_humidity_24_hour_difference_data(current_time):
         times.append(new_time)
         times_24.append(old_time)
         
-    try:
-        main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-        main_server_status = main_server_response.status_code
-    except Exception as a:
-        pass
-    
-    try:
-        first_backup_server_response = requests.get("https://thredds-test.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        first_backup_server_status = first_backup_server_response.status_code
-    except Exception as b:
-        pass
-    
-    try:
-        second_backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-        second_backup_server_status = second_backup_server_response.status_code
-    except Exception as c:
-        pass
+    main_server_status, first_backup_server_status, second_backup_server_status = thredds_server_statuses()
 
     if main_server_status == 200:
         print("Main UCAR THREDDS Server is online. Connecting!")
@@ -4771,40 +5422,23 @@ def get_rtma_relative_humidity_24_hour_difference_data(current_time):
 
 
 
-def previous_day_weather_summary(station_id):
+def previous_day_metar_files(days_ago=1):
 
     r'''
-    This function retrieves the 24 hour observations for the previous day and returns the extreme maximum and minimum values as well as the times associated with those values.
+    This function returns the 25 hourly METAR collection files of a past day on the UCAR THREDDS server. 
 
-    Inputs:
-           1) station_id (String) - The 4 letter station identifier for the observational site. 
-
-    Returns:
-            1) Maximum Temperature (°F)
-            2) The time the maximum temperature occurred
-            3) Minimum Temperature (°F)
-            4) The time the minimum temperature occurred
-            5) Minimum Relative Humidity (%)
-            6) The time the minimum relative humidity occurred
-            7) Maximum Relative Humidity (%)
-            8) The time the maximum relative humidity occurred
-            9) Maximum Wind Speed (MPH)
-            10) The time the maximum wind speed occurred
-            11) Maximum Wind Gust (MPH)
-            12) The time the maximum wind gust occurred 
+    Optional Arguments: 1) days_ago (Integer) - How many days before the current local day. Default is 1. 
 
+    Returns: 1) A list of the METAR collection files (siphon Datasets). 
+             2) The start of the day in UTC. 
     '''
 
     local_time, utc_time = standard.plot_creation_time()
     year = local_time.year
     month = local_time.month
     day = local_time.day
-    station_id = station_id
 
-    main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-    backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-    main_server_status = main_server_response.status_code
-    backup_server_status = backup_server_response.status_code
+    main_server_status, backup_server_status = thredds_server_statuses([main_thredds_server, second_backup_thredds_server])
     
     hour = 0
     date = datetime(year, month, day, hour)
@@ -4817,13 +5451,7 @@ def previous_day_weather_summary(station_id):
     
     new_date_utc = date_utc.replace(tzinfo=None)
     
-    previous_day_utc = new_date_utc - timedelta(days=1)
-    
-    # Pings server for airport data
-    airports_df = pd.read_csv(get_test_data('airport-codes.csv'))
-    
-    # Queries our airport types (airport sizes)
-    airports_df = airports_df[(airports_df['type'] == 'large_airport') | (airports_df['type'] == 'medium_airport') | (airports_df['type'] == 'small_airport')]
+    previous_day_utc = new_date_utc - timedelta(days=days_ago)
     
     # Accesses the METAR data
 
@@ -4850,67 +5478,127 @@ def previous_day_weather_summary(station_id):
         print("ERROR! Cannot connect to either the main or backup server. Aborting!")
 
     metar_file = metar_cat.datasets.filter_time_range(previous_day_utc, previous_day_utc + timedelta(days=1))
-    
-    sfc_data_list = []
-    for i in range(0,25):
-        data = metar_file[i].remote_open()
-        metar_text = StringIO(data.read().decode('latin-1'))
-        sfc_data = parse_metar_file(metar_text)
-        sfc_units = sfc_data.units
-        sfc_data_list.append(sfc_data)
-    
+
+    return metar_file[0:25], previous_day_utc
+
+
+def station_extreme_rows(df, column, largest=True):
+
+    r'''
+    This function returns the observation with the largest (or smallest) value of a column at each station. 
+    Missing values are skipped. 
+
+    Returns: A DataFrame indexed by station_id. 
+    '''
+
+    rows = df.dropna(subset=[column]).sort_values(column, kind='stable')
+
+    if largest == True:
+        rows = rows.groupby('station_id').tail(1)
+    else:
+        rows = rows.groupby('station_id').head(1)
+
+    return rows.set_index('station_id')
+
+
+def previous_day_weather_summaries(station_ids, days_ago=2):
+
+    r'''
+    This function retrieves the 24 hour observations of a past day for several stations at once and returns the extreme 
+    maximum and minimum values (and the times associated with those values) of each station. 
+    The 25 hourly METAR files are downloaded and parsed once for all of the stations and the extremes of every station 
+    are found together. 
+
+    Required Arguments: 1) station_ids (List) - The 4 letter station identifiers of the observational sites. 
+
+    Optional Arguments: 1) days_ago (Integer) - How many days before the current local day. Default is 2 
+                           (the day used by previous_day_weather_summary_and_all_data()). 
+
+    Returns: A dictionary with the station id as the key. Each value is the same as the return of 
+             previous_day_weather_summary_and_all_data() for that station. 
+             Stations without any observations are left out. 
+    '''
+
+    station_ids = [station_id.upper() for station_id in station_ids]
+
+    to_zone = tz.tzutc()
+    from_zone = tz.tzlocal()
+
+    metar_files, previous_day_utc = previous_day_metar_files(days_ago)
+
+    # Downloads the 25 hourly files at the same time and only keeps the reports of the stations
+    sfc_data_list = fetch_metar_collections(metar_files, station_ids=station_ids)
+
     df = pd.concat(sfc_data_list)
     
     df = df.loc[:, ['station_id', 'latitude', 'longitude', 'date_time', 'air_temperature', 'dew_point_temperature', 'wind_speed', 'wind_gust', 'wind_direction']]
 
     df['relative_humidity'] = calc.Thermodynamics.relative_humidity_from_temperature_and_dewpoint_celsius(df['air_temperature'], df['dew_point_temperature'])
-   
-    df = df[df['station_id'] == station_id]
     
     df['air_temperature'] = calc.unit_conversion.celsius_to_fahrenheit(df['air_temperature'])
     df['wind_speed'] = calc.unit_conversion.knots_to_mph(df['wind_speed'])
     df['wind_gust'] = calc.unit_conversion.knots_to_mph(df['wind_gust'])
-    
-    df = df.sort_values(['air_temperature'], ascending=False)
-    maximum_temperature = df['air_temperature'].iloc[0]
-    maximum_temperature_time = df['date_time'].iloc[0]
-    maximum_temperature_time_utc = maximum_temperature_time.replace(tzinfo=to_zone)
-    maximum_temperature_time_local = maximum_temperature_time_utc.astimezone(from_zone)
-    minimum_temperature = df['air_temperature'].iloc[-1]
-    minimum_temperature_time = df['date_time'].iloc[-1]
-    minimum_temperature_time_utc = minimum_temperature_time.replace(tzinfo=to_zone)
-    minimum_temperature_time_local = minimum_temperature_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['relative_humidity'], ascending=True)
-    minimum_relative_humidity = df['relative_humidity'].iloc[0]
-    minimum_relative_humidity_time = df['date_time'].iloc[0]
-    minimum_relative_humidity_time_utc = minimum_relative_humidity_time.replace(tzinfo=to_zone)
-    minimum_relative_humidity_time_local = minimum_relative_humidity_time_utc.astimezone(from_zone)
-    maximum_relative_humidity = df['relative_humidity'].iloc[-1]
-    maximum_relative_humidity_time = df['date_time'].iloc[-1]
-    maximum_relative_humidity_time_utc = maximum_relative_humidity_time.replace(tzinfo=to_zone)
-    maximum_relative_humidity_time_local = maximum_relative_humidity_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['wind_speed'], ascending=False)
-    maximum_wind_speed = df['wind_speed'].iloc[0]
-    wind_direction = df['wind_direction'].iloc[0]
-    wind_dir = parsers.checks.wind_direction_number_to_abbreviation(wind_direction)
-    maximum_wind_speed_time = df['date_time'].iloc[0]
-    maximum_wind_speed_time_utc = maximum_wind_speed_time.replace(tzinfo=to_zone)
-    maximum_wind_speed_time_local = maximum_wind_speed_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['wind_gust'], ascending=False)
-    maximum_wind_gust = df['wind_gust'].iloc[0]
-    maximum_wind_gust_time = df['date_time'].iloc[0]
-    maximum_wind_gust_time_utc = maximum_wind_gust_time.replace(tzinfo=to_zone)
-    maximum_wind_gust_time_local = maximum_wind_gust_time_utc.astimezone(from_zone)
+
+    df = df.sort_values(['date_time'], ascending=True, kind='stable')
+
+    extremes = {
+        'maximum_temperature': station_extreme_rows(df, 'air_temperature', largest=True),
+        'minimum_temperature': station_extreme_rows(df, 'air_temperature', largest=False),
+        'minimum_relative_humidity': station_extreme_rows(df, 'relative_humidity', largest=False),
+        'maximum_relative_humidity': station_extreme_rows(df, 'relative_humidity', largest=True),
+        'maximum_wind_speed': station_extreme_rows(df, 'wind_speed', largest=True),
+        'maximum_wind_gust': station_extreme_rows(df, 'wind_gust', largest=True)
+    }
+
+    columns = {
+        'maximum_temperature': 'air_temperature',
+        'minimum_temperature': 'air_temperature',
+        'minimum_relative_humidity': 'relative_humidity',
+        'maximum_relative_humidity': 'relative_humidity',
+        'maximum_wind_speed': 'wind_speed',
+        'maximum_wind_gust': 'wind_gust'
+    }
+
+    def extreme(name, station_id):
+        rows = extremes[name]
+        if station_id not in rows.index:
+            return np.nan, None, None
+        row = rows.loc[station_id]
+        extreme_time = row['date_time']
+        extreme_time_local = extreme_time.replace(tzinfo=to_zone).astimezone(from_zone)
+        return row[columns[name]], extreme_time, extreme_time_local
+
+    summaries = {}
+    for station_id, station_df in df.groupby('station_id', sort=False):
+
+        if station_id not in station_ids:
+            continue
+
+        maximum_temperature, maximum_temperature_time, maximum_temperature_time_local = extreme('maximum_temperature', station_id)
+        minimum_temperature, minimum_temperature_time, minimum_temperature_time_local = extreme('minimum_temperature', station_id)
+        minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local = extreme('minimum_relative_humidity', station_id)
+        maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local = extreme('maximum_relative_humidity', station_id)
+        maximum_wind_speed, maximum_wind_speed_time, maximum_wind_speed_time_local = extreme('maximum_wind_speed', station_id)
+        maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local = extreme('maximum_wind_gust', station_id)
+
+        if maximum_wind_speed_time != None:
+            wind_direction = extremes['maximum_wind_speed'].loc[station_id, 'wind_direction']
+            wind_dir = parsers.checks.wind_direction_number_to_abbreviation(wind_direction)
+        else:
+            wind_dir = None
+
+        summaries[station_id] = (station_df, maximum_temperature, maximum_temperature_time, maximum_temperature_time_local, minimum_temperature, minimum_temperature_time, minimum_temperature_time_local, minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local, maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local, maximum_wind_speed, wind_dir, maximum_wind_speed_time, maximum_wind_speed_time_local, maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local, station_id, previous_day_utc)
+
+    for station_id in station_ids:
+        if station_id not in summaries:
+            print("There are no observations for " + station_id + " on " + previous_day_utc.strftime('%m/%d/%Y'))
 
     print("Data retrieved successfully!")
 
-    return maximum_temperature, maximum_temperature_time, maximum_temperature_time_local, minimum_temperature, minimum_temperature_time, minimum_temperature_time_local, minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local, maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local, maximum_wind_speed, wind_dir, maximum_wind_speed_time, maximum_wind_speed_time_local, maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local, station_id, previous_day_utc
+    return summaries
 
 
-def previous_day_weather_summary_and_all_data(station_id):
+def previous_day_weather_summary(station_id):
 
     r'''
     This function retrieves the 24 hour observations for the previous day and returns the extreme maximum and minimum values as well as the times associated with those values.
@@ -4934,121 +5622,38 @@ def previous_day_weather_summary_and_all_data(station_id):
 
     '''
 
-    local_time, utc_time = standard.plot_creation_time()
-    year = local_time.year
-    month = local_time.month
-    day = local_time.day
-    station_id = station_id
+    summaries = previous_day_weather_summaries([station_id], days_ago=1)
 
-    main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-    backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-    main_server_status = main_server_response.status_code
-    backup_server_status = backup_server_response.status_code
-    
-    hour = 0
-    date = datetime(year, month, day, hour)
-    
-    to_zone = tz.tzutc()
-    from_zone = tz.tzlocal()
-    
-    time = date.replace(tzinfo=from_zone)
-    date_utc = date.astimezone(to_zone)
-    
-    new_date_utc = date_utc.replace(tzinfo=None)
-    
-    previous_day_utc = new_date_utc - timedelta(days=2)
-    
-    # Pings server for airport data
-    airports_df = pd.read_csv(get_test_data('airport-codes.csv'))
-    
-    # Queries our airport types (airport sizes)
-    airports_df = airports_df[(airports_df['type'] == 'large_airport') | (airports_df['type'] == 'medium_airport') | (airports_df['type'] == 'small_airport')]
-    
-    # Accesses the METAR data
+    return summaries[station_id.upper()][1:]
 
-    if main_server_status == 200:
-        print("Main UCAR THREDDS Server is online. Connecting!")
-        try:
-            print("Downloading...")
-            metar_cat = TDSCatalog('https://thredds-test.unidata.ucar.edu/thredds/catalog/noaaport/text/metar/catalog.xml')
-        
-        except Exception as e:
-            print("Downloading...")
-            metar_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/noaaport/text/metar/catalog.xml')
 
-    if main_server_status != 200 and backup_server_status == 200:
-        print("Main UCAR THREDDS Server is down. Connecting to the backup UCAR THREDDS Server!") 
-        try:
-            print("Downloading...")
-            metar_cat = TDSCatalog('https://thredds-dev.unidata.ucar.edu/thredds/catalog/noaaport/text/metar/catalog.xml')
-        
-        except Exception as e:
-            print("ERROR! Cannot connect to either the main or backup server. Aborting!")
+def previous_day_weather_summary_and_all_data(station_id):
 
-    if main_server_status != 200 and backup_server_status != 200:
-        print("ERROR! Cannot connect to either the main or backup server. Aborting!")
+    r'''
+    This function retrieves the 24 hour observations for the previous day and returns the extreme maximum and minimum values as well as the times associated with those values.
 
-    metar_file = metar_cat.datasets.filter_time_range(previous_day_utc, previous_day_utc + timedelta(days=1))
-    
-    sfc_data_list = []
-    for i in range(0,25):
-        data = metar_file[i].remote_open()
-        metar_text = StringIO(data.read().decode('latin-1'))
-        sfc_data = parse_metar_file(metar_text)
-        sfc_units = sfc_data.units
-        sfc_data_list.append(sfc_data)
-    
-    df = pd.concat(sfc_data_list)
-    
-    df = df.loc[:, ['station_id', 'latitude', 'longitude', 'date_time', 'air_temperature', 'dew_point_temperature', 'wind_speed', 'wind_gust', 'wind_direction']]
+    Inputs:
+           1) station_id (String) - The 4 letter station identifier for the observational site. 
 
-    df['relative_humidity'] = calc.Thermodynamics.relative_humidity_from_temperature_and_dewpoint_celsius(df['air_temperature'], df['dew_point_temperature'])
-   
-    df = df[df['station_id'] == station_id]
-    
-    df['air_temperature'] = calc.unit_conversion.celsius_to_fahrenheit(df['air_temperature'])
-    df['wind_speed'] = calc.unit_conversion.knots_to_mph(df['wind_speed'])
-    df['wind_gust'] = calc.unit_conversion.knots_to_mph(df['wind_gust'])
-    
-    df = df.sort_values(['air_temperature'], ascending=False)
-    maximum_temperature = df['air_temperature'].iloc[0]
-    maximum_temperature_time = df['date_time'].iloc[0]
-    maximum_temperature_time_utc = maximum_temperature_time.replace(tzinfo=to_zone)
-    maximum_temperature_time_local = maximum_temperature_time_utc.astimezone(from_zone)
-    minimum_temperature = df['air_temperature'].iloc[-1]
-    minimum_temperature_time = df['date_time'].iloc[-1]
-    minimum_temperature_time_utc = minimum_temperature_time.replace(tzinfo=to_zone)
-    minimum_temperature_time_local = minimum_temperature_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['relative_humidity'], ascending=True)
-    minimum_relative_humidity = df['relative_humidity'].iloc[0]
-    minimum_relative_humidity_time = df['date_time'].iloc[0]
-    minimum_relative_humidity_time_utc = minimum_relative_humidity_time.replace(tzinfo=to_zone)
-    minimum_relative_humidity_time_local = minimum_relative_humidity_time_utc.astimezone(from_zone)
-    maximum_relative_humidity = df['relative_humidity'].iloc[-1]
-    maximum_relative_humidity_time = df['date_time'].iloc[-1]
-    maximum_relative_humidity_time_utc = maximum_relative_humidity_time.replace(tzinfo=to_zone)
-    maximum_relative_humidity_time_local = maximum_relative_humidity_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['wind_speed'], ascending=False)
-    maximum_wind_speed = df['wind_speed'].iloc[0]
-    wind_direction = df['wind_direction'].iloc[0]
-    wind_dir = parsers.checks.wind_direction_number_to_abbreviation(wind_direction)
-    maximum_wind_speed_time = df['date_time'].iloc[0]
-    maximum_wind_speed_time_utc = maximum_wind_speed_time.replace(tzinfo=to_zone)
-    maximum_wind_speed_time_local = maximum_wind_speed_time_utc.astimezone(from_zone)
-    
-    df = df.sort_values(['wind_gust'], ascending=False)
-    maximum_wind_gust = df['wind_gust'].iloc[0]
-    maximum_wind_gust_time = df['date_time'].iloc[0]
-    maximum_wind_gust_time_utc = maximum_wind_gust_time.replace(tzinfo=to_zone)
-    maximum_wind_gust_time_local = maximum_wind_gust_time_utc.astimezone(from_zone)
-
-    df = df.sort_values(['date_time'], ascending=True)
+    Returns:
+            1) Maximum Temperature (°F)
+            2) The time the maximum temperature occurred
+            3) Minimum Temperature (°F)
+            4) The time the minimum temperature occurred
+            5) Minimum Relative Humidity (%)
+            6) The time the minimum relative humidity occurred
+            7) Maximum Relative Humidity (%)
+            8) The time the maximum relative humidity occurred
+            9) Maximum Wind Speed (MPH)
+            10) The time the maximum wind speed occurred
+            11) Maximum Wind Gust (MPH)
+            12) The time the maximum wind gust occurred 
 
-    print("Data retrieved successfully!")
+    '''
 
-    return df, maximum_temperature, maximum_temperature_time, maximum_temperature_time_local, minimum_temperature, minimum_temperature_time, minimum_temperature_time_local, minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local, maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local, maximum_wind_speed, wind_dir, maximum_wind_speed_time, maximum_wind_speed_time_local, maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local, station_id, previous_day_utc
+    summaries = previous_day_weather_summaries([station_id], days_ago=2)
+
+    return summaries[station_id.upper()]
 
 
 def get_METAR_Data(current_time, plot_projection, mask):
@@ -5076,16 +5681,10 @@ def get_METAR_Data(current_time, plot_projection, mask):
     '''
     metar_time = current_time
 
-    main_server_response = requests.get("https://thredds.ucar.edu/thredds/catalog/catalog.xml")
-    backup_server_response = requests.get("https://thredds-dev.unidata.ucar.edu/thredds/catalog/catalog.xml")
-    main_server_status = main_server_response.status_code
-    backup_server_status = backup_server_response.status_code
-    
-    # Pings server for airport data
-    airports_df = pd.read_csv(get_test_data('airport-codes.csv'))
+    main_server_status, backup_server_status = thredds_server_statuses([main_thredds_server, second_backup_thredds_server])
     
-    # Queries our airport types (airport sizes)
-    airports_df = airports_df[(airports_df['type'] == 'large_airport') | (airports_df['type'] == 'medium_airport') | (airports_df['type'] == 'small_airport')]
+    # Station ids of the airports (large, medium and small) from the station index
+    airports = airport_station_ids(['large_airport', 'medium_airport', 'small_airport'])
     
     # Accesses the METAR data
 
@@ -5112,18 +5711,13 @@ def get_METAR_Data(current_time, plot_projection, mask):
     if main_server_status != 200 and backup_server_status != 200:
         print("ERROR! Cannot connect to either the main or backup server. Aborting!")
         
-    # Opens METAR file
-    metar_file = metar_cat.datasets.filter_time_nearest(metar_time).remote_open()
-    
-    # Decodes bytes into strings
-    metar_text = StringIO(metar_file.read().decode('latin-1'))
-    
-    # Parses through data
-    sfc_data = parse_metar_file(metar_text, year=metar_time.year, month=metar_time.month)
+    # Downloads and parses the METAR file (or reads it from the METAR cache)
+    metar_file = metar_cat.datasets.filter_time_nearest(metar_time)
+    sfc_data = get_parsed_metar_file(metar_file, year=metar_time.year, month=metar_time.month)
     sfc_units = sfc_data.units
     
     # Creates dataframe
-    sfc_data = sfc_data[sfc_data['station_id'].isin(airports_df['ident'])]
+    sfc_data = sfc_data[sfc_data['station_id'].isin(airports)]
     
     sfc_data = pandas_dataframe_to_unit_arrays(sfc_data, sfc_units)
     
@@ -5135,11 +5729,8 @@ def get_METAR_Data(current_time, plot_projection, mask):
     sfc_data_rh = mpcalc.relative_humidity_from_dewpoint(sfc_data['air_temperature'], sfc_data['dew_point_temperature'])
     
     
-    locs = plot_projection.transform_points(ccrs.PlateCarree(), sfc_data['longitude'].m, sfc_data['latitude'].m)
-    #print(locs[:, :])
-    
-    # Creates mask for plotting METAR obs
-    sfc_data_mask = mpcalc.reduce_point_density(locs[:, :], mask)
+    # Creates mask for plotting METAR obs (cached for each projection, mask and set of stations)
+    sfc_data_mask = metar_density_mask(sfc_data['station_id'], sfc_data['longitude'].m, sfc_data['latitude'].m, plot_projection, mask)
 
     print("METAR Data successfully retrieved for " + metar_time.strftime('%m/%d/%Y %H00 UTC'))
     return sfc_data, sfc_data_u_kt, sfc_data_v_kt, sfc_data_rh, sfc_data_mask, metar_time
@@ -5163,11 +5754,8 @@ def get_METAR_Data_CONUS(current_time):
     '''
     metar_time = current_time
     
-    # Pings server for airport data
-    airports_df = pd.read_csv(get_test_data('airport-codes.csv'))
-    
-    # Queries our airport types (airport sizes)
-    airports_df = airports_df[(airports_df['type'] == 'large_airport') | (airports_df['type'] == 'medium_airport') | (airports_df['type'] == 'small_airport')]
+    # Station ids of the airports (large, medium and small) from the station index
+    airports = airport_station_ids(['large_airport', 'medium_airport', 'small_airport'])
     
     # Accesses the METAR data
     try:
@@ -5176,18 +5764,13 @@ def get_METAR_Data_CONUS(current_time):
     except Exception as e:
         metar_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/noaaport/text/metar/catalog.xml')
         
-    # Opens METAR file
-    metar_file = metar_cat.datasets.filter_time_nearest(metar_time).remote_open()
-    
-    # Decodes bytes into strings
-    metar_text = StringIO(metar_file.read().decode('latin-1'))
-    
-    # Parses through data
-    sfc_data = parse_metar_file(metar_text, year=metar_time.year, month=metar_time.month)
+    # Downloads and parses the METAR file (or reads it from the METAR cache)
+    metar_file = metar_cat.datasets.filter_time_nearest(metar_time)
+    sfc_data = get_parsed_metar_file(metar_file, year=metar_time.year, month=metar_time.month)
     sfc_units = sfc_data.units
     
     # Creates dataframe
-    sfc_data = sfc_data[sfc_data['station_id'].isin(airports_df['ident'])]
+    sfc_data = sfc_data[sfc_data['station_id'].isin(airports)]
     
     sfc_data = pandas_dataframe_to_unit_arrays(sfc_data, sfc_units)
     
@@ -5222,11 +5805,8 @@ def get_METAR_Data_Hawaii(current_time):
     '''
     metar_time = current_time
     
-    # Pings server for airport data
-    airports_df = pd.read_csv(get_test_data('airport-codes.csv'))
-    
-    # Queries our airport types (airport sizes)
-    airports_df = airports_df[(airports_df['type'] == 'large_airport') | (airports_df['type'] == 'small_airport')]
+    # Station ids of the airports (large and small) from the station index
+    airports = airport_station_ids(['large_airport', 'small_airport'])
     
     # Accesses the METAR data
     try:
@@ -5235,18 +5815,13 @@ def get_METAR_Data_Hawaii(current_time):
     except Exception as e:
         metar_cat = TDSCatalog('https://thredds.ucar.edu/thredds/catalog/noaaport/text/metar/catalog.xml')
         
-    # Opens METAR file
-    metar_file = metar_cat.datasets.filter_time_nearest(metar_time).remote_open()
-    
-    # Decodes bytes into strings
-    metar_text = StringIO(metar_file.read().decode('latin-1'))
-    
-    # Parses through data
-    sfc_data = parse_metar_file(metar_text, year=metar_time.year, month=metar_time.month)
+    # Downloads and parses the METAR file (or reads it from the METAR cache)
+    metar_file = metar_cat.datasets.filter_time_nearest(metar_time)
+    sfc_data = get_parsed_metar_file(metar_file, year=metar_time.year, month=metar_time.month)
     sfc_units = sfc_data.units
     
     # Creates dataframe
-    sfc_data = sfc_data[sfc_data['station_id'].isin(airports_df['ident'])]
+    sfc_data = sfc_data[sfc_data['station_id'].isin(airports)]
     
     sfc_data = pandas_dataframe_to_unit_arrays(sfc_data, sfc_units)
     
@@ -5418,132 +5993,35 @@ def RTMA_Dataset_Synced_With_METAR(current_time):
 
 
 
-def get_rtma_data_past_6hrs():
-
-
-    
-    local_time, utc_time = standard.plot_creation_time()
-    times = []
-
-    for i in range(0, 10):
-        time = utc_time - timedelta(hours=i)
-        times.append(time)
-
-    t1 = times[0]
-    t2 = times[1]
-    t3 = times[2]
-    t4 = times[3]
-    t5 = times[4]
-    t6 = times[5]
-    t7 = times[6]
-    t8 = times[7]
-    t9 = times[8]
-    t10 = times[9]
-
-    ds_0, rtma_time_0 = get_RTMA_dataset(t1)
-
-    t.sleep(15)
-
-    ds_1, rtma_time_1 = get_RTMA_dataset(t2)
-
-    t.sleep(15)
-
-    if rtma_time_0.hour == rtma_time_1.hour:
-
-        ds_1, rtma_time_1 = get_RTMA_dataset(t3)
-
-        t.sleep(15)
-
-        if rtma_time_0.hour == rtma_time_1.hour:
-
-            ds_1, rtma_time_1 = get_RTMA_dataset(t4)
-
-            t.sleep(15)
-
-            ds_2, rtma_time_2 = get_RTMA_dataset(t5)
-
-            tsleep(15)
-    
-            ds_3, rtma_time_3 = get_RTMA_dataset(t6)
-
-            t.sleep(15)
-    
-            ds_4, rtma_time_4 = get_RTMA_dataset(t7)
-
-            t.sleep(15)
-    
-            ds_5, rtma_time_5 = get_RTMA_dataset(t8)
-
-            t.sleep(15)
-    
-            ds_6, rtma_time_6 = get_RTMA_dataset(t9)
-
-            t.sleep(15)
-
-            ds_7, rtma_time_7 = get_RTMA_dataset(t10)
-
-            t.sleep(15)
-
-
-        else:
-
-            ds_1, rtma_time_1 = get_RTMA_dataset(t3)
+def get_rtma_data_past_6hrs(extent=None, variables=None):
 
-            t.sleep(15)
-            
-            ds_2, rtma_time_2 = get_RTMA_dataset(t4)
+    r'''
+    This function retrieves the latest 2.5km x 2.5km RTMA Dataset and the datasets for each of the 7 hours before it. 
+    The earlier hours are read from the RTMA archive when an earlier run already downloaded them so usually only the 
+    latest hour is downloaded. 
 
-            t.sleep(15)
-    
-            ds_3, rtma_time_3 = get_RTMA_dataset(t5)
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in degrees. 
+                           Default is None (the full CONUS domain). 
 
-            t.sleep(15)
-    
-            ds_4, rtma_time_4 = get_RTMA_dataset(t6)
+                        2) variables (List) - The names of the variables to download. Default is None (all variables). 
+                           The archive is only used when the variables are given. 
 
-            t.sleep(15)
-    
-            ds_5, rtma_time_5 = get_RTMA_dataset(t7)
+    Returns: 1) A list of the datasets (latest first)
 
-            t.sleep(15)
+             2) A list of the times corresponding to the datasets
+    '''
     
-            ds_6, rtma_time_6 = get_RTMA_dataset(t8)
-
-            t.sleep(15)
-
-            ds_7, rtma_time_7 = get_RTMA_dataset(t9)
-
-            t.sleep(15)
-
-    else:
-
-        ds_1, rtma_time_1 = get_RTMA_dataset(t2)
-
-        t.sleep(15)
-
-        ds_2, rtma_time_2 = get_RTMA_dataset(t3)
-
-        t.sleep(15)
-
-        ds_3, rtma_time_3 = get_RTMA_dataset(t4)
-
-        t.sleep(15)
-
-        ds_4, rtma_time_4 = get_RTMA_dataset(t5)
-
-        t.sleep(15)
-
-        ds_5, rtma_time_5 = get_RTMA_dataset(t6)
-
-        t.sleep(15)
+    local_time, utc_time = standard.plot_creation_time()
 
-        ds_6, rtma_time_6 = get_RTMA_dataset(t7)
+    ds_0, rtma_time_0 = RTMA_CONUS.get_RTMA_dataset(utc_time, extent, variables)
 
-        t.sleep(15)
+    ds_list = [ds_0]
+    rtma_times = [rtma_time_0]
 
-        ds_7, rtma_time_7 = get_RTMA_dataset(t8)
-    
-    ds_list, rtma_times = parsers.save.append_data_RTMA_6hr_timelapse(ds_0, ds_1, ds_2, ds_3, ds_4, ds_5, ds_6, ds_7, rtma_time_0, rtma_time_1, rtma_time_2, rtma_time_3, rtma_time_4, rtma_time_5, rtma_time_6, rtma_time_7)
+    for i in range(1, 8):
+        rtma_time = rtma_time_0 - timedelta(hours=i)
+        ds_list.append(get_nomads_rtma_dataset('rtma2p5', rtma_time, extent, variables))
+        rtma_times.append(rtma_time)
 
     return ds_list, rtma_times        
 
@@ -7,6 +7,7 @@ import metpy.calc as mpcalc
 import numpy as np
 import firewxpy.parsers as parsers
 import firewxpy.geometry as geometry
+import firewxpy.rendering as rendering
 import firewxpy.colormaps as colormaps
 import pandas as pd
 import matplotlib.gridspec as gridspec
@@ -316,42 +317,42 @@ class dynamics:
             
             ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
             ax.set_extent([wb, eb, sb, nb], datacrs)
-            ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-            ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-            ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
-            ax.add_feature(provinces, linewidth=province_border_linewidth, zorder=1)
+            rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+            rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, provinces, linewidth=province_border_linewidth, zorder=1)
             if show_rivers == True:
-                ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
     
@@ -692,42 +693,42 @@ class dynamics:
             
             ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
             ax.set_extent([wb, eb, sb, nb], datacrs)
-            ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-            ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-            ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
-            ax.add_feature(provinces, linewidth=province_border_linewidth, zorder=1)
+            rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+            rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, provinces, linewidth=province_border_linewidth, zorder=1)
             if show_rivers == True:
-                ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
     
@@ -1013,42 +1014,42 @@ class dynamics:
             
             ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
             ax.set_extent([wb, eb, sb, nb], datacrs)
-            ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-            ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-            ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
-            ax.add_feature(provinces, linewidth=province_border_linewidth, zorder=1)
+            rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+            rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, provinces, linewidth=province_border_linewidth, zorder=1)
             if show_rivers == True:
-                ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
     
@@ -1397,42 +1398,42 @@ class dynamics:
             
             ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
             ax.set_extent([wb, eb, sb, nb], datacrs)
-            ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-            ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-            ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
-            ax.add_feature(provinces, linewidth=province_border_linewidth, zorder=1)
+            rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+            rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, provinces, linewidth=province_border_linewidth, zorder=1)
             if show_rivers == True:
-                ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
     
@@ -1694,42 +1695,42 @@ class dynamics:
             
             ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
             ax.set_extent([wb, eb, sb, nb], datacrs)
-            ax.add_feature(cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
-            ax.add_feature(cfeature.LAND, color='beige', zorder=1)
-            ax.add_feature(cfeature.OCEAN, color='lightcyan', zorder=1)
-            ax.add_feature(cfeature.LAKES, color='lightcyan', zorder=1)
-            ax.add_feature(provinces, linewidth=province_border_linewidth, zorder=1)
+            rendering.add_feature(ax, cfeature.COASTLINE.with_scale('50m'), linewidth=0.75, zorder=9)
+            rendering.add_feature(ax, cfeature.LAND, color='beige', zorder=1)
+            rendering.add_feature(ax, cfeature.OCEAN, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, cfeature.LAKES, color='lightcyan', zorder=1)
+            rendering.add_feature(ax, provinces, linewidth=province_border_linewidth, zorder=1)
             if show_rivers == True:
-                ax.add_feature(cfeature.RIVERS, color='lightcyan', zorder=4)
+                rendering.add_feature(ax, cfeature.RIVERS, color='lightcyan', zorder=4)
             else:
                 pass
         
             if show_gacc_borders == True:
-                ax.add_feature(GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
+                rendering.add_feature(ax, GACC, linewidth=gacc_border_linewidth, linestyle=gacc_border_linestyle, zorder=6)
             else:
                 pass
             if show_psa_borders == True:
-                ax.add_feature(PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, PSAs, linewidth=psa_border_linewidth, linestyle=psa_border_linestyle, zorder=5)
             else:
                 pass
             if show_county_borders == True:
-                ax.add_feature(USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
+                rendering.add_feature(ax, USCOUNTIES, linewidth=county_border_linewidth, linestyle=county_border_linestyle, zorder=5)
             else:
                 pass
             if show_state_borders == True:
-                ax.add_feature(cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
+                rendering.add_feature(ax, cfeature.STATES, linewidth=state_border_linewidth, linestyle=state_border_linestyle, edgecolor='black', zorder=6)
             else:
                 pass
             if show_cwa_borders == True:
-                ax.add_feature(CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
+                rendering.add_feature(ax, CWAs, linewidth=cwa_border_linewidth, linestyle=cwa_border_linestyle, zorder=5)
             else:
                 pass
             if show_nws_firewx_zones == True:
-                ax.add_feature(FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, FWZs, linewidth=nws_firewx_zones_linewidth, linestyle=nws_firewx_zones_linestyle, zorder=5)
             else:
                 pass
             if show_nws_public_zones == True:
-                ax.add_feature(PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
+                rendering.add_feature(ax, PZs, linewidth=nws_public_zones_linewidth, linestyle=nws_public_zones_linestyle, zorder=5)
             else:
                 pass
     
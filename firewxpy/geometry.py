@@ -2,6 +2,7 @@
 # PYTHON DEPENDENCIES:
 # 1) MATPLOTLIB
 # 2) CARTOPY
+# 3) SHAPELY
 #
 #  (C) METEOROLOGIST ERIC J. DREWITZ
 #               USDA/USFS
@@ -9,14 +10,21 @@
 ###### IMPORTS ################
 import urllib.request
 import os
+import json
+import hashlib
+import numpy as np
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
+import shapely.geometry as sgeom
 import warnings
 warnings.filterwarnings('ignore')
 
 from cartopy.io.shapereader import Reader
-from cartopy.feature import ShapelyFeature
+from cartopy.feature import Feature
+from shapely.prepared import prep
+from shapely import wkb
 from firewxpy.utilities import file_functions
+from firewxpy.settings import get_region_extent, state_list, gacc_region_list
 
 #### INFORMATION CLASS ####
 # The information class returns helpful tips for when the user encounters errors
@@ -161,22 +169,43 @@ def download_shape_files():
 
 
 
-def import_shapefiles(file_path, line_color, boundary_type):
+# Process-wide boundary registries. Shapefiles are only read the first time a layer is drawn 
+# and every later figure, product and call within the same process reuses those geometries. 
+_geometry_registry = {}
+_feature_registry = {}
+_shapefiles_checked = {}
+_tile_registry = {}
+_record_geometry_registry = {}
 
-    r'''
-    This function reads and returns the shapefiles (.shp) files from a specific file location. 
+# Pre-clipped and simplified boundaries for each state and GACC region are written here. 
+tile_directory = "Boundary Tiles"
 
-    Required Arguments: 1) file_path (String) - The file location of the SHP files. 
-                        2) line_color (String) - The color the user wishes to display for the borders in the shapefile. 
-                        3) boundary_type (String) - The type of geographical boundaries the user wishes to use. 
-                                                    This is necessary because the NWS boundaries have a large file size which to be able to host on github, the files need to be zipped so we need to unzip and extract those files. 
+# Simplification tolerance is one pixel at this resolution for the figure size of each region. 
+tile_dpi = 100
 
-    Returns: 1) The shapefile borders the user wishes to import into the weather graphics. 
+boundary_file_paths = {
+    'psa':f"PSA Shapefiles/National_PSA_Current.shp",
+    'gacc':f"GACC Boundaries Shapefiles/National_GACC_Current.shp",
+    'cwa':f"NWS CWA Boundaries/w_05mr24.shp",
+    'fwz':f"NWS Fire Weather Zones/fz05mr24.shp",
+    'pz':f"NWS Public Zones/z_05mr24.shp"
+}
+
+
+def extract_nws_shapefiles(boundary_type):
+
+    r'''
+    This function makes sure the shapefiles exist locally and unzips the NWS boundaries when needed. 
+    The check only runs once per boundary type for the life of the process. 
+
+    Required Arguments: 1) boundary_type (String) - The type of geographical boundaries (i.e. 'psa', 'gacc', 'cwa', 'fwz' or 'pz'). 
 
+    Returns: None
+    
     '''
-    file_path = file_path 
-    line_color = line_color
-    boundary_type = boundary_type
+
+    if _shapefiles_checked.get(boundary_type, False) == True:
+        return
 
     download_shape_files()
 
@@ -221,20 +250,431 @@ def import_shapefiles(file_path, line_color, boundary_type):
 
     else:
         pass
+
+    _shapefiles_checked[boundary_type] = True
+
+
+def load_boundary_geometries(file_path, boundary_type):
+
+    r'''
+    This function reads the geometries of a shapefile one time per process and stores them in the geometry registry. 
+
+    Each geometry is stored alongside its prepared version (for fast intersection tests) and the bounds of 
+    every geometry so the geometries outside of the map extent can be thrown out without touching shapely. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP files. 
+                        2) boundary_type (String) - The type of geographical boundaries. 
+
+    Returns: 1) A dictionary with the geometries, prepared geometries and bounds (xmin, ymin, xmax, ymax) of the boundary set. 
     
+    '''
+
+    try:
+        return _geometry_registry[file_path]
+    except KeyError:
+        pass
+
+    extract_nws_shapefiles(boundary_type)
+
     try:
-        shape_feature = ShapelyFeature(Reader(file_path).geometries(),
-                                       ccrs.PlateCarree(), facecolor=(0,0,0,0), edgecolor=line_color)
+        geometries = [g for g in Reader(file_path).geometries() if g is not None and g.is_empty == False]
+    except Exception as a:
+        error = shape_file_error()
+        print(error)
+        return {'geometries':[], 'prepared':[], 'bounds':np.empty((0, 4), dtype=np.float64)}
+
+    prepared = [prep(g) for g in geometries]
+    if len(geometries) > 0:
+        bounds = np.asarray([g.bounds for g in geometries], dtype=np.float64)
+    else:
+        bounds = np.empty((0, 4), dtype=np.float64)
+
+    entry = {'geometries':geometries, 'prepared':prepared, 'bounds':bounds}
+    _geometry_registry[file_path] = entry
+
+    print("Shapefile imported successfully!")
+
+    return entry
+
+
+def boundary_record_geometries(file_path, boundary_type, attribute, value):
 
+    r'''
+    This function returns the geometries of the records of a shapefile where an attribute has a given value 
+    (i.e. the GACC region where GACCAbbrev is OSCC). The geometries are read one time per process. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP files. 
+                        2) boundary_type (String) - The type of geographical boundaries. 
+                        3) attribute (String) - The name of the attribute (i.e. 'GACCAbbrev' or 'CWA'). 
+                        4) value (String) - The value of the attribute (not case sensitive). 
 
-        print("Shapefile imported successfully!")
+    Returns: 1) A list of shapely geometries. 
     
-        return shape_feature
+    '''
+
+    key = (file_path, attribute, value.upper())
 
+    try:
+        return _record_geometry_registry[key]
+    except KeyError:
+        pass
+
+    extract_nws_shapefiles(boundary_type)
+
+    try:
+        geometries = [r.geometry for r in Reader(file_path).records() if r.geometry is not None and str(r.attributes.get(attribute, '')).strip().upper() == value.upper()]
     except Exception as a:
         error = shape_file_error()
         print(error)
+        return []
+
+    _record_geometry_registry[key] = geometries
+
+    return geometries
+
+
+def region_key(state=None, gacc_region=None):
+
+    r'''
+    This function returns the name of the boundary tile for a state or GACC region. 
+    
+    Returns None for the CONUS and custom extents since those use the full national boundaries. 
+    
+    '''
+
+    if gacc_region != None:
+        return 'GACC_' + str(gacc_region).upper()
+    if state != None:
+        state = str(state).upper()
+        if state == 'US' or state == 'USA' or state == 'CUSTOM':
+            return None
+        return 'STATE_' + state
+    return None
+
+
+def read_tile_index():
+
+    index_path = os.path.join(tile_directory, 'index.json')
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except Exception as e:
+        index = {'sources':{}, 'tiles':{}}
+
+    return index
+
+
+def write_tile_index(index):
+
+    r'''
+    This function saves the tile index. Other processes (i.e. the render workers) may have saved tiles since the 
+    index was read, so the index on disk is read again under a lock and the entries of this index are merged into it. 
+    '''
+
+    if os.path.exists(tile_directory) == False:
+        os.makedirs(tile_directory, exist_ok=True)
+
+    index_path = os.path.join(tile_directory, 'index.json')
+
+    def write(path):
+        with open(path, 'w') as f:
+            json.dump(merged, f, indent=1)
+
+    with file_functions.locked_file(index_path):
+        merged = read_tile_index()
+        merged['sources'].update(index['sources'])
+        merged['tiles'].update(index['tiles'])
+        file_functions.write_file_atomically(index_path, write)
+
+
+def source_fingerprint(file_path, index):
+
+    r'''
+    This function returns the hash of a source shapefile. 
+
+    The hash is only recomputed when the mtime or size of the file differs from what is recorded in the tile index. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP file. 
+                        2) index (Dictionary) - The tile index. 
+
+    Returns: 1) The SHA-1 hash of the source shapefile. 
+    
+    '''
+
+    stat = os.stat(file_path)
+    record = index['sources'].get(file_path)
+
+    if record != None and record['mtime'] == stat.st_mtime and record['size'] == stat.st_size:
+        return record['hash']
+
+    sha = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+
+    index['sources'][file_path] = {'mtime':stat.st_mtime, 'size':stat.st_size, 'hash':sha.hexdigest()}
 
+    return sha.hexdigest()
 
 
+def build_boundary_tile(file_path, boundary_type, state=None, gacc_region=None, index=None):
 
+    r'''
+    This function clips a national boundary shapefile to the extent of a state or GACC region, simplifies the 
+    geometries to one pixel of the figure for that region and writes them to the tile directory as WKB. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP file. 
+                        2) boundary_type (String) - The type of geographical boundaries. 
+
+    Optional Arguments: 1) state (String) - Default = None. The two letter state abbreviation. 
+                        2) gacc_region (String) - Default = None. The GACC region abbreviation. 
+                        3) index (Dictionary) - Default = None. The tile index. If None, the index is read from and saved to the tile directory. 
+
+    Returns: 1) The file path of the boundary tile. 
+    
+    '''
+
+    save_index = False
+    if index == None:
+        index = read_tile_index()
+        save_index = True
+
+    name = region_key(state, gacc_region)
+    if os.path.exists(tile_directory) == False:
+        os.makedirs(tile_directory, exist_ok=True)
+    tile_path = os.path.join(tile_directory, f"{name}_{boundary_type}.npz")
+
+    western_bound, eastern_bound, southern_bound, northern_bound, fig_x_length, fig_y_length = get_region_extent(state, gacc_region)
+
+    # The clip box extends past the map so the artificial edges created by clipping are never visible
+    margin = 0.05 * max(eastern_bound - western_bound, northern_bound - southern_bound)
+    x0 = western_bound - margin
+    x1 = eastern_bound + margin
+    y0 = southern_bound - margin
+    y1 = northern_bound + margin
+    tolerance = (x1 - x0) / (fig_x_length * tile_dpi)
+
+    entry = load_boundary_geometries(file_path, boundary_type)
+    bounds = entry['bounds']
+    mask = (bounds[:, 0] <= x1) & (bounds[:, 2] >= x0) & (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0)
+    clip_box = sgeom.box(x0, y0, x1, y1)
+
+    blobs = []
+    for i in np.flatnonzero(mask):
+        geometry = entry['geometries'][i]
+        if entry['prepared'][i].intersects(clip_box) == False:
+            continue
+        if clip_box.contains(geometry) == False:
+            geometry = geometry.intersection(clip_box)
+        geometry = geometry.simplify(tolerance, preserve_topology=True)
+        if geometry.is_empty:
+            continue
+        blobs.append(wkb.dumps(geometry))
+
+    offsets = np.cumsum([0] + [len(b) for b in blobs]).astype(np.int64)
+    data = np.frombuffer(b''.join(blobs), dtype=np.uint8)
+    file_functions.write_file_atomically(tile_path, lambda path: np.savez_compressed(path, offsets=offsets, data=data))
+
+    index['tiles'][f"{name}_{boundary_type}"] = {'source':file_path, 'hash':source_fingerprint(file_path, index), 'tolerance':tolerance, 'extent':[x0, x1, y0, y1]}
+
+    if save_index == True:
+        write_tile_index(index)
+
+    print("Boundary tile saved to: "+tile_path)
+
+    return tile_path
+
+
+def build_boundary_tiles(states=None, gacc_regions=None, boundary_types=None):
+
+    r'''
+    This function builds the pre-clipped and simplified boundary tiles for every state and GACC region. 
+
+    This is meant to be run once (i.e. when setting up a new machine). Any tile that is missing or out of date 
+    is also rebuilt automatically the first time it is needed. 
+
+    Optional Arguments: 1) states (List) - Default = None. The states to build. If None, all states are built. 
+                        2) gacc_regions (List) - Default = None. The GACC regions to build. If None, all GACC regions are built. 
+                        3) boundary_types (List) - Default = None. Any of 'psa', 'gacc', 'cwa', 'fwz', 'pz'. If None, all boundary types are built. 
+
+    Returns: 1) A list of the file paths of the boundary tiles. 
+    
+    '''
+
+    if states == None:
+        states = state_list
+    if gacc_regions == None:
+        gacc_regions = gacc_region_list
+    if boundary_types == None:
+        boundary_types = list(boundary_file_paths.keys())
+
+    index = read_tile_index()
+    tile_paths = []
+
+    for boundary_type in boundary_types:
+        file_path = boundary_file_paths[boundary_type]
+        for state in states:
+            tile_paths.append(build_boundary_tile(file_path, boundary_type, state=state, index=index))
+        for gacc_region in gacc_regions:
+            tile_paths.append(build_boundary_tile(file_path, boundary_type, gacc_region=gacc_region, index=index))
+
+    write_tile_index(index)
+
+    return tile_paths
+
+
+def load_boundary_tile(file_path, boundary_type, state=None, gacc_region=None):
+
+    r'''
+    This function returns the pre-clipped boundaries of a state or GACC region. 
+
+    The tile is rebuilt when it is missing or when the source shapefile has changed since the tile was built. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP file. 
+                        2) boundary_type (String) - The type of geographical boundaries. 
+
+    Optional Arguments: 1) state (String) - Default = None. The two letter state abbreviation. 
+                        2) gacc_region (String) - Default = None. The GACC region abbreviation. 
+
+    Returns: 1) A dictionary with the geometries, prepared geometries and bounds of the boundary tile. 
+    
+    '''
+
+    name = region_key(state, gacc_region)
+    key = (file_path, name)
+
+    try:
+        return _tile_registry[key]
+    except KeyError:
+        pass
+
+    extract_nws_shapefiles(boundary_type)
+
+    index = read_tile_index()
+    tile_path = os.path.join(tile_directory, f"{name}_{boundary_type}.npz")
+    record = index['tiles'].get(f"{name}_{boundary_type}")
+    fingerprint = source_fingerprint(file_path, index)
+
+    if record == None or record['hash'] != fingerprint or os.path.exists(tile_path) == False:
+        print(f"Building the {boundary_type.upper()} boundary tile for {name}...")
+        build_boundary_tile(file_path, boundary_type, state=state, gacc_region=gacc_region, index=index)
+        write_tile_index(index)
+
+    with np.load(tile_path) as tile:
+        offsets = tile['offsets']
+        data = tile['data'].tobytes()
+
+    geometries = [wkb.loads(data[offsets[i]:offsets[i+1]]) for i in range(0, len(offsets) - 1)]
+    if len(geometries) > 0:
+        bounds = np.asarray([g.bounds for g in geometries], dtype=np.float64)
+    else:
+        bounds = np.empty((0, 4), dtype=np.float64)
+
+    entry = {'geometries':geometries, 'prepared':[prep(g) for g in geometries], 'bounds':bounds}
+    _tile_registry[key] = entry
+
+    return entry
+
+
+def clear_boundary_cache():
+
+    r'''
+    This function empties the boundary registries so the shapefiles are read again on the next draw. 
+
+    Returns: None
+    
+    '''
+
+    _geometry_registry.clear()
+    _feature_registry.clear()
+    _shapefiles_checked.clear()
+    _tile_registry.clear()
+    _record_geometry_registry.clear()
+
+
+class CachedBoundaryFeature(Feature):
+
+    r'''
+    A cartopy feature that defers reading the shapefile until the feature is actually drawn. 
+
+    Plotting functions build every boundary layer up front but only draw the layers the reference system needs, 
+    so the layers that are never drawn are never read. The geometries themselves live in the process-wide registry. 
+
+    '''
+
+    def __init__(self, file_path, boundary_type, state=None, gacc_region=None, **kwargs):
+        super().__init__(ccrs.PlateCarree(), **kwargs)
+        self.file_path = file_path
+        self.boundary_type = boundary_type
+        self.state = state
+        self.gacc_region = gacc_region
+
+    def _entry(self):
+        if region_key(self.state, self.gacc_region) != None:
+            try:
+                return load_boundary_tile(self.file_path, self.boundary_type, state=self.state, gacc_region=self.gacc_region)
+            except Exception as e:
+                print("Unable to use the boundary tile. Using the full shapefile instead.")
+        return load_boundary_geometries(self.file_path, self.boundary_type)
+
+    def geometries(self):
+        return iter(self._entry()['geometries'])
+
+    def intersecting_geometries(self, extent):
+        if extent is None:
+            return self.geometries()
+        entry = self._entry()
+        bounds = entry['bounds']
+        x0, x1, y0, y1 = extent
+        mask = (bounds[:, 0] <= x1) & (bounds[:, 2] >= x0) & (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0)
+        extent_box = sgeom.box(x0, y0, x1, y1)
+        geometries = entry['geometries']
+        prepared = entry['prepared']
+        return (geometries[i] for i in np.flatnonzero(mask) if prepared[i].intersects(extent_box))
+
+
+def import_shapefiles(file_path, line_color, boundary_type, state=None, gacc_region=None):
+
+    r'''
+    This function reads and returns the shapefiles (.shp) files from a specific file location. 
+
+    The returned feature is cached per (boundary_type, line_color) and the shapefile itself is only read the first 
+    time the feature is drawn on a map. Every later call in the same process reuses the same geometries. 
+
+    Required Arguments: 1) file_path (String) - The file location of the SHP files. 
+                        2) line_color (String) - The color the user wishes to display for the borders in the shapefile. 
+                        3) boundary_type (String) - The type of geographical boundaries the user wishes to use. 
+                                                    This is necessary because the NWS boundaries have a large file size which to be able to host on github, the files need to be zipped so we need to unzip and extract those files. 
+
+    Optional Arguments: 1) state (String) - Default = None. When set to a state abbreviation, the pre-clipped boundary tile for that state is drawn. 
+                        2) gacc_region (String) - Default = None. When set to a GACC region abbreviation, the pre-clipped boundary tile for that GACC region is drawn. 
+
+    Returns: 1) The shapefile borders the user wishes to import into the weather graphics. 
+
+    '''
+    file_path = file_path 
+    line_color = line_color
+    boundary_type = boundary_type
+
+    region = region_key(state, gacc_region)
+
+    if isinstance(line_color, str):
+        key = (boundary_type, line_color, file_path, region)
+    else:
+        key = (boundary_type, str(line_color), file_path, region)
+
+    try:
+        return _feature_registry[key]
+    except KeyError:
+        pass
+    
+    try:
+        shape_feature = CachedBoundaryFeature(file_path, boundary_type, state=state, gacc_region=gacc_region, facecolor=(0,0,0,0), edgecolor=line_color)
+
+        _feature_registry[key] = shape_feature
+    
+        return shape_feature
+
+    except Exception as a:
+        error = shape_file_error()
+        print(error)
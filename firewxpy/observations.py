@@ -22,6 +22,8 @@ import pandas as pd
 import matplotlib.gridspec as gridspec
 import matplotlib.dates as md
 import firewxpy.standard as standard
+import firewxpy.rendering as rendering
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -31,7 +33,7 @@ from metpy.plots import colortables
 from dateutil import tz
 from pysolar import solar, radiation
 from firewxpy.utilities import file_functions
-from firewxpy.data_access import previous_day_weather_summary_and_all_data
+from firewxpy.data_access import previous_day_weather_summary_and_all_data, previous_day_weather_summaries, stations_in_region
 
 mpl.rcParams['font.weight'] = 'bold'
 
@@ -57,7 +59,83 @@ def graphical_daily_summary(station_id):
 
     station_id = station_id.upper()
 
-    df, maximum_temperature, maximum_temperature_time, maximum_temperature_time_local, minimum_temperature, minimum_temperature_time, minimum_temperature_time_local, minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local, maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local, maximum_wind_speed, wind_dir, maximum_wind_speed_time, maximum_wind_speed_time_local, maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local, station_id, previous_day_utc = previous_day_weather_summary_and_all_data(station_id)
+    summary = previous_day_weather_summary_and_all_data(station_id)
+
+    save_daily_summary(summary)
+
+
+def graphical_daily_summaries(station_ids=None, state=None, gacc_region=None, cwa=None, workers=None):
+
+    r'''
+    This function creates the graphical daily weather summaries of many ASOS sites at once. 
+    The METAR data of the day is downloaded and parsed once for all of the stations and the figures are drawn in worker processes. 
+
+    Required Arguments: None
+
+    Optional Arguments: 1) station_ids (List) - The 4-letter station identifiers of the ASOS stations. Default is None. 
+                        2) state (String) - The two letter state abbreviation. Every airport in the state is used. Default is None. 
+                        3) gacc_region (String) - The GACC region abbreviation. Every airport in the GACC region is used. Default is None. 
+                        4) cwa (String) - The 3 letter identifier of an NWS office. Every airport in the County Warning Area is used. Default is None. 
+                        5) workers (Integer) - The number of worker processes. Default is None (rendering.render_workers or one per CPU). 
+
+    Returns: Saved figures to the observations folder (the same figures as graphical_daily_summary()). 
+             A list of the station ids with a saved figure. 
+
+    '''
+
+    if station_ids == None:
+        station_ids = stations_in_region(state=state, gacc_region=gacc_region, cwa=cwa)
+    else:
+        station_ids = [station_id.upper() for station_id in station_ids]
+
+    summaries = previous_day_weather_summaries(station_ids)
+
+    # The folders are made before the workers start so the workers don't try to make them at the same time
+    os.makedirs(f"Weather Data/Daily Weather Summary", exist_ok=True)
+
+    stations = list(summaries.keys())
+    results = rendering.render_tasks(save_daily_summary, [(summaries[station_id],) for station_id in stations], workers=workers, return_exceptions=True)
+
+    saved = []
+    for station_id, result in zip(stations, results):
+        if isinstance(result, Exception):
+            print("Unable to create the daily weather summary for " + station_id + ": " + str(result))
+        else:
+            saved.append(station_id)
+
+    return saved
+
+
+def save_daily_summary(summary):
+
+    r'''
+    This function draws and saves the graphical daily weather summary of one station. 
+
+    Required Arguments: 1) summary (Tuple) - The return of previous_day_weather_summary_and_all_data() for the station. 
+
+    Returns: None
+
+    '''
+
+    fig = daily_summary_figure(summary)
+
+    file_functions.save_daily_weather_summary(fig, summary[-2])
+
+    plt.close(fig)
+
+
+def daily_summary_figure(summary):
+
+    r'''
+    This function returns the figure of the graphical daily weather summary of one station. 
+
+    Required Arguments: 1) summary (Tuple) - The return of previous_day_weather_summary_and_all_data() for the station. 
+
+    Returns: The matplotlib figure. 
+
+    '''
+
+    df, maximum_temperature, maximum_temperature_time, maximum_temperature_time_local, minimum_temperature, minimum_temperature_time, minimum_temperature_time_local, minimum_relative_humidity, minimum_relative_humidity_time, minimum_relative_humidity_time_local, maximum_relative_humidity, maximum_relative_humidity_time, maximum_relative_humidity_time_local, maximum_wind_speed, wind_dir, maximum_wind_speed_time, maximum_wind_speed_time_local, maximum_wind_gust, maximum_wind_gust_time, maximum_wind_gust_time_local, station_id, previous_day_utc = summary
 
     time = df['date_time']
     time = pd.to_datetime(time)
@@ -281,7 +359,7 @@ def graphical_daily_summary(station_id):
     
     fig.text(0.27, 0.07, "Plot Created With FireWxPy (C) Eric J. Drewitz 2025\nData Source: thredds.ucar.edu\nImage Created: " + local_time.strftime('%m/%d/%Y %H:%M Local') + " (" + utc_time.strftime('%H:%M UTC') + ")", fontsize=14, fontweight='bold', verticalalignment='top', bbox=props, zorder=10)    
 
-    file_functions.save_daily_weather_summary(fig, station_id)
+    return fig
 
 
     
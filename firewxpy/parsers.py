@@ -14,6 +14,7 @@ import numpy as np
 import firewxpy.data_access as da
 import matplotlib.pyplot as plt
 import firewxpy.calc as calc
+import firewxpy.rendering as rendering
 import cartopy.crs as ccrs
 import xarray as xr
 import os
@@ -339,14 +340,85 @@ class NDFD:
         
 
 
-    def parse_GRIB_files_full_forecast_period(file_path, grid_time_interval, convert_temperature, count_short, count_extended, directory_name):
+    def decode_GRIB_file(file_path, grid_time_interval):
+
+        r'''
+        This function decodes every message in an NDFD GRIB2 file in one pass. 
+
+        All of the messages in an NDFD file share the same grid so the latitude and longitude are only computed once 
+        and the values of every forecast period are written into one preallocated float32 (time, y, x) array. 
+
+        Required Arguments: 1) file_path (String) - The path to the GRIB2 file (i.e. 'ds.maxt.bin'). 
+                            2) grid_time_interval (Integer) - The length in hours of each forecast period. 
+
+        Returns: 1) An NDFD_Grids object with the values, latitude, longitude and the valid start and end times of each forecast period. 
+
+        '''
 
         GRIB_File_List = pygrib.open(file_path)
-        grid_time_interval = grid_time_interval
-        convert_temperature = convert_temperature
-        count_short = count_short
-        count_extended = count_extended
-        directory_name = directory_name
+
+        try:
+            count = GRIB_File_List.messages
+
+            first = GRIB_File_List.message(1)
+            lats, lons = first.latlons()
+            ny, nx = lats.shape
+
+            values = np.empty((count, ny, nx), dtype=np.float32)
+            start_times = []
+
+            GRIB_File_List.seek(0)
+            for i, grb in enumerate(GRIB_File_List):
+                vals = grb.values
+                if np.ma.isMaskedArray(vals):
+                    vals = vals.filled(np.nan)
+                values[i] = vals
+                start_times.append(grb.validDate)
+
+        finally:
+            GRIB_File_List.close()
+
+        end_times = [t + timedelta(hours=grid_time_interval) for t in start_times]
+
+        return NDFD_Grids(values, lats.astype(np.float32), lons.astype(np.float32), start_times, end_times, os.path.basename(file_path))
+
+
+    # The first forecast period of each file starts at this hour (UTC). The function returns True when the first period
+    # is still valid at the current local hour even though the file no longer starts at that hour. 
+    first_period_rules = {
+        'ds.maxrh.bin': (6, lambda local_hour: local_hour < 4 or local_hour >= 16),
+        'ds.minrh.bin': (18, lambda local_hour: local_hour < 14),
+        'ds.critfireo.bin': (12, lambda local_hour: local_hour < 13),
+        'ds.dryfireo.bin': (12, lambda local_hour: local_hour < 13),
+        'ds.maxt.bin': (12, lambda local_hour: local_hour < 14 or local_hour >= 18),
+        'ds.mint.bin': (0, lambda local_hour: local_hour < 4 or local_hour >= 16),
+    }
+
+
+    def select_forecast_periods(grids, count_short, count_extended):
+
+        r'''
+        This function throws out the first forecast period of an NDFD file when it is old and no longer valid. 
+
+        Required Arguments: 1) grids (NDFD_Grids) - The decoded NDFD file. 
+                            2) count_short (Integer) - The number of GRIB messages in the short-term forecast. 
+                            3) count_extended (Integer) - The number of GRIB messages in the extended forecast. 
+
+        Returns: 1) The NDFD_Grids object of the valid forecast periods. 
+                 2) The count of GRIB files. 
+                 3) count_short
+                 4) count_extended
+                 5) discard (Boolean) - True when the first forecast period was thrown out. 
+
+        '''
+
+        file_path = grids.file_path
+        count = grids.count
+
+        try:
+            start_hour, keep_first_period = NDFD.first_period_rules[file_path]
+        except KeyError:
+            return grids, count, count_short, count_extended, False
 
         try:
             utc = datetime.now(UTC)
@@ -355,969 +427,146 @@ class NDFD:
             
         local = datetime.now()
 
-        utc_hour = utc.hour
-        local_hour = local.hour
+        outlook = file_path == 'ds.critfireo.bin' or file_path == 'ds.dryfireo.bin'
+        test_8 = count >= 8
 
-        if file_path != 'ds.apt.bin' or file_path != 'ds.conhazo.bin' or file_path != 'ds.critfireo.bin' or file_path != 'ds.dryfireo.bin' or file_path != 'ds.iceaccum.bin' or file_path != 'ds.maxrh.bin' or file_path != 'ds.maxt.bin' or file_path != 'ds.minrh.bin' or file_path != 'ds.mint.bin' or file_path != 'ds.phail.bin' or file_path != 'ds.pop12.bin' or file_path != 'ds.ptornado.bin' or file_path != 'ds.ptotsvrtstm.bin' or file_path != 'ds.ptotxsvrtstm.bin' or file_path != 'ds.ptstmwinds.bin' or file_path != 'ds.pxhail.bin' or file_path != 'ds.pxtornado.bin' or file_path != 'ds.pxtstmwinds.bin' or file_path != 'ds.qpf.bin' or file_path != 'ds.rhm.bin' or file_path != 'ds.sky.bin' or file_path != 'ds.snow.bin' or file_path != 'ds.tcwspdabv34c.bin' or file_path != 'ds.tcwspdabv34i.bin' or file_path != 'ds.tcwspdabv50c.bin' or file_path != 'ds.tcwspdabv50i.bin' or file_path != 'ds.tcwspdabv64c.bin' or file_path != 'ds.tcwspdabv64i.bin' or file_path != 'ds.td.bin' or file_path != 'ds.temp.bin' or file_path != 'ds.waveh.bin' or file_path != 'ds.wdir.bin' or file_path != 'ds.wgust.bin' or file_path != 'ds.wspd.bin' or file_path != 'ds.wwa.bin' or file_path != 'ds.wx.bin':
+        if grids.start_times[0].hour == start_hour:
+            print("The " +file_path+ " forecast period begins at " + grids.start_times[0].strftime('%m/%d/%Y %HZ'))
+            return grids, count, count_short, count_extended, False
 
-            file_path = os.path.basename(file_path)
+        if keep_first_period(local.hour) == True:
 
-        else:
-            file_path = file_path
+            if outlook == True and count > 1 and grids.start_times[0].day == grids.start_times[1].day:
+                print("Either duplicate or old files are being dowloaded.\nThrowing out the old file!")
+                if test_8 == False and file_path == 'ds.dryfireo.bin':
+                    count_short = count_short - 1
+                return grids.drop_first_period(), count, count_short, count_extended, True
 
-        count = 0
-        for grb in GRIB_File_List:
-            count = count + 1
+            print("The " +file_path+ " forecast period began at " + grids.start_times[0].strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is still within the first forecast period.\nThe first forecast grid is still returned.")
+            grids = grids.copy()
+            grids.set_first_period_start(datetime(utc.year, utc.month, utc.day, start_hour))
+            return grids, count, count_short, count_extended, False
 
-        print("There are " +str(count) + " GRIB files in the " + file_path + " download.\n")
+        print("The first forecast grid from " + grids.start_times[0].strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grids.start_times[1].strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
 
-        if file_path == 'ds.minrh.bin' or file_path == 'ds.maxrh.bin' or file_path == 'ds.critfireo.bin' or file_path == 'ds.dryfireo.bin':
-    
-            if count == 5: 
-                grb_1 = GRIB_File_List[1]
-                grb_2 = GRIB_File_List[2]
-                grb_3 = GRIB_File_List[3]
-                grb_4 = GRIB_File_List[4]
-                grb_5 = GRIB_File_List[5]
-                grb_6 = None
-                grb_7 = None
-                grb_8 = None
-    
-                grb_1_vals = grb_1.values
-                grb_1_start = grb_1.validDate
-                grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                grb_2_vals = grb_2.values
-                grb_2_start = grb_2.validDate
-                grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                grb_3_vals = grb_3.values
-                grb_3_start = grb_3.validDate
-                grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                grb_4_vals = grb_4.values
-                grb_4_start = grb_4.validDate
-                grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                grb_5_vals = grb_5.values
-                grb_5_start = grb_5.validDate
-                grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                grb_6_vals = None
-                grb_6_start = None
-                grb_6_end = None
-                grb_7_vals = None
-                grb_7_start = None
-                grb_7_end = None
-                grb_8_vals = None
-                grb_8_start = None
-                grb_8_end = None
-                
-                          
-                lats_1, lons_1 = grb_1.latlons()
-                lats_2, lons_2 = grb_2.latlons()
-                lats_3, lons_3 = grb_3.latlons()
-                lats_4, lons_4 = grb_4.latlons()
-                lats_5, lons_5 = grb_5.latlons()
-                lats_6, lons_6 = None, None
-                lats_7, lons_7 = None, None
-                lats_8, lons_8 = None, None
-    
-            if count == 6: 
-                grb_1 = GRIB_File_List[1]
-                grb_2 = GRIB_File_List[2]
-                grb_3 = GRIB_File_List[3]
-                grb_4 = GRIB_File_List[4]
-                grb_5 = GRIB_File_List[5]
-                grb_6 = GRIB_File_List[6]
-                grb_7 = None
-                grb_8 = None
-    
-                grb_1_vals = grb_1.values
-                grb_1_start = grb_1.validDate
-                grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                grb_2_vals = grb_2.values
-                grb_2_start = grb_2.validDate
-                grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                grb_3_vals = grb_3.values
-                grb_3_start = grb_3.validDate
-                grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                grb_4_vals = grb_4.values
-                grb_4_start = grb_4.validDate
-                grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                grb_5_vals = grb_5.values
-                grb_5_start = grb_5.validDate
-                grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                grb_6_vals = grb_6.values
-                grb_6_start = grb_6.validDate
-                grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                grb_7_vals = None
-                grb_7_start = None
-                grb_7_end = None
-                grb_8_vals = None
-                grb_8_start = None
-                grb_8_end = None
-    
-                lats_1, lons_1 = grb_1.latlons()
-                lats_2, lons_2 = grb_2.latlons()
-                lats_3, lons_3 = grb_3.latlons()
-                lats_4, lons_4 = grb_4.latlons()
-                lats_5, lons_5 = grb_5.latlons()
-                lats_6, lons_6 = grb_6.latlons()
-                lats_7, lons_7 = None, None
-                lats_8, lons_8 = None, None
-    
-            if count == 7: 
-                grb_1 = GRIB_File_List[1]
-                grb_2 = GRIB_File_List[2]
-                grb_3 = GRIB_File_List[3]
-                grb_4 = GRIB_File_List[4]
-                grb_5 = GRIB_File_List[5]
-                grb_6 = GRIB_File_List[6]
-                grb_7 = GRIB_File_List[7]
-                grb_8 = None
-
-                grb_1_vals = grb_1.values
-                grb_1_start = grb_1.validDate
-                grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                grb_2_vals = grb_2.values
-                grb_2_start = grb_2.validDate
-                grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                grb_3_vals = grb_3.values
-                grb_3_start = grb_3.validDate
-                grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                grb_4_vals = grb_4.values
-                grb_4_start = grb_4.validDate
-                grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                grb_5_vals = grb_5.values
-                grb_5_start = grb_5.validDate
-                grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                grb_6_vals = grb_6.values
-                grb_6_start = grb_6.validDate
-                grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                grb_7_vals = grb_7.values
-                grb_7_start = grb_7.validDate
-                grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                grb_8_vals = None
-                grb_8_start = None
-                grb_8_end = None
-    
-                lats_1, lons_1 = grb_1.latlons()
-                lats_2, lons_2 = grb_2.latlons()
-                lats_3, lons_3 = grb_3.latlons()
-                lats_4, lons_4 = grb_4.latlons()
-                lats_5, lons_5 = grb_5.latlons()
-                lats_6, lons_6 = grb_6.latlons()
-                lats_7, lons_7 = grb_7.latlons()
-                lats_8, lons_8 = None, None
-    
-            if count == 8: 
-                grb_1 = GRIB_File_List[1]
-                grb_2 = GRIB_File_List[2]
-                grb_3 = GRIB_File_List[3]
-                grb_4 = GRIB_File_List[4]
-                grb_5 = GRIB_File_List[5]
-                grb_6 = GRIB_File_List[6]
-                grb_7 = GRIB_File_List[7]
-                grb_8 = GRIB_File_List[8]
-
-                grb_1_vals = grb_1.values
-                grb_1_start = grb_1.validDate
-                grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                grb_2_vals = grb_2.values
-                grb_2_start = grb_2.validDate
-                grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                grb_3_vals = grb_3.values
-                grb_3_start = grb_3.validDate
-                grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                grb_4_vals = grb_4.values
-                grb_4_start = grb_4.validDate
-                grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                grb_5_vals = grb_5.values
-                grb_5_start = grb_5.validDate
-                grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                grb_6_vals = grb_6.values
-                grb_6_start = grb_6.validDate
-                grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                grb_7_vals = grb_7.values
-                grb_7_start = grb_7.validDate
-                grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                grb_8_vals = grb_8.values
-                grb_8_start = grb_8.validDate
-                grb_8_end = grb_8_start + timedelta(hours=grid_time_interval)
-    
-                lats_1, lons_1 = grb_1.latlons()
-                lats_2, lons_2 = grb_2.latlons()
-                lats_3, lons_3 = grb_3.latlons()
-                lats_4, lons_4 = grb_4.latlons()
-                lats_5, lons_5 = grb_5.latlons()
-                lats_6, lons_6 = grb_6.latlons()
-                lats_7, lons_7 = grb_7.latlons()
-                lats_8, lons_8 = grb_8.latlons()
+        count_short = count_short - 1
+        if test_8 == False or outlook == False:
+            count = count - 1
 
+        return grids.drop_first_period(), count, count_short, count_extended, True
 
-            forecast_hour = grb_1_start.hour
-    
-            if file_path == 'ds.maxrh.bin':
-                if forecast_hour == 6:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 4 or local_hour >= 16:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 04:00 (4AM)\nThe first maximum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 6
-    
-                        grb_1_start = datetime(year, month, day, start_hour)
-                        grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                        print("\nThere are " + str(count) + " files returned.")
-                        print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                        discard = False
-                        
-                        return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        
-                        discard = True
-                        
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            lats_8, lons_8 = None, None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count = count - 1
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-
-            if file_path == 'ds.minrh.bin':
-                if forecast_hour == 18:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 14:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 15:00 (3PM)\nThe first maximum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 18
-
-                        grb_1_start = datetime(year, month, day, start_hour)
-                        grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                        print("\nThere are " + str(count) + " files returned.")
-                        print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                        discard = False
-                        
-                        return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        discard = True
-
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            lats_8, lons_8 = None, None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count = count - 1
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-
-            if file_path == 'ds.critfireo.bin':
-                if forecast_hour == 12:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 13:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 13:00 (1PM)\nThe first maximum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 12
-                        discard = False
-                        day_1 = grb_1_start.day
-                        day_2 = grb_2_start.day
-                        if day_1 == day_2:
-                            print("Either duplicate or old files are being dowloaded.\nThrowing out the old file!")
-                            discard = True
-                            try:
-                                if grb_8_vals.all() != None:
-                                    test_8 = True
-                    
-                            except Exception as e:
-                                test_8 = False    
-
-                            if test_8 == False:
-                                grb_8_vals = None
-                                grb_8_start = None
-                                grb_8_end = None
-                                lats_8, lons_8 = None, None
-                                count_of_GRIB_files = count - 2
-                                print("There are " + str(count_of_GRIB_files) + " files returned.")
-                                print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                                
-                                return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-                            if test_8 == True:
-                                count_of_GRIB_files = count - 1
-                                print("There are " + str(count_of_GRIB_files) + " files returned.")
-                                print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                                
-                                return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-    
-                        else:                   
-                            grb_1_start = datetime(year, month, day, start_hour)
-                            grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        discard = True
-
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-            if file_path == 'ds.dryfireo.bin':
-                if forecast_hour == 12:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 13:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 13:00 (1PM)\nThe first maximum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 12
-                        discard = False
-    
-                        day_1 = grb_1_start.day
-                        day_2 = grb_2_start.day
-                        if day_1 == day_2:
-                            print("Either duplicate or old files are being dowloaded.\nThrowing out the old file!")
-
-                            discard = True
-                            
-                            try:
-                                if grb_8_vals.all() != None:
-                                    test_8 = True
-                    
-                            except Exception as e:
-                                test_8 = False    
-
-                            if test_8 == False:
-                                grb_8_vals = None
-                                grb_8_start = None
-                                grb_8_end = None
-                                lats_8, lons_8 = None, None
-                                count_of_GRIB_files = count - 2
-                                count_short = count_short - 1
-                                print("There are " + str(count_of_GRIB_files) + " files returned.")
-                                print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                                
-                                return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-                            if test_8 == True:
-                                count_of_GRIB_files = count - 1
-                                print("There are " + str(count_of_GRIB_files) + " files returned.")
-                                print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                                
-                                return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-    
-                        else:                 
-                            grb_1_start = datetime(year, month, day, start_hour)
-                            grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        discard = True
-
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            lats_8, lons_8 = None, None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-        if file_path == 'ds.mint.bin' or file_path == 'ds.maxt.bin':
-
-            if convert_temperature == True:
-
-                if count == 5: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = None
-                    grb_7 = None
-                    grb_8 = None
-    
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_start = None
-                    grb_6_end = None
-                    grb_7_start = None
-                    grb_7_end = None
-                    grb_8_start = None
-                    grb_8_end = None
-                    
-                              
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = None, None
-                    lats_7, lons_7 = None, None
-                    lats_8, lons_8 = None, None
-    
-                if count == 6: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = None
-                    grb_8 = None
-    
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = None
-                    grb_8 = None
-        
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_start = None
-                    grb_7_end = None
-                    grb_8_start = None
-                    grb_8_end = None
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = None, None
-                    lats_8, lons_8 = None, None
-    
-                if count == 7: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = GRIB_File_List[7]
-                    grb_8 = None
-    
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_start = grb_7.validDate
-                    grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                    grb_8_start = None
-                    grb_8_end = None
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = grb_7.latlons()
-                    lats_8, lons_8 = None, None
-    
-                if count == 8: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = GRIB_File_List[7]
-                    grb_8 = GRIB_File_List[8]
-    
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_start = grb_7.validDate
-                    grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                    grb_8_start = grb_8.validDate
-                    grb_8_end = grb_8_start + timedelta(hours=grid_time_interval)
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = grb_7.latlons()
-                    lats_8, lons_8 = grb_8.latlons()
-    
-                
-                grb_1_vals, grb_2_vals, grb_3_vals, grb_4_vals, grb_5_vals, grb_6_vals, grb_7_vals, grb_8_vals = NDFD.GRIB_temperature_conversion_7_day(grb_1, grb_2, grb_3, grb_4, grb_5, grb_6, grb_7, grb_8, count)
 
+    def parse_GRIB_files_full_forecast_period(file_path, grid_time_interval, convert_temperature, count_short, count_extended, directory_name):
+
+        r'''
+        This function returns the first 7 forecast periods of an NDFD file as individual variables. 
+
+        This is kept for the plotting functions that unpack the values, start time, end time, latitude and longitude of 
+        each period. New code should use NDFD.decode_GRIB_file() and NDFD.select_forecast_periods() instead. 
+
+        The decoded arrays of a file downloaded with NDFD_CONUS_Hawaii.download_NDFD_grids() come from the NDFD product cache. 
+
+        Returns: 1) grb_N_vals, grb_N_start, grb_N_end for the 7 forecast periods, lats_N, lons_N for the 7 forecast periods, count, count_short, count_extended, discard
+
+        '''
+
+        grids = da.get_cached_NDFD_grids(directory_name, file_path, grid_time_interval)
+
+        print("There are " +str(grids.count) + " GRIB files in the " + grids.file_path + " download.\n")
+
+        if grids.file_path not in NDFD.first_period_rules:
+            return None
+
+        grids, count, count_short, count_extended, discard = NDFD.select_forecast_periods(grids, count_short, count_extended)
+
+        if convert_temperature == True and (grids.file_path == 'ds.mint.bin' or grids.file_path == 'ds.maxt.bin'):
+            grids = grids.copy()
+            grids.values = calc.unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(grids.values)
+
+        print("\nThere are " + str(count) + " files returned.")
+        print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
+
+        return grids.to_tuple(7) + (count, count_short, count_extended, discard)
+
+
+class NDFD_Grids:
+
+    r'''
+    THIS CLASS HOLDS THE DECODED FORECAST PERIODS OF AN NDFD GRIB FILE
+
+    values - float32 array with the dimensions (time, y, x)
+    lats, lons - 2-D latitude and longitude shared by every forecast period
+    start_times, end_times - the valid start and end time of each forecast period
+
+    '''
+
+    def __init__(self, values, lats, lons, start_times, end_times, file_path):
+
+        self.values = values
+        self.lats = lats
+        self.lons = lons
+        self.start_times = list(start_times)
+        self.end_times = list(end_times)
+        self.file_path = file_path
+
+    @property
+    def count(self):
+        return self.values.shape[0]
+
+    def __len__(self):
+        return self.count
+
+    def period(self, i):
+
+        r'''
+        Returns the values, start time and end time of forecast period i (starting at 0). 
+        Periods past the end of the file return None. 
+        '''
+
+        if i >= self.count:
+            return None, None, None
+        return self.values[i], self.start_times[i], self.end_times[i]
+
+    def drop_first_period(self):
+
+        r'''
+        Returns a new NDFD_Grids object without the first forecast period. The values are a view and are not copied. 
+        '''
+
+        return NDFD_Grids(self.values[1:], self.lats, self.lons, self.start_times[1:], self.end_times[1:], self.file_path)
+
+    def copy(self):
+
+        r'''
+        Returns a new NDFD_Grids object with its own start and end times. The arrays are shared and are not copied. 
+        '''
+
+        return NDFD_Grids(self.values, self.lats, self.lons, self.start_times, self.end_times, self.file_path)
+
+    def set_first_period_start(self, start_time):
+
+        interval = self.end_times[0] - self.start_times[0]
+        self.start_times[0] = start_time
+        self.end_times[0] = start_time + interval
+
+    def to_tuple(self, periods):
+
+        r'''
+        Returns the forecast periods in the layout of NDFD.parse_GRIB_files_full_forecast_period(). 
+        Every period shares the same latitude and longitude arrays. 
+        '''
+
+        vals = []
+        coords = []
+        for i in range(0, periods):
+            grb_vals, grb_start, grb_end = self.period(i)
+            vals.extend([grb_vals, grb_start, grb_end])
+            if grb_vals is None:
+                coords.extend([None, None])
             else:
+                coords.extend([self.lats, self.lons])
 
-                if count == 5: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = None
-                    grb_7 = None
-                    grb_8 = None
-        
-                    grb_1_vals = grb_1.values
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_vals = grb_2.values
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_vals = grb_3.values
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_vals = grb_4.values
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_vals = grb_5.values
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_vals = None
-                    grb_6_start = None
-                    grb_6_end = None
-                    grb_7_vals = None
-                    grb_7_start = None
-                    grb_7_end = None
-                    grb_8_vals = None
-                    grb_8_start = None
-                    grb_8_end = None
-                    
-                              
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = None, None
-                    lats_7, lons_7 = None, None
-                    lats_8, lons_8 = None, None
-        
-                if count == 6: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = None
-                    grb_8 = None
-        
-                    grb_1_vals = grb_1.values
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_vals = grb_2.values
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_vals = grb_3.values
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_vals = grb_4.values
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_vals = grb_5.values
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_vals = grb_6.values
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_vals = None
-                    grb_7_start = None
-                    grb_7_end = None
-                    grb_8_vals = None
-                    grb_8_start = None
-                    grb_8_end = None
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = None, None
-                    lats_8, lons_8 = None, None
-        
-                if count == 7: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = GRIB_File_List[7]
-                    grb_8 = None
-        
-                    grb_1_vals = grb_1.values
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_vals = grb_2.values
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_vals = grb_3.values
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_vals = grb_4.values
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_vals = grb_5.values
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_vals = grb_6.values
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_vals = grb_7.values
-                    grb_7_start = grb_7.validDate
-                    grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                    grb_8_vals = None
-                    grb_8_start = None
-                    grb_8_end = None
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = grb_7.latlons()
-                    lats_8, lons_8 = None, None
-        
-                if count == 8: 
-                    grb_1 = GRIB_File_List[1]
-                    grb_2 = GRIB_File_List[2]
-                    grb_3 = GRIB_File_List[3]
-                    grb_4 = GRIB_File_List[4]
-                    grb_5 = GRIB_File_List[5]
-                    grb_6 = GRIB_File_List[6]
-                    grb_7 = GRIB_File_List[7]
-                    grb_8 = GRIB_File_List[8]
-        
-                    grb_1_vals = grb_1.values
-                    grb_1_start = grb_1.validDate
-                    grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                    grb_2_vals = grb_2.values
-                    grb_2_start = grb_2.validDate
-                    grb_2_end = grb_2_start + timedelta(hours=grid_time_interval)
-                    grb_3_vals = grb_3.values
-                    grb_3_start = grb_3.validDate
-                    grb_3_end = grb_3_start + timedelta(hours=grid_time_interval)
-                    grb_4_vals = grb_4.values
-                    grb_4_start = grb_4.validDate
-                    grb_4_end = grb_4_start + timedelta(hours=grid_time_interval)
-                    grb_5_vals = grb_5.values
-                    grb_5_start = grb_5.validDate
-                    grb_5_end = grb_5_start + timedelta(hours=grid_time_interval)
-                    grb_6_vals = grb_6.values
-                    grb_6_start = grb_6.validDate
-                    grb_6_end = grb_6_start + timedelta(hours=grid_time_interval)
-                    grb_7_vals = grb_7.values
-                    grb_7_start = grb_7.validDate
-                    grb_7_end = grb_7_start + timedelta(hours=grid_time_interval)
-                    grb_8_vals = grb_8.values
-                    grb_8_start = grb_8.validDate
-                    grb_8_end = grb_8_start + timedelta(hours=grid_time_interval)
-        
-                    lats_1, lons_1 = grb_1.latlons()
-                    lats_2, lons_2 = grb_2.latlons()
-                    lats_3, lons_3 = grb_3.latlons()
-                    lats_4, lons_4 = grb_4.latlons()
-                    lats_5, lons_5 = grb_5.latlons()
-                    lats_6, lons_6 = grb_6.latlons()
-                    lats_7, lons_7 = grb_7.latlons()
-                    lats_8, lons_8 = grb_8.latlons()
-
-            forecast_hour = grb_1_start.hour
-
-            if file_path == 'ds.mint.bin':
-                if forecast_hour == 0:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 4 or local_hour >= 16:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 04:00 (4AM)\nThe first minimum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 0
-    
-                        grb_1_start = datetime(year, month, day, start_hour)
-                        grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                        print("\nThere are " + str(count) + " files returned.")
-                        print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                        discard = False
-                        
-                        return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        discard = True
-                        
-
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            lats_8, lons_8 = None, None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count = count - 1
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
-
-
-            if file_path == 'ds.maxt.bin':
-                if forecast_hour == 12:
-                    print("The " +file_path+ " forecast period begins at " + grb_1_start.strftime('%m/%d/%Y %HZ'))
-                    print("\nThere are " + str(count) + " files returned.")
-                    print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                    discard = False
-                    
-                    return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                    
-                else:
-                    if local_hour < 14 or local_hour >= 18:
-                        print("The " +file_path+ " forecast period began at " + grb_1_start.strftime('%m/%d/%Y %HZ') + "\nThe current time of " +local.strftime('%m/%d/%Y %H:00 Local')+ " is before 15:00 (3PM)\nThe first maximum temperature grid is still returned.")
-    
-                        year = utc.year
-                        month = utc.month
-                        day = utc.day
-                        start_hour = 12
-    
-                        grb_1_start = datetime(year, month, day, start_hour)
-                        grb_1_end = grb_1_start + timedelta(hours=grid_time_interval)
-                        print("\nThere are " + str(count) + " files returned.")
-                        print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                        discard = False
-                        
-                        return grb_1_vals, grb_1_start, grb_1_end, grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, lats_1, lons_1, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, count, count_short, count_extended, discard
-                        
-                    else:
-                        print("The first forecast grid from " + grb_1_start.strftime('%m/%d/%Y %HZ') + " is old and not valid anymore. The second forecast grid starting at " +grb_2_start.strftime('%m/%d/%Y %HZ') + " is the first forecast grid returned in this dataset.")
-
-                        discard = True
-
-                        try:
-                            if grb_8_vals.all() != None:
-                                test_8 = True
-                
-                        except Exception as e:
-                            test_8 = False                        
-
-                        if test_8 == False:
-                            grb_8_vals = None
-                            grb_8_start = None
-                            grb_8_end = None
-                            lats_8, lons_8 = None, None
-                            count_of_GRIB_files = count - 1
-                            count_short = count_short - 1
-                            print("There is no 8th GRIB file.")
-                            print("\nThere are " + str(count_of_GRIB_files) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count_of_GRIB_files, count_short, count_extended, discard
-
-                        if test_8 == True:
-                            print("There is an 8th GRIB file.")
-                            count = count - 1
-                            count_short = count_short - 1
-                            print("\nThere are " + str(count) + " files returned.")
-                            print("\n"+str(count_short)+" short-term files.\n"+str(count_extended)+" extended files.")
-                            
-                            return grb_2_vals, grb_2_start, grb_2_end, grb_3_vals, grb_3_start, grb_3_end, grb_4_vals, grb_4_start, grb_4_end, grb_5_vals, grb_5_start, grb_5_end, grb_6_vals, grb_6_start, grb_6_end, grb_7_vals, grb_7_start, grb_7_end, grb_8_vals, grb_8_start, grb_8_end, lats_2, lons_2, lats_3, lons_3, lats_4, lons_4, lats_5, lons_5, lats_6, lons_6, lats_7, lons_7, lats_8, lons_8, count, count_short, count_extended, discard
+        return tuple(vals + coords)
 
 
 class checks:
@@ -1447,7 +696,7 @@ class checks:
         return new_metar_time1
 
 
-    def parse_NWS_GRIB_data_array(data_array, parameter, file_count, convert_to_pandas_dataframe, count_short, count_extended, discard):
+    def parse_NWS_GRIB_data_array(data_array, parameter, file_count, convert_to_pandas_dataframe, count_short, count_extended, discard, decimate=1, extent=None):
 
 
         ds = data_array
@@ -1668,40 +917,16 @@ class checks:
             return vals
 
         if convert_to_pandas_dataframe == True:
-            vals_df = []
-            ds0 = vals[0]
-            ds1 = vals[1]
-            ds2 = vals[2]
-            ds3 = vals[3]
-            ds4 = vals[4]
-            ds5 = vals[5]
-            if file_count >= 7:
-                ds6 = vals[6]
-
-            df0 = ds0.to_dataframe()
-            df1 = ds1.to_dataframe()
-            df2 = ds2.to_dataframe()
-            df3 = ds3.to_dataframe()
-            df4 = ds4.to_dataframe()
-            df5 = ds5.to_dataframe()
-            if file_count >= 7:
-                df6 = ds6.to_dataframe()
-
-            if file_count < 8:
-                vals_df.append(df0)
-            vals_df.append(df1)
-            vals_df.append(df2)
-            vals_df.append(df3)
-            vals_df.append(df4)
-            vals_df.append(df5)
-            if file_count >= 7:
-                vals_df.append(df6)
-            
+            # The sample points are taken straight from the grids (no DataFrame of the whole grid). 
+            # Each day is a dictionary of small NumPy arrays with the same keys as the DataFrame columns. 
             if file_count == 8:
-                ds7 = vals[7]
-                df7 = ds7.to_dataframe()
-                vals_df.append(df7)
-   
+                vals = vals[1:]
+
+            vals_df = []
+            for val in vals:
+                lons, lats, values = rendering.sample_grid(val['latitude'].values, val['longitude'].values, val.values, decimate, extent=extent)
+                vals_df.append({'longitude': lons, 'latitude': lats, parameter: values})
+
             return vals_df
 
 
@@ -0,0 +1,1111 @@
+'''
+This file hosts the functions that render the daily figures of the 7-day NWS forecast graphics in parallel.
+
+Each day of a 7-day NWS forecast graphic is its own figure. Once the forecast grids are decoded, every figure is
+independent so each one is drawn and saved in its own worker process (using the Agg backend). The forecast grids
+are put in shared memory once and the workers read them from there instead of each worker getting its own copy.
+
+The 7-day products of NWS_CONUS, NWS_Alaska and NWS_Hawaii describe their figures with a dictionary of settings and the 
+settings of each day and save them with render_nws_forecast(), which draws every day with nws_forecast_day_figure(). 
+
+The static map layers (land, water, coastlines and borders) of every product are added with add_feature(). They are drawn 
+once per map into cached rasters and reused by every figure of that map.
+
+ This file was written by Meteorologist Eric J. Drewitz
+
+            (C) Meteorologist Eric J. Drewitz
+                        USDA/USFS
+
+'''
+
+#### IMPORTS ####
+
+import os
+import pickle
+import multiprocessing
+import numpy as np
+import warnings
+warnings.filterwarnings('ignore')
+
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.artist import Artist
+
+# The number of worker processes. None uses one worker per CPU (up to 7, one per day).
+# Set render_workers = 1 to draw the figures in the current process.
+render_workers = None
+
+_render_pool = None
+_render_pool_workers = None
+
+# While render_all_regions() runs, render_forecast_days() and save_region_figure() add their figures to this list instead of saving them
+_render_batch = None
+
+# Degrees around the map extent that are kept when a grid is cropped to a region
+grid_window_margin = 1
+
+_grid_window_registry = {}
+
+# How the gridded products are drawn: 'contourf' (filled contours) or 'raster' (pcolormesh with the same colors and levels). 
+# The raster mode does not smooth the edges between the levels but it is several times faster. 
+# The plotting functions use this setting when their render_mode argument is None. 
+render_mode = 'contourf'
+
+_projected_grid_registry = {}
+
+_sample_point_registry = {}
+
+
+def share_array(array):
+
+    r'''
+    This function copies an array into a new block of shared memory.
+
+    Returns: 1) The SharedMemory object (keep a reference until the workers are finished).
+             2) The (name, shape, dtype) the workers use to find the array.
+
+    '''
+
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared[...] = array
+
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def attach_array(spec):
+
+    r'''
+    This function returns a view of an array in shared memory made with share_array().
+    '''
+
+    name, shape, dtype = spec
+
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers the block again with the resource tracker. The spawned workers share the 
+        # resource tracker of the parent process (which keeps one entry per block) so the block is still 
+        # unregistered once when the parent unlinks it. 
+        shm = shared_memory.SharedMemory(name=name)
+
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def initialize_worker():
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def get_render_pool(workers):
+
+    r'''
+    This function returns the process pool used to draw the figures. The pool is kept between calls so the workers
+    only import cartopy and metpy (and read the boundary shapefiles) once.
+    '''
+
+    global _render_pool, _render_pool_workers
+
+    if _render_pool != None and _render_pool_workers == workers:
+        return _render_pool
+
+    shutdown_render_pool()
+
+    _render_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'), initializer=initialize_worker)
+    _render_pool_workers = workers
+
+    return _render_pool
+
+
+def shutdown_render_pool():
+
+    r'''
+    This function stops the worker processes.
+    '''
+
+    global _render_pool, _render_pool_workers
+
+    if _render_pool != None:
+        _render_pool.shutdown(wait=True)
+
+    _render_pool = None
+    _render_pool_workers = None
+
+
+def save_figure(figure_function, values, lats, lons, day, settings, file_path):
+
+    import matplotlib.pyplot as plt
+
+    fig = figure_function(values, lats, lons, day, settings)
+    fig.savefig(file_path, bbox_inches='tight')
+    plt.close(fig)
+
+    return file_path
+
+
+def save_pickled_figure(figure, file_path):
+
+    import matplotlib.pyplot as plt
+
+    fig = pickle.loads(figure)
+    fig.savefig(file_path, bbox_inches='tight')
+    plt.close(fig)
+
+    return file_path
+
+
+def save_region_figure(fig, file_path):
+
+    r'''
+    This function saves a figure that is drawn in the current process (i.e. the RTMA graphics). 
+
+    While render_all_regions() runs the figure is pickled and saved in a worker process together with the figures of 
+    the other regions. Figures that can't be pickled are saved right away. 
+
+    Required Arguments: 1) fig (Figure) - The matplotlib figure. 
+                        2) file_path (String) - Where to save the figure. 
+
+    Returns: 1) The file path. 
+    '''
+
+    import matplotlib.pyplot as plt
+
+    if _render_batch != None:
+        try:
+            figure = pickle.dumps(fig)
+        except Exception as e:
+            figure = None
+        if figure == None:
+            fig.savefig(file_path, bbox_inches='tight')
+        _render_batch.append({'figure': figure, 'file_path': file_path})
+        plt.close(fig)
+        return file_path
+
+    fig.savefig(file_path, bbox_inches='tight')
+
+    return file_path
+
+
+def render_day(figure_function, specs, index, day, settings, file_path):
+
+    values_shm, values = attach_array(specs[0])
+    lats_shm, lats = attach_array(specs[1])
+    lons_shm, lons = attach_array(specs[2])
+
+    try:
+        return save_figure(figure_function, values[index], lats, lons, day, settings, file_path)
+    finally:
+        del values, lats, lons
+        values_shm.close()
+        lats_shm.close()
+        lons_shm.close()
+
+
+def grid_window(lats, lons, extent, margin=None):
+
+    r'''
+    This function returns the index window (row slice, column slice) of the grid points inside a map extent 
+    plus a margin. The window is computed once for each grid and extent. 
+
+    Required Arguments: 1) lats, lons (Array) - The 2-D latitude and longitude of the grid.
+                        2) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound].
+
+    Optional Arguments: 1) margin (Float) - Degrees around the extent. Default is grid_window_margin.
+
+    Returns: 1) A tuple of two slices. The whole grid is returned when no grid point is inside the extent.
+
+    '''
+
+    if margin == None:
+        margin = grid_window_margin
+
+    lats = np.asarray(lats)
+    lons = np.asarray(lons)
+
+    key = (lats.shape, float(lats.flat[0]), float(lats.flat[-1]), float(lons.flat[0]), float(lons.flat[-1]), tuple(float(bound) for bound in extent), margin)
+
+    try:
+        return _grid_window_registry[key]
+    except KeyError:
+        pass
+
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    # Longitudes from 0 to 360 are compared as -180 to 180
+    lons = np.where(lons > 180, lons - 360, lons)
+
+    inside = (lons >= western_bound - margin) & (lons <= eastern_bound + margin) & (lats >= southern_bound - margin) & (lats <= northern_bound + margin)
+
+    rows = np.flatnonzero(inside.any(axis=1))
+    columns = np.flatnonzero(inside.any(axis=0))
+
+    if len(rows) == 0 or len(columns) == 0:
+        window = (slice(None), slice(None))
+    else:
+        window = (slice(int(rows[0]), int(rows[-1]) + 1), slice(int(columns[0]), int(columns[-1]) + 1))
+
+    _grid_window_registry[key] = window
+
+    return window
+
+
+def axis_window(coordinates, low, high, margin):
+
+    coordinates = np.asarray(coordinates)
+    inside = np.flatnonzero((coordinates >= low - margin) & (coordinates <= high + margin))
+
+    if len(inside) == 0:
+        return slice(None)
+
+    return slice(int(inside[0]), int(inside[-1]) + 1)
+
+
+def crop_grid(lons, lats, values, extent, margin=None):
+
+    r'''
+    This function crops a grid to the index window of a map extent (plus a margin) so matplotlib only contours the 
+    grid points that are on the map. The window is computed once for each grid and extent (see grid_window()). 
+
+    Required Arguments: 1) lons, lats (Array) - The longitude and latitude of the grid (2-D or 1-D).
+                        2) values (Array) - The 2-D values of the grid.
+                        3) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound].
+
+    Optional Arguments: 1) margin (Float) - Degrees around the extent. Default is grid_window_margin.
+
+    Returns: 1) The cropped lons, lats and values. Grids that don't match the shape of the values are returned as they are.
+
+    '''
+
+    if margin == None:
+        margin = grid_window_margin
+
+    lons_array = np.asarray(lons)
+    lats_array = np.asarray(lats)
+    shape = np.shape(values)
+
+    if lons_array.ndim == 2 and lats_array.shape == lons_array.shape and shape == lons_array.shape:
+        window = grid_window(lats_array, lons_array, extent, margin)
+        return lons[window], lats[window], values[window]
+
+    if lons_array.ndim == 1 and lats_array.ndim == 1 and shape == (len(lats_array), len(lons_array)):
+        western_bound, eastern_bound, southern_bound, northern_bound = extent
+        if np.nanmax(lons_array) > 180:
+            lons_array = np.where(lons_array > 180, lons_array - 360, lons_array)
+        columns = axis_window(lons_array, western_bound, eastern_bound, margin)
+        rows = axis_window(lats_array, southern_bound, northern_bound, margin)
+        return lons[columns], lats[rows], values[rows, columns]
+
+    return lons, lats, values
+
+
+def crop_to_axes(ax, lons, lats, values, margin=None):
+
+    r'''
+    This function crops a grid to the extent of a map (set with ax.set_extent()) before it is contoured, 
+    i.e. ax.contourf(*rendering.crop_to_axes(ax, lons, lats, values), levels=levels, ...). 
+
+    Returns: 1) The cropped lons, lats and values.
+
+    '''
+
+    import cartopy.crs as ccrs
+
+    try:
+        extent = [round(bound, 4) for bound in ax.get_extent(crs=ccrs.PlateCarree())]
+    except Exception as e:
+        return lons, lats, values
+
+    return crop_grid(lons, lats, values, extent, margin)
+
+
+def projected_grid(lons, lats, mapcrs, datacrs):
+
+    r'''
+    This function returns the x and y coordinates of a grid in the map projection. 
+    The coordinates are transformed once for each grid, map projection and data projection. 
+    '''
+
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+
+    if lons.ndim == 1 and lats.ndim == 1:
+        lons, lats = np.meshgrid(lons, lats)
+
+    key = (lons.shape, float(lons.flat[0]), float(lons.flat[-1]), float(lats.flat[0]), float(lats.flat[-1]), mapcrs.proj4_init, datacrs.proj4_init)
+
+    try:
+        return _projected_grid_registry[key]
+    except KeyError:
+        pass
+
+    points = mapcrs.transform_points(datacrs, lons, lats)
+    grid = (points[..., 0], points[..., 1])
+
+    _projected_grid_registry[key] = grid
+
+    return grid
+
+
+def raster(ax, lons, lats, values, levels, cmap=None, extend='neither', transform=None, **kwargs):
+
+    r'''
+    This function draws a grid with pcolormesh using the same colormap, levels and extend as contourf 
+    (a BoundaryNorm maps each value to the color of its level). The values outside of the levels are not drawn 
+    unless the levels are extended on that side, like contourf. 
+
+    Returns: 1) The QuadMesh (it works with fig.colorbar() like the filled contours).
+
+    '''
+
+    import matplotlib as mpl
+    import cartopy.crs as ccrs
+    from matplotlib.colors import BoundaryNorm
+
+    if cmap == None:
+        cmap = mpl.rcParams['image.cmap']
+    if isinstance(cmap, str):
+        cmap = mpl.colormaps[cmap]
+    levels = np.asarray(levels)
+    bins = len(levels) - 1 + (extend in ['both', 'min']) + (extend in ['both', 'max'])
+    if cmap.N < bins:
+        cmap = cmap.resampled(bins)
+    cmap = cmap.copy()
+
+    if extend != 'both' and extend != 'min':
+        cmap.set_under('none')
+    if extend != 'both' and extend != 'max':
+        cmap.set_over('none')
+    cmap.set_bad('none')
+
+    norm = BoundaryNorm(levels, ncolors=cmap.N, extend=extend)
+
+    if transform == None:
+        transform = ccrs.PlateCarree()
+
+    x, y = projected_grid(lons, lats, ax.projection, transform)
+    values = np.ma.masked_invalid(np.ma.asarray(values))
+
+    return ax.pcolormesh(x, y, values, cmap=cmap, norm=norm, shading='nearest', transform=ax.projection, **kwargs)
+
+
+def contourf(ax, lons, lats, values, render_mode=None, margin=None, **kwargs):
+
+    r'''
+    This function draws a gridded product on a map. The grid is cropped to the extent of the map first 
+    (see crop_to_axes()) and is then drawn with ax.contourf() or with raster() depending on the render mode. 
+
+    Required Arguments: 1) ax (cartopy GeoAxes) - The map (after ax.set_extent()).
+                        2) lons, lats (Array) - The longitude and latitude of the grid.
+                        3) values (Array) - The 2-D values of the grid.
+
+    Optional Arguments: 1) render_mode (String) - 'contourf' or 'raster'. Default is None (the module setting render_mode).
+                        2) margin (Float) - Degrees around the extent that are kept. Default is None (grid_window_margin).
+                        3) **kwargs - The keyword arguments of ax.contourf() (i.e. levels, cmap, alpha, transform, extend).
+
+    Returns: 1) The filled contours or the QuadMesh.
+
+    '''
+
+    if render_mode == None:
+        render_mode = globals()['render_mode']
+
+    lons, lats, values = crop_to_axes(ax, lons, lats, values, margin=margin)
+
+    if render_mode == 'raster':
+        return raster(ax, lons, lats, values, **kwargs)
+
+    return ax.contourf(lons, lats, values, **kwargs)
+
+
+def render_day_window(figure_function, specs, index, window, day, settings, file_path):
+
+    values_shm, values = attach_array(specs[0])
+    lats_shm, lats = attach_array(specs[1])
+    lons_shm, lons = attach_array(specs[2])
+
+    try:
+        return save_figure(figure_function, values[index][window], lats[window], lons[window], day, settings, file_path)
+    finally:
+        del values, lats, lons
+        values_shm.close()
+        lats_shm.close()
+        lons_shm.close()
+
+
+def render_all_regions(plot_function, states=None, gacc_regions=None, workers=None, **kwargs):
+
+    r'''
+    This function makes the same product for many states and GACC regions at once. 
+    
+    The plotting function is called for each region but the figures are not saved right away. The forecast grids are 
+    only downloaded and decoded once (the NDFD product cache returns the same grids for every region) and the figures 
+    of every region are drawn together in the worker processes. Each grid is put in shared memory once and every 
+    region only draws the part of the grid inside its map extent. 
+
+    The RTMA analysis is downloaded once for the full domain and every region is cropped from it in memory. The RTMA 
+    figures are still drawn in this process one region at a time but they are saved in the worker processes. 
+
+    Required Arguments: 1) plot_function (Function) - The plotting function (i.e. firewxpy.NWS_CONUS.temperature.plot_extreme_heat_forecast).
+
+    Optional Arguments: 1) states (List) - The two letter state abbreviations. Default is None (every state in the CONUS). 
+                        2) gacc_regions (List) - The GACC region abbreviations. Default is None (every GACC region in the CONUS). 
+                        3) workers (Integer) - The number of worker processes. Default is render_workers.
+                        4) **kwargs - The other arguments of the plotting function (i.e. reference_system). 
+
+    Returns: 1) A list of the file paths of the saved figures.
+
+    '''
+
+    global _render_batch
+
+    import firewxpy.settings as settings
+
+    if states == None:
+        states = [state for state in settings.state_list if state != 'AK' and state != 'HI']
+    if gacc_regions == None:
+        gacc_regions = settings.gacc_region_list
+
+    regions = [{'state': state, 'gacc_region': None} for state in states] + [{'state': None, 'gacc_region': gacc_region} for gacc_region in gacc_regions]
+
+    import firewxpy.data_access as data_access
+
+    _render_batch = []
+    data_access._rtma_batch_cache = {}
+
+    try:
+        for region in regions:
+            plot_function(state=region['state'], gacc_region=region['gacc_region'], **kwargs)
+        batch = _render_batch
+    finally:
+        _render_batch = None
+        data_access._rtma_batch_cache = None
+
+    return render_batch(batch, workers)
+
+
+def render_batch(batch, workers=None):
+
+    r'''
+    This function draws and saves the figures collected by render_all_regions(). 
+    '''
+
+    if len(batch) == 0:
+        return []
+
+    if workers == None:
+        workers = render_workers
+    if workers == None:
+        workers = os.cpu_count() or 1
+
+    # The regions of a product share the same grid so each grid is only put in shared memory once. 
+    # The grids are found by the grid_key of render_forecast_days() or else by the identity of the arrays 
+    # (the batch keeps every array alive so the identities are not reused). 
+    grids = {}
+    for job in batch:
+        if 'grids' not in job:
+            continue
+        values, lats, lons = job['grids']
+        if job['grid_key'] != None:
+            key = ('grid_key', job['grid_key'])
+        else:
+            key = ('id', id(values), id(lats), id(lons))
+        if key not in grids:
+            grids[key] = [share_array(values), share_array(lats), share_array(lons)]
+        job['key'] = key
+
+    saved = []
+
+    try:
+        pool = get_render_pool(workers)
+        futures = []
+        for job in batch:
+            if 'grids' not in job:
+                if job['figure'] == None:
+                    futures.append((job, []))
+                else:
+                    futures.append((job, [pool.submit(save_pickled_figure, job['figure'], job['file_path'])]))
+                continue
+            values, lats, lons = job['grids']
+            window = grid_window(lats, lons, job['settings']['extent'], margin=job['settings']['grid_window_margin'])
+            specs = [spec for shm, spec in grids[job['key']]]
+            job_futures = [pool.submit(render_day_window, job['figure_function'], specs, i, window, job['days'][i], job['settings'], job['file_paths'][i]) for i in range(0, len(job['days']))]
+            futures.append((job, job_futures))
+
+        for job, job_futures in futures:
+            paths = [future.result() for future in job_futures]
+            if 'grids' not in job:
+                if job['figure'] == None:
+                    paths = [job['file_path']]
+            elif job['on_saved'] != None:
+                job['on_saved'](paths)
+            saved = saved + paths
+    finally:
+        for shared in grids.values():
+            for shm, spec in shared:
+                shm.close()
+                shm.unlink()
+
+    return saved
+
+
+def worker_settings(settings):
+
+    r'''
+    This function returns the settings of a figure with the module settings of this process 
+    (render_mode, use_basemap_cache and grid_window_margin) that the figure does not already set. 
+    '''
+
+    settings = dict(settings)
+
+    if settings.get('render_mode') == None:
+        settings['render_mode'] = render_mode
+    if settings.get('use_basemap_cache') == None:
+        settings['use_basemap_cache'] = use_basemap_cache
+    if settings.get('grid_window_margin') == None:
+        settings['grid_window_margin'] = grid_window_margin
+
+    return settings
+
+
+def render_forecast_days(figure_function, values, lats, lons, days, settings, file_paths, workers=None, on_saved=None, grid_key=None):
+
+    r'''
+    This function draws and saves the figure of each forecast day at the same time in worker processes.
+
+    Required Arguments: 1) figure_function (Function) - A module level function figure_function(values, lats, lons, day, settings)
+                           that returns the matplotlib figure of one day (i.e. nws_forecast_day_figure).
+                        2) values (Array) - The forecast grids with the dimensions (day, y, x).
+                        3) lats (Array) - The 2-D latitude of the forecast grids.
+                        4) lons (Array) - The 2-D longitude of the forecast grids.
+                        5) days (List) - A dictionary for each day with the settings that change from day to day
+                           (i.e. the start and end time and the sample points).
+                        6) settings (Dictionary) - The settings that are the same for every day.
+                        7) file_paths (List) - Where to save the figure of each day.
+
+    Optional Arguments: 1) workers (Integer) - The number of worker processes. Default is render_workers.
+                        2) on_saved (Function) - Called with the file paths once the figures are saved (i.e. to make the GIF). 
+                           Default is None.
+                        3) grid_key (Tuple) - Identifies the decoded grids (i.e. the product and the decoded dataset) so 
+                           render_all_regions() shares the grids of every region once. Default is None.
+
+    Returns: 1) The file paths of the saved figures in the same order as days.
+
+    '''
+
+    # The worker processes do not see the module settings changed in this process so they are passed with the settings
+    settings = worker_settings(settings)
+
+    if _render_batch != None:
+        _render_batch.append({'figure_function': figure_function, 'grids': (np.asarray(values, dtype=np.float32), np.ascontiguousarray(lats), np.ascontiguousarray(lons)), 'days': days, 'settings': settings, 'file_paths': file_paths, 'on_saved': on_saved, 'grid_key': grid_key})
+        return file_paths
+
+    if workers == None:
+        workers = render_workers
+    if workers == None:
+        workers = min(os.cpu_count() or 1, len(days))
+
+    workers = max(min(workers, len(days)), 1)
+
+    if workers == 1:
+        saved = [save_figure(figure_function, values[i], lats, lons, days[i], settings, file_paths[i]) for i in range(0, len(days))]
+        if on_saved != None:
+            on_saved(saved)
+        return saved
+
+    shared = [share_array(np.asarray(values, dtype=np.float32)), share_array(lats), share_array(lons)]
+    specs = [spec for shm, spec in shared]
+
+    try:
+        pool = get_render_pool(workers)
+        futures = [pool.submit(render_day, figure_function, specs, i, days[i], settings, file_paths[i]) for i in range(0, len(days))]
+        saved = [future.result() for future in futures]
+    finally:
+        for shm, spec in shared:
+            shm.close()
+            shm.unlink()
+
+    if on_saved != None:
+        on_saved(saved)
+
+    return saved
+
+
+def render_nws_forecast(values, lats, lons, days, settings, path, gif_path, plot_type, prefix='Day', first_day=1, grid_key=None, workers=None):
+
+    r'''
+    This function saves the figures of a 7-day NWS forecast graphic (see nws_forecast_day_figure()) with render_forecast_days() 
+    and makes the GIF of the figures. It replaces file_functions.update_images() for the 7-day NWS products. 
+
+    Required Arguments: 1) values (List) - The forecast grid of each day.
+                        2) lats, lons (Array) - The 2-D latitude and longitude of the forecast grids.
+                        3) days (List) - The settings of each day (see nws_forecast_day_figure()).
+                        4) settings (Dictionary) - The settings that are the same for every day.
+                        5) path (String) - The directory of the images.
+                        6) gif_path (String) - The directory of the GIF.
+                        7) plot_type (String) - The name of the product and of its GIF (i.e. 'NWS Max T').
+
+    Optional Arguments: 1) prefix (String) - 'Day' or 'Night'. The images are saved as prefix + ' ' + the number of the day. Default is 'Day'.
+                        2) first_day (Integer) - The number of the first image. Default is 1 (the trends begin with 2).
+                        3) grid_key (Tuple) - Identifies the decoded forecast grids (see render_forecast_days()). Default is None.
+                        4) workers (Integer) - The number of worker processes. Default is render_workers.
+
+    Returns: 1) The file paths of the saved figures.
+
+    '''
+
+    from firewxpy.utilities import save
+
+    file_paths = [path+"/"+prefix+" "+str(i)+".png" for i in range(first_day, 8)]
+
+    for file_path in file_paths:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def make_gif(saved):
+        saved = list(saved) + [None] * (8 - len(saved))
+        save.make_NDFD_Outlook_GIF(gif_path+"/"+plot_type+".gif", *saved)
+
+    if grid_key != None:
+        grid_key = (plot_type, grid_key, len(days))
+
+    values = np.stack([np.ma.filled(np.ma.asarray(vals, dtype=np.float32), np.nan) for vals in values])
+
+    saved = render_forecast_days(nws_forecast_day_figure, values, np.asarray(lats), np.asarray(lons), days, settings, file_paths[0:len(days)], workers=workers, on_saved=make_gif, grid_key=grid_key)
+
+    print("Individual images saved to: "+path)
+    print("GIF saved to "+gif_path)
+
+    return saved
+
+
+def render_tasks(task_function, tasks, workers=None, return_exceptions=False):
+
+    r'''
+    This function calls task_function(*task) for every task at the same time in the worker processes 
+    (i.e. to draw and save one figure per station or per region).
+
+    Required Arguments: 1) task_function (Function) - A module level function that draws and saves one figure.
+                        2) tasks (List) - The arguments (a tuple) of each call.
+
+    Optional Arguments: 1) workers (Integer) - The number of worker processes. Default is render_workers.
+                        2) return_exceptions (Boolean) - When True, the exception of a task that failed is returned in 
+                           place of its result instead of being raised. Default is False.
+
+    Returns: 1) The results of the calls in the same order as tasks.
+
+    '''
+
+    if workers == None:
+        workers = render_workers
+    if workers == None:
+        workers = os.cpu_count() or 1
+
+    workers = max(min(workers, len(tasks)), 1)
+
+    def result(call):
+        try:
+            return call()
+        except Exception as e:
+            if return_exceptions == True:
+                return e
+            raise
+
+    if workers == 1:
+        return [result(lambda task=task: task_function(*task)) for task in tasks]
+
+    pool = get_render_pool(workers)
+    futures = [pool.submit(task_function, *task) for task in tasks]
+
+    return [result(future.result) for future in futures]
+
+
+# The static map layers (land, water, coastlines and borders) are the same on every day and every product of a region. 
+# rendering.add_feature() adds them to a map like ax.add_feature() but the layers with the same zorder are drawn together 
+# into one raster once per (projection, map limits, map size in pixels, dpi, layers) and later figures reuse the raster. 
+# The raster is drawn when the figure is saved, at the final size of the map, so every pixel of the raster is one pixel 
+# of the saved figure. Set use_basemap_cache = False to draw the map layers on every figure. 
+use_basemap_cache = True
+
+# The number of rasters kept in each process. The oldest raster is dropped first. 
+basemap_cache_size = 64
+
+_basemap_registry = {}
+
+
+def feature_key(feature):
+
+    if isinstance(feature, str):
+        return feature
+
+    # Features without a file or a name (i.e. a ShapelyFeature) are only the same as themselves
+    if getattr(feature, 'file_path', None) == None and getattr(feature, 'name', None) == None:
+        return feature
+
+    kwargs = getattr(feature, 'kwargs', {})
+    # An adaptive scaler changes its scale with the map extent (which is part of the key) so only its default scale is used
+    scaler = getattr(feature, 'scaler', None)
+    scale = getattr(scaler, '_default_scale', getattr(scaler, 'scale', None))
+
+    return (type(feature).__name__, getattr(feature, 'file_path', None), getattr(feature, 'state', None), getattr(feature, 'gacc_region', None), getattr(feature, 'category', None), getattr(feature, 'name', None), type(scaler).__name__, scale, str(sorted(kwargs.items())))
+
+
+class CachedMapLayer(Artist):
+
+    r'''
+    The map layers of a map that have the same zorder. The layers are drawn from a cached raster (see add_feature()). 
+    Renderers other than Agg (i.e. PDF and SVG) draw the layers as vectors. 
+    '''
+
+    def __init__(self, zorder):
+
+        super().__init__()
+        self.set_zorder(zorder)
+        self.set_in_layout(False)
+        self.layers = []
+
+    def add(self, artist, feature, kwargs):
+
+        artist.set_visible(False)
+        self.layers.append((artist, feature, kwargs))
+
+    def draw(self, renderer):
+
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        if self.get_visible() == False:
+            return
+
+        if isinstance(renderer, RendererAgg) == False:
+            for artist, feature, kwargs in self.layers:
+                artist.set_visible(True)
+                try:
+                    artist.draw(renderer)
+                finally:
+                    artist.set_visible(False)
+            return
+
+        ax = self.axes
+        x0, y0, x1, y1 = ax.bbox.extents
+
+        # The raster covers whole pixels and the map keeps its position inside the first pixel so the layers 
+        # land on exactly the same pixels as when they are drawn on the map
+        left = int(np.floor(x0))
+        bottom = int(np.floor(y0))
+        pixel_size = (int(np.ceil(x1)) - left, int(np.ceil(y1)) - bottom)
+        position = (round(x0 - left, 3), round(y0 - bottom, 3), round(x1 - x0, 3), round(y1 - y0, 3))
+
+        if pixel_size[0] > 0 and pixel_size[1] > 0:
+            image = get_map_layer(ax.projection, ax.get_xlim(), ax.get_ylim(), pixel_size, position, renderer.dpi, self.layers)
+            gc = renderer.new_gc()
+            gc.set_clip_rectangle(ax.bbox)
+            renderer.draw_image(gc, left, bottom, image[::-1])
+            gc.restore()
+
+        self.stale = False
+
+
+def add_feature(ax, feature, use_cache=None, **kwargs):
+
+    r'''
+    This function adds a map layer (i.e. cfeature.LAND or a boundary shapefile) to a map the same way as ax.add_feature(). 
+
+    When the basemap cache is on, the layers with the same zorder are drawn from one cached raster instead of being 
+    projected and drawn again on every figure. The raster is drawn where the first layer of that zorder was added. 
+
+    Required Arguments: 1) ax (GeoAxes) - The map.
+                        2) feature (cartopy Feature) - The map layer.
+
+    Optional Arguments: 1) use_cache (Boolean) - Default is None (use_basemap_cache).
+                        2) **kwargs - The keyword arguments of ax.add_feature() (i.e. color, linewidth, zorder). 
+
+    Returns: 1) The cartopy FeatureArtist.
+
+    '''
+
+    if use_cache == None:
+        use_cache = use_basemap_cache
+
+    artist = ax.add_feature(feature, **kwargs)
+
+    if use_cache == False:
+        return artist
+
+    zorder = artist.get_zorder()
+
+    layer = None
+    for child in ax.artists:
+        if isinstance(child, CachedMapLayer) and child.get_zorder() == zorder:
+            layer = child
+
+    if layer is None:
+        layer = CachedMapLayer(zorder)
+        ax.add_artist(layer)
+
+    layer.add(artist, feature, kwargs)
+
+    return artist
+
+
+def render_map_layer(projection, xlim, ylim, pixel_size, position, dpi, layers):
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(pixel_size[0] / dpi, pixel_size[1] / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0)
+
+    width, height = pixel_size
+    ax = fig.add_axes([position[0] / width, position[1] / height, position[2] / width, position[3] / height], projection=projection)
+    ax.set_aspect('auto')
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    ax.patch.set_visible(False)
+    ax.spines['geo'].set_visible(False)
+
+    for artist, feature, kwargs in layers:
+        ax.add_feature(feature, **kwargs)
+
+    canvas.draw()
+
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def get_map_layer(projection, xlim, ylim, pixel_size, position, dpi, layers):
+
+    r'''
+    This function returns the RGBA raster of the map layers of one zorder, drawing it the first time it is needed. 
+
+    Returns: 1) An array with the dimensions (height, width, 4). The first row is the top of the map.
+
+    '''
+
+    key = (projection.proj4_init, tuple(xlim), tuple(ylim), tuple(pixel_size), position, dpi, tuple((feature_key(feature), str(sorted(kwargs.items()))) for artist, feature, kwargs in layers))
+
+    if key in _basemap_registry:
+        # Moves the raster to the end so the oldest raster is dropped first
+        image = _basemap_registry.pop(key)
+        _basemap_registry[key] = image
+        return image
+
+    image = render_map_layer(projection, xlim, ylim, pixel_size, position, dpi, layers)
+
+    _basemap_registry[key] = image
+    while len(_basemap_registry) > basemap_cache_size:
+        del _basemap_registry[next(iter(_basemap_registry))]
+
+    return image
+
+
+def clear_basemap_cache():
+
+    _basemap_registry.clear()
+
+
+def add_map_layers(ax, show_rivers, borders, use_cache=None, ocean_zorder=2, lakes_zorder=2, rivers_zorder=2):
+
+    r'''
+    This function adds the land, water and border layers of a 7-day NWS forecast graphic to a map (see add_feature()).
+    The ocean is not drawn when ocean_zorder is None. 
+    '''
+
+    import cartopy.feature as cfeature
+
+    add_feature(ax, cfeature.LAND, use_cache=use_cache, color='beige', zorder=1)
+    if ocean_zorder != None:
+        add_feature(ax, cfeature.OCEAN, use_cache=use_cache, color='lightcyan', zorder=ocean_zorder)
+    add_feature(ax, cfeature.LAKES, use_cache=use_cache, color='lightcyan', zorder=lakes_zorder)
+    if show_rivers == True:
+        add_feature(ax, cfeature.RIVERS, use_cache=use_cache, color='lightcyan', zorder=rivers_zorder)
+
+    # (feature, linewidth, linestyle, zorder) of each border layer that is shown
+    for feature, linewidth, linestyle, zorder in borders:
+        if feature == 'STATES':
+            add_feature(ax, cfeature.STATES, use_cache=use_cache, linewidth=linewidth, linestyle=linestyle, edgecolor='black', zorder=zorder)
+        else:
+            add_feature(ax, feature, use_cache=use_cache, linewidth=linewidth, linestyle=linestyle, zorder=zorder)
+
+
+def crop_sample_points(sample_points, extent, margin=None):
+
+    r'''
+    This function drops the sample points (longitude, latitude, values) outside of the map extent plus a margin.
+    '''
+
+    if margin == None:
+        margin = grid_window_margin
+
+    sample_lons, sample_lats, sample_vals = [np.asarray(a) for a in sample_points]
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    lons = np.where(sample_lons > 180, sample_lons - 360, sample_lons)
+    keep = (lons >= western_bound - margin) & (lons <= eastern_bound + margin) & (sample_lats >= southern_bound - margin) & (sample_lats <= northern_bound + margin)
+
+    return sample_lons[keep], sample_lats[keep], sample_vals[keep]
+
+
+def sample_point_indices(lats, lons, decimate, extent=None, margin=None):
+
+    r'''
+    This function returns the flat indices of the sample points of a grid: every decimate-th grid point 
+    (the same points as the rows of the grid's DataFrame [::decimate]) that is inside the map extent plus a margin. 
+    The indices are computed once for each grid, decimation and extent and are reused by every day and product. 
+
+    Required Arguments: 1) lats, lons (Array) - The latitude and longitude of the grid.
+                        2) decimate (Integer) - The spacing of the sample points in grid points.
+
+    Optional Arguments: 1) extent (List) - [western_bound, eastern_bound, southern_bound, northern_bound]. 
+                           Default is None (the sample points of the whole grid).
+                        2) margin (Float) - Degrees around the extent. Default is grid_window_margin.
+
+    Returns: 1) A NumPy array of flat indices.
+
+    '''
+
+    if margin == None:
+        margin = grid_window_margin
+
+    lats = np.asarray(lats)
+    lons = np.asarray(lons)
+    decimate = int(decimate)
+
+    if extent != None:
+        extent = tuple(float(bound) for bound in extent)
+        # An extent that crosses the antimeridian keeps the sample points of the whole grid
+        if extent[0] < -180 or extent[1] > 180 or extent[0] >= extent[1]:
+            extent = None
+
+    key = (lats.shape, lons.shape, float(lats.flat[0]), float(lats.flat[-1]), float(lons.flat[0]), float(lons.flat[-1]), decimate, extent, margin)
+
+    try:
+        return _sample_point_registry[key]
+    except KeyError:
+        pass
+
+    if lats.ndim == 1 and lons.ndim == 1 and lats.shape != lons.shape:
+        lons, lats = np.meshgrid(lons, lats)
+
+    indices = np.arange(0, lats.size, decimate)
+
+    if extent != None:
+        sample_lons, sample_lats, indices = crop_sample_points((lons.ravel()[indices], lats.ravel()[indices], indices), extent, margin=margin)
+
+    _sample_point_registry[key] = indices
+
+    return indices
+
+
+def sample_grid(lats, lons, values, decimate, extent=None):
+
+    r'''
+    This function returns the longitude, latitude and values of the sample points of a grid 
+    (see sample_point_indices()) as small NumPy arrays. 
+    '''
+
+    lats = np.asarray(lats)
+    lons = np.asarray(lons)
+    values = np.asarray(values)
+
+    indices = sample_point_indices(lats, lons, decimate, extent=extent)
+
+    if lats.ndim == 1 and lons.ndim == 1 and lats.shape != lons.shape:
+        rows, columns = np.divmod(indices, len(lons))
+        return lons[columns], lats[rows], values.ravel()[indices]
+
+    return lons.ravel()[indices], lats.ravel()[indices], values.ravel()[indices]
+
+
+def nws_forecast_day_figure(values, lats, lons, day, settings):
+
+    r'''
+    This function draws the figure of one day of a 7-day NWS forecast graphic.
+
+    Required Arguments: 1) values (Array) - The forecast grid of the day.
+                        2) lats, lons (Array) - The 2-D latitude and longitude of the forecast grid.
+                        3) day (Dictionary) - 'title' (String), 'start' and 'end' (datetime in local time) and
+                           'sample_points' ((longitude, latitude, values) or None).
+                        4) settings (Dictionary) - The figure, map, border and contour settings of the plotting function.
+                           The optional settings are 'ocean_zorder', 'lakes_zorder' and 'rivers_zorder' (default 2, 
+                           'ocean_zorder': None leaves out the ocean), 'contour_zorder', 'alpha', 'extend' (default 'neither'), 
+                           'sample_point_zorder' (default 10) and 'colorbar_fontsize'.
+
+    Returns: 1) The matplotlib figure.
+
+    '''
+
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    import metpy.plots as mpplots
+    from matplotlib.patheffects import withStroke
+
+    mpl.rcParams['xtick.labelsize'] = settings['tick']
+    mpl.rcParams['ytick.labelsize'] = settings['tick']
+
+    mapcrs = settings['mapcrs']
+    datacrs = settings['datacrs']
+
+    basemap_cache = settings.get('use_basemap_cache')
+    if basemap_cache == None:
+        basemap_cache = use_basemap_cache
+    margin = settings.get('grid_window_margin')
+
+    fig = plt.figure(figsize=(settings['fig_x_length'], settings['fig_y_length']))
+    fig.set_facecolor('aliceblue')
+    fig.text(settings['signature_x_position'], settings['signature_y_position'], settings['signature'], fontsize=settings['signature_fontsize'], fontweight='bold', bbox=settings['props'], zorder=10)
+
+    ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
+    ax.set_extent(settings['extent'], datacrs)
+
+    add_map_layers(ax, settings['show_rivers'], settings['borders'], use_cache=basemap_cache, ocean_zorder=settings.get('ocean_zorder', 2), lakes_zorder=settings.get('lakes_zorder', 2), rivers_zorder=settings.get('rivers_zorder', 2))
+
+    ax.set_title(day['title'], fontsize=settings['title_fontsize'], fontweight='bold', loc='left')
+    ax.set_title('Start: '+ day['start'].strftime('%a %m/%d %H:00 Local') + '\nEnd: '+ day['end'].strftime('%a %m/%d %H:00 Local'), fontsize=settings['subplot_title_fontsize'], fontweight='bold', loc='right')
+
+    if day['sample_points'] != None:
+        sample_lons, sample_lats, sample_vals = crop_sample_points(day['sample_points'], settings['extent'], margin=margin)
+        sample_point_zorder = settings.get('sample_point_zorder', 10)
+        stn = mpplots.StationPlot(ax, sample_lons, sample_lats, transform=ccrs.PlateCarree(), fontsize=settings['sample_point_fontsize'], zorder=sample_point_zorder, clip_on=True)
+        stn.plot_parameter('C', sample_vals, color=settings['sample_point_color'], path_effects=[withStroke(linewidth=1, foreground='black')], zorder=sample_point_zorder)
+
+    contour_kwargs = {}
+    if settings.get('contour_zorder') != None:
+        contour_kwargs['zorder'] = settings['contour_zorder']
+
+    cs = contourf(ax, lons, lats, values, render_mode=settings.get('render_mode'), margin=margin, levels=settings['levels'], cmap=settings['cmap'], alpha=settings.get('alpha'), transform=datacrs, extend=settings.get('extend', 'neither'), **contour_kwargs)
+
+    cbar = fig.colorbar(cs, location='bottom', ticks=settings['labels'], aspect=settings['aspect'], shrink=settings['color_table_shrink'], pad=0.02)
+    if settings.get('colorbar_fontsize') != None:
+        cbar.set_label(label=settings['colorbar_label'], fontsize=settings['colorbar_fontsize'], fontweight='bold')
+    else:
+        cbar.set_label(label=settings['colorbar_label'], fontweight='bold')
+
+    return fig
+
+
+def border_layers(show_gacc_borders, show_psa_borders, show_county_borders, show_state_borders, show_cwa_borders, show_nws_firewx_zones, show_nws_public_zones, GACC, PSAs, USCOUNTIES, CWAs, FWZs, PZs, gacc_border_linewidth, psa_border_linewidth, county_border_linewidth, state_border_linewidth, cwa_border_linewidth, nws_firewx_zones_linewidth, nws_public_zones_linewidth, gacc_border_linestyle, psa_border_linestyle, county_border_linestyle, state_border_linestyle, cwa_border_linestyle, nws_firewx_zones_linestyle, nws_public_zones_linestyle):
+
+    r'''
+    This function returns the border layers of the reference system in the order the plotting functions draw them.
+    '''
+
+    borders = []
+
+    if show_gacc_borders == True:
+        borders.append((GACC, gacc_border_linewidth, gacc_border_linestyle, 6))
+    if show_psa_borders == True:
+        borders.append((PSAs, psa_border_linewidth, psa_border_linestyle, 5))
+    if show_county_borders == True:
+        borders.append((USCOUNTIES, county_border_linewidth, county_border_linestyle, 5))
+    if show_state_borders == True:
+        borders.append(('STATES', state_border_linewidth, state_border_linestyle, 6))
+    if show_cwa_borders == True:
+        borders.append((CWAs, cwa_border_linewidth, cwa_border_linestyle, 5))
+    if show_nws_firewx_zones == True:
+        borders.append((FWZs, nws_firewx_zones_linewidth, nws_firewx_zones_linestyle, 5))
+    if show_nws_public_zones == True:
+        borders.append((PZs, nws_public_zones_linewidth, nws_public_zones_linestyle, 5))
+
+    return borders
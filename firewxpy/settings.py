@@ -11,6 +11,11 @@ This file hosts all the functions that return the settings for each plot for eac
 
 import cartopy.crs as ccrs
 
+# The states and GACC regions that have a fixed map extent in this file.
+state_list = ['CA', 'AK', 'HI', 'ME', 'NH', 'VT', 'MA', 'RI', 'CT', 'NJ', 'DE', 'NY', 'PA', 'OH', 'MI', 'MN', 'WI', 'IA', 'IN', 'MO', 'IL', 'ND', 'SD', 'NE', 'MD', 'VA', 'SC', 'KY', 'WV', 'NC', 'NV', 'FL', 'OR', 'WA', 'ID', 'GA', 'AL', 'MS', 'LA', 'AR', 'TX', 'OK', 'NM', 'AZ', 'UT', 'CO', 'WY', 'MT', 'KS', 'TN']
+
+gacc_region_list = ['OSCC', 'ONCC', 'GBCC', 'NRCC', 'RMCC', 'SWCC', 'SACC', 'EACC', 'NWCC']
+
 def get_region_info(model, region):
 
     model = model
@@ -4969,3 +4974,23 @@ def check_NDFD_directory_name(directory_name):
     
 
     
+
+
+def get_region_extent(state=None, gacc_region=None):
+
+    r'''
+    This function returns the fixed map extent and figure size for a state or a GACC region. 
+
+    Required Arguments: 1) state (String) - The two letter state abbreviation. Set to None if using gacc_region. 
+                        2) gacc_region (String) - The GACC region abbreviation. Set to None if using state. 
+
+    Returns: 1) western_bound, eastern_bound, southern_bound, northern_bound, fig_x_length, fig_y_length
+    
+    '''
+
+    if gacc_region != None:
+        vals = get_gacc_region_data_and_coords(gacc_region, 'nws', False)
+    else:
+        vals = get_state_data_and_coords(state, 'nws', False)
+
+    return vals[1], vals[2], vals[3], vals[4], vals[5], vals[6]
@@ -1,10 +1,17 @@
 import os
 import imageio
+import numpy as np
 import matplotlib.pyplot as plt
+import tempfile
 import time
 from zipfile import ZipFile
+from contextlib import contextmanager
 from PIL import Image
 from datetime import datetime
+import firewxpy.rendering as rendering
+
+# The formats of the animations: 'gif', 'webp' (animated WebP) and/or 'mp4' (needs the imageio-ffmpeg package)
+animation_formats = ['gif']
 
 class file_functions:
 
@@ -129,6 +136,73 @@ class file_functions:
         zObject.close()
 
 
+    def write_file_atomically(file_path, write):
+
+        r'''
+        This function writes a file that other processes may be reading (i.e. a cache file or a cache index). 
+
+        write(temporary_path) writes the file to a unique temporary file in the same directory and the temporary file 
+        then replaces file_path in one step, so a reader never sees a partly written file and two processes never 
+        write to the same temporary file. The temporary file keeps the extension of file_path (np.savez() adds .npz). 
+
+        Inputs: 1) file_path (String) - The path of the file. 
+                2) write (Function) - Writes the file to the path it is given. 
+
+        '''
+
+        directory = os.path.dirname(file_path)
+        if directory != '' and os.path.exists(directory) == False:
+            os.makedirs(directory, exist_ok=True)
+
+        root, extension = os.path.splitext(os.path.basename(file_path))
+        fd, temporary_path = tempfile.mkstemp(dir=directory or '.', prefix=root + '.', suffix='.tmp' + extension)
+        os.close(fd)
+
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    @contextmanager
+    def locked_file(file_path):
+
+        r'''
+        This function holds an exclusive lock on file_path + '.lock' (across processes and threads) while the block runs. 
+        It is used around the read-modify-write of the cache indexes. 
+        '''
+
+        lock_path = file_path + '.lock'
+        directory = os.path.dirname(lock_path)
+        if directory != '' and os.path.exists(directory) == False:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(lock_path, 'a+b') as lock:
+            if os.name == 'nt':
+                import msvcrt
+                lock.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        pass
+                try:
+                    yield
+                finally:
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
     def update_images(figure_list, path, GIF_path, plot_type):
 
         
@@ -141,7 +215,7 @@ class file_functions:
             
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA LOW AND HIGH RH.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA LOW AND HIGH RH.png')
 
             print("Image saved to: "+path+"/RTMA LOW AND HIGH RH.png")              
 
@@ -149,7 +223,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA WIND GUST & OBS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA WIND GUST & OBS.png')
 
             print("Image saved to: "+path+"/RTMA WIND GUST & OBS.png")                
 
@@ -157,7 +231,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA WIND SPEED & OBS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA WIND SPEED & OBS.png')
 
             print("Image saved to: "+path+"/RTMA WIND SPEED & OBS.png")             
 
@@ -165,7 +239,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DEW POINT ADVECTION.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DEW POINT ADVECTION.png')
 
             print("Image saved to: "+path+"/RTMA DEW POINT ADVECTION.png")              
 
@@ -173,7 +247,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA RH ADVECTION.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA RH ADVECTION.png')
 
             print("Image saved to: "+path+"/RTMA RH ADVECTION.png")  
 
@@ -181,7 +255,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA TEMPERATURE ADVECTION.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA TEMPERATURE ADVECTION.png')
 
             print("Image saved to: "+path+"/RTMA TEMPERATURE ADVECTION.png")  
 
@@ -189,7 +263,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA EXTREME HEAT.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA EXTREME HEAT.png')
 
             print("Image saved to: "+path+"/RTMA EXTREME HEAT.png")     
 
@@ -197,7 +271,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA FROST FREEZE.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA FROST FREEZE.png')
 
             print("Image saved to: "+path+"/RTMA FROST FREEZE.png")            
 
@@ -205,7 +279,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA LOW RH & METAR.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA LOW RH & METAR.png')
 
             print("Image saved to: "+path+"/RTMA LOW RH & METAR.png")
 
@@ -213,7 +287,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA RH & METAR.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA RH & METAR.png')
 
             print("Image saved to: "+path+"/RTMA RH & METAR.png")
 
@@ -221,7 +295,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DRY & WINDY AREAS WIND VECTORS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DRY & WINDY AREAS WIND VECTORS.png')
 
             print("Image saved to: "+path+"/RTMA DRY & WINDY AREAS WIND VECTORS.png")
 
@@ -229,7 +303,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DRY & WINDY AREAS WIND BARBS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DRY & WINDY AREAS WIND BARBS.png')
 
             print("Image saved to: "+path+"/RTMA DRY & WINDY AREAS WIND BARBS.png")
 
@@ -237,7 +311,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DRY & WINDY AREAS SAMPLE POINTS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DRY & WINDY AREAS SAMPLE POINTS.png')
 
             print("Image saved to: "+path+"/RTMA DRY & WINDY AREAS SAMPLE POINTS.png")  
 
@@ -245,7 +319,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DRY & GUSTY AREAS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DRY & GUSTY AREAS.png')
 
             print("Image saved to: "+path+"/RTMA DRY & GUSTY AREAS.png")    
            
@@ -254,7 +328,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA WIND SPEED & DIRECTION WIND VECTORS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA WIND SPEED & DIRECTION WIND VECTORS.png')
 
             print("Image saved to: "+path+"/RTMA WIND SPEED & DIRECTION COMPARISON WIND VECTORS.png")  
 
@@ -262,7 +336,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA WIND SPEED & DIRECTION WIND BARBS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA WIND SPEED & DIRECTION WIND BARBS.png')
 
             print("Image saved to: "+path+"/RTMA WIND SPEED & DIRECTION WIND BARBS.png")     
 
@@ -270,7 +344,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND VECTORS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND VECTORS.png')
 
             print("Image saved to: "+path+"/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND VECTORS.png")              
 
@@ -278,7 +352,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND BARBS.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND BARBS.png')
 
             print("Image saved to: "+path+"/24HR RTMA WIND SPEED & DIRECTION COMPARISON WIND BARBS.png")             
 
@@ -286,7 +360,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA WIND SPEED.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA WIND SPEED.png')
 
             print("Image saved to: "+path+"/RTMA WIND SPEED.png")              
 
@@ -294,7 +368,7 @@ class file_functions:
             
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA WIND SPEED COMPARISON.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA WIND SPEED COMPARISON.png')
 
             print("Image saved to: "+path+"/24HR RTMA WIND SPEED COMPARISON.png")  
             
@@ -302,7 +376,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA DEW POINT COMPARISON.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA DEW POINT COMPARISON.png')
 
             print("Image saved to: "+path+"/24HR RTMA DEW POINT COMPARISON.png")              
 
@@ -310,7 +384,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA DEW POINT.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA DEW POINT.png')
 
             print("Image saved to: "+path+"/RTMA DEW POINT.png")  
             
@@ -319,7 +393,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA TOTAL CLOUD COVER COMPARISON.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA TOTAL CLOUD COVER COMPARISON.png')
 
             print("Image saved to: "+path+"/24HR RTMA TOTAL CLOUD COVER COMPARISON.png")           
 
@@ -327,7 +401,7 @@ class file_functions:
             
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA TOTAL CLOUD COVER.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA TOTAL CLOUD COVER.png')
 
             print("Image saved to: "+path+"/RTMA TOTAL CLOUD COVER.png")
 
@@ -335,7 +409,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA TEMPERATURE COMPARISON.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA TEMPERATURE COMPARISON.png')
 
             print("Image saved to: "+path+"/24HR RTMA TEMPERATURE COMPARISON.png")
 
@@ -343,7 +417,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA TEMPERATURE.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA TEMPERATURE.png')
 
             print("Image saved to: "+path+"/RTMA TEMPERATURE.png")
 
@@ -351,7 +425,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/RTMA RH.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/RTMA RH.png')
 
             print("Image saved to: "+path+"/RTMA RH.png")
 
@@ -359,7 +433,7 @@ class file_functions:
 
             fig = figure_list
 
-            fig = fig.savefig(path+'/24HR RTMA RH COMPARISON.png', bbox_inches='tight')
+            rendering.save_region_figure(fig, path+'/24HR RTMA RH COMPARISON.png')
 
             print("Image saved to: "+path+"/24HR RTMA RH COMPARISON.png")
 
@@ -391,9 +465,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -430,9 +504,9 @@ class file_functions:
                     pass
                 
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -468,9 +542,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -506,9 +580,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -544,9 +618,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -582,9 +656,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -617,9 +691,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -655,9 +729,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -693,9 +767,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -728,9 +802,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -766,9 +840,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -804,9 +878,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -823,9 +897,9 @@ class file_functions:
 
             GIF = GIF_path+"/NWS Frost Freeze.gif"
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -858,9 +932,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, None, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -896,9 +970,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -934,9 +1008,9 @@ class file_functions:
                 except Exception as e:
                     pass
 
-            save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
+            frames = save.extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7)
 
-            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None)
+            save.make_NDFD_Outlook_GIF(GIF, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, None, frames=frames)
 
             print("Individual images saved to: "+path)
             print("GIF saved to "+GIF_path)
@@ -2504,6 +2578,68 @@ class save:
 
         plt.savefig(file_path, bbox_inches='tight')
 
+    def save_figure_frame(figure, file_path):
+
+        r'''
+        This function saves a figure to a specified file path and returns the RGBA pixels of the saved image. 
+        The pixels are taken from the canvas that was just rendered by savefig() so the PNG is never read back from the disk. 
+
+        Inputs: 1) figure (matplotlib figure) - The figure to save. 
+                2) file_path (String) - Path to where the figure is saved. 
+
+        Return: A (height, width, 4) uint8 array of the saved image or None when the canvas does not hold the 
+                pixels (i.e. a canvas that is not an Agg canvas). Errors while saving the figure are raised. 
+
+        '''
+
+        try:
+            figure.savefig(file_path, bbox_inches='tight')
+
+            try:
+                frame = np.array(figure.canvas.buffer_rgba())
+                if frame.ndim != 3 or frame.shape[2] != 4:
+                    frame = None
+            except Exception as e:
+                print("Unable to take the frame of " + file_path + " from the canvas: " + str(e))
+                frame = None
+
+        finally:
+            plt.close(figure)
+
+        return frame
+
+    def save_figures_and_frames(figure_list, file_paths):
+
+        r'''
+        This function saves the figures and returns their RGBA frames (see save_figure_frame()). 
+
+        The figures are saved until the figure list or the file paths run out (a file path of None ends the list). 
+        A frame that can not be taken from the canvas is read from the saved image instead. 
+        An error while saving a figure is printed and the figures after it are not saved. 
+
+        Return: 1) The frames of the saved figures. 
+                2) True when every figure was saved. 
+
+        '''
+
+        frames = []
+        for i in range(0, len(figure_list)):
+            if i >= len(file_paths) or file_paths[i] == None:
+                break
+
+            try:
+                frame = save.save_figure_frame(figure_list[i], file_paths[i])
+            except Exception as e:
+                print("Unable to save " + file_paths[i] + ": " + str(e))
+                return frames, False
+
+            if frame is None:
+                frames = frames + save.read_frames([file_paths[i]])
+            else:
+                frames.append(frame)
+
+        return frames, True
+
     def extract_NDFD_figures(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7):
 
         r'''
@@ -2519,118 +2655,22 @@ class save:
                 7) file_path_6 (String) - Path to where the sixth figure is saved.
                 7) file_path_7 (String) - Path to where the seventh figure is saved.
 
-        Return: Each figure in the list is saved as its own file to a specified file path
+        Return: Each figure in the list is saved as its own file to a specified file path. 
+                The RGBA frames of the saved figures are returned in the same order (see make_NDFD_Outlook_GIF()).
 
         '''
-        try:
-            fig1 = figure_list[0]
-            fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-            plt.close(fig1)
-            fig2 = figure_list[1]
-            fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-            plt.close(fig2)
-            fig3 = figure_list[2]
-            fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-            plt.close(fig3)
-            fig4 = figure_list[3]
-            fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-            plt.close(fig4) 
-            fig5 = figure_list[4]
-            fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-            plt.close(fig5) 
-            fig6 = figure_list[5]
-            fig6 = fig6.savefig(file_path_6, bbox_inches='tight')
-            plt.close(fig6) 
-            fig7 = figure_list[6]
-            fig7 = fig7.savefig(file_path_7, bbox_inches='tight')
-            plt.close(fig7)
+
+        file_paths = [file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7]
+
+        frames, saved = save.save_figures_and_frames(figure_list, file_paths)
+
+        if saved == True and len(frames) > 0:
             print("All frames saved.")
-        except Exception as ee:
-            try:
-                fig1 = figure_list[0]
-                fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                plt.close(fig1)
-                fig2 = figure_list[1]
-                fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                plt.close(fig2)
-                fig3 = figure_list[2]
-                fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                plt.close(fig3)
-                fig4 = figure_list[3]
-                fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                plt.close(fig4) 
-                fig5 = figure_list[4]
-                fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-                plt.close(fig5) 
-                fig6 = figure_list[5]
-                fig6 = fig6.savefig(file_path_6, bbox_inches='tight')
-                plt.close(fig6) 
-                print("All frames saved.")
-            except Exception as a:
-                try:
-                    fig1 = figure_list[0]
-                    fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                    plt.close(fig1)
-                    fig2 = figure_list[1]
-                    fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                    plt.close(fig2)
-                    fig3 = figure_list[2]
-                    fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                    plt.close(fig3)
-                    fig4 = figure_list[3]
-                    fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                    plt.close(fig4) 
-                    fig5 = figure_list[4]
-                    fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-                    plt.close(fig5)
-                    print("All frames saved.")
-                except Exception as b:    
-                    try:
-                        fig1 = figure_list[0]
-                        fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                        plt.close(fig1)
-                        fig2 = figure_list[1]
-                        fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                        plt.close(fig2)
-                        fig3 = figure_list[2]
-                        fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                        plt.close(fig3)
-                        fig4 = figure_list[3]
-                        fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                        plt.close(fig4)
-                        print("All frames saved.")
-                    except Exception as c:
-                        try:     
-                            fig1 = figure_list[0]
-                            fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                            plt.close(fig1)
-                            fig2 = figure_list[1]
-                            fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                            plt.close(fig2)
-                            fig3 = figure_list[2]
-                            fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                            plt.close(fig3)
-                            print("All frames saved.")
-                        except Exception as b:
-                            try:
-                                fig1 = figure_list[0]
-                                fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                                plt.close(fig1)
-                                fig2 = figure_list[1]
-                                fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                                plt.close(fig2)
-                                print("All frames saved.")
-                            except Exception as c:
-                                try:
-                                    fig1 = figure_list[0]
-                                    fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                                    plt.close(fig1)
-                                    print("All frames saved.")
-                                except Exception as d:
-                                    pass    
-
-
-    def make_NDFD_Outlook_GIF(GIF_Image_file_path, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, file_path_8, fps=1):
+
+        return frames
+
+
+    def make_NDFD_Outlook_GIF(GIF_Image_file_path, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, file_path_8, fps=1, frames=None):
 
         r'''
         This function makes an animated GIF images of the NWS/NDFD plots and/or SPC Outlooks and saves the GIF to a specified location. 
@@ -2646,201 +2686,16 @@ class save:
                 8) file_path_7 (String) - Path to where the seventh figure is saved.
                 9) file_path_8 (String) - Path to where the eigth figure is saved.
                 10) fps (Integer) - The rate in frames per second the GIF loops. 
+                11) frames (List) - The RGBA frames returned by extract_NDFD_figures(). Default is None. 
+                    When the frames are passed the saved images are not read again. Otherwise the images that exist are read in order. 
 
         '''
 
+        if frames == None:
+            file_paths = [file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, file_path_8]
+            frames = save.read_frames(file_paths)
 
-        try:
-            file_path_1 = file_path_1
-            file_path_2 = file_path_2
-            file_path_3 = file_path_3
-            file_path_4 = file_path_4
-            file_path_5 = file_path_5
-            file_path_6 = file_path_6
-            file_path_7 = file_path_7
-            file_path_8 = file_path_8
-
-            datetime_str_1 = time.ctime(os.path.getmtime(file_path_1))
-            datetime_str_2 = time.ctime(os.path.getmtime(file_path_2))
-            datetime_str_3 = time.ctime(os.path.getmtime(file_path_3))
-            datetime_str_4 = time.ctime(os.path.getmtime(file_path_4))
-            datetime_str_5 = time.ctime(os.path.getmtime(file_path_5))
-            datetime_str_6 = time.ctime(os.path.getmtime(file_path_6))
-            datetime_str_7 = time.ctime(os.path.getmtime(file_path_7))
-            datetime_str_8 = time.ctime(os.path.getmtime(file_path_8))
-
-            day_1 = datetime.strptime(datetime_str_1, '%a %b %d %H:%M:%S %Y')
-            day_2 = datetime.strptime(datetime_str_2, '%a %b %d %H:%M:%S %Y')
-            day_3 = datetime.strptime(datetime_str_3, '%a %b %d %H:%M:%S %Y')
-            day_4 = datetime.strptime(datetime_str_4, '%a %b %d %H:%M:%S %Y')
-            day_5 = datetime.strptime(datetime_str_5, '%a %b %d %H:%M:%S %Y')
-            day_6 = datetime.strptime(datetime_str_6, '%a %b %d %H:%M:%S %Y')
-            day_7 = datetime.strptime(datetime_str_7, '%a %b %d %H:%M:%S %Y')
-            day_8 = datetime.strptime(datetime_str_8, '%a %b %d %H:%M:%S %Y')
-        
-            if day_7.day == day_8.day and day_7.hour == day_8.hour:
-                filenames = []
-                filenames.append(file_path_1)
-                filenames.append(file_path_2)
-                filenames.append(file_path_3)
-                filenames.append(file_path_4)
-                filenames.append(file_path_5)
-                filenames.append(file_path_6)
-                filenames.append(file_path_7)
-                filenames.append(file_path_8)
-
-            else:
-                filenames = []
-                filenames.append(file_path_1)
-                filenames.append(file_path_2)
-                filenames.append(file_path_3)
-                filenames.append(file_path_4)
-                filenames.append(file_path_5)
-                filenames.append(file_path_6)
-                filenames.append(file_path_7)  
-            
-            with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                for filename in filenames:
-                    image = imageio.v2.imread(filename)
-                    writer.append_data(image)
-                    
-            
-        except Exception as a:
-            try:
-                file_path_1 = file_path_1
-                file_path_2 = file_path_2
-                file_path_3 = file_path_3
-                file_path_4 = file_path_4
-                file_path_5 = file_path_5
-                file_path_6 = file_path_6
-                file_path_7 = file_path_7
-                
-    
-                datetime_str_1 = time.ctime(os.path.getmtime(file_path_1))
-                datetime_str_2 = time.ctime(os.path.getmtime(file_path_2))
-                datetime_str_3 = time.ctime(os.path.getmtime(file_path_3))
-                datetime_str_4 = time.ctime(os.path.getmtime(file_path_4))
-                datetime_str_5 = time.ctime(os.path.getmtime(file_path_5))
-                datetime_str_6 = time.ctime(os.path.getmtime(file_path_6))
-                datetime_str_7 = time.ctime(os.path.getmtime(file_path_7))
-    
-                day_1 = datetime.strptime(datetime_str_1, '%a %b %d %H:%M:%S %Y')
-                day_2 = datetime.strptime(datetime_str_2, '%a %b %d %H:%M:%S %Y')
-                day_3 = datetime.strptime(datetime_str_3, '%a %b %d %H:%M:%S %Y')
-                day_4 = datetime.strptime(datetime_str_4, '%a %b %d %H:%M:%S %Y')
-                day_5 = datetime.strptime(datetime_str_5, '%a %b %d %H:%M:%S %Y')
-                day_6 = datetime.strptime(datetime_str_6, '%a %b %d %H:%M:%S %Y')
-                day_7 = datetime.strptime(datetime_str_7, '%a %b %d %H:%M:%S %Y')
-            
-                if day_6.day == day_7.day and day_6.hour == day_7.hour:
-                    filenames = []
-                    filenames.append(file_path_1)
-                    filenames.append(file_path_2)
-                    filenames.append(file_path_3)
-                    filenames.append(file_path_4)
-                    filenames.append(file_path_5)
-                    filenames.append(file_path_6)
-                    filenames.append(file_path_7)
-    
-                else:
-                    filenames = []
-                    filenames.append(file_path_1)
-                    filenames.append(file_path_2)
-                    filenames.append(file_path_3)
-                    filenames.append(file_path_4)
-                    filenames.append(file_path_5)
-                    filenames.append(file_path_6)
-
-                with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                    for filename in filenames:
-                        image = imageio.v2.imread(filename)
-                        writer.append_data(image)
-        
-            except Exception as b:
-                try:
-                    file_path_1 = file_path_1
-                    file_path_2 = file_path_2
-                    file_path_3 = file_path_3
-                    file_path_4 = file_path_4
-                    file_path_5 = file_path_5
-                    file_path_6 = file_path_6
-        
-                    datetime_str_1 = time.ctime(os.path.getmtime(file_path_1))
-                    datetime_str_2 = time.ctime(os.path.getmtime(file_path_2))
-                    datetime_str_3 = time.ctime(os.path.getmtime(file_path_3))
-                    datetime_str_4 = time.ctime(os.path.getmtime(file_path_4))
-                    datetime_str_5 = time.ctime(os.path.getmtime(file_path_5))
-                    datetime_str_6 = time.ctime(os.path.getmtime(file_path_6))
-        
-                    day_1 = datetime.strptime(datetime_str_1, '%a %b %d %H:%M:%S %Y')
-                    day_2 = datetime.strptime(datetime_str_2, '%a %b %d %H:%M:%S %Y')
-                    day_3 = datetime.strptime(datetime_str_3, '%a %b %d %H:%M:%S %Y')
-                    day_4 = datetime.strptime(datetime_str_4, '%a %b %d %H:%M:%S %Y')
-                    day_5 = datetime.strptime(datetime_str_5, '%a %b %d %H:%M:%S %Y')
-                    day_6 = datetime.strptime(datetime_str_6, '%a %b %d %H:%M:%S %Y')
-                
-                    if day_5.day == day_6.day and day_5.hour == day_6.hour:
-                        filenames = []
-                        filenames.append(file_path_1)
-                        filenames.append(file_path_2)
-                        filenames.append(file_path_3)
-                        filenames.append(file_path_4)
-                        filenames.append(file_path_5)
-                        filenames.append(file_path_6)
-                  
-                    else:
-                        filenames = []
-                        filenames.append(file_path_1)
-                        filenames.append(file_path_2)
-                        filenames.append(file_path_3)
-                        filenames.append(file_path_4)
-                        filenames.append(file_path_5)
-                    
-                    with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                        for filename in filenames:
-                            image = imageio.v2.imread(filename)
-                            writer.append_data(image)
-
-                except Exception as c:
-
-                    file_path_1 = file_path_1
-                    file_path_2 = file_path_2
-                    file_path_3 = file_path_3
-                    file_path_4 = file_path_4
-                    file_path_5 = file_path_5
-        
-                    datetime_str_1 = time.ctime(os.path.getmtime(file_path_1))
-                    datetime_str_2 = time.ctime(os.path.getmtime(file_path_2))
-                    datetime_str_3 = time.ctime(os.path.getmtime(file_path_3))
-                    datetime_str_4 = time.ctime(os.path.getmtime(file_path_4))
-                    datetime_str_5 = time.ctime(os.path.getmtime(file_path_5))
-        
-                    day_1 = datetime.strptime(datetime_str_1, '%a %b %d %H:%M:%S %Y')
-                    day_2 = datetime.strptime(datetime_str_2, '%a %b %d %H:%M:%S %Y')
-                    day_3 = datetime.strptime(datetime_str_3, '%a %b %d %H:%M:%S %Y')
-                    day_4 = datetime.strptime(datetime_str_4, '%a %b %d %H:%M:%S %Y')
-                    day_5 = datetime.strptime(datetime_str_5, '%a %b %d %H:%M:%S %Y')
-                
-                    if day_4.day == day_5.day and day_4.hour == day_5.hour:
-                        filenames = []
-                        filenames.append(file_path_1)
-                        filenames.append(file_path_2)
-                        filenames.append(file_path_3)
-                        filenames.append(file_path_4)
-                        filenames.append(file_path_5)
-                  
-                    else:
-                        filenames = []
-                        filenames.append(file_path_1)
-                        filenames.append(file_path_2)
-                        filenames.append(file_path_3)
-                        filenames.append(file_path_4)
-                    
-                    with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                        for filename in filenames:
-                            image = imageio.v2.imread(filename)
-                            writer.append_data(image)                  
-            
+        save.write_animation(GIF_Image_file_path, frames, fps=fps)
         
         
     def extract_RTMA_figures_6hr_timelapse(figure_list, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7):
@@ -2858,117 +2713,19 @@ class save:
                 7) file_path_6 (String) - Path to where the sixth figure is saved.
                 8) file_path_7 (String) - Path to where the seventh figure is saved.
 
-        Return: Each figure in the list is saved as its own file to a specified file path
+        Return: Each figure in the list is saved as its own file to a specified file path. 
+                The RGBA frames of the saved figures are returned in the same order (see make_RTMA_6hr_timelapse_GIF()).
 
         '''
-        try:
-            fig1 = figure_list[0]
-            fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-            plt.close(fig1)
-            fig2 = figure_list[1]
-            fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-            plt.close(fig2)
-            fig3 = figure_list[2]
-            fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-            plt.close(fig3)
-            fig4 = figure_list[3]
-            fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-            plt.close(fig4) 
-            fig5 = figure_list[4]
-            fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-            plt.close(fig5) 
-            fig6 = figure_list[5]
-            fig6 = fig6.savefig(file_path_6, bbox_inches='tight')
-            plt.close(fig6) 
-            fig7 = figure_list[6]
-            fig7 = fig7.savefig(file_path_7, bbox_inches='tight')
-            plt.close(fig7)
 
-        except Exception as a:
-            try:
-                fig1 = figure_list[0]
-                fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                plt.close(fig1)
-                fig2 = figure_list[1]
-                fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                plt.close(fig2)
-                fig3 = figure_list[2]
-                fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                plt.close(fig3)
-                fig4 = figure_list[3]
-                fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                plt.close(fig4) 
-                fig5 = figure_list[4]
-                fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-                plt.close(fig5) 
-                fig6 = figure_list[5]
-                fig6 = fig6.savefig(file_path_6, bbox_inches='tight')
-                plt.close(fig6) 
-    
-            except Exception as b:
-                try:
-                    fig1 = figure_list[0]
-                    fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                    plt.close(fig1)
-                    fig2 = figure_list[1]
-                    fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                    plt.close(fig2)
-                    fig3 = figure_list[2]
-                    fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                    plt.close(fig3)
-                    fig4 = figure_list[3]
-                    fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                    plt.close(fig4) 
-                    fig5 = figure_list[4]
-                    fig5 = fig5.savefig(file_path_5, bbox_inches='tight')
-                    plt.close(fig5)
-                except Exception as c:    
-                    try:
-                        fig1 = figure_list[0]
-                        fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                        plt.close(fig1)
-                        fig2 = figure_list[1]
-                        fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                        plt.close(fig2)
-                        fig3 = figure_list[2]
-                        fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                        plt.close(fig3)
-                        fig4 = figure_list[3]
-                        fig4 = fig4.savefig(file_path_4, bbox_inches='tight')
-                        plt.close(fig4)
-                    
-                    except Exception as d:
-                        try:     
-                            fig1 = figure_list[0]
-                            fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                            plt.close(fig1)
-                            fig2 = figure_list[1]
-                            fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                            plt.close(fig2)
-                            fig3 = figure_list[2]
-                            fig3 = fig3.savefig(file_path_3, bbox_inches='tight')
-                            plt.close(fig3)
-                
-                        except Exception as e:
-                            try:
-                                fig1 = figure_list[0]
-                                fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                                plt.close(fig1)
-                                fig2 = figure_list[1]
-                                fig2 = fig2.savefig(file_path_2, bbox_inches='tight')
-                                plt.close(fig2)
-                
-                            except Exception as f:
-                                try:
-                                    fig1 = figure_list[0]
-                                    fig1 = fig1.savefig(file_path_1, bbox_inches='tight')
-                                    plt.close(fig1)
-                
-                                except Exception as g:
-                                    pass        
+        file_paths = [file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7]
+
+        frames, saved = save.save_figures_and_frames(figure_list, file_paths)
 
+        return frames
 
-    def make_RTMA_6hr_timelapse_GIF(GIF_Image_file_path, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, fps=1):
+
+    def make_RTMA_6hr_timelapse_GIF(GIF_Image_file_path, file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7, fps=1, frames=None):
 
         r'''
         This function makes an animated GIF images of the SPC Outlooks and saves the GIF to a specified location. 
@@ -2982,72 +2739,123 @@ class save:
                 7) file_path_6 (String) - Path to where the sixth figure is saved.
                 8) file_path_7 (String) - Path to where the seventh figure is saved.
                 9) fps (Integer) - The rate in frames per second the GIF loops. 
+                10) frames (List) - The RGBA frames returned by extract_RTMA_figures_6hr_timelapse(). Default is None. 
 
         '''
 
+        if frames == None:
+            file_paths = [file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7]
+            frames = save.read_frames(file_paths)
 
-        filenames = []
-        filenames.append(file_path_1)
-        filenames.append(file_path_2)
-        filenames.append(file_path_3)
-        filenames.append(file_path_4)
-        filenames.append(file_path_5)
-        filenames.append(file_path_6)
-        filenames.append(file_path_7)
+        save.write_animation(GIF_Image_file_path, frames, fps=fps)
+        
+        print("GIF Saved!")   
 
 
-        try:
-            with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                for filename in filenames:
-                    image = imageio.v2.imread(filename)
-                    writer.append_data(image)
-        
-        except Exception as a:
+    def read_frames(file_paths):
+
+        r'''
+        This function reads the saved images that exist (in order) as RGBA frames. 
+        A missing image ends the animation (i.e. the seventh day of a six day forecast). 
+        '''
+
+        frames = []
+        for file_path in file_paths:
+            if file_path == None or os.path.exists(file_path) == False:
+                break
+            frames.append(np.asarray(Image.open(file_path).convert('RGBA')))
+
+        return frames
+
+
+    def shared_palette(frames, colors=256, stride=4):
+
+        r'''
+        This function builds one palette for every frame of an animation. 
+        The palette is quantized once from a sample of the pixels of all of the frames. 
+        '''
+
+        sample = np.concatenate([frame[::stride, ::stride, :3].reshape(-1, 3) for frame in frames])
+        width = 1024
+        rows = -(-len(sample) // width)
+        sample = np.concatenate([sample, np.repeat(sample[-1:], rows * width - len(sample), axis=0)])
+
+        return Image.fromarray(sample.reshape(rows, width, 3), 'RGB').quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+
+
+    def pad_frames(frames):
+
+        r'''
+        This function pads the frames with white to the size of the largest frame. 
+        The figures are saved with bbox_inches='tight' so the frames can differ by a few pixels. 
+        '''
+
+        height = max(frame.shape[0] for frame in frames)
+        width = max(frame.shape[1] for frame in frames)
+
+        padded = []
+        for frame in frames:
+            if frame.shape[0] == height and frame.shape[1] == width:
+                padded.append(frame)
+            else:
+                new_frame = np.full((height, width, 4), 255, dtype=np.uint8)
+                new_frame[:frame.shape[0], :frame.shape[1]] = frame
+                padded.append(new_frame)
+
+        return padded
+
+
+    def write_animation(file_path, frames, fps=1, formats=None):
+
+        r'''
+        This function writes an animation from RGBA frames. 
+
+        Every frame of the GIF is quantized to one shared palette (see shared_palette()) with no dithering so the 
+        colors do not shimmer from frame to frame. 
+
+        Inputs: 1) file_path (String) - The path of the GIF plus the filename of the GIF. 
+                2) frames (List) - The RGBA frames (see extract_NDFD_figures()). 
+                3) fps (Integer) - The rate in frames per second the animation loops. 
+                4) formats (List) - The formats to write: 'gif', 'webp' (animated WebP) and/or 'mp4'. 
+                   Default is None (animation_formats). The WebP and MP4 are saved next to the GIF with the same filename.
+
+        '''
+
+        if formats == None:
+            formats = animation_formats
+
+        if len(frames) == 0:
+            print("No frames to animate.")
+            return
+
+        frames = save.pad_frames(frames)
+        duration = int(round(1000 / fps))
+        root = os.path.splitext(file_path)[0]
+
+        if 'gif' in formats:
+            palette = save.shared_palette(frames)
+            images = [Image.fromarray(frame, 'RGBA').convert('RGB').quantize(palette=palette, dither=Image.Dither.NONE) for frame in frames]
+            images[0].save(file_path, save_all=True, append_images=images[1:], duration=duration, loop=0)
+
+        if 'webp' in formats:
             try:
-                with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                    new_list = []
-                    image_1 = filenames[0]
-                    image_2 = filenames[1]
-                    image_3 = filenames[2]
-                    image_4 = filenames[3]
-                    image_5 = filenames[4]
-                    image_6 = filenames[5]
-                    image_7 = filenames[6]
-                    new_list.append(image_1)
-                    new_list.append(image_2)
-                    new_list.append(image_3)
-                    new_list.append(image_4)
-                    new_list.append(image_5)
-                    new_list.append(image_6)
-                    new_list.append(image_7)
-            
-                    for filename in new_list:
-                        image = imageio.v2.imread(filename)
-                        writer.append_data(image)
-                        
-            
-        
-            except Exception as b:
-                with imageio.get_writer(GIF_Image_file_path, fps=fps) as writer:
-                    new_list = []
-                    image_1 = filenames[0]
-                    image_2 = filenames[1]
-                    image_3 = filenames[2]
-                    image_4 = filenames[3]
-                    image_5 = filenames[4]
-                    image_6 = filenames[5]
-                    new_list.append(image_1)
-                    new_list.append(image_2)
-                    new_list.append(image_3)
-                    new_list.append(image_4)
-                    new_list.append(image_5)
-                    new_list.append(image_6)
-            
-                    for filename in new_list:
-                        image = imageio.v2.imread(filename)
-                        writer.append_data(image)        
-        
-        print("GIF Saved!")   
+                images = [Image.fromarray(frame, 'RGBA') for frame in frames]
+                images[0].save(root + '.webp', save_all=True, append_images=images[1:], duration=duration, loop=0, lossless=True)
+            except Exception as e:
+                print("Animated WebP not saved (Pillow needs WebP support): " + str(e))
+
+        if 'mp4' in formats:
+            try:
+                # H.264 needs an even width and height
+                height = frames[0].shape[0] + frames[0].shape[0] % 2
+                width = frames[0].shape[1] + frames[0].shape[1] % 2
+                with imageio.get_writer(root + '.mp4', fps=fps, macro_block_size=1) as writer:
+                    for frame in frames:
+                        rgb = np.full((height, width, 3), 255, dtype=np.uint8)
+                        rgb[:frame.shape[0], :frame.shape[1]] = frame[:, :, :3]
+                        writer.append_data(rgb)
+            except Exception as e:
+                print("MP4 not saved (imageio needs the imageio-ffmpeg package): " + str(e))
 
 
     def clear_NDFD_images(file_path_1, file_path_2, file_path_3, file_path_4, file_path_5, file_path_6, file_path_7):
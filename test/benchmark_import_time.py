@@ -0,0 +1,43 @@
+# This script tracks how long `import firewxpy` takes using `python -X importtime`
+# It prints the total import time of the firewxpy package and the slowest modules imported along with it
+# Optional: pass a public name (i.e. rtma_conus) to also time the first access of that name
+#
+# Usage: python benchmark_import_time.py [public_name]
+
+import re
+import subprocess
+import sys
+
+public_name = sys.argv[1] if len(sys.argv) > 1 else None
+
+if public_name == None:
+    code = "import firewxpy"
+else:
+    code = f"import firewxpy; firewxpy.{public_name}"
+
+result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+
+# Lines look like: "import time:       self [us] |  cumulative | imported package"
+pattern = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+modules = []
+for line in result.stderr.splitlines():
+    match = pattern.match(line)
+    if match:
+        modules.append((int(match.group(2)), int(match.group(1)), match.group(4)))
+
+if len(modules) == 0:
+    print(result.stderr)
+    sys.exit(1)
+
+total = sum(m[1] for m in modules)
+firewxpy_total = max([m[0] for m in modules if m[2] == 'firewxpy'] or [0])
+
+print(f"Command: {code}")
+print(f"Modules imported: {len(modules)}")
+print(f"firewxpy package (cumulative): {firewxpy_total / 1000:.1f} ms")
+print(f"All imports (self time sum): {total / 1000:.1f} ms\n")
+
+print("Slowest modules (cumulative):")
+for cumulative, self_time, name in sorted(modules, reverse=True)[:15]:
+    print(f"{cumulative / 1000:10.1f} ms  {name}")
@@ -0,0 +1,54 @@
+# This script compares how long it takes to draw a gridded product with render_mode='contourf' and render_mode='raster'
+# It draws a synthetic 2.5 km CONUS sized grid on a Lambert Conformal map (like the NDFD/RTMA graphics) and saves it to a PNG in memory
+#
+# Usage: python benchmark_render_mode.py [number of runs]
+
+import io
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+import numpy as np
+
+import firewxpy.rendering as rendering
+
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+mapcrs = ccrs.LambertConformal(central_longitude=-96, central_latitude=39, standard_parallels=(33, 45))
+datacrs = ccrs.PlateCarree()
+
+lats_1d = np.linspace(20, 52, 1377)
+lons_1d = np.linspace(-130, -60, 2145)
+lons, lats = np.meshgrid(lons_1d, lats_1d)
+values = 15 + 10 * np.sin(np.radians(lons) * 8) * np.cos(np.radians(lats) * 6) + (lats - 36) * 0.5
+
+
+def draw(mode):
+
+    fig = plt.figure(figsize=(12, 12))
+    ax = fig.add_subplot(1, 1, 1, projection=mapcrs)
+    ax.set_extent([-125, -66, 24, 50], datacrs)
+    cs = rendering.contourf(ax, lons, lats, values, render_mode=mode, levels=np.arange(0, 31, 1), cmap='jet', alpha=0.5, transform=datacrs, extend='both', zorder=2)
+    fig.colorbar(cs, shrink=0.7)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    plt.close(fig)
+
+
+for mode in ['contourf', 'raster']:
+    # The first draw also projects the grid coordinates (raster mode caches them)
+    start = time.perf_counter()
+    draw(mode)
+    first = time.perf_counter() - start
+
+    times = []
+    for i in range(0, runs):
+        start = time.perf_counter()
+        draw(mode)
+        times.append(time.perf_counter() - start)
+
+    print(f"{mode:10s} first: {first:6.2f} s   best of {runs}: {min(times):6.2f} s   mean: {sum(times) / len(times):6.2f} s")
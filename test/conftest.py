@@ -0,0 +1,84 @@
+# Shared fixtures of the offline tests (python -m pytest test)
+# The tests never connect to the NWS FTP server or the UCAR THREDDS servers. Every test runs in its own temporary
+# working directory (the NDFD files, the NDFD Cache and the METAR Cache are written relative to it) and the
+# module level caches of firewxpy.data_access are emptied before and after each test.
+
+import struct
+
+import numpy as np
+import pytest
+
+import firewxpy.data_access as da
+
+
+def clear_data_access_caches():
+
+    da.clear_NDFD_cache()
+    da.close_ftp_connections()
+    da._station_index.clear()
+    da._station_id_sets.clear()
+    da._station_projected_coordinates.clear()
+    da._metar_frames.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_access(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    clear_data_access_caches()
+    yield
+    clear_data_access_caches()
+
+
+def grib2_message(issuance, forecast_hour, values, first_lat=45.0, first_lon=235.0, step=0.5):
+
+    r'''
+    Returns one GRIB2 message (a regular latitude/longitude grid with simple packing) as bytes.
+    The grid starts at the north west corner and the rows go south like the values array.
+    '''
+
+    ny, nx = values.shape
+    scaled = np.round(np.asarray(values, dtype='float64') * 100).astype('int64')
+    reference = int(scaled.min())
+    packed = (scaled - reference).astype('>u4').view('u1').reshape(-1, 4)[:, 1:].tobytes()
+
+    section_1 = struct.pack('>IBHHBBBHBBBBBBB', 21, 1, 8, 0, 2, 1, 1, issuance.year, issuance.month, issuance.day, issuance.hour, issuance.minute, 0, 0, 1)
+    section_3 = struct.pack('>IBBIBBH', 72, 3, 0, nx * ny, 0, 0, 0) + struct.pack('>BBIBIBIIIIIIIBIIIIB', 6, 0, 0, 0, 0, 0, 0, nx, ny, 0, 0,
+                int(first_lat * 1e6), int(first_lon * 1e6), 48, int((first_lat - (ny - 1) * step) * 1e6), int((first_lon + (nx - 1) * step) * 1e6),
+                int(step * 1e6), int(step * 1e6), 0)
+    section_4 = struct.pack('>IBHH', 34, 4, 0, 0) + struct.pack('>BBBBBHBBIBBIBBI', 0, 0, 2, 0, 0, 0, 0, 1, forecast_hour, 1, 0, 0, 255, 0, 0)
+    section_5 = struct.pack('>IBIHfhhBB', 21, 5, nx * ny, 0, float(reference), 0, 2, 24, 0)
+    section_6 = struct.pack('>IBB', 6, 6, 255)
+    section_7 = struct.pack('>IB', 5 + len(packed), 7) + packed
+
+    body = section_1 + section_3 + section_4 + section_5 + section_6 + section_7
+
+    return b'GRIB' + struct.pack('>HBBQ', 0, 0, 2, 16 + len(body) + 4) + body + b'7777'
+
+
+@pytest.fixture
+def write_grib2():
+
+    r'''
+    Returns a function write(path, issuance, forecast_hours, values) that writes a synthetic NDFD GRIB2 file with one
+    message per forecast hour. values has the dimensions (time, y, x).
+    '''
+
+    def write(path, issuance, forecast_hours, values):
+        with open(path, 'wb') as fp:
+            for forecast_hour, vals in zip(forecast_hours, values):
+                fp.write(grib2_message(issuance, forecast_hour, vals))
+        return path
+
+    return write
+
+
+@pytest.fixture
+def synthetic_values():
+
+    r'''
+    Three forecast periods on a 3 x 4 grid.
+    '''
+
+    base = np.arange(12, dtype='float32').reshape(3, 4) + 280
+    return np.stack([base, base + 1.5, base - 2.25])
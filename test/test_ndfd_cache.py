@@ -0,0 +1,232 @@
+# Offline tests of the NDFD product cache, NDFD_grid_key() and the parse_GRIB_files_full_forecast_period() adapter
+
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pygrib
+
+import firewxpy.calc as calc
+import firewxpy.data_access as da
+import firewxpy.parsers as parsers
+
+CONUS = '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/'
+HAWAII = '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.hawaii/'
+
+# The ds.maxt.bin periods start at 12Z so select_forecast_periods() keeps the first period at any time of the day
+ISSUANCE = datetime(2024, 7, 1, 11)
+FORECAST_HOURS = [1, 25, 49]
+
+
+def cache_issuance(write_grib2, values, issuance, directory_name=CONUS, parameter='ds.maxt.bin', remote=None):
+
+    write_grib2(parameter, issuance, FORECAST_HOURS, values)
+
+    return da.cache_NDFD_product(directory_name, parameter, 'ds', len(values), 0, remote)
+
+
+def test_decode_GRIB_file_matches_pygrib(write_grib2, synthetic_values):
+
+    write_grib2('ds.maxt.bin', ISSUANCE, FORECAST_HOURS, synthetic_values)
+
+    grids = parsers.NDFD.decode_GRIB_file('ds.maxt.bin', 12)
+
+    grbs = pygrib.open('ds.maxt.bin')
+    messages = [grb for grb in grbs]
+    lats, lons = messages[0].latlons()
+    grbs.close()
+
+    assert grids.values.dtype == np.float32
+    assert grids.values.shape == (3, 3, 4)
+    assert grids.file_path == 'ds.maxt.bin'
+    for i, grb in enumerate(messages):
+        np.testing.assert_allclose(grids.values[i], grb.values, atol=1e-4)
+    np.testing.assert_allclose(grids.lats, lats)
+    np.testing.assert_allclose(grids.lons, lons)
+    assert grids.start_times == [ISSUANCE + timedelta(hours=h) for h in FORECAST_HOURS]
+    assert grids.end_times == [s + timedelta(hours=12) for s in grids.start_times]
+
+
+def test_parse_GRIB_files_full_forecast_period_layout(write_grib2, synthetic_values):
+
+    write_grib2('ds.maxt.bin', ISSUANCE, FORECAST_HOURS, synthetic_values)
+
+    parsed = parsers.NDFD.parse_GRIB_files_full_forecast_period('ds.maxt.bin', 12, False, 3, 0, CONUS)
+    grids = parsers.NDFD.decode_GRIB_file('ds.maxt.bin', 12)
+
+    assert len(parsed) == 7 * 3 + 7 * 2 + 4
+
+    for i in range(0, 7):
+        vals, start, end = parsed[3 * i:3 * i + 3]
+        lats, lons = parsed[21 + 2 * i:23 + 2 * i]
+        if i < 3:
+            np.testing.assert_array_equal(vals, grids.values[i])
+            assert start == grids.start_times[i]
+            assert end == grids.end_times[i]
+            np.testing.assert_array_equal(lats, grids.lats)
+            np.testing.assert_array_equal(lons, grids.lons)
+            # Every period shares the same coordinate arrays
+            assert lats is parsed[21] and lons is parsed[22]
+        else:
+            assert vals is None and start is None and end is None
+            assert lats is None and lons is None
+
+    count, count_short, count_extended, discard = parsed[-4:]
+    assert (count, count_short, count_extended, discard) == (3, 3, 0, False)
+
+
+def test_parse_GRIB_files_full_forecast_period_converts_temperature(write_grib2, synthetic_values):
+
+    write_grib2('ds.maxt.bin', ISSUANCE, FORECAST_HOURS, synthetic_values)
+
+    kelvin = parsers.NDFD.parse_GRIB_files_full_forecast_period('ds.maxt.bin', 12, False, 3, 0, CONUS)
+    fahrenheit = parsers.NDFD.parse_GRIB_files_full_forecast_period('ds.maxt.bin', 12, True, 3, 0, CONUS)
+
+    for i in range(0, 3):
+        np.testing.assert_allclose(fahrenheit[3 * i], calc.unit_conversion.Temperature_Data_or_Dewpoint_Data_Kelvin_to_Fahrenheit(kelvin[3 * i]), rtol=1e-6)
+
+
+def test_parse_GRIB_files_full_forecast_period_drops_an_old_first_period(write_grib2, synthetic_values):
+
+    # The first period starts at 00Z instead of 12Z. It is thrown out unless the local hour is still inside it.
+    write_grib2('ds.maxt.bin', ISSUANCE - timedelta(hours=12), [1, 13, 37], synthetic_values)
+
+    parsed = parsers.NDFD.parse_GRIB_files_full_forecast_period('ds.maxt.bin', 12, False, 3, 0, CONUS)
+    grids = parsers.NDFD.decode_GRIB_file('ds.maxt.bin', 12)
+
+    count, count_short, count_extended, discard = parsed[-4:]
+    if discard == True:
+        np.testing.assert_array_equal(parsed[0], grids.values[1])
+        assert parsed[1] == grids.start_times[1]
+        assert (count, count_short) == (2, 2)
+    else:
+        np.testing.assert_array_equal(parsed[0], grids.values[0])
+        assert parsed[1].hour == 12
+        assert (count, count_short) == (3, 3)
+
+
+def test_cache_entry_is_keyed_by_directory_parameter_and_issuance(write_grib2, synthetic_values):
+
+    entry = cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+
+    assert entry['issuance'] == ISSUANCE
+    assert da._ndfd_product_cache[(CONUS, 'ds.maxt.bin', ISSUANCE)] is entry
+    assert da._ndfd_latest_issuance[(CONUS, 'ds.maxt.bin')] == ISSUANCE
+    assert entry['raw_path'] == os.path.join(da.ndfd_cache_directory, 'AR.conus', '202407011100', 'ds.maxt.bin')
+    assert os.path.exists(entry['raw_path'])
+
+    record = da.read_ndfd_cache_index()[CONUS + 'ds.maxt.bin']
+    assert record['issuance'] == '202407011100'
+    assert record['raw_path'] == entry['raw_path']
+
+    # Hawaii writes the same file name but is a separate entry
+    hawaii = cache_issuance(write_grib2, synthetic_values + 10, ISSUANCE, directory_name=HAWAII)
+
+    assert hawaii is not entry
+    assert da._ndfd_product_cache[(CONUS, 'ds.maxt.bin', ISSUANCE)] is entry
+    assert hawaii['raw_path'] == os.path.join(da.ndfd_cache_directory, 'AR.hawaii', '202407011100', 'ds.maxt.bin')
+
+
+def test_cache_keeps_the_newest_issuances(write_grib2, synthetic_values, monkeypatch):
+
+    monkeypatch.setattr(da, 'ndfd_cache_retention', 2)
+
+    issuances = [ISSUANCE + timedelta(hours=h) for h in range(0, 4)]
+    for i, issuance in enumerate(issuances):
+        cache_issuance(write_grib2, synthetic_values + i, issuance)
+
+    cached = sorted(key[2] for key in da._ndfd_product_cache.keys() if key[:2] == (CONUS, 'ds.maxt.bin'))
+    assert cached == issuances[2:]
+    assert da._ndfd_latest_issuance[(CONUS, 'ds.maxt.bin')] == issuances[-1]
+
+    domain_directory = os.path.join(da.ndfd_cache_directory, 'AR.conus')
+    assert sorted(os.listdir(domain_directory)) == [issuance.strftime('%Y%m%d%H%M') for issuance in issuances[2:]]
+
+
+def test_latest_cached_product_is_read_back_from_the_index(write_grib2, synthetic_values, monkeypatch):
+
+    cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+    da.clear_NDFD_cache()
+
+    entry = da.latest_cached_NDFD_product(CONUS, 'ds.maxt.bin')
+
+    assert entry['issuance'] == ISSUANCE
+    assert entry['ds'] is None
+    assert entry['working_file'] == None
+    assert da._ndfd_latest_issuance[(CONUS, 'ds.maxt.bin')] == ISSUANCE
+
+    monkeypatch.setattr(da, 'ndfd_cache_max_age', 0)
+    entry['fetched'] = entry['fetched'] - 1
+
+    assert da.latest_cached_NDFD_product(CONUS, 'ds.maxt.bin') == None
+    assert da.latest_cached_NDFD_product(CONUS, 'ds.maxt.bin', check_age=False) is entry
+    assert da.latest_cached_NDFD_product(HAWAII, 'ds.maxt.bin') == None
+
+
+def test_restore_working_file_puts_the_cached_copy_back(write_grib2, synthetic_values):
+
+    conus = cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+    cache_issuance(write_grib2, synthetic_values + 10, ISSUANCE, directory_name=HAWAII)
+
+    da.restore_NDFD_working_file(conus, 'ds.maxt.bin')
+
+    with open('ds.maxt.bin', 'rb') as working, open(conus['raw_path'], 'rb') as cached:
+        assert working.read() == cached.read()
+    assert conus['working_file'] == da.working_file_fingerprint('ds.maxt.bin')
+
+
+def test_cached_grids_are_decoded_once_per_grid_time_interval(write_grib2, synthetic_values, monkeypatch):
+
+    entry = cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+    expected = parsers.NDFD.decode_GRIB_file('ds.maxt.bin', 12)
+
+    grids_12 = da.get_cached_NDFD_grids(CONUS, 'ds.maxt.bin', 12)
+
+    assert os.path.exists(entry['raw_path'] + '.npz')
+    assert da.get_cached_NDFD_grids(CONUS, 'ds.maxt.bin', 12) is grids_12
+
+    def decode(file_path, grid_time_interval):
+        raise AssertionError("the cached arrays should be used")
+
+    monkeypatch.setattr(parsers.NDFD, 'decode_GRIB_file', decode)
+
+    grids_24 = da.get_cached_NDFD_grids(CONUS, 'ds.maxt.bin', 24)
+
+    for grids, hours in [(grids_12, 12), (grids_24, 24)]:
+        np.testing.assert_array_equal(grids.values, expected.values)
+        np.testing.assert_array_equal(grids.lats, expected.lats)
+        np.testing.assert_array_equal(grids.lons, expected.lons)
+        assert grids.start_times == expected.start_times
+        assert grids.end_times == [s + timedelta(hours=hours) for s in expected.start_times]
+        assert grids.file_path == 'ds.maxt.bin'
+
+    assert sorted(entry['grids'].keys()) == [12, 24]
+
+
+def test_cached_grids_are_not_used_for_another_file(write_grib2, synthetic_values, monkeypatch):
+
+    cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+    write_grib2('ds.maxt.bin', ISSUANCE, FORECAST_HOURS, synthetic_values + 5)
+
+    grids = da.get_cached_NDFD_grids(CONUS, 'ds.maxt.bin', 12)
+
+    np.testing.assert_allclose(grids.values, synthetic_values + 5, atol=1e-4)
+
+
+def test_NDFD_grid_key(write_grib2, synthetic_values):
+
+    assert da.NDFD_grid_key(CONUS, 'ds.maxt.bin') == None
+
+    cache_issuance(write_grib2, synthetic_values, ISSUANCE)
+
+    assert da.NDFD_grid_key(CONUS, 'ds.maxt.bin') == ('NDFD', CONUS, 'ds.maxt.bin', ISSUANCE)
+    assert da.NDFD_grid_key(CONUS, 'ds.maxt.bin', 'ds.maxt.bin') == da.NDFD_grid_key(CONUS, 'ds.maxt.bin')
+
+    # Once another directory writes the working file it is no longer the cached CONUS download
+    cache_issuance(write_grib2, synthetic_values + 10, ISSUANCE + timedelta(hours=1), directory_name=HAWAII)
+
+    assert da.NDFD_grid_key(HAWAII, 'ds.maxt.bin') == ('NDFD', HAWAII, 'ds.maxt.bin', ISSUANCE + timedelta(hours=1))
+    assert da.NDFD_grid_key(CONUS, 'ds.maxt.bin') == ('file',) + tuple(da.working_file_fingerprint('ds.maxt.bin'))
+
+    other = write_grib2('other.bin', ISSUANCE, FORECAST_HOURS, synthetic_values)
+    assert da.NDFD_grid_key(CONUS, 'ds.maxt.bin', other) == ('file', os.path.abspath(other)) + tuple(da.working_file_fingerprint(other)[1:])
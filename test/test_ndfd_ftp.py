@@ -0,0 +1,379 @@
+# Offline tests of the FTP connection pool, the MDTM/SIZE freshness check and the NDFD file watcher
+# The NWS FTP server is replaced by FakeFTPServer (see the ftp_server fixture).
+
+import asyncio
+import ftplib
+from datetime import datetime, timedelta
+
+import pytest
+
+import firewxpy.data_access as da
+
+CONUS = '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.conus/'
+ISSUANCE = datetime(2024, 7, 1, 11)
+
+
+class FakeFTPServer:
+
+    def __init__(self):
+        self.files = {}
+        self.modified = {}
+        self.connections = []
+        # Exceptions raised by the next transfers (i.e. the server closing the connection)
+        self.failures = []
+
+    def add_file(self, path, data, modified='20240701113000'):
+        self.files[path] = data
+        self.modified[path] = modified
+
+
+class FakeDataConnection:
+
+    def __init__(self, data):
+        self.data = data
+
+    def recv(self, size):
+        chunk = self.data[:size]
+        self.data = self.data[size:]
+        return chunk
+
+    def close(self):
+        pass
+
+
+class FakeFTP:
+
+    def __init__(self, server):
+        self.server = server
+        self.directory = '/'
+        self.commands = []
+        self.dead = False
+        self.closed = False
+
+    def connect(self, host, port, timeout=None):
+        self.host = host
+        self.port = port
+        self.server.connections.append(self)
+
+    def login(self):
+        pass
+
+    def cwd(self, directory):
+        self.directory = directory
+
+    def path(self, name):
+        if name.startswith('/'):
+            return name
+        return self.directory + name
+
+    def retrbinary(self, command, callback):
+        if len(self.server.failures) > 0:
+            raise self.server.failures.pop(0)
+        path = self.path(command[len('RETR '):])
+        if path not in self.server.files:
+            raise ftplib.error_perm('550 ' + path + ': No such file or directory')
+        callback(self.server.files[path])
+
+    def voidcmd(self, command):
+        self.commands.append(command)
+        if self.dead == True:
+            raise EOFError()
+        if command.startswith('MDTM '):
+            return '213 ' + self.server.modified[self.path(command[len('MDTM '):])]
+        return '200 OK'
+
+    def size(self, path):
+        return len(self.server.files[self.path(path)])
+
+    def transfercmd(self, command):
+        path = self.path(command[len('RETR '):])
+        if path not in self.server.files:
+            raise ftplib.error_perm('550 ' + path + ': No such file or directory')
+        return FakeDataConnection(self.server.files[path])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now = self.now + seconds
+
+
+@pytest.fixture
+def ftp_server(monkeypatch):
+
+    server = FakeFTPServer()
+    monkeypatch.setattr(da, 'FTP', lambda: FakeFTP(server))
+
+    return server
+
+
+def grib_bytes(write_grib2, values, issuance=ISSUANCE):
+
+    write_grib2('remote.bin', issuance, [1, 25, 49][:len(values)], values)
+
+    with open('remote.bin', 'rb') as fp:
+        return fp.read()
+
+
+def test_download_reuses_the_connection(ftp_server):
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', b'short')
+
+    assert da.ftp_download(CONUS + 'VP.001-003/', 'ds.maxt.bin', 'a.bin') == 'a.bin'
+    assert da.ftp_download(CONUS + 'VP.001-003/', 'ds.maxt.bin', 'b.bin') == 'b.bin'
+
+    assert len(ftp_server.connections) == 1
+    assert (ftp_server.connections[0].host, ftp_server.connections[0].port) == (da.ndfd_ftp_host, da.ndfd_ftp_port)
+    with open('b.bin', 'rb') as fp:
+        assert fp.read() == b'short'
+    assert len(da._ftp_idle_connections[(da.ndfd_ftp_host, da.ndfd_ftp_port)]) == 1
+
+
+def test_pool_keeps_at_most_ftp_pool_size_connections(ftp_server, monkeypatch):
+
+    monkeypatch.setattr(da, 'ftp_pool_size', 2)
+
+    connections = [da.get_ftp_connection() for i in range(0, 3)]
+    for ftp in connections:
+        da.release_ftp_connection(ftp)
+
+    assert len(ftp_server.connections) == 3
+    assert [ftp.closed for ftp in connections] == [False, False, True]
+    assert len(da._ftp_idle_connections[(da.ndfd_ftp_host, da.ndfd_ftp_port)]) == 2
+
+    da.close_ftp_connections()
+
+    assert all(ftp.closed for ftp in connections)
+    assert da._ftp_idle_connections == {}
+
+
+def test_idle_connections_are_checked_after_ftp_keepalive(ftp_server, monkeypatch):
+
+    ftp = da.get_ftp_connection()
+    da.release_ftp_connection(ftp)
+
+    # A connection that was used within ftp_keepalive seconds is returned without a round trip
+    assert da.get_ftp_connection() is ftp
+    assert ftp.commands == []
+    da.release_ftp_connection(ftp)
+
+    monkeypatch.setattr(da, 'ftp_keepalive', -1)
+
+    assert da.get_ftp_connection() is ftp
+    assert ftp.commands == ['NOOP']
+    da.release_ftp_connection(ftp)
+
+    # The server closed the connection
+    ftp.dead = True
+    replacement = da.get_ftp_connection()
+
+    assert replacement is not ftp
+    assert ftp.closed == True
+    assert len(ftp_server.connections) == 2
+
+
+def test_lost_connection_is_retried_once(ftp_server):
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', b'short')
+    ftp_server.failures = [EOFError()]
+
+    da.ftp_download(CONUS + 'VP.001-003/', 'ds.maxt.bin', 'a.bin')
+
+    assert len(ftp_server.connections) == 2
+    assert ftp_server.connections[0].closed == True
+    with open('a.bin', 'rb') as fp:
+        assert fp.read() == b'short'
+
+    ftp_server.failures = [EOFError(), EOFError()]
+
+    with pytest.raises(EOFError):
+        da.ftp_download(CONUS + 'VP.001-003/', 'ds.maxt.bin', 'a.bin')
+
+
+def test_missing_file_keeps_the_connection(ftp_server):
+
+    with pytest.raises(ftplib.error_perm):
+        da.ftp_download(CONUS + 'VP.001-003/', 'ds.maxt.bin', 'a.bin')
+
+    assert len(ftp_server.connections) == 1
+    assert ftp_server.connections[0].closed == False
+    assert len(da._ftp_idle_connections[(da.ndfd_ftp_host, da.ndfd_ftp_port)]) == 1
+
+
+def test_download_files_returns_the_paths_in_order(ftp_server):
+
+    downloads = []
+    for i in range(0, 6):
+        ftp_server.add_file(CONUS + 'VP.001-003/file' + str(i), str(i).encode())
+        downloads.append((CONUS + 'VP.001-003/', 'file' + str(i), 'local' + str(i)))
+
+    assert da.ftp_download_files(downloads) == ['local' + str(i) for i in range(0, 6)]
+
+    for i in range(0, 6):
+        with open('local' + str(i), 'rb') as fp:
+            assert fp.read() == str(i).encode()
+    assert len(ftp_server.connections) <= da.ftp_pool_size
+
+
+def test_short_and_extended_files_are_joined(ftp_server, write_grib2, synthetic_values):
+
+    short = grib_bytes(write_grib2, synthetic_values[:2])
+    extended = grib_bytes(write_grib2, synthetic_values[2:])
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', short)
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', extended)
+
+    assert da.download_short_and_extended_files(CONUS, 'ds.maxt.bin') == 2
+
+    with open('ds.maxt.bin', 'rb') as fp:
+        assert fp.read() == short + extended
+
+
+def test_remote_file_stats(ftp_server):
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', b'short', '20240701113000')
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', b'extended', '20240701113500')
+
+    stats = da.ndfd_remote_file_stats(CONUS, 'ds.maxt.bin')
+
+    assert stats == {'VP.001-003': ['20240701113000', 5], 'VP.004-007': ['20240701113500', 8]}
+    assert 'TYPE I' in ftp_server.connections[0].commands
+
+
+def test_remote_issuance_time_reads_the_GRIB2_header(ftp_server, write_grib2, synthetic_values):
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', grib_bytes(write_grib2, synthetic_values))
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', b'GRIB' + bytes(10))
+
+    assert da.ndfd_remote_issuance_time(CONUS + 'VP.001-003/', 'ds.maxt.bin') == ISSUANCE
+    # The transfer is stopped early so the connection is closed instead of going back to the pool
+    assert ftp_server.connections[0].closed == True
+
+    with pytest.raises(ValueError):
+        da.ndfd_remote_issuance_time(CONUS + 'VP.004-007/', 'ds.maxt.bin')
+
+
+def test_files_available_needs_matching_issuances(ftp_server, write_grib2, synthetic_values):
+
+    assert da.NDFD_files_available(CONUS, 'ds.maxt.bin') == False
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', grib_bytes(write_grib2, synthetic_values))
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', grib_bytes(write_grib2, synthetic_values, ISSUANCE - timedelta(hours=1)))
+
+    assert da.NDFD_files_available(CONUS, 'ds.maxt.bin') == False
+
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', grib_bytes(write_grib2, synthetic_values))
+
+    assert da.NDFD_files_available(CONUS, 'ds.maxt.bin') == True
+
+
+def test_download_only_when_the_files_changed(ftp_server, write_grib2, synthetic_values, monkeypatch):
+
+    ftp_server.add_file(CONUS + 'VP.001-003/ds.maxt.bin', b'short', '20240701113000')
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', b'extended', '20240701113000')
+
+    downloads = []
+
+    def download(directory_name, parameter):
+        downloads.append(parameter)
+        write_grib2(parameter, ISSUANCE + timedelta(hours=len(downloads)), [1, 25, 49], synthetic_values)
+        return 'grbs', 'ds ' + str(len(downloads)), 2, 1
+
+    monkeypatch.setattr(da, 'get_NWS_NDFD_7_Day_grid_data', download)
+
+    grbs, ds, count_short, count_extended, new_data = da.download_NDFD_grids_if_updated(CONUS, 'ds.maxt.bin')
+
+    assert (ds, count_short, count_extended, new_data) == ('ds 1', 2, 1, True)
+    entry = da.latest_cached_NDFD_product(CONUS, 'ds.maxt.bin')
+    assert entry['remote'] == {'VP.001-003': ['20240701113000', 5], 'VP.004-007': ['20240701113000', 8]}
+
+    # Within ndfd_cache_max_age the server is not asked at all
+    connections = len(ftp_server.connections)
+    grbs, ds, count_short, count_extended, new_data = da.download_NDFD_grids_if_updated(CONUS, 'ds.maxt.bin')
+
+    assert (ds, new_data) == ('ds 1', False)
+    assert isinstance(grbs, da.cached_grib_file)
+    assert len(ftp_server.connections) == connections
+
+    # After ndfd_cache_max_age the MDTM and SIZE of the files are compared with the last download
+    monkeypatch.setattr(da, 'ndfd_cache_max_age', 0)
+    entry['fetched'] = entry['fetched'] - 1
+    checked = entry['fetched']
+
+    grbs, ds, count_short, count_extended, new_data = da.download_NDFD_grids_if_updated(CONUS, 'ds.maxt.bin')
+
+    assert (ds, new_data) == ('ds 1', False)
+    assert entry['fetched'] > checked
+    assert len(downloads) == 1
+
+    ftp_server.add_file(CONUS + 'VP.004-007/ds.maxt.bin', b'extended', '20240701123000')
+
+    grbs, ds, count_short, count_extended, new_data = da.download_NDFD_grids_if_updated(CONUS, 'ds.maxt.bin')
+
+    assert (ds, new_data) == ('ds 2', True)
+    assert len(downloads) == 2
+    assert da._ndfd_latest_issuance[(CONUS, 'ds.maxt.bin')] == ISSUANCE + timedelta(hours=2)
+
+
+def test_watch_delays_double_up_to_the_deadline(monkeypatch):
+
+    clock = FakeClock()
+    monkeypatch.setattr(da, 't', clock)
+
+    delays = []
+    for delay in da.NDFD_watch_delays(10):
+        delays.append(delay)
+        clock.sleep(delay)
+
+    assert delays == [15, 30, 60, 120, 240, 135]
+    assert sum(delays) == 600
+
+
+def test_wait_for_files_returns_as_soon_as_they_are_ready(monkeypatch):
+
+    clock = FakeClock()
+    monkeypatch.setattr(da, 't', clock)
+    checks = iter([False, False, True])
+    monkeypatch.setattr(da, 'NDFD_files_available', lambda directory_name, parameter: next(checks))
+
+    assert da.wait_for_NDFD_files(CONUS, 'ds.maxt.bin') == True
+    assert clock.sleeps == [15, 30]
+
+
+def test_wait_for_files_gives_up_at_the_deadline(monkeypatch):
+
+    clock = FakeClock()
+    monkeypatch.setattr(da, 't', clock)
+    monkeypatch.setattr(da, 'NDFD_files_available', lambda directory_name, parameter: False)
+
+    assert da.wait_for_NDFD_files(CONUS, 'ds.maxt.bin', deadline=2) == False
+    assert sum(clock.sleeps) == 120
+
+
+def test_wait_for_files_async(monkeypatch):
+
+    clock = FakeClock()
+    monkeypatch.setattr(da, 't', clock)
+    checks = iter([False, True])
+    monkeypatch.setattr(da, 'NDFD_files_available', lambda directory_name, parameter: next(checks))
+
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(da.asyncio, 'sleep', sleep)
+
+    assert asyncio.run(da.wait_for_NDFD_files_async(CONUS, 'ds.maxt.bin')) == True
+    assert clock.sleeps == [15]
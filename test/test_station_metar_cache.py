@@ -0,0 +1,233 @@
+# Offline tests of the airport station index and the METAR cache
+# The station index is built from a small airport-codes.csv and the METAR collection files are fake THREDDS datasets.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import firewxpy.data_access as da
+
+AIRPORT_CODES = '''ident,type,name,elevation_ft,continent,iso_country,iso_region,municipality,gps_code,iata_code,local_code,coordinates
+KLAX,large_airport,Los Angeles,125,NA,US,US-CA,Los Angeles,KLAX,LAX,LAX,"-118.4081, 33.9425"
+KSFO,large_airport,San Francisco,13,NA,US,US-CA,San Francisco,KSFO,SFO,SFO,"-122.375, 37.619"
+KBFL,medium_airport,Bakersfield,510,NA,US,US-CA,Bakersfield,KBFL,BFL,BFL,"-119.0568, 35.4336"
+CL01,heliport,Helipad,100,NA,US,US-CA,Somewhere,CL01,,CL01,"-118.0, 34.0"
+KPDX,large_airport,Portland,31,NA,US,US-OR,Portland,KPDX,PDX,PDX,"-122.5975, 45.5887"
+'''
+
+
+@pytest.fixture
+def airport_codes(monkeypatch):
+
+    with open('airport-codes.csv', 'w') as fp:
+        fp.write(AIRPORT_CODES)
+
+    source_path = os.path.abspath('airport-codes.csv')
+    monkeypatch.setattr(da, 'get_test_data', lambda name, as_file_obj=False: source_path)
+
+    return source_path
+
+
+class FakeMetarDataset:
+
+    def __init__(self, name, text):
+        self.name = name
+        self.text = text
+        self.access_urls = {'HTTPServer': 'https://thredds.ucar.edu/thredds/fileServer/noaaport/text/metar/' + name}
+
+    def remote_open(self):
+        from io import BytesIO
+        return BytesIO(self.text.encode('latin-1'))
+
+
+@pytest.fixture
+def metar_server(monkeypatch):
+
+    r'''
+    Replaces the HEAD request (the version of each file) and the MetPy parser. The parsed frames are counted.
+    '''
+
+    server = {'versions': {}, 'parsed': []}
+
+    monkeypatch.setattr(da, 'metar_collection_version', lambda dataset: server['versions'].get(dataset.name))
+
+    def parse(dataset, year=None, month=None, station_ids=None):
+        server['parsed'].append((dataset.name, station_ids))
+        station_ids_in_file = ['KLAX', 'KSFO', 'KPDX']
+        if station_ids != None:
+            station_ids_in_file = [station_id for station_id in station_ids_in_file if station_id in station_ids]
+        df = pd.DataFrame({'station_id': station_ids_in_file, 'air_temperature': np.arange(len(station_ids_in_file), dtype='float64')})
+        return df, {'station_id': None, 'air_temperature': 'degC'}
+
+    monkeypatch.setattr(da, 'parse_metar_collection', parse)
+
+    return server
+
+
+def test_station_index_is_built_once_and_saved(airport_codes, monkeypatch):
+
+    index = da.load_station_index()
+
+    assert index['ident'].tolist() == ['KLAX', 'KSFO', 'KBFL', 'CL01', 'KPDX']
+    np.testing.assert_allclose(index['latitude'][:2], [33.9425, 37.619], rtol=1e-6)
+    np.testing.assert_allclose(index['longitude'][:2], [-118.4081, -122.375], rtol=1e-6)
+    assert os.path.exists(da.station_index_path())
+
+    def build(source_path, source_mtime):
+        raise AssertionError("the saved station index should be used")
+
+    monkeypatch.setattr(da, 'build_station_index', build)
+    da._station_index.clear()
+
+    saved = da.load_station_index()
+
+    assert saved['ident'].tolist() == index['ident'].tolist()
+    np.testing.assert_array_equal(saved['latitude'], index['latitude'])
+    assert saved['region'].tolist() == ['US-CA', 'US-CA', 'US-CA', 'US-CA', 'US-OR']
+
+
+def test_station_index_is_rebuilt_when_the_csv_changes(airport_codes):
+
+    da.load_station_index()
+    da._station_index.clear()
+
+    with open(airport_codes, 'a') as fp:
+        fp.write('KSEA,large_airport,Seattle,433,NA,US,US-WA,Seattle,KSEA,SEA,SEA,"-122.309, 47.449"\n')
+    stats = os.stat(airport_codes)
+    os.utime(airport_codes, (stats.st_atime, stats.st_mtime + 10))
+
+    assert da.load_station_index()['ident'].tolist()[-1] == 'KSEA'
+
+
+def test_station_ids_and_coordinates(airport_codes):
+
+    assert da.airport_station_ids() == frozenset(['KLAX', 'KSFO', 'KBFL', 'KPDX'])
+    assert da.airport_station_ids(['large_airport']) == frozenset(['KLAX', 'KSFO', 'KPDX'])
+    assert da.airport_station_ids(['large_airport']) is da.airport_station_ids(['large_airport'])
+
+    latitude, longitude = da.station_coordinates(['KPDX', 'XXXX', 'KLAX'])
+
+    np.testing.assert_allclose(latitude[[0, 2]], [45.5887, 33.9425], rtol=1e-6)
+    np.testing.assert_allclose(longitude[[0, 2]], [-122.5975, -118.4081], rtol=1e-6)
+    assert np.isnan(latitude[1]) and np.isnan(longitude[1])
+
+    assert da.stations_in_region(state='ca') == ['KLAX', 'KSFO', 'KBFL']
+    assert da.stations_in_region(state='CA', types=['heliport']) == ['CL01']
+
+
+def test_filter_metar_text_keeps_continuation_lines():
+
+    text = '\n'.join([
+        'METAR KLAX 011753Z 25010KT 10SM FEW020 22/14 A2990',
+        '     RMK AO2',
+        'KSFO 011756Z 28015KT 10SM CLR 18/10 A3001',
+        '     RMK AO2 SLP163',
+        'SPECI COR KPDX 011755Z 00000KT 10SM CLR 20/08 A3005',
+    ])
+
+    filtered = da.filter_metar_text(text, {'KLAX', 'KPDX'})
+
+    assert filtered.splitlines() == ['METAR KLAX 011753Z 25010KT 10SM FEW020 22/14 A2990', '     RMK AO2', 'SPECI COR KPDX 011755Z 00000KT 10SM CLR 20/08 A3005']
+
+
+def test_metar_file_is_parsed_once_per_version(metar_server):
+
+    dataset = FakeMetarDataset('metar_20240701_1800.txt', '')
+    metar_server['versions'][dataset.name] = 'Mon, 01 Jul 2024 18:55:00 GMT 1000'
+
+    first = da.get_parsed_metar_file(dataset)
+    second = da.get_parsed_metar_file(dataset)
+
+    assert len(metar_server['parsed']) == 1
+    assert second['station_id'].tolist() == ['KLAX', 'KSFO', 'KPDX']
+    assert second.units == {'station_id': None, 'air_temperature': 'degC'}
+
+    # Callers get a copy so their columns are not added to the cached frame
+    first['new_column'] = 1
+    assert 'new_column' not in da.get_parsed_metar_file(dataset).columns
+
+    # The frame is read back from the disk after the memory is cleared
+    da._metar_frames.clear()
+    from_disk = da.get_parsed_metar_file(dataset)
+
+    assert len(metar_server['parsed']) == 1
+    pd.testing.assert_frame_equal(from_disk, second)
+
+    # The file of the current hour grew on the server
+    metar_server['versions'][dataset.name] = 'Mon, 01 Jul 2024 19:05:00 GMT 1200'
+    da.get_parsed_metar_file(dataset)
+
+    assert len(metar_server['parsed']) == 2
+
+
+def test_metar_cache_is_keyed_by_year_and_month(metar_server):
+
+    dataset = FakeMetarDataset('metar_20240701_1800.txt', '')
+    metar_server['versions'][dataset.name] = 'Mon, 01 Jul 2024 18:55:00 GMT 1000'
+
+    da.get_parsed_metar_file(dataset, year=2024, month=7)
+    da.get_parsed_metar_file(dataset, year=2024, month=7)
+    da.get_parsed_metar_file(dataset, year=2024, month=6)
+
+    assert len(metar_server['parsed']) == 2
+
+
+def test_metar_station_filter(metar_server):
+
+    dataset = FakeMetarDataset('metar_20240701_1800.txt', '')
+    metar_server['versions'][dataset.name] = 'Mon, 01 Jul 2024 18:55:00 GMT 1000'
+
+    # Not cached yet: only the stations are parsed and the partial frame is not cached
+    partial = da.get_parsed_metar_file(dataset, station_ids=['KPDX'])
+
+    assert partial['station_id'].tolist() == ['KPDX']
+    assert metar_server['parsed'] == [(dataset.name, {'KPDX'})]
+    assert da._metar_frames == {}
+
+    da.get_parsed_metar_file(dataset)
+    cached = da.get_parsed_metar_file(dataset, station_ids=['KLAX', 'KSFO'])
+
+    assert cached['station_id'].tolist() == ['KLAX', 'KSFO']
+    assert len(metar_server['parsed']) == 2
+
+
+def test_metar_file_without_a_version_is_not_cached(metar_server):
+
+    dataset = FakeMetarDataset('metar_20240701_1800.txt', '')
+
+    da.get_parsed_metar_file(dataset)
+    da.get_parsed_metar_file(dataset)
+
+    assert len(metar_server['parsed']) == 2
+    assert da._metar_frames == {}
+    assert os.path.exists(da.metar_cache_directory) == False
+
+
+def test_metar_memory_keeps_the_newest_files(metar_server, monkeypatch):
+
+    monkeypatch.setattr(da, 'metar_cache_memory_entries', 2)
+
+    names = ['metar_20240701_' + str(hour) + '00.txt' for hour in range(16, 19)]
+    for name in names:
+        metar_server['versions'][name] = 'Mon, 01 Jul 2024 ' + name[-8:-6] + ':55:00 GMT 1000'
+        da.get_parsed_metar_file(FakeMetarDataset(name, ''))
+
+    assert list(da._metar_frames.keys()) == names[1:]
+
+
+def test_prune_metar_cache_deletes_old_files(metar_server, monkeypatch):
+
+    dataset = FakeMetarDataset('metar_20240701_1800.txt', '')
+    metar_server['versions'][dataset.name] = 'Mon, 01 Jul 2024 18:55:00 GMT 1000'
+    da.get_parsed_metar_file(dataset)
+
+    frame_path, info_path = da.metar_cache_paths(dataset.name)
+    old = os.path.getmtime(info_path) - (da.metar_cache_retention * 3600) - 60
+    os.utime(frame_path, (old, old))
+    os.utime(info_path, (old, old))
+
+    da.prune_metar_cache()
+
+    assert os.path.exists(frame_path) == False and os.path.exists(info_path) == False